@@ -0,0 +1,47 @@
+"""add candidate_contact_key index table
+
+Revision ID: a4c6e8f0b2d5
+Revises: f3a5c7e9b1d4
+Create Date: 2026-10-16
+
+Normalised email / E.164 phone → candidate index used by the duplicate-merge
+bulk scan to find shared contact keys with one self-join (see
+candidate_contact_index.py).
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "a4c6e8f0b2d5"
+down_revision = "f3a5c7e9b1d4"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "candidate_contact_key",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("bullhorn_candidate_id", sa.Integer(), nullable=False),
+        sa.Column("kind", sa.String(length=10), nullable=False),
+        sa.Column("value", sa.String(length=255), nullable=False),
+        sa.Column("seen_at", sa.DateTime(), nullable=False),
+    )
+    op.create_index(
+        "ix_candidate_contact_key_bullhorn_candidate_id", "candidate_contact_key",
+        ["bullhorn_candidate_id"],
+    )
+    op.create_index(
+        "idx_contact_key_lookup", "candidate_contact_key",
+        ["kind", "value", "bullhorn_candidate_id"],
+    )
+    op.create_index("idx_contact_key_seen_at", "candidate_contact_key", ["seen_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("idx_contact_key_seen_at", table_name="candidate_contact_key")
+    op.drop_index("idx_contact_key_lookup", table_name="candidate_contact_key")
+    op.drop_index(
+        "ix_candidate_contact_key_bullhorn_candidate_id", table_name="candidate_contact_key"
+    )
+    op.drop_table("candidate_contact_key")
@@ -0,0 +1,30 @@
+"""add embedding_blob to job_embedding
+
+Revision ID: b5d7f9a1c3e6
+Revises: a3c5e7g9i1k2
+Create Date: 2026-10-16
+
+Packed little-endian float32 copy of job_embedding.embedding_vector. The
+Layer 1 pre-filter loads these into a process-wide NumPy matrix instead of
+JSON-decoding one 3072-float text blob per job per candidate. Nullable:
+legacy rows fall back to the JSON column until they are next re-embedded.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "b5d7f9a1c3e6"
+down_revision = "a3c5e7g9i1k2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "job_embedding",
+        sa.Column("embedding_blob", sa.LargeBinary(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("job_embedding", "embedding_blob")
@@ -0,0 +1,58 @@
+"""add scheduler_job_lease and scheduler_job_run tables
+
+Revision ID: b6d8f0a2c4e7
+Revises: a4c6e8f0b2d5
+Create Date: 2026-10-16
+
+Per-job execution leases for the lease-based scheduler backend (every worker
+runs APScheduler; a job runs only on the worker holding its lease) and a
+per-run metrics log of duration, outcome and start lag. See
+scheduler_leases.py.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "b6d8f0a2c4e7"
+down_revision = "a4c6e8f0b2d5"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "scheduler_job_lease",
+        sa.Column("job_id", sa.String(length=191), primary_key=True),
+        sa.Column("owner", sa.String(length=100), nullable=True),
+        sa.Column("lease_token", sa.String(length=36), nullable=True),
+        sa.Column("lease_expires_at", sa.DateTime(), nullable=True),
+        sa.Column("heartbeat_at", sa.DateTime(), nullable=True),
+        sa.Column("next_due_at", sa.DateTime(), nullable=True),
+        sa.Column("last_started_at", sa.DateTime(), nullable=True),
+        sa.Column("last_finished_at", sa.DateTime(), nullable=True),
+        sa.Column("last_outcome", sa.String(length=20), nullable=True),
+    )
+    op.create_table(
+        "scheduler_job_run",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("job_id", sa.String(length=191), nullable=False),
+        sa.Column("owner", sa.String(length=100), nullable=True),
+        sa.Column("due_at", sa.DateTime(), nullable=True),
+        sa.Column("started_at", sa.DateTime(), nullable=False),
+        sa.Column("finished_at", sa.DateTime(), nullable=False),
+        sa.Column("duration_ms", sa.Integer(), nullable=False),
+        sa.Column("lag_ms", sa.Integer(), nullable=True),
+        sa.Column("outcome", sa.String(length=20), nullable=False),
+        sa.Column("error", sa.Text(), nullable=True),
+    )
+    op.create_index(
+        "idx_scheduler_job_run_job_started", "scheduler_job_run", ["job_id", "started_at"]
+    )
+    op.create_index("idx_scheduler_job_run_started", "scheduler_job_run", ["started_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("idx_scheduler_job_run_started", table_name="scheduler_job_run")
+    op.drop_index("idx_scheduler_job_run_job_started", table_name="scheduler_job_run")
+    op.drop_table("scheduler_job_run")
+    op.drop_table("scheduler_job_lease")
@@ -0,0 +1,43 @@
+"""add embedding_cache table
+
+Revision ID: c6e8a0b2d4f7
+Revises: b5d7f9a1c3e6
+Create Date: 2026-10-16
+
+Content-addressed embedding cache keyed by (model, sha256 of normalised
+text). DB tier behind the in-process LRU in services/embedding_cache.py so a
+resume, profile or job description is embedded once per model across
+workers and restarts.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "c6e8a0b2d4f7"
+down_revision = "b5d7f9a1c3e6"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "embedding_cache",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("model", sa.String(length=60), nullable=False),
+        sa.Column("text_hash", sa.String(length=64), nullable=False),
+        sa.Column("dims", sa.Integer(), nullable=True),
+        sa.Column("embedding_blob", sa.LargeBinary(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("model", "text_hash", name="uq_embedding_cache_model_hash"),
+    )
+    op.create_index(
+        "ix_embedding_cache_created_at",
+        "embedding_cache",
+        ["created_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_embedding_cache_created_at", table_name="embedding_cache")
+    op.drop_table("embedding_cache")
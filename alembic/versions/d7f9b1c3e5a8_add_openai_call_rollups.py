@@ -0,0 +1,64 @@
+"""add hourly / daily openai_call_log rollup tables
+
+Revision ID: d7f9b1c3e5a8
+Revises: c6e8a0b2d4f7
+Create Date: 2026-10-16
+
+Pre-aggregated rollups of `openai_call_log` keyed by (bucket_start,
+call_site_id, model, tenant_id), plus a single-row watermark. Maintained by
+services/ai_cost_rollup.refresh_rollups() and read by the AI cost dashboard,
+the spend alert, the System Health tile and the forecaster so their cost is
+independent of how much log history has accumulated.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "d7f9b1c3e5a8"
+down_revision = "c6e8a0b2d4f7"
+branch_labels = None
+depends_on = None
+
+
+def _rollup_table(name: str) -> None:
+    op.create_table(
+        name,
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("bucket_start", sa.DateTime(), nullable=False),
+        sa.Column("call_site_id", sa.String(length=80), nullable=False),
+        sa.Column("model", sa.String(length=80), nullable=False),
+        sa.Column("tenant_id", sa.String(length=80), nullable=False, server_default=""),
+        sa.Column("calls", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("failures", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("input_tokens", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("output_tokens", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("cached_input_tokens", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("estimated_cost_usd", sa.Numeric(14, 6), nullable=False, server_default="0"),
+        sa.Column("duration_ms_sum", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("duration_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "bucket_start", "call_site_id", "model", "tenant_id",
+            name=f"uq_{name}_key",
+        ),
+    )
+    op.create_index(f"ix_{name}_bucket_start", name, ["bucket_start"])
+
+
+def upgrade() -> None:
+    _rollup_table("openai_call_rollup_hourly")
+    _rollup_table("openai_call_rollup_daily")
+    op.create_table(
+        "openai_call_rollup_state",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("rolled_up_to", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("openai_call_rollup_state")
+    for name in ("openai_call_rollup_daily", "openai_call_rollup_hourly"):
+        op.drop_index(f"ix_{name}_bucket_start", table_name=name)
+        op.drop_table(name)
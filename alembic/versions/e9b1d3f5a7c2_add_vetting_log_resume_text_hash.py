@@ -0,0 +1,49 @@
+"""add candidate_vetting_log.resume_text_hash
+
+Revision ID: e9b1d3f5a7c2
+Revises: d7f9b1c3e5a8
+Create Date: 2026-10-16
+
+Whitespace-normalised md5 of `resume_text`, maintained by the model on every
+write. The fraud resume-reuse check becomes an indexed equality on this
+column instead of `md5(resume_text) = md5(:rt)` over the whole table.
+Existing rows are filled in batches by tasks.vetting.run_resume_hash_backfill.
+
+On PostgreSQL the index is built CONCURRENTLY so the live table keeps
+accepting screening writes during rollout.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "e9b1d3f5a7c2"
+down_revision = "d7f9b1c3e5a8"
+branch_labels = None
+depends_on = None
+
+
+INDEX_NAME = "ix_candidate_vetting_log_resume_text_hash"
+
+
+def upgrade() -> None:
+    op.add_column(
+        "candidate_vetting_log",
+        sa.Column("resume_text_hash", sa.String(length=32), nullable=True),
+    )
+    if op.get_bind().dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {INDEX_NAME} "
+                f"ON candidate_vetting_log (resume_text_hash)"
+            )
+    else:
+        op.create_index(INDEX_NAME, "candidate_vetting_log", ["resume_text_hash"])
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {INDEX_NAME}")
+    else:
+        op.drop_index(INDEX_NAME, table_name="candidate_vetting_log")
+    op.drop_column("candidate_vetting_log", "resume_text_hash")
@@ -0,0 +1,51 @@
+"""add inbound_email_job queue table
+
+Revision ID: f3a5c7e9b1d4
+Revises: e9b1d3f5a7c2
+Create Date: 2026-10-16
+
+Durable queue behind the SendGrid inbound webhook and the mailbox puller.
+Payloads are persisted on receipt and drained by a fixed-size worker pool
+(see inbound_email_queue.py) instead of one thread per request.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "f3a5c7e9b1d4"
+down_revision = "e9b1d3f5a7c2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "inbound_email_job",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("kind", sa.String(length=32), nullable=False),
+        sa.Column("priority", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("status", sa.String(length=16), nullable=False, server_default="queued"),
+        sa.Column("dedupe_key", sa.String(length=255), nullable=True),
+        sa.Column("payload_json", sa.Text(), nullable=True),
+        sa.Column("result_json", sa.Text(), nullable=True),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("next_attempt_at", sa.DateTime(), nullable=False),
+        sa.Column("locked_at", sa.DateTime(), nullable=True),
+        sa.Column("locked_by", sa.String(length=64), nullable=True),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("completed_at", sa.DateTime(), nullable=True),
+    )
+    op.create_index(
+        "ix_inbound_email_job_dedupe_key", "inbound_email_job", ["dedupe_key"]
+    )
+    op.create_index(
+        "idx_inbound_email_job_claim", "inbound_email_job",
+        ["status", "priority", "next_attempt_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_inbound_email_job_claim", table_name="inbound_email_job")
+    op.drop_index("ix_inbound_email_job_dedupe_key", table_name="inbound_email_job")
+    op.drop_table("inbound_email_job")
@@ -443,9 +443,14 @@ with app.app_context():
         app.logger.error(f"❌ Database seeding failed: {str(e)}")
         app.logger.debug(f"Seeding error details: {traceback.format_exc()}")
 
-# Initialize scheduler with optimized settings and delayed start
+# Initialize scheduler with optimized settings and delayed start. The
+# executor records per-run metrics and, with SCHEDULER_BACKEND=lease, runs
+# each job only under its database lease (see scheduler_leases.py).
+from scheduler_leases import LeasedThreadPoolExecutor
+
 scheduler = BackgroundScheduler(
     timezone='UTC',
+    executors={'default': LeasedThreadPoolExecutor(app)},
     job_defaults={
         'coalesce': True,
         'max_instances': 1,
@@ -912,7 +912,8 @@ class ResumeMixin:
     def _extract_title_from_resume_text(self, resume_text, candidate_name=""):
         try:
             from openai import OpenAI
-            client = OpenAI()
+            from services.openai_governor import shared_http_client
+            client = OpenAI(http_client=shared_http_client())
 
             prompt = (
                 f"Extract the most recent/current job title from this resume. "
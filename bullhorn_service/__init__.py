@@ -16,6 +16,10 @@ This is the modular successor to the former bullhorn_service.py monolith
   - NotesMixin          : Candidate note retrieval and creation
   - EntitiesMixin       : Generic entity CRUD + meta/options/settings
 
+Authentication is brokered process-wide by ``session_broker``: all instances
+with the same credentials share one BhRestToken, logins are single-flight,
+and sessions are refreshed ahead of expiry.
+
 Public import surface is preserved:
 
     from bullhorn_service import BullhornService
@@ -62,8 +62,11 @@ class _BullhornCore:
             'Accept': 'application/json',
             'Content-Type': 'application/json'
         })
-        self._auth_in_progress = False
-        self._last_auth_attempt = None
+        # Set when this instance adopts a session from the process-wide
+        # broker (bullhorn_service.session_broker).
+        self._session_generation = None
+        self._session_token = None
+        self.session.hooks['response'].append(self._record_session_use)
         
         # Check if we should use Bullhorn One (new) API
         self.use_bullhorn_one = os.environ.get('BULLHORN_USE_NEW_API', 'false').lower() == 'true'
@@ -137,19 +140,18 @@ class _BullhornCore:
             from models import GlobalSettings
             
             with app.app_context():
-                client_id_setting = GlobalSettings.query.filter_by(setting_key='bullhorn_client_id').first()
-                client_secret_setting = GlobalSettings.query.filter_by(setting_key='bullhorn_client_secret').first()
-                username_setting = GlobalSettings.query.filter_by(setting_key='bullhorn_username').first()
-                password_setting = GlobalSettings.query.filter_by(setting_key='bullhorn_password').first()
-                
-                if client_id_setting:
-                    self.client_id = client_id_setting.setting_value
-                if client_secret_setting:
-                    self.client_secret = client_secret_setting.setting_value
-                if username_setting:
-                    self.username = username_setting.setting_value
-                if password_setting:
-                    self.password = password_setting.setting_value
+                stored = GlobalSettings.settings.get_many([
+                    'bullhorn_client_id', 'bullhorn_client_secret',
+                    'bullhorn_username', 'bullhorn_password',
+                ])
+                if 'bullhorn_client_id' in stored:
+                    self.client_id = stored['bullhorn_client_id']
+                if 'bullhorn_client_secret' in stored:
+                    self.client_secret = stored['bullhorn_client_secret']
+                if 'bullhorn_username' in stored:
+                    self.username = stored['bullhorn_username']
+                if 'bullhorn_password' in stored:
+                    self.password = stored['bullhorn_password']
         except Exception as e:
             logger.warning(f"Could not load Bullhorn credentials from database: {str(e)}")
     def _filter_excluded_jobs(self, jobs: List[Dict]) -> List[Dict]:
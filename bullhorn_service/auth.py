@@ -8,6 +8,8 @@ from urllib.parse import urlencode
 
 import requests  # noqa: F401  (used by methods via self.session)
 
+from bullhorn_service.session_broker import get_session_broker
+
 logger = logging.getLogger(__name__)
 
 
@@ -18,27 +20,33 @@ class AuthMixin:
         """
         Authenticate with Bullhorn using OAuth 2.0 flow
         
+        Sessions are shared process-wide through the session broker: an
+        instance adopts the current shared BhRestToken, concurrent logins
+        are coalesced into one, and a token cleared after a 401 is only
+        re-issued once no matter how many callers saw the 401.
+        
         Returns:
             bool: True if authentication successful, False otherwise
         """
-        # Check if we already have a valid session - skip re-authentication
+        broker = get_session_broker()
+        key = broker.key_for(self)
+        rejected_token = None
         if self.rest_token and self.base_url:
-            logger.debug("Already authenticated, reusing existing session")
-            return True
-        
-        # Prevent concurrent authentication attempts
-        if self._auth_in_progress:
-            logger.warning("Authentication already in progress, skipping duplicate attempt")
-            return False
-            
-        # Check if we just tried to authenticate (within last 5 seconds - reduced from 30 to allow faster recovery)
-        if self._last_auth_attempt:
-            time_since_last = datetime.now() - self._last_auth_attempt
-            if time_since_last.total_seconds() < 5:
-                logger.warning(f"Recent authentication attempt detected ({time_since_last.total_seconds():.1f}s ago), skipping to prevent overload")
-                return False
+            mine = getattr(self, '_session_generation', None)
+            shared = broker.peek(key)
+            # Tokens set by hand (no generation) or still current are reused.
+            if mine is None or shared is None or (
+                    shared.generation == mine and not broker.is_due(shared)):
+                if mine is not None:
+                    broker.touch(key)
+                logger.debug("Already authenticated, reusing existing session")
+                return True
+        else:
+            # The caller dropped its token (the 401 convention) — tell the
+            # broker which one was rejected so it is discarded exactly once.
+            rejected_token = getattr(self, '_session_token', None)
         
-        if not all([self.client_id, self.client_secret, self.username, self.password]):
+        if broker.peek(key) is None and not all([self.client_id, self.client_secret, self.username, self.password]):
             missing = []
             if not self.client_id: missing.append('client_id')
             if not self.client_secret: missing.append('client_secret')
@@ -48,17 +56,21 @@ class AuthMixin:
             logger.error(f"Missing {api_mode} credentials: {', '.join(missing)}")
             return False
             
-        try:
-            self._auth_in_progress = True
-            self._last_auth_attempt = datetime.now()
-            # Try direct login first (simpler for API access)
-            return self._direct_login()
-            
-        except Exception as e:
-            logger.error(f"Bullhorn authentication failed: {str(e)}")
-            return False
-        finally:
-            self._auth_in_progress = False
+        return broker.acquire(self, rejected_token=rejected_token)
+
+    def _record_session_use(self, response, *args, **kwargs):
+        """requests response hook: keep the broker's idle clock current.
+
+        API methods skip authenticate() while they hold a token, so without
+        this a session in constant use would look idle and be refreshed
+        (invalidating the token every running job holds).
+        """
+        token = self._session_token
+        if token and token == self.rest_token and response.status_code < 400:
+            broker = get_session_broker()
+            broker.touch(broker.key_for(self), token)
+        return response
+
     def _get_current_user_id(self) -> Optional[int]:
         """
         Query Bullhorn API for the current user's ID (CorporateUser)
@@ -2,6 +2,8 @@
 import os
 import json
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 from urllib.parse import urlencode
@@ -10,6 +12,10 @@ import requests  # noqa: F401  (used by methods via self.session)
 
 logger = logging.getLogger(__name__)
 
+# Multi-ID entity GETs: IDs per request and requests in flight at once.
+ENTITY_BATCH_SIZE = 50
+ENTITY_BATCH_CONCURRENCY = 4
+
 
 class EntitiesMixin:
     """Mixin providing entities-related Bullhorn API methods."""
@@ -48,6 +54,116 @@ class EntitiesMixin:
         except Exception as e:
             logger.error(f"Error getting {entity_type} {entity_id}: {e}")
             return None
+    def get_entities(self, entity_type: str, entity_ids: List[int], fields: str = None,
+                     batch_size: int = ENTITY_BATCH_SIZE,
+                     max_workers: int = ENTITY_BATCH_CONCURRENCY) -> Dict[int, Dict]:
+        """Fetch many entities by ID using comma-separated multi-ID GETs.
+
+        ``entity/{type}/{id1,id2,...}`` returns every record in one round
+        trip. IDs go ``batch_size`` to a request with up to ``max_workers``
+        requests in flight, each worker on its own session. A 401 re-authenticates once and retries the
+        affected batches; a batch that fails outright (e.g. it contains a
+        deleted ID) falls back to per-ID ``get_entity`` so one bad record
+        doesn't drop its neighbours.
+
+        Returns ``{id: record}``; IDs that could not be fetched are absent.
+        """
+        if entity_type not in self.SUPPORTED_ENTITY_TYPES:
+            logger.error(f"Unsupported entity type: {entity_type}")
+            return {}
+
+        ids = list(dict.fromkeys(int(i) for i in entity_ids if i))
+        if not ids:
+            return {}
+
+        if not self.base_url or not self.rest_token:
+            if not self.authenticate():
+                return {}
+
+        if not fields:
+            fields = self.ENTITY_DEFAULT_FIELDS.get(entity_type, 'id')
+        if 'id' not in fields.split(','):
+            fields = f"id,{fields}"
+
+        batch_size = max(1, batch_size)
+        batches = [ids[i:i + batch_size] for i in range(0, len(ids), batch_size)]
+        results: Dict[int, Dict] = {}
+
+        def run(pending):
+            token, base_url = self.rest_token, self.base_url
+            local = threading.local()
+            sessions = []
+            sessions_lock = threading.Lock()
+
+            def fetch(batch):
+                session = getattr(local, 'session', None)
+                if session is None:
+                    session = local.session = self._new_page_session()
+                    with sessions_lock:
+                        sessions.append(session)
+                return self._get_entity_batch(session, entity_type, batch, fields, base_url, token)
+
+            workers = max(1, min(max_workers, len(pending)))
+            try:
+                with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='bh-entities') as pool:
+                    outcomes = list(pool.map(fetch, pending))
+            finally:
+                for session in sessions:
+                    session.close()
+            rejected, failed = [], []
+            for batch, (status, records) in zip(pending, outcomes):
+                if status == 200:
+                    for record in records:
+                        if isinstance(record, dict) and record.get('id') is not None:
+                            results[int(record['id'])] = record
+                elif status == 401:
+                    rejected.append(batch)
+                else:
+                    failed.append(batch)
+            return rejected, failed
+
+        rejected, failed = run(batches)
+        if rejected:
+            # One re-auth for the whole call, not one per batch thread.
+            self.rest_token = None
+            if self.authenticate():
+                rejected, more_failed = run(rejected)
+                failed.extend(more_failed)
+            if rejected:
+                logger.error(f"Multi-ID {entity_type} fetch still unauthorized after re-auth")
+
+        for batch in failed:
+            if len(batch) == 1:
+                continue
+            logger.warning(
+                f"Multi-ID {entity_type} fetch failed for {len(batch)} IDs, "
+                f"falling back to per-ID requests"
+            )
+            for entity_id in batch:
+                record = self.get_entity(entity_type, entity_id, fields=fields)
+                if record:
+                    results[entity_id] = record
+
+        logger.info(f"Fetched {len(results)}/{len(ids)} {entity_type} records in {len(batches)} request(s)")
+        return results
+
+    def _get_entity_batch(self, session, entity_type: str, ids: List[int], fields: str,
+                          base_url: str, token: str):
+        """One multi-ID GET. Returns ``(status_code, records)``; status 0 on error."""
+        try:
+            url = f"{base_url}entity/{entity_type}/{','.join(str(i) for i in ids)}"
+            params = {'fields': fields, 'BhRestToken': token}
+            response = session.get(url, params=params, timeout=30)
+            if response.status_code != 200:
+                if response.status_code != 401:
+                    logger.warning(f"Multi-ID {entity_type} GET returned {response.status_code}")
+                return response.status_code, []
+            data = self._safe_json_parse(response).get('data') or []
+            # A single ID comes back as an object rather than a list.
+            return 200, data if isinstance(data, list) else [data]
+        except Exception as e:
+            logger.error(f"Error in multi-ID {entity_type} GET: {e}")
+            return 0, []
     def update_entity(self, entity_type: str, entity_id: int, data: Dict) -> bool:
         if entity_type not in self.SUPPORTED_ENTITY_TYPES:
             logger.error(f"Unsupported entity type for update: {entity_type}")
@@ -1,15 +1,26 @@
 """JobsMixin — Bullhorn API methods for this domain."""
 import os
+import copy
 import json
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 from urllib.parse import urlencode
 
-import requests  # noqa: F401  (used by methods via self.session)
+import requests
 
 logger = logging.getLogger(__name__)
 
+# Tearsheet pagination: Bullhorn's max page size, parallel page fetches per
+# pass, and per-page attempts before pagination stops at that page.
+TEARSHEET_PAGE_SIZE = 200
+TEARSHEET_PAGE_WORKERS = max(1, int(os.environ.get('BULLHORN_PAGE_WORKERS', '4') or 4))
+TEARSHEET_PAGE_ATTEMPTS = 3
+TEARSHEET_PAGE_RETRY_DELAY = 0.5
+
 
 def _reconcile_tearsheet_search_results(
     search_jobs: List[Dict],
@@ -112,18 +123,23 @@ class JobsMixin:
             if not self.authenticate():
                 return []
         
+        # Page workers (and concurrent tearsheet pulls) share this instance, so
+        # read the session credentials once rather than on every request.
+        base_url, rest_token = self.base_url, self.rest_token
+        
         try:
             # First get the entity API count for validation
-            entity_url = f"{self.base_url}entity/Tearsheet/{tearsheet_id}"
+            entity_url = f"{base_url}entity/Tearsheet/{tearsheet_id}"
             entity_params = {
                 'fields': 'id,name,jobOrders(id,title,isOpen,status,dateAdded,dateLastModified,clientCorporation(name),description,publicDescription,address(address1,city,state,countryName),employmentType,onSite,assignedUsers(id,firstName,lastName,email),responseUser(firstName,lastName),owner(firstName,lastName))',
-                'BhRestToken': self.rest_token
+                'BhRestToken': rest_token
             }
             
             entity_response = self.session.get(entity_url, params=entity_params, timeout=60)
             entity_total = 0
             entity_job_ids = set()
             entity_membership_complete = False
+            assoc_starts = []
             
             if entity_response.status_code == 200:
                 entity_data = self._safe_json_parse(entity_response)
@@ -140,40 +156,9 @@ class JobsMixin:
                     if entity_total <= 5:
                         return self._filter_excluded_jobs(entity_jobs_data)
                     
-                    # For larger tearsheets, fetch ALL Entity job IDs with pagination (for orphan detection)
+                    # For larger tearsheets, fetch ALL Entity job IDs (for orphan detection)
                     if entity_total > len(entity_job_ids):
-                        # Use association endpoint for proper pagination
-                        assoc_url = f"{self.base_url}entity/Tearsheet/{tearsheet_id}/jobOrders"
-                        entity_start = len(entity_job_ids)
-                        page_size = 200
-                        
-                        while entity_start < entity_total:
-                            assoc_params = {
-                                'fields': 'id',
-                                'start': entity_start,
-                                'count': page_size,
-                                'BhRestToken': self.rest_token
-                            }
-                            paginated_response = self.session.get(assoc_url, params=assoc_params, timeout=60)
-                            if paginated_response.status_code == 200:
-                                paginated_data = self._safe_json_parse(paginated_response)
-                                paginated_jobs = paginated_data.get('data', [])
-                                if not paginated_jobs:
-                                    break
-                                entity_job_ids.update({job.get('id') for job in paginated_jobs if job.get('id')})
-                                entity_start += len(paginated_jobs)
-                                if len(paginated_jobs) < page_size:
-                                    break
-                            else:
-                                logger.warning(f"Failed to fetch Entity API page at start={entity_start}: {paginated_response.status_code}")
-                                break
-                        
-                        # Safeguard: Abort orphan filtering if we didn't collect all Entity IDs
-                        if len(entity_job_ids) < entity_total:
-                            logger.error(f"Tearsheet {tearsheet_id}: Entity pagination incomplete! Collected {len(entity_job_ids)} IDs but Entity API reports {entity_total}. Aborting orphan filtering to prevent data loss.")
-                            entity_job_ids = set()  # Clear IDs to disable orphan filtering
-                        else:
-                            entity_membership_complete = True
+                        assoc_starts = list(range(len(entity_job_ids), entity_total, TEARSHEET_PAGE_SIZE))
                     else:
                         entity_membership_complete = True
             
@@ -195,40 +180,53 @@ class JobsMixin:
                 "responseUser(firstName,lastName)"
             ]
             
-            all_jobs = []
-            start = 0
-            count = 200  # Max records per page
+            def _entity_pass():
+                # Association endpoint pages, fetched concurrently.
+                assoc_url = f"{base_url}entity/Tearsheet/{tearsheet_id}/jobOrders"
+                pages = self._fetch_pages_concurrently(
+                    assoc_url, {'fields': 'id'}, assoc_starts, rest_token, timeout=60,
+                    label=f"Tearsheet {tearsheet_id} Entity",
+                )
+                return {job.get('id') for page in pages for job in page if job.get('id')}
             
-            while True:
-                # Make API request using search endpoint
-                url = f"{self.base_url}search/JobOrder"
+            def _search_pass():
+                # First page gives `total`; remaining pages go out concurrently.
+                url = f"{base_url}search/JobOrder"
                 params = {
                     'query': query,
                     'fields': ','.join(fields),
                     'sort': '-dateLastModified',
-                    'start': start,
-                    'count': count,
-                    'BhRestToken': self.rest_token
                 }
+                first = self._get_page(self.session, url, params, 0, rest_token, timeout=30)
+                if first is None:
+                    return []
+                jobs_data = first.get('data', [])
+                total = first.get('total', 0)
+                if len(jobs_data) < TEARSHEET_PAGE_SIZE or len(jobs_data) >= total:
+                    return list(jobs_data)
+                starts = list(range(TEARSHEET_PAGE_SIZE, total, TEARSHEET_PAGE_SIZE))
+                pages = self._fetch_pages_concurrently(
+                    url, params, starts, rest_token, timeout=30,
+                    label=f"Tearsheet {tearsheet_id} Search",
+                )
+                return [job for page in [jobs_data] + pages for job in page]
+            
+            if assoc_starts:
+                # Entity and Search passes are independent; run them side by side.
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    entity_future = executor.submit(_entity_pass)
+                    all_jobs = _search_pass()
+                    entity_job_ids.update(entity_future.result())
                 
-                response = self.session.get(url, params=params, timeout=30)
-                
-                if response.status_code == 200:
-                    data = self._safe_json_parse(response)
-                    jobs_data = data.get('data', [])
-                    total = data.get('total', 0)
-                    
-                    # Add jobs from this page
-                    all_jobs.extend(jobs_data)
-                    
-                    # Check if we need to fetch more pages
-                    if len(jobs_data) < count or len(all_jobs) >= total:
-                        break
-                    
-                    start += count
+                # Safeguard: Abort orphan filtering if we didn't collect all Entity IDs
+                if len(entity_job_ids) < entity_total:
+                    logger.error(f"Tearsheet {tearsheet_id}: Entity pagination incomplete! Collected {len(entity_job_ids)} IDs but Entity API reports {entity_total}. Aborting orphan filtering to prevent data loss.")
+                    entity_job_ids = set()  # Clear IDs to disable orphan filtering
                 else:
-                    logger.error(f"Failed to get tearsheet jobs: {response.status_code} - {response.text}")
-                    break
+                    entity_membership_complete = True
+            else:
+                all_jobs = _search_pass()
+            
             # Apply job exclusion filter
             filtered_jobs = self._filter_excluded_jobs(all_jobs)
 
@@ -266,6 +264,86 @@ class JobsMixin:
         except Exception as e:
             logger.error(f"Error getting tearsheet jobs: {str(e)}")
             return []
+
+    def _new_page_session(self) -> requests.Session:
+        """Fresh session for a pagination worker (requests.Session is not thread-safe)."""
+        session = requests.Session()
+        session.headers.update(self.session.headers)
+        session.hooks['response'] = list(self.session.hooks['response'])
+        return session
+
+    def worker_clone(self):
+        """Copy of this service, with its own session, for another thread.
+
+        The copy keeps the credentials and the adopted broker session, so it
+        needs no login of its own; a 401 on it re-authenticates through the
+        broker like any other instance.
+        """
+        clone = copy.copy(self)
+        clone.session = requests.Session()
+        clone.session.headers.update(self.session.headers)
+        clone.session.hooks['response'] = [clone._record_session_use]
+        return clone
+
+    def _get_page(self, session, url: str, params: Dict, start: int,
+                  rest_token: str, timeout: int) -> Optional[Dict]:
+        """GET one page (start/count) with per-page retry. None after the last failure."""
+        page_params = dict(params, start=start, count=TEARSHEET_PAGE_SIZE, BhRestToken=rest_token)
+        for attempt in range(1, TEARSHEET_PAGE_ATTEMPTS + 1):
+            try:
+                response = session.get(url, params=page_params, timeout=timeout)
+                if response.status_code == 200:
+                    return self._safe_json_parse(response)
+                logger.warning(f"Page start={start} of {url} failed: {response.status_code} (attempt {attempt}/{TEARSHEET_PAGE_ATTEMPTS})")
+            except Exception as e:
+                logger.warning(f"Page start={start} of {url} errored: {str(e)} (attempt {attempt}/{TEARSHEET_PAGE_ATTEMPTS})")
+            if attempt < TEARSHEET_PAGE_ATTEMPTS:
+                time.sleep(TEARSHEET_PAGE_RETRY_DELAY * attempt)
+        return None
+
+    def _fetch_pages_concurrently(self, url: str, params: Dict, starts: List[int],
+                                  rest_token: str, timeout: int, label: str) -> List[List[Dict]]:
+        """Fetch pages at ``starts`` in parallel, each worker on its own session.
+
+        ``url`` and ``rest_token`` are read by the caller before the workers
+        start, so a re-auth elsewhere on this instance can't change them mid-pass.
+
+        Returns page data lists in ``start`` order, truncated at the first page
+        that still failed after retries or came back empty — the same
+        contiguous prefix a serial loop would have produced.
+        """
+        if not starts:
+            return []
+        local = threading.local()
+        sessions = []
+        sessions_lock = threading.Lock()
+
+        def _fetch(start):
+            session = getattr(local, 'session', None)
+            if session is None:
+                session = local.session = self._new_page_session()
+                with sessions_lock:
+                    sessions.append(session)
+            return self._get_page(session, url, params, start, rest_token, timeout)
+
+        workers = min(TEARSHEET_PAGE_WORKERS, len(starts))
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(_fetch, starts))
+        finally:
+            for session in sessions:
+                session.close()
+
+        pages = []
+        for start, data in zip(starts, results):
+            page = (data or {}).get('data', []) if data is not None else None
+            if not page:
+                if data is None:
+                    logger.warning(f"{label}: page start={start} failed after {TEARSHEET_PAGE_ATTEMPTS} attempt(s); stopping pagination there")
+                break
+            pages.append(page)
+        return pages
+
     def get_jobs_by_query(self, query: str) -> List[Dict]:
         """
         Get jobs using a custom search query with proper pagination
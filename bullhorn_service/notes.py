@@ -8,6 +8,8 @@ from urllib.parse import urlencode
 
 import requests  # noqa: F401  (used by methods via self.session)
 
+from bullhorn_service.notes_cache import candidate_notes_cache
+
 logger = logging.getLogger(__name__)
 
 
@@ -138,6 +140,7 @@ class NotesMixin:
                     data = self._safe_json_parse(response)
                     note_id = data.get('changedEntityId')
                     logger.info(f"✅ Created note {note_id} on candidate {candidate_id} using '{approach_name}' approach")
+                    candidate_notes_cache.invalidate(self.base_url, candidate_id)
                     return note_id
                 elif response.status_code == 401:
                     # Token expired, re-authenticate and retry this approach
@@ -151,6 +154,7 @@ class NotesMixin:
                             data = self._safe_json_parse(response)
                             note_id = data.get('changedEntityId')
                             logger.info(f"✅ Created note {note_id} on candidate {candidate_id} using '{approach_name}' after re-auth")
+                            candidate_notes_cache.invalidate(self.base_url, candidate_id)
                             return note_id
                     else:
                         # Re-auth failed - abort all attempts
@@ -0,0 +1,108 @@
+"""Short-lived cache of candidate Notes shared by the screening gates.
+
+The recruiter-decision and recruiter-activity gates in ``screening.dedup`` and
+owner reassignment's first-human-interactor lookup each read the same
+``entity/Candidate/{id}?fields=notes(...)`` association — one candidate could
+cost three identical note fetches per cycle. They now read one superset field
+list through this cache:
+
+    notes = candidate_notes_cache.get(base_url, candidate_id)
+    if notes is None:
+        ...fetch with CANDIDATE_NOTES_FIELDS...
+        notes = parse_candidate_notes(body)
+        candidate_notes_cache.put(base_url, candidate_id, notes)
+
+Entries live for ``NOTES_CACHE_TTL_SECONDS`` (about one cycle) and are
+dropped as soon as we write a note on the candidate. Failed fetches are never
+cached, so each caller keeps its own retry / fail-open behaviour.
+"""
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+NOTES_CACHE_TTL_SECONDS = float(os.environ.get('BULLHORN_NOTES_CACHE_TTL_SECONDS', '120'))
+NOTES_CACHE_MAX_ENTRIES = 5000
+
+# Union of the fields every cached reader needs.
+CANDIDATE_NOTES_FIELDS = 'notes(id,dateAdded,action,commentingPerson(id,firstName,lastName))'
+
+
+def parse_candidate_notes(body: Any) -> List[Dict]:
+    """Extract the notes list from an ``entity/Candidate`` response body.
+
+    Bullhorn returns to-many associations either wrapped
+    (``{'data': [...], 'total': N}``) or as a bare list. Anything malformed
+    is treated as "no notes" and non-dict items are dropped.
+    """
+    candidate_data = body.get('data') if isinstance(body, dict) else None
+    if not isinstance(candidate_data, dict):
+        return []
+    notes_assoc = candidate_data.get('notes')
+    if isinstance(notes_assoc, dict):
+        notes_raw = notes_assoc.get('data')
+    elif isinstance(notes_assoc, list):
+        notes_raw = notes_assoc
+    else:
+        notes_raw = []
+    if not isinstance(notes_raw, list):
+        return []
+    return [n for n in notes_raw if isinstance(n, dict)]
+
+
+class CandidateNotesCache:
+    """TTL cache of parsed candidate notes, keyed by (REST base URL, candidate ID)."""
+
+    def __init__(self, ttl: float = NOTES_CACHE_TTL_SECONDS):
+        self.ttl = ttl
+        self._entries: Dict[Tuple[Any, int], Tuple[float, List[Dict]]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(base_url, candidate_id) -> Tuple[Any, int]:
+        return (base_url, int(candidate_id))
+
+    def get(self, base_url, candidate_id) -> Optional[List[Dict]]:
+        """Cached notes, or None when absent or expired."""
+        key = self._key(base_url, candidate_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[0] < self.ttl:
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, base_url, candidate_id, notes: List[Dict]):
+        with self._lock:
+            if len(self._entries) >= NOTES_CACHE_MAX_ENTRIES:
+                self._prune()
+            self._entries[self._key(base_url, candidate_id)] = (time.monotonic(), notes)
+
+    def invalidate(self, base_url, candidate_id):
+        """Drop one candidate's notes (call after writing a note on it)."""
+        with self._lock:
+            self._entries.pop(self._key(base_url, candidate_id), None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def _prune(self):
+        cutoff = time.monotonic() - self.ttl
+        expired = [k for k, (at, _) in self._entries.items() if at < cutoff]
+        for k in expired:
+            del self._entries[k]
+        if len(self._entries) >= NOTES_CACHE_MAX_ENTRIES:
+            # Still full of live entries: drop the oldest half.
+            oldest = sorted(self._entries, key=lambda k: self._entries[k][0])
+            for k in oldest[:len(oldest) // 2]:
+                del self._entries[k]
+
+
+candidate_notes_cache = CandidateNotesCache()
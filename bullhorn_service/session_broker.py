@@ -0,0 +1,199 @@
+"""Process-wide Bullhorn REST session broker.
+
+Every ``BullhornService`` instance used to log in on its own. A new REST login
+invalidates the BhRestToken previously issued to the same API user, so
+parallel scheduler jobs (tearsheet monitor, vetting, dedup, owner
+reassignment) knocked each other's sessions out and then all re-logged in on
+the resulting 401s.
+
+The broker owns one session per credential set for the whole process:
+
+    * ``authenticate()`` adopts the shared session instead of logging in.
+    * Logins are single-flight: concurrent callers wait on the one in
+      progress and pick up its result.
+    * A 401 only discards the session if it is still the one the caller was
+      rejected with — a burst of 401s on the same token triggers one login.
+    * Sessions are refreshed ahead of expiry: before the REST session idles
+      out and after a maximum age. Every successful REST response on the
+      shared token counts as use, so a busy session never looks idle.
+    * A failed login backs off briefly so a Bullhorn outage doesn't turn
+      into a login storm.
+"""
+import logging
+import os
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Bullhorn expires an idle REST session after ~10 minutes; refresh before that.
+IDLE_REFRESH_SECONDS = float(os.environ.get('BULLHORN_SESSION_IDLE_REFRESH_SECONDS', '480'))
+MAX_AGE_SECONDS = float(os.environ.get('BULLHORN_SESSION_MAX_AGE_SECONDS', '3000'))
+FAILED_LOGIN_BACKOFF_SECONDS = float(os.environ.get('BULLHORN_LOGIN_BACKOFF_SECONDS', '5'))
+
+SessionKey = Tuple[bool, Optional[str], Optional[str]]
+
+
+class BullhornSession:
+    """One REST session shared by every service using the same credentials."""
+
+    __slots__ = ('rest_token', 'base_url', 'user_id', 'access_token',
+                 'generation', 'obtained_at', 'last_used')
+
+    def __init__(self, rest_token, base_url, user_id, access_token, generation):
+        self.rest_token = rest_token
+        self.base_url = base_url
+        self.user_id = user_id
+        self.access_token = access_token
+        self.generation = generation
+        self.obtained_at = self.last_used = time.monotonic()
+
+
+class _Slot:
+    __slots__ = ('lock', 'session', 'generation', 'failed_at', 'logins')
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.session: Optional[BullhornSession] = None
+        self.generation = 0
+        self.failed_at: Optional[float] = None
+        self.logins = 0
+
+
+class BullhornSessionBroker:
+    """Owns the BhRestToken / REST URL per credential set for this process."""
+
+    def __init__(self):
+        self._slots: Dict[SessionKey, _Slot] = {}
+        self._slots_lock = threading.Lock()
+
+    @staticmethod
+    def key_for(service) -> SessionKey:
+        return (bool(getattr(service, 'use_bullhorn_one', False)),
+                getattr(service, 'client_id', None),
+                getattr(service, 'username', None))
+
+    def _slot(self, key: SessionKey) -> _Slot:
+        slot = self._slots.get(key)
+        if slot is None:
+            with self._slots_lock:
+                slot = self._slots.setdefault(key, _Slot())
+        return slot
+
+    @staticmethod
+    def is_due(session: BullhornSession, now: Optional[float] = None) -> bool:
+        """True once the session should be refreshed rather than reused."""
+        now = time.monotonic() if now is None else now
+        return (now - session.last_used >= IDLE_REFRESH_SECONDS
+                or now - session.obtained_at >= MAX_AGE_SECONDS)
+
+    def peek(self, key: SessionKey) -> Optional[BullhornSession]:
+        slot = self._slots.get(key)
+        return slot.session if slot is not None else None
+
+    def acquire(self, service, rejected_token: Optional[str] = None) -> bool:
+        """Give ``service`` a usable session, logging in only if required.
+
+        ``rejected_token`` is the token the caller just got a 401 with; the
+        shared session is dropped only if it still holds that token.
+        Returns False when no session could be obtained.
+        """
+        slot = self._slot(self.key_for(service))
+        with slot.lock:
+            now = time.monotonic()
+            session = slot.session
+            if session is not None and rejected_token and session.rest_token == rejected_token:
+                logger.info("Bullhorn session rejected (401) — discarding shared token")
+                slot.session = session = None
+
+            if session is not None and not self.is_due(session, now):
+                session.last_used = now
+                self._adopt(service, session)
+                return True
+
+            if slot.failed_at is not None and now - slot.failed_at < FAILED_LOGIN_BACKOFF_SECONDS:
+                logger.warning(
+                    f"Bullhorn login failed {now - slot.failed_at:.1f}s ago, "
+                    f"not retrying yet")
+                return self._fallback(service, session)
+
+            if session is not None:
+                logger.info("Refreshing shared Bullhorn session ahead of expiry")
+            service.rest_token = None
+            service.base_url = None
+            try:
+                ok = service._direct_login()
+            except Exception as e:
+                logger.error(f"Bullhorn authentication failed: {str(e)}")
+                ok = False
+            if not ok:
+                slot.failed_at = time.monotonic()
+                return self._fallback(service, session)
+
+            slot.failed_at = None
+            slot.logins += 1
+            if service.rest_token and service.base_url:
+                slot.generation += 1
+                slot.session = BullhornSession(
+                    service.rest_token, service.base_url,
+                    getattr(service, 'user_id', None),
+                    getattr(service, 'access_token', None),
+                    slot.generation,
+                )
+                self._adopt(service, slot.session)
+            return True
+
+    def _fallback(self, service, session: Optional[BullhornSession]) -> bool:
+        # A refresh-ahead that failed still leaves a session that was valid a
+        # moment ago; keep using it until Bullhorn actually rejects it.
+        if session is not None:
+            self._adopt(service, session)
+            return True
+        return False
+
+    @staticmethod
+    def _adopt(service, session: BullhornSession):
+        service.rest_token = session.rest_token
+        service.base_url = session.base_url
+        service.user_id = session.user_id
+        service.access_token = session.access_token
+        service._session_generation = session.generation
+        service._session_token = session.rest_token
+
+    def touch(self, key: SessionKey, token: Optional[str] = None):
+        """Mark the shared session as used (only if it still holds ``token``)."""
+        session = self.peek(key)
+        if session is not None and (token is None or session.rest_token == token):
+            session.last_used = time.monotonic()
+
+    def stats(self) -> Dict[str, dict]:
+        """Per-credential-set session summary (no secrets) for diagnostics."""
+        now = time.monotonic()
+        out = {}
+        for (bh_one, client_id, username), slot in list(self._slots.items()):
+            session = slot.session
+            out[f"{'one' if bh_one else 'legacy'}:{username}"] = {
+                'has_session': session is not None,
+                'generation': slot.generation,
+                'logins': slot.logins,
+                'age_seconds': round(now - session.obtained_at, 1) if session else None,
+                'idle_seconds': round(now - session.last_used, 1) if session else None,
+            }
+        return out
+
+    def reset(self):
+        """Forget every session (tests, and the child side of a fork)."""
+        with self._slots_lock:
+            self._slots = {}
+
+
+_BROKER = BullhornSessionBroker()
+
+if hasattr(os, 'register_at_fork'):
+    # Locks held mid-login must not leak into a forked worker.
+    os.register_at_fork(after_in_child=_BROKER.reset)
+
+
+def get_session_broker() -> BullhornSessionBroker:
+    return _BROKER
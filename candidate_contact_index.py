@@ -0,0 +1,208 @@
+"""
+Candidate Contact Index — local email / phone → candidate lookup for dedup.
+
+The duplicate-merge bulk scan used to issue an email search and a phone search
+against Bullhorn for every candidate in the database, sleeping between calls
+to stay under the rate limit — hours of throttled HTTP for a full scan.
+
+Instead, every candidate pull the merge service already makes (bulk-scan
+pages, the scheduled recent-window search) feeds the ``candidate_contact_key``
+table with that candidate's normalised contact keys:
+
+    * emails (email / email2 / email3), trimmed and lower-cased
+    * phones (phone / mobile) in E.164 form
+
+Candidates that share a key are then found with one grouped, indexed
+self-join (``find_shared_contact_pairs``) and Bullhorn is only asked to
+confirm those records. Keys shared by more than ``MAX_SHARED_GROUP_SIZE``
+candidates (placeholder addresses, office switchboards) are ignored rather
+than exploding into every pairwise combination.
+"""
+
+import logging
+import re
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import and_, func
+from sqlalchemy.orm import aliased
+
+from extensions import db
+
+logger = logging.getLogger(__name__)
+
+EMAIL_FIELDS = ('email', 'email2', 'email3')
+PHONE_FIELDS = ('phone', 'mobile')
+
+# Matches the legacy matcher's rule: anything shorter than a full national
+# number is too ambiguous to treat as an identity key.
+MIN_PHONE_DIGITS = 10
+MAX_PHONE_DIGITS = 15
+
+MAX_SHARED_GROUP_SIZE = 10
+_DELETE_CHUNK = 500
+
+
+def normalize_email(raw) -> Optional[str]:
+    email = (raw or '').strip().lower() if isinstance(raw, str) else ''
+    if '@' not in email or len(email) > 255:
+        return None
+    return email
+
+
+def normalize_phone(raw) -> Optional[str]:
+    """E.164 form of a phone number, or None when it isn't one.
+
+    Bullhorn stores phones free-form. Ten-digit numbers are North American
+    (the bulk of the database) and get ``+1``; an 11-digit number starting
+    with 1 is the same number with its country code. Anything else between
+    10 and 15 digits is taken to already carry its country code (a leading
+    ``00`` international prefix is dropped).
+    """
+    if not isinstance(raw, str):
+        return None
+    digits = re.sub(r'\D', '', raw)
+    if raw.strip().startswith('00'):
+        digits = digits[2:]
+    if len(digits) == 10:
+        return f'+1{digits}'
+    if MIN_PHONE_DIGITS <= len(digits) <= MAX_PHONE_DIGITS:
+        return f'+{digits}'
+    return None
+
+
+def contact_keys(candidate: dict) -> Set[Tuple[str, str]]:
+    """Every ``(kind, value)`` identity key on a Bullhorn candidate record."""
+    keys = set()
+    for field in EMAIL_FIELDS:
+        email = normalize_email(candidate.get(field))
+        if email:
+            keys.add(('email', email))
+    for field in PHONE_FIELDS:
+        phone = normalize_phone(candidate.get(field))
+        if phone:
+            keys.add(('phone', phone))
+    return keys
+
+
+def _delete_keys_for(candidate_ids: List[int]):
+    from models import CandidateContactKey
+    for i in range(0, len(candidate_ids), _DELETE_CHUNK):
+        CandidateContactKey.query.filter(
+            CandidateContactKey.bullhorn_candidate_id.in_(candidate_ids[i:i + _DELETE_CHUNK])
+        ).delete(synchronize_session=False)
+
+
+def index_candidates(candidates: Iterable[dict], seen_at: Optional[datetime] = None) -> int:
+    """Replace the indexed keys of each candidate with its current ones.
+
+    Archived / deleted records are dropped from the index. Returns the
+    number of key rows written; commits.
+    """
+    from models import CandidateContactKey
+
+    seen_at = seen_at or datetime.utcnow()
+    ids = []
+    rows = []
+    for candidate in candidates:
+        cid = candidate.get('id')
+        if not cid:
+            continue
+        ids.append(int(cid))
+        if (candidate.get('status') or '').lower() == 'archive' or candidate.get('isDeleted'):
+            continue
+        for kind, value in contact_keys(candidate):
+            rows.append({
+                'bullhorn_candidate_id': int(cid),
+                'kind': kind,
+                'value': value,
+                'seen_at': seen_at,
+            })
+    if not ids:
+        return 0
+    try:
+        _delete_keys_for(ids)
+        if rows:
+            db.session.bulk_insert_mappings(CandidateContactKey, rows)
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+    return len(rows)
+
+
+def remove_candidates(candidate_ids: Iterable[int]):
+    """Drop every key for these candidates (merged away / archived); commits."""
+    ids = [int(c) for c in candidate_ids if c]
+    if not ids:
+        return
+    try:
+        _delete_keys_for(ids)
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+
+
+def prune_unseen(before: datetime) -> int:
+    """Delete keys not refreshed since ``before``; commits.
+
+    Only safe after a pull that covered the whole database — a candidate that
+    stopped appearing has been archived or deleted in Bullhorn.
+    """
+    from models import CandidateContactKey
+    try:
+        removed = CandidateContactKey.query.filter(
+            CandidateContactKey.seen_at < before
+        ).delete(synchronize_session=False)
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+    return removed
+
+
+def find_shared_contact_pairs(max_group_size: int = MAX_SHARED_GROUP_SIZE) -> Dict[int, Set[int]]:
+    """Candidates sharing at least one contact key, as ``{lower_id: {higher_ids}}``.
+
+    One query: the keys held by 2..``max_group_size`` distinct candidates,
+    self-joined back onto the index to produce each candidate pair once.
+    """
+    from models import CandidateContactKey as K
+
+    shared = (
+        db.session.query(K.kind.label('kind'), K.value.label('value'))
+        .group_by(K.kind, K.value)
+        .having(func.count(func.distinct(K.bullhorn_candidate_id)).between(2, max_group_size))
+        .subquery()
+    )
+    a = aliased(K)
+    b = aliased(K)
+    rows = (
+        db.session.query(a.bullhorn_candidate_id, b.bullhorn_candidate_id)
+        .join(shared, and_(a.kind == shared.c.kind, a.value == shared.c.value))
+        .join(b, and_(
+            b.kind == a.kind,
+            b.value == a.value,
+            b.bullhorn_candidate_id > a.bullhorn_candidate_id,
+        ))
+        .distinct()
+        .all()
+    )
+    pairs: Dict[int, Set[int]] = defaultdict(set)
+    for low, high in rows:
+        pairs[low].add(high)
+    return dict(pairs)
+
+
+def oversized_key_count(max_group_size: int = MAX_SHARED_GROUP_SIZE) -> int:
+    """How many keys are shared too widely to be matched on (for the scan log)."""
+    from models import CandidateContactKey as K
+    oversized = (
+        db.session.query(K.kind, K.value)
+        .group_by(K.kind, K.value)
+        .having(func.count(func.distinct(K.bullhorn_candidate_id)) > max_group_size)
+        .subquery()
+    )
+    return db.session.query(func.count()).select_from(oversized).scalar() or 0
@@ -8,6 +8,7 @@ from datetime import datetime
 from typing import Optional
 
 from openai import OpenAI
+from services.openai_governor import shared_http_client
 
 from app import db
 from models import VettingConfig, GlobalSettings, JobVettingRequirements
@@ -24,7 +25,7 @@ class VettingConfigMixin:
         """Initialize OpenAI client"""
         api_key = os.environ.get('OPENAI_API_KEY')
         if api_key:
-            self.openai_client = OpenAI(api_key=api_key)
+            self.openai_client = OpenAI(api_key=api_key, http_client=shared_http_client())
         else:
             logger.warning("OPENAI_API_KEY not found - AI matching will not work")
 
@@ -61,8 +62,7 @@ class VettingConfigMixin:
             logger.debug(f"Env-credential resolution skipped (fail-soft to global): {e}")
 
         bh_keys = ['bullhorn_client_id', 'bullhorn_client_secret', 'bullhorn_username', 'bullhorn_password']
-        rows = GlobalSettings.query.filter(GlobalSettings.setting_key.in_(bh_keys)).all()
-        raw = {r.setting_key: r.setting_value for r in rows if r.setting_value}
+        raw = {k: v for k, v in GlobalSettings.settings.get_many(bh_keys).items() if v}
         credentials = {k.replace('bullhorn_', ''): raw[k] for k in bh_keys if k in raw}
 
         if len(credentials) == 4:
@@ -150,8 +150,7 @@ class VettingConfigMixin:
         if key in overrides:
             value = overrides[key]
             return value if value is None else str(value)
-        config = VettingConfig.query.filter_by(setting_key=key).first()
-        return config.setting_value if config else default
+        return VettingConfig.settings.get(key, default)
 
     def is_enabled(self) -> bool:
         """Check if vetting is enabled"""
@@ -348,10 +347,7 @@ class VettingConfigMixin:
     def _get_global_custom_requirements(self) -> Optional[str]:
         """Get global screening instructions that apply to ALL jobs."""
         try:
-            config = VettingConfig.query.filter_by(setting_key='global_custom_requirements').first()
-            if config and config.setting_value and config.setting_value.strip():
-                return config.setting_value.strip()
-            return None
+            return VettingConfig.settings.get_str('global_custom_requirements') or None
         except Exception as e:
             logger.error(f"Error getting global custom requirements: {str(e)}")
             return None
@@ -379,20 +375,11 @@ class VettingConfigMixin:
     def _get_admin_notification_email(self) -> str:
         """Get the admin notification email from VettingConfig."""
         try:
-            config = VettingConfig.query.filter_by(setting_key='admin_notification_email').first()
-            if config and config.setting_value:
-                return config.setting_value.strip()
+            return VettingConfig.settings.get_str('admin_notification_email')
         except Exception:
             pass
         return ''
 
     def _get_batch_size(self) -> int:
         """Get configured batch size from database, default 25"""
-        try:
-            config = VettingConfig.query.filter_by(setting_key='batch_size').first()
-            if config and config.setting_value:
-                batch = int(config.setting_value)
-                return max(1, min(batch, 100))
-        except (ValueError, TypeError):
-            pass
-        return 25
+        return VettingConfig.settings.get_int('batch_size', 25, minimum=1, maximum=100)
@@ -289,6 +289,14 @@ class VettingCycleMixin:
             elif type(self)._consecutive_quota_errors == 0:
                 type(self)._quota_alert_sent = False
 
+            try:
+                from services.openai_governor import get_openai_governor
+                governor_stats = get_openai_governor().stats()
+                if governor_stats:
+                    logger.info(f"🚦 OpenAI governor: {governor_stats}")
+            except Exception:
+                pass
+
             logger.info(f"✅ Vetting cycle complete: {summary}")
             return summary
 
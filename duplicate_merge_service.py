@@ -4,6 +4,14 @@ import time
 from datetime import datetime, timedelta
 from collections import defaultdict
 from extensions import db
+from candidate_contact_index import (
+    find_shared_contact_pairs,
+    index_candidates,
+    normalize_phone,
+    oversized_key_count,
+    prune_unseen,
+    remove_candidates,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +23,12 @@ RECENT_WINDOW_HOURS = 2
 # Long-tail candidates ride to the next cycle.
 FUZZY_MAX_CANDIDATES_PER_CYCLE = 100
 
+# Bulk scan: pause between candidate pages. Matching now happens in SQL, so
+# paging is the only sustained Bullhorn load the scan generates.
+BULK_PAGE_DELAY_SECONDS = 1.0
+CONFIRM_FIELDS = ('id,firstName,lastName,email,email2,email3,phone,mobile,dateAdded,'
+                  'status,isDeleted,owner(id,firstName,lastName)')
+
 
 class DuplicateMergeService:
     def __init__(self):
@@ -527,7 +541,11 @@ class DuplicateMergeService:
         self._add_merge_note(primary_id, duplicate_id, is_primary=True, original_dates=original_dates, transferred=transferred)
         self._add_merge_note(duplicate_id, primary_id, is_primary=False)
 
-        self._archive_duplicate(duplicate_id)
+        if self._archive_duplicate(duplicate_id):
+            try:
+                remove_candidates([duplicate_id])
+            except Exception as e:
+                logger.warning(f"  Could not drop {duplicate_id} from contact index: {e}")
 
         # Safety net for the active-placement edge: if the survivor still ended
         # up owned by an API user (or unowned) while the archived duplicate was
@@ -616,13 +634,10 @@ class DuplicateMergeService:
                 return 1.0, 'email'
             return 0.95, 'email_secondary'
 
-        phone_a_digits = ''.join(filter(str.isdigit, candidate_a.get('phone') or ''))
-        mobile_a_digits = ''.join(filter(str.isdigit, candidate_a.get('mobile') or ''))
-        phone_b_digits = ''.join(filter(str.isdigit, candidate_b.get('phone') or ''))
-        mobile_b_digits = ''.join(filter(str.isdigit, candidate_b.get('mobile') or ''))
-
-        phones_a = {p for p in [phone_a_digits, mobile_a_digits] if len(p) >= 10}
-        phones_b = {p for p in [phone_b_digits, mobile_b_digits] if len(p) >= 10}
+        # E.164 so '(555) 123-4567' and '+1 555 123 4567' compare equal —
+        # the same normalisation the contact index groups on.
+        phones_a = {p for p in (normalize_phone(candidate_a.get(f)) for f in ('phone', 'mobile')) if p}
+        phones_b = {p for p in (normalize_phone(candidate_b.get(f)) for f in ('phone', 'mobile')) if p}
         if phones_a & phones_b:
             if self._names_match(candidate_a, candidate_b):
                 return 0.90, 'phone+name'
@@ -635,6 +650,11 @@ class DuplicateMergeService:
         return 0.0, 'none'
 
     def _search_all_candidates_batch(self, start=0, count=BATCH_SIZE):
+        """One page of active candidates sorted by id.
+
+        Returns an empty list past the last page and None when the page
+        could not be fetched, so callers can tell end-of-data from errors.
+        """
         MAX_AUTH_RETRIES = 3
         for attempt in range(MAX_AUTH_RETRIES + 1):
             try:
@@ -675,7 +695,7 @@ class DuplicateMergeService:
             except Exception as e:
                 logger.error(f"Error fetching candidate batch at start={start}: {e}", exc_info=True)
                 break
-        return []
+        return None
 
     def _search_recent_candidates(self, hours=RECENT_WINDOW_HOURS):
         try:
@@ -777,13 +797,52 @@ class DuplicateMergeService:
 
         return matches
 
+    def _index_candidates(self, candidates, seen_at=None):
+        """Feed a candidate pull into the contact index; never fails the caller."""
+        if not candidates:
+            return
+        try:
+            index_candidates(candidates, seen_at=seen_at)
+        except Exception as e:
+            logger.warning(f"Contact index update failed for {len(candidates)} candidate(s): {e}")
+
+    def _fetch_confirmed_candidates(self, candidate_ids):
+        """Current Bullhorn records for index-matched candidates.
+
+        Records that are now archived or deleted are dropped from the index
+        and left out; IDs Bullhorn did not return are simply absent.
+        """
+        records = self.bullhorn.get_entities('Candidate', candidate_ids, fields=CONFIRM_FIELDS)
+        live, gone = {}, []
+        for cid, record in records.items():
+            if (record.get('status') or '').lower() == 'archive' or record.get('isDeleted'):
+                gone.append(cid)
+            else:
+                live[cid] = record
+        if gone:
+            try:
+                remove_candidates(gone)
+            except Exception as e:
+                logger.warning(f"Could not drop {len(gone)} archived candidate(s) from contact index: {e}")
+        self._index_candidates(list(live.values()))
+        return live
+
     def run_bulk_scan(self, progress_callback=None):
+        """Full-database duplicate scan driven by the local contact index.
+
+        Phase 1 pages through every active candidate (one search per
+        ``BATCH_SIZE`` records) and refreshes ``candidate_contact_key``.
+        Phase 2 finds candidates sharing a normalised email / phone with one
+        SQL self-join, fetches only those records from Bullhorn to confirm
+        them, and merges exactly as before.
+        """
         from models import CandidateMergeLog
 
         self._ensure_auth()
 
         stats = {
             'candidates_scanned': 0,
+            'index_pairs': 0,
             'duplicates_found': 0,
             'merged': 0,
             'skipped_below_threshold': 0,
@@ -800,8 +859,10 @@ class DuplicateMergeService:
         for log in existing_logs:
             already_merged.add(log.duplicate_candidate_id)
 
+        # ── Phase 1: refresh the contact index ────────────────────────────
+        scan_started = datetime.utcnow()
+        pull_complete = False
         start = 0
-        batch_count = 0
         last_auth_time = time.time()
         TOKEN_REFRESH_INTERVAL = 300
         while True:
@@ -818,74 +879,118 @@ class DuplicateMergeService:
                     break
 
             batch = self._search_all_candidates_batch(start=start, count=BATCH_SIZE)
+            if batch is None:
+                logger.warning(f"⚠️ Bulk scan: candidate pull aborted at start={start}")
+                stats['errors'] += 1
+                break
             if not batch:
+                # An empty page right after a full one is the end of the data
+                # (exact multiple of BATCH_SIZE); an empty first page is not
+                # trusted to prune the whole index.
+                pull_complete = start > 0
                 break
 
             stats['candidates_scanned'] += len(batch)
+            self._index_candidates(batch, seen_at=scan_started)
 
-            for candidate in batch:
-                cid = candidate.get('id')
-                if cid in processed_ids or cid in already_merged:
-                    continue
+            if progress_callback:
+                progress_callback(stats)
 
-                matches = self._find_matches_for_candidate(candidate)
-                if not matches:
-                    continue
+            start += len(batch)
+            logger.info(f"📊 Bulk scan progress: indexed={stats['candidates_scanned']}")
 
-                for match in matches:
-                    mid = match.get('id')
-                    if mid in processed_ids or mid in already_merged:
-                        continue
+            if len(batch) < BATCH_SIZE:
+                pull_complete = True
+                break
 
-                    confidence, match_field = self._compute_match_confidence(candidate, match)
+            time.sleep(BULK_PAGE_DELAY_SECONDS)
 
-                    if confidence < CONFIDENCE_THRESHOLD:
-                        stats['skipped_below_threshold'] += 1
-                        continue
+        # Only a pull that reached the last page proves absent candidates
+        # are gone; an aborted one must not prune the rest of the index.
+        if pull_complete:
+            try:
+                pruned = prune_unseen(scan_started)
+                if pruned:
+                    logger.info(f"🧹 Bulk scan: pruned {pruned} contact key(s) for candidates no longer active")
+            except Exception as e:
+                logger.warning(f"Contact index prune failed: {e}")
 
-                    stats['duplicates_found'] += 1
+        # ── Phase 2: match on the index, confirm with Bullhorn ────────────
+        try:
+            pairs = find_shared_contact_pairs()
+            oversized = oversized_key_count()
+        except Exception as e:
+            logger.error(f"Contact index match query failed: {e}", exc_info=True)
+            stats['errors'] += 1
+            pairs, oversized = {}, 0
+        stats['index_pairs'] = sum(len(partners) for partners in pairs.values())
+        logger.info(
+            f"🔍 Bulk scan: contact index matched {stats['index_pairs']} candidate pair(s)"
+            + (f" ({oversized} over-shared key(s) ignored)" if oversized else "")
+        )
 
-                    primary, duplicate, reason = self.determine_primary(candidate, match)
+        matched_ids = set(pairs)
+        for partners in pairs.values():
+            matched_ids.update(partners)
+        records = self._fetch_confirmed_candidates(sorted(matched_ids)) if matched_ids else {}
 
-                    if primary is None:
-                        logger.warning(f"⚠️ SKIP: Both candidates {cid} and {mid} have active placements")
-                        self._log_skip(candidate, match, confidence, match_field,
-                                       "Both records have active placements", merge_type='bulk',
-                                       match_type='exact')
-                        stats['skipped_both_placements'] += 1
-                        continue
+        for cid in sorted(pairs):
+            candidate = records.get(cid)
+            if candidate is None or cid in processed_ids or cid in already_merged:
+                continue
+
+            for mid in sorted(pairs[cid]):
+                match = records.get(mid)
+                if match is None:
+                    continue
+                if mid in processed_ids or mid in already_merged:
+                    stats['skipped_already_processed'] += 1
+                    continue
+
+                confidence, match_field = self._compute_match_confidence(candidate, match)
+
+                if confidence < CONFIDENCE_THRESHOLD:
+                    stats['skipped_below_threshold'] += 1
+                    continue
+
+                stats['duplicates_found'] += 1
+
+                primary, duplicate, reason = self.determine_primary(candidate, match)
+
+                if primary is None:
+                    logger.warning(f"⚠️ SKIP: Both candidates {cid} and {mid} have active placements")
+                    self._log_skip(candidate, match, confidence, match_field,
+                                   "Both records have active placements", merge_type='bulk',
+                                   match_type='exact')
+                    stats['skipped_both_placements'] += 1
+                    continue
 
+                try:
+                    self.merge_candidates(primary, duplicate, confidence, match_field,
+                                          merge_type='bulk', match_type='exact')
+                    dup_id = duplicate.get('id')
+                    processed_ids.add(dup_id)
+                    already_merged.add(dup_id)
+                    stats['merged'] += 1
+                except Exception as e:
+                    logger.error(f"  ❌ Merge failed for {cid} + {mid}: {e}")
+                    stats['errors'] += 1
                     try:
-                        self.merge_candidates(primary, duplicate, confidence, match_field,
-                                              merge_type='bulk', match_type='exact')
-                        dup_id = duplicate.get('id')
-                        processed_ids.add(dup_id)
-                        already_merged.add(dup_id)
-                        stats['merged'] += 1
-                    except Exception as e:
-                        logger.error(f"  ❌ Merge failed for {cid} + {mid}: {e}")
-                        stats['errors'] += 1
-                        try:
-                            db.session.rollback()
-                        except Exception:
-                            pass
-
-                    time.sleep(1.0)
-
-                processed_ids.add(cid)
-                time.sleep(0.3)
+                        db.session.rollback()
+                    except Exception:
+                        pass
 
-            if progress_callback:
-                progress_callback(stats)
+                time.sleep(1.0)
 
-            batch_count += 1
-            start += len(batch)
-            logger.info(f"📊 Bulk scan progress: scanned={stats['candidates_scanned']}, merged={stats['merged']}, skipped_placement={stats['skipped_both_placements']}")
+                # This candidate was archived into its match — its remaining
+                # pairs belong to the survivor now.
+                if cid in already_merged:
+                    break
 
-            if len(batch) < BATCH_SIZE:
-                break
+            processed_ids.add(cid)
 
-            time.sleep(2)
+        if progress_callback:
+            progress_callback(stats)
 
         stats['completed_at'] = datetime.utcnow().isoformat()
         logger.info(f"✅ Bulk scan complete: {json.dumps(stats, indent=2)}")
@@ -922,6 +1027,8 @@ class DuplicateMergeService:
 
         recent_candidates = self._search_recent_candidates()
         stats['candidates_checked'] = len(recent_candidates)
+        # Keeps the bulk scan's contact index current between full scans.
+        self._index_candidates(recent_candidates)
 
         if not recent_candidates:
             # IMPORTANT: do NOT early-return here. A quiet hour with zero
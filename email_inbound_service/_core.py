@@ -4,6 +4,7 @@ from datetime import datetime
 from typing import Dict, Optional
 
 from openai import OpenAI
+from services.openai_governor import shared_http_client
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -89,7 +90,8 @@ class _InboundCore:
         if api_key:
             self.openai_client = OpenAI(
                 api_key=api_key,
-                timeout=60.0
+                timeout=60.0,
+                http_client=shared_http_client(),
             )
             self.logger.info("OpenAI client initialized for resume parsing (60s timeout)")
         else:
@@ -19,10 +19,15 @@ import logging
 logger = logging.getLogger(__name__)
 import math
 import os
+import threading
+import time
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 
 from openai import OpenAI
+from services.openai_governor import shared_http_client
+
+from services.vector_index import FlatVectorIndex, pack_vector, unpack_vector
 
 # Tiktoken for precise token counting (graceful fallback if unavailable)
 try:
@@ -38,6 +43,107 @@ DEFAULT_SIMILARITY_THRESHOLD = 0.25
 DEFAULT_EMBEDDING_MODEL = "text-embedding-3-large"
 EMBEDDING_DIMENSIONS = 3072
 MAX_EMBEDDING_TOKENS = 8000  # Model limit is 8192; 192-token safety buffer
+JOB_INDEX_REFRESH_SECONDS = 60  # Re-sync the in-process job matrix at most this often
+EMBEDDING_BATCH_TOKEN_BUDGET = 250_000  # Per-request input cap is 300k tokens
+EMBEDDING_BATCH_MAX_INPUTS = 512  # API accepts up to 2048 inputs per request
+
+
+class JobEmbeddingIndex(FlatVectorIndex):
+    """Process-wide, L2-normalised matrix of every cached job embedding.
+
+    Keyed by ``bullhorn_job_id`` and tagged with ``description_hash``, so a
+    Layer 1 pass scores one resume against all jobs with a single mat-vec
+    instead of one ``JobEmbedding`` query + JSON decode + Python dot product
+    per job. ``refresh_from_db`` is incremental: it reads only the
+    (job id, hash) pairs and fetches vectors for rows whose hash moved.
+    Writes made by this process land via ``upsert`` immediately; writes from
+    other workers are picked up on the next refresh.
+    """
+
+    def __init__(self, refresh_seconds: int = JOB_INDEX_REFRESH_SECONDS):
+        super().__init__(name='job_embedding')
+        self.refresh_seconds = refresh_seconds
+        self._last_refresh = 0.0
+        self._refresh_lock = threading.Lock()
+
+    def refresh_from_db(self, force: bool = False) -> int:
+        """Sync with the ``job_embedding`` table. Returns rows (re)loaded.
+
+        Fail-soft: any DB error leaves the current matrix untouched and the
+        caller falls back to per-job ``get_job_embedding``.
+        """
+        if not self.available:
+            return 0
+        if not force and time.monotonic() - self._last_refresh < self.refresh_seconds:
+            return 0
+        if not self._refresh_lock.acquire(blocking=False):
+            return 0  # another thread is already refreshing
+        try:
+            from models import JobEmbedding
+            from app import db
+
+            current = dict(
+                db.session.query(JobEmbedding.bullhorn_job_id, JobEmbedding.description_hash).all()
+            )
+            for stale_id in [k for k in list(self._row_of) if k not in current]:
+                self.remove(stale_id)
+            changed = [
+                job_id for job_id, desc_hash in current.items()
+                if not self.has_current(job_id, desc_hash)
+            ]
+            loaded = 0
+            for start in range(0, len(changed), 500):
+                chunk = changed[start:start + 500]
+                rows = (
+                    db.session.query(
+                        JobEmbedding.bullhorn_job_id,
+                        JobEmbedding.description_hash,
+                        JobEmbedding.embedding_blob,
+                        JobEmbedding.embedding_vector,
+                    )
+                    .filter(JobEmbedding.bullhorn_job_id.in_(chunk))
+                    .all()
+                )
+                for job_id, desc_hash, blob, vector_json in rows:
+                    vector = decode_job_vector(blob, vector_json)
+                    if vector and self.upsert(job_id, vector, desc_hash):
+                        loaded += 1
+            self._last_refresh = time.monotonic()
+            if loaded:
+                logger.info(f"🧮 Job embedding index: loaded {loaded} row(s), {len(self)} total")
+            return loaded
+        except Exception as e:
+            logger.warning(f"Job embedding index refresh failed: {e}")
+            return 0
+        finally:
+            self._refresh_lock.release()
+
+
+_job_index: Optional[JobEmbeddingIndex] = None
+_job_index_lock = threading.Lock()
+
+
+def get_job_embedding_index() -> JobEmbeddingIndex:
+    """Return the process-wide JobEmbeddingIndex singleton."""
+    global _job_index
+    if _job_index is None:
+        with _job_index_lock:
+            if _job_index is None:
+                _job_index = JobEmbeddingIndex()
+    return _job_index
+
+
+def decode_job_vector(blob: Optional[bytes], vector_json: Optional[str]) -> Optional[List[float]]:
+    """Prefer the packed float32 blob; fall back to the legacy JSON column."""
+    vector = unpack_vector(blob) if blob else None
+    if vector:
+        return vector
+    if vector_json:
+        try:
+            return json.loads(vector_json)
+        except (TypeError, ValueError):
+            return None
+    return None
 
 
 class EmbeddingService:
@@ -70,7 +176,7 @@ class EmbeddingService:
         """Initialize OpenAI client for embedding generation"""
         api_key = os.environ.get('OPENAI_API_KEY')
         if api_key:
-            self.openai_client = OpenAI(api_key=api_key)
+            self.openai_client = OpenAI(api_key=api_key, http_client=shared_http_client())
         else:
             logger.warning("OPENAI_API_KEY not found - embedding service will not work")
     
@@ -190,6 +296,15 @@ class EmbeddingService:
             return None
         
         try:
+            from services.openai_helper import resolve_model, log_call
+            from services.embedding_cache import get_embedding_cache
+            _model = resolve_model('embedding_service.candidate', self.embedding_model)
+            # Same text + model → same vector; skip the tokenizer and the API
+            cache = get_embedding_cache()
+            cached = cache.get(_model, text)
+            if cached is not None:
+                return cached
+            
             # Intelligently truncate to avoid token limits
             # (text-embedding-3-large supports max 8192 tokens, budget 8000)
             truncated_text, was_truncated, original_tokens = self._truncate_for_embedding(text)
@@ -201,20 +316,84 @@ class EmbeddingService:
                     f"Resume length: {len(text)} chars."
                 )
             
-            from services.openai_helper import resolve_model, log_call
-            _model = resolve_model('embedding_service.candidate', self.embedding_model)
             response = self.openai_client.embeddings.create(
                 input=truncated_text,
                 model=_model
             )
             log_call('embedding_service.candidate', _model, response)
 
-            return response.data[0].embedding
+            embedding = response.data[0].embedding
+            cache.put(_model, text, embedding)
+            return embedding
             
         except Exception as e:
             logger.error(f"Failed to generate embedding: {str(e)}")
             return None
     
+    def generate_embeddings_batch(self, texts: List[str]) -> List[Optional[List[float]]]:
+        """
+        Embed many texts with as few ``embeddings.create`` requests as possible.
+        
+        Each text is truncated with _truncate_for_embedding, then texts are
+        packed into multi-input requests bounded by EMBEDDING_BATCH_TOKEN_BUDGET
+        and EMBEDDING_BATCH_MAX_INPUTS. A failed request yields None for each of
+        its texts (caller falls back per item); other batches are unaffected.
+        
+        Args:
+            texts: Input texts, in caller order
+            
+        Returns:
+            List aligned with ``texts`` — a vector, or None when unavailable
+        """
+        results: List[Optional[List[float]]] = [None] * len(texts)
+        if not self.openai_client or not texts:
+            return results
+        
+        from services.openai_helper import resolve_model, log_call
+        from services.embedding_cache import get_embedding_cache
+        _model = resolve_model('embedding_service.candidate', self.embedding_model)
+        cache = get_embedding_cache()
+        for position, cached in enumerate(cache.get_many(_model, texts)):
+            results[position] = cached
+        
+        batches: List[List[Tuple[int, str]]] = []
+        current: List[Tuple[int, str]] = []
+        current_tokens = 0
+        for position, text in enumerate(texts):
+            if not text or not text.strip() or results[position] is not None:
+                continue
+            truncated_text, _was_truncated, _original_tokens = self._truncate_for_embedding(text)
+            tokens = min(self.count_tokens(truncated_text), MAX_EMBEDDING_TOKENS)
+            if current and (
+                current_tokens + tokens > EMBEDDING_BATCH_TOKEN_BUDGET
+                or len(current) >= EMBEDDING_BATCH_MAX_INPUTS
+            ):
+                batches.append(current)
+                current, current_tokens = [], 0
+            current.append((position, truncated_text))
+            current_tokens += tokens
+        if current:
+            batches.append(current)
+        
+        for batch in batches:
+            try:
+                response = self.openai_client.embeddings.create(
+                    input=[text for _position, text in batch],
+                    model=_model
+                )
+                log_call('embedding_service.candidate', _model, response)
+                # Results carry their input index; don't rely on response order
+                fresh = []
+                for item in response.data:
+                    position = batch[item.index][0]
+                    results[position] = item.embedding
+                    fresh.append((texts[position], item.embedding))
+                cache.put_many(_model, fresh)
+            except Exception as e:
+                logger.error(f"Failed to generate embedding batch of {len(batch)}: {str(e)}")
+        
+        return results
+    
     @staticmethod
     def compute_similarity(vec_a: List[float], vec_b: List[float]) -> float:
         """
@@ -291,21 +470,27 @@ class EmbeddingService:
             # Check cache
             cached = JobEmbedding.query.filter_by(bullhorn_job_id=job_id).first()
             
-            if cached and cached.description_hash == description_hash and cached.embedding_vector:
+            if cached and cached.description_hash == description_hash:
                 # Cache hit — description hasn't changed
-                return json.loads(cached.embedding_vector)
+                vector = decode_job_vector(cached.embedding_blob, cached.embedding_vector)
+                if vector:
+                    return vector
             
             # Cache miss or description changed — generate new embedding
             embedding = self.generate_embedding(description)
             if not embedding:
                 return None
             
+            # embedding_blob (packed float32) is what readers prefer; the JSON
+            # column stays populated until every worker reads the blob.
             vector_json = json.dumps(embedding)
+            vector_blob = pack_vector(embedding)
             
             if cached:
                 # Update existing cache entry
                 cached.description_hash = description_hash
                 cached.embedding_vector = vector_json
+                cached.embedding_blob = vector_blob
                 cached.job_title = job_title
                 cached.embedding_model = self.embedding_model
                 cached.updated_at = datetime.utcnow()
@@ -317,12 +502,14 @@ class EmbeddingService:
                     job_title=job_title,
                     description_hash=description_hash,
                     embedding_vector=vector_json,
+                    embedding_blob=vector_blob,
                     embedding_model=self.embedding_model
                 )
                 db.session.add(new_entry)
                 logger.info(f"📦 Cached new embedding for job {job_id}: {job_title}")
             
             db.session.commit()
+            get_job_embedding_index().upsert(job_id, embedding, description_hash)
             return embedding
             
         except Exception as e:
@@ -334,6 +521,115 @@ class EmbeddingService:
             # Fall through — generate without caching
             return self.generate_embedding(description)
     
+    def embed_missing_jobs(self, jobs: List[Dict]) -> Dict[int, List[float]]:
+        """
+        Bulk-fill the JobEmbedding cache for every job that misses it.
+        
+        One query finds which jobs have no row or a stale description_hash;
+        those descriptions are embedded via generate_embeddings_batch and all
+        rows are upserted in a single transaction, then pushed into the
+        process-wide JobEmbeddingIndex. Cache hits are left untouched.
+        
+        Args:
+            jobs: Job dictionaries (id, title, description/publicDescription)
+            
+        Returns:
+            Dict of job_id → freshly generated vector (empty on failure)
+        """
+        if not self.openai_client or not jobs:
+            return {}
+        
+        from models import JobEmbedding
+        from app import db
+        
+        wanted: Dict[int, Tuple[str, str, str]] = {}
+        for job in jobs:
+            job_id = job.get('id')
+            job_description = job.get('description', '') or job.get('publicDescription', '') or ''
+            if not job_id or not job_description.strip():
+                continue
+            wanted[job_id] = (
+                job_description,
+                job.get('title', '') or '',
+                self.compute_description_hash(job_description),
+            )
+        if not wanted:
+            return {}
+        
+        try:
+            existing: Dict[int, JobEmbedding] = {}
+            job_ids = list(wanted)
+            for start in range(0, len(job_ids), 500):
+                for row in JobEmbedding.query.filter(
+                    JobEmbedding.bullhorn_job_id.in_(job_ids[start:start + 500])
+                ).all():
+                    existing[row.bullhorn_job_id] = row
+            
+            missing = [
+                job_id for job_id, (_desc, _title, desc_hash) in wanted.items()
+                if job_id not in existing
+                or existing[job_id].description_hash != desc_hash
+                or not (existing[job_id].embedding_blob or existing[job_id].embedding_vector)
+            ]
+            if not missing:
+                return {}
+            
+            vectors = self.generate_embeddings_batch([wanted[job_id][0] for job_id in missing])
+            
+            generated: Dict[int, List[float]] = {}
+            now = datetime.utcnow()
+            for job_id, embedding in zip(missing, vectors):
+                if not embedding:
+                    continue
+                _desc, job_title, desc_hash = wanted[job_id]
+                row = existing.get(job_id)
+                if row is None:
+                    row = JobEmbedding(bullhorn_job_id=job_id)
+                    db.session.add(row)
+                row.job_title = job_title
+                row.description_hash = desc_hash
+                row.embedding_vector = json.dumps(embedding)
+                row.embedding_blob = pack_vector(embedding)
+                row.embedding_model = self.embedding_model
+                row.updated_at = now
+                generated[job_id] = embedding
+            
+            if generated:
+                db.session.commit()
+                job_index = get_job_embedding_index()
+                for job_id, embedding in generated.items():
+                    job_index.upsert(job_id, embedding, wanted[job_id][2])
+                logger.info(
+                    f"📦 Batch-embedded {len(generated)}/{len(missing)} cache-miss job(s) "
+                    f"({len(wanted)} checked)"
+                )
+            return generated
+        
+        except Exception as e:
+            logger.error(f"Error in embed_missing_jobs: {str(e)}")
+            try:
+                db.session.rollback()
+            except Exception:
+                pass
+            return {}
+    
+    def prewarm_job_embeddings(self, jobs: List[Dict]) -> int:
+        """
+        Scheduled pre-warm: embed cache-miss jobs before any candidate needs them.
+        
+        Runs right after the active-job-IDs refresh so the first candidate of a
+        cycle doesn't pay for every changed job serially. No-op when the
+        Layer 1 filter is disabled.
+        
+        Returns:
+            Number of job embeddings generated
+        """
+        if not self.is_filter_enabled():
+            return 0
+        generated = self.embed_missing_jobs(jobs)
+        get_job_embedding_index().refresh_from_db(force=True)
+        return len(generated)
+    
     def get_similarity_threshold(self) -> float:
         """
         Get the current embedding similarity threshold from VettingConfig.
@@ -391,6 +687,11 @@ class EmbeddingService:
         if not self.openai_client or not text or not text.strip():
             return None
         try:
+            from services.embedding_cache import get_embedding_cache
+            cache = get_embedding_cache()
+            cached = cache.get(model, text)
+            if cached is not None:
+                return cached
             truncated_text, _was_trunc, _orig_tok = self._truncate_for_embedding(text)
             from services.openai_helper import log_call
             response = self.openai_client.embeddings.create(
@@ -398,7 +699,9 @@ class EmbeddingService:
                 model=model,
             )
             log_call(site_id, model, response)
-            return response.data[0].embedding
+            embedding = response.data[0].embedding
+            cache.put(model, text, embedding)
+            return embedding
         except Exception as e:
             logger.warning(f"Shadow embedding generation failed ({model}): {e}")
             return None
@@ -563,6 +866,8 @@ class EmbeddingService:
                 logger.warning(f"Shadow A/B setup failed: {exc}")
                 ab_shadow_on = False
 
+        job_scores = self._score_jobs(resume_embedding, jobs)
+
         for job in jobs:
             job_id = job.get('id', 0)
             job_title = job.get('title', 'Unknown')
@@ -573,16 +878,12 @@ class EmbeddingService:
                 relevant_jobs.append(job)
                 continue
             
-            # Get cached or generate job embedding
-            job_embedding = self.get_job_embedding(job_id, job_description, job_title)
-            if not job_embedding:
+            similarity = job_scores.get(job_id)
+            if similarity is None:
                 # Failed to get embedding — let it through (safe fallback)
                 relevant_jobs.append(job)
                 continue
             
-            # Compute similarity
-            similarity = self.compute_similarity(resume_embedding, job_embedding)
-            
             primary_passed = similarity >= threshold
             if primary_passed:
                 relevant_jobs.append(job)
@@ -656,6 +957,69 @@ class EmbeddingService:
         
         return relevant_jobs, filtered_count
     
+    def _score_jobs(self, resume_embedding: List[float], jobs: List[Dict]) -> Dict[int, float]:
+        """
+        Cosine similarity of the resume against every job with a description.
+        
+        Jobs whose current description hash is already in the process-wide
+        JobEmbeddingIndex are scored together with one mat-vec product. The
+        rest (cache miss, changed description, NumPy unavailable, dimension
+        mismatch) are batch-embedded by embed_missing_jobs when there are
+        several; whatever is left goes through get_job_embedding. Both paths
+        upsert into the index. Jobs with no usable embedding are absent from
+        the result.
+        
+        Args:
+            resume_embedding: Candidate resume vector
+            jobs: Job dictionaries (id, title, description/publicDescription)
+            
+        Returns:
+            Dict of job_id → similarity clamped to [0, 1]
+        """
+        job_index = get_job_embedding_index()
+        job_index.refresh_from_db()
+        
+        pending: List[Tuple[int, str, str]] = []
+        indexed_ids: List[int] = []
+        for job in jobs:
+            job_id = job.get('id', 0)
+            job_description = job.get('description', '') or job.get('publicDescription', '') or ''
+            if not job_description.strip():
+                continue
+            description_hash = self.compute_description_hash(job_description)
+            if job_index.has_current(job_id, description_hash):
+                indexed_ids.append(job_id)
+            else:
+                pending.append((job_id, job_description, job.get('title', 'Unknown')))
+        
+        scores: Dict[int, float] = {}
+        if indexed_ids:
+            matrix_scores = job_index.similarities(resume_embedding, indexed_ids)
+            scores.update({k: max(0.0, min(1.0, v)) for k, v in matrix_scores.items()})
+            # Dimension mismatch (e.g. model override) → score the slow way
+            unscored = set(indexed_ids) - set(scores)
+            for job in jobs:
+                job_id = job.get('id', 0)
+                if job_id in unscored:
+                    job_description = job.get('description', '') or job.get('publicDescription', '') or ''
+                    pending.append((job_id, job_description, job.get('title', 'Unknown')))
+        
+        if len(pending) > 1:
+            fresh = self.embed_missing_jobs(
+                [{'id': job_id, 'description': desc, 'title': title} for job_id, desc, title in pending]
+            )
+            for job_id, job_embedding in fresh.items():
+                scores[job_id] = self.compute_similarity(resume_embedding, job_embedding)
+        
+        for job_id, job_description, job_title in pending:
+            if job_id in scores:
+                continue
+            job_embedding = self.get_job_embedding(job_id, job_description, job_title)
+            if job_embedding:
+                scores[job_id] = self.compute_similarity(resume_embedding, job_embedding)
+        
+        return scores
+    
     def _save_filter_logs(self, entries: List[Dict]):
         """
         Batch-save EmbeddingFilterLog entries for audit.
@@ -109,6 +109,22 @@ def channel_feeds_for_upload():
     return tuple(out)
 
 
+def upload_cycle_tearsheet_ids():
+    """Tearsheets one upload cycle actually pulls (v2 + non-parked channels).
+
+    The upload cycle fetches these once into a shared snapshot and fans the
+    jobs out to every feed; parked (force_empty) channels need no fetch.
+    """
+    ids = list(V2_TEARSHEET_IDS)
+    for feed_cfg in channel_feeds_for_upload():
+        if feed_cfg.get('force_empty'):
+            continue
+        for tid in feed_cfg['tearsheet_ids']:
+            if tid not in ids:
+                ids.append(tid)
+    return ids
+
+
 def all_xml_feed_tearsheet_ids():
     """Tearsheets covered by every published XML feed (v2 + STSI channels).
 
@@ -18,7 +18,6 @@ Design tenets:
 from __future__ import annotations
 
 import base64
-import hashlib
 import json
 import logging
 import re
@@ -40,8 +39,9 @@ from fraud_detection import signals as fsig
 
 logger = logging.getLogger("fraud_detection")
 
-# Bound the embedding scan so the near-dup check can't turn the screening hook
-# into an O(N) table walk on large datasets.
+# Bound the DB-scan fallback (used only when the shared profile vector index
+# can't serve) so the near-dup check can't turn the screening hook into an
+# O(N) table walk on large datasets. The index itself covers every row.
 _EMBEDDING_SCAN_LIMIT = 2000
 # Velocity window: count this candidate's applications in the last N hours.
 _VELOCITY_WINDOW_HOURS = fsig.DEFAULT_VELOCITY_WINDOW_HOURS
@@ -514,10 +514,13 @@ class FraudSignalEngine:
     def _count_resume_reuse(self, candidate_id, vetting_log) -> dict:
         """Classify OTHER candidate records that share this résumé's exact content.
 
-        Uses Postgres ``md5(resume_text)`` over `candidate_vetting_log` so it
+        Looks up the indexed ``resume_text_hash`` (whitespace-normalised md5,
+        see ``fsig.resume_content_hash``) on `candidate_vetting_log` so it
         works across distinct Bullhorn candidate IDs (the cache table can't — its
-        content_hash is unique and byte-based). Each OTHER candidate record is
-        classified by comparing its name + email to THIS candidate:
+        content_hash is unique and byte-based). Rows written before the column
+        existed are filled in by ``tasks.vetting.run_resume_hash_backfill``.
+        Each OTHER candidate record is classified by comparing its name +
+        email to THIS candidate:
 
           - "duplicates": SAME normalized name AND SAME normalized email — the
             same person entered twice (e.g. a duplicate Bullhorn record). Benign;
@@ -563,56 +566,29 @@ class FraudSignalEngine:
                     genuine.append(item)
             return {"genuine": genuine, "duplicates": dupes}
 
+        target_hash = fsig.resume_content_hash(resume_text)
         try:
             with Session(db.engine) as session:
-                dialect = session.bind.dialect.name if session.bind else ""
-                if dialect == "postgresql":
-                    # Efficient server-side hashing on the live DB. DISTINCT ON
-                    # collapses to the MOST-RECENT row per other candidate id so
-                    # name/email/date are read from ONE coherent record (a plain
-                    # GROUP BY + MAX() could mix fields across rows and misclassify
-                    # a duplicate as genuine).
-                    rows = session.execute(
-                        text(
-                            "SELECT DISTINCT ON (bullhorn_candidate_id) "
-                            "bullhorn_candidate_id, "
-                            "candidate_name AS name, "
-                            "candidate_email AS email, "
-                            "created_at AS last_seen "
-                            "FROM candidate_vetting_log "
-                            "WHERE resume_text IS NOT NULL "
-                            "AND md5(resume_text) = md5(:rt) "
-                            "AND bullhorn_candidate_id IS NOT NULL "
-                            "AND (:cid IS NULL OR bullhorn_candidate_id <> :cid) "
-                            "AND is_sandbox = false "
-                            "ORDER BY bullhorn_candidate_id, created_at DESC NULLS LAST"
-                        ),
-                        {"rt": resume_text, "cid": candidate_id},
-                    ).all()
-                    return _classify(rows)
-
-                # Dialect-agnostic fallback (e.g. SQLite in tests): hash in Python.
-                target_hash = hashlib.md5(resume_text.encode("utf-8")).hexdigest()
-                all_rows = (
+                # Indexed equality on the stored hash; only the (few) matching
+                # rows come back, so the per-candidate collapse is done here.
+                q = (
                     session.query(
                         CandidateVettingLog.bullhorn_candidate_id,
                         CandidateVettingLog.candidate_name,
                         CandidateVettingLog.candidate_email,
                         CandidateVettingLog.created_at,
-                        CandidateVettingLog.resume_text,
                     )
-                    .filter(CandidateVettingLog.resume_text.isnot(None))
+                    .filter(CandidateVettingLog.resume_text_hash == target_hash)
                     .filter(CandidateVettingLog.bullhorn_candidate_id.isnot(None))
                     .filter(CandidateVettingLog.is_sandbox.is_(False))
-                    .all()
                 )
-                # Collapse to one (most-recent) row per other candidate id.
+                if candidate_id is not None:
+                    q = q.filter(CandidateVettingLog.bullhorn_candidate_id != candidate_id)
+                # Collapse to the MOST-RECENT row per other candidate id so
+                # name/email/date are read from ONE coherent record (mixing
+                # fields across rows could misclassify a duplicate as genuine).
                 seen_best = {}
-                for cid, nm, em, created, rt in all_rows:
-                    if candidate_id is not None and cid == candidate_id:
-                        continue
-                    if not rt or hashlib.md5(rt.encode("utf-8")).hexdigest() != target_hash:
-                        continue
+                for cid, nm, em, created in q.all():
                     prev = seen_best.get(cid)
                     if prev is None or (
                         created is not None and (prev[2] is None or created > prev[2])
@@ -694,11 +670,25 @@ class FraudSignalEngine:
             logger.debug("velocity query failed: %s", exc)
             return 0
 
+    @staticmethod
+    def _profile_index():
+        """The shared profile vector index when it is loaded, else None."""
+        try:
+            from services.vector_index import get_profile_embedding_index
+            index = get_profile_embedding_index()
+            index.refresh_from_db()
+            if index.ready and len(index):
+                return index
+        except Exception as exc:  # pragma: no cover
+            logger.debug("profile index unavailable: %s", exc)
+        return None
+
     def _top_profile_similarity(self, candidate_id):
         """Return (top_similarity, identity_differs) for near-dup detection.
 
         Compares this candidate's CACHED embedding (no new API call) against
-        other cached embeddings, bounded to the most-recent N rows. Returns
+        every other cached embedding via the shared profile vector index, or —
+        when the index can't serve — the most-recent N rows. Returns
         ``(None, False)`` when there's nothing to compare — which the evaluator
         treats as "no signal".
         """
@@ -716,6 +706,13 @@ class FraudSignalEngine:
                 target_vec = json.loads(target_row.embedding_vector)
                 if not target_vec:
                     return (None, False)
+
+                index = self._profile_index()
+                if index is not None:
+                    top = index.top_k(target_vec, 1, exclude=(candidate_id,))
+                    if top:
+                        return (max(-1.0, min(1.0, top[0][1])), True)
+
                 target_norm = sum(v * v for v in target_vec) ** 0.5
                 if target_norm == 0:
                     return (None, False)
@@ -799,6 +796,7 @@ class FraudSignalEngine:
             cur_span = fsig.extract_year_span(resume_text)
             cur_name = fsig.normalize_name(name)
             cur_li = (linkedin_url or "").strip().lower()
+            cur_hash = fsig.resume_content_hash(resume_text)
 
             for prior in priors:
                 prior_date = ""
@@ -829,6 +827,9 @@ class FraudSignalEngine:
                         ),
                         "prior_date": prior_date,
                     })
+                if cur_hash and prior.resume_text_hash == cur_hash:
+                    # Same résumé content — no claim can have drifted.
+                    continue
                 prior_years = fsig.extract_max_years_claim(prior.resume_text)
                 prior_span = fsig.extract_year_span(prior.resume_text)
                 # Inflation: current claim ≥ prior + 3 years
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
-import hashlib
 import logging
 import re
 from datetime import datetime, timedelta
 from typing import Any, Dict, Optional
 
+from fraud_detection.signals import resume_content_hash
+
 logger = logging.getLogger("fraud_detection.pdf_meta")
 
 _META_KEYS = ("author", "creator", "producer", "creationDate", "modDate")
@@ -77,6 +78,7 @@ def pdf_mod_is_recent(meta: Optional[Dict[str, str]], days: int = 14) -> bool:
 
 
 def content_md5(text: Optional[str]) -> str:
+    """Same normalised hash as ``CandidateVettingLog.resume_text_hash``."""
     if not text or len(text) < 50:
         return ""
-    return hashlib.md5(text.encode("utf-8")).hexdigest()
+    return resume_content_hash(text)
@@ -177,6 +177,19 @@ def normalize_name(name: Optional[str]) -> str:
     return re.sub(r"[^a-z]", "", str(name).lower())
 
 
+def resume_content_hash(text: Optional[str]) -> str:
+    """md5 of résumé text with whitespace runs collapsed (and NULs dropped,
+    as SafeText does on write), so the same document extracted with
+    different line breaks/spacing hashes identically. Stored on
+    ``CandidateVettingLog.resume_text_hash`` for the indexed reuse lookup."""
+    if not text:
+        return ""
+    normalized = " ".join(str(text).replace("\x00", "").split())
+    if not normalized:
+        return ""
+    return hashlib.md5(normalized.encode("utf-8")).hexdigest()
+
+
 def is_personal_email(email: Optional[str]) -> bool:
     """True when the address is a known free / personal webmail provider.
 
@@ -935,7 +948,7 @@ def dedupe_near_identical_resume_versions(
             continue
         content_hash = str(raw.get("content_hash") or "")
         if not content_hash and text:
-            content_hash = hashlib.md5(text.encode("utf-8")).hexdigest()
+            content_hash = resume_content_hash(text)
         is_dup = False
         for kept in unique:
             if content_hash and content_hash == kept.get("content_hash"):
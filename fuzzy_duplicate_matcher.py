@@ -12,9 +12,9 @@ Architecture (mirrors the existing two-layer pattern in ``embedding_service``):
     - Cache the vector in ``candidate_profile_embedding`` keyed by
       candidate id, with a SHA-256 ``profile_hash`` so we can detect
       profile changes and refresh just those rows.
-    - For a target candidate, cosine-compare its vector against the cached
-      pool (most-recent N to bound work) and keep the top-N above a
-      coarse cosine threshold.
+    - For a target candidate, run a top-k query against the process-wide
+      profile vector index (``services.vector_index``), which covers the
+      whole cache, and keep the top-N above a coarse cosine threshold.
 
   Layer B: GPT-5.4 final scoring
     - For each top-N candidate, ask GPT-5.4 to compare the two profile
@@ -55,7 +55,9 @@ AI_CONFIDENCE_THRESHOLD = 0.90
 # Budget caps so we never blow the hourly scheduled-job window.
 # Long-tail candidates simply ride along to the next cycle.
 MAX_CANDIDATES_PER_CYCLE = 25
-EMBEDDING_CACHE_SCAN_LIMIT = 2000  # most-recently-updated cache rows scanned
+# Row cap for the DB-scan fallback only (NumPy unavailable / index not yet
+# loaded). The vector index itself has no recency cap.
+EMBEDDING_CACHE_SCAN_LIMIT = 2000
 
 # Rolling backfill cap per cycle. Each scheduled run embeds up to this many
 # historical (uncached) candidates so the cosine pre-filter pool grows
@@ -97,9 +99,11 @@ class FuzzyDuplicateMatcher:
         backfill_per_cycle: int = BACKFILL_PER_CYCLE,
         backfill_page_size: int = BACKFILL_PAGE_SIZE,
         backfill_max_pages: int = BACKFILL_MAX_PAGES,
+        profile_index=None,
     ):
         self.bh = bullhorn_service
         self._embedding_service = embedding_service
+        self._profile_index = profile_index
         self._openai_client = openai_client
         self.model_chat = model_chat
         self.ai_confidence_threshold = ai_confidence_threshold
@@ -119,14 +123,22 @@ class FuzzyDuplicateMatcher:
             self._embedding_service = EmbeddingService()
         return self._embedding_service
 
+    @property
+    def profile_index(self):
+        if self._profile_index is None:
+            from services.vector_index import get_profile_embedding_index
+            self._profile_index = get_profile_embedding_index()
+        return self._profile_index
+
     @property
     def openai_client(self):
         if self._openai_client is None:
             from openai import OpenAI
+            from services.openai_governor import shared_http_client
             api_key = os.environ.get('OPENAI_API_KEY')
             if not api_key:
                 raise RuntimeError("OPENAI_API_KEY is not set; cannot run fuzzy AI matcher")
-            self._openai_client = OpenAI(api_key=api_key)
+            self._openai_client = OpenAI(api_key=api_key, http_client=shared_http_client())
         return self._openai_client
 
     # ── Profile text builder ────────────────────────────────────────────
@@ -344,6 +356,10 @@ class FuzzyDuplicateMatcher:
                 logger.debug(f"FuzzyMatcher: cached new profile embedding for candidate {cid}")
 
             db.session.commit()
+            try:
+                self.profile_index.upsert(cid, vector, profile_hash)
+            except Exception as e:
+                logger.debug(f"FuzzyMatcher: profile index upsert failed for {cid}: {e}")
             return vector, profile_text
 
         except Exception as e:
@@ -525,10 +541,66 @@ class FuzzyDuplicateMatcher:
     ) -> List[Tuple[int, float, str, str]]:
         """Return up to N (candidate_id, similarity, name, profile_snippet) tuples.
 
-        Scans the most-recently-updated rows in
-        ``candidate_profile_embedding`` (capped by ``cache_scan_limit``) so
-        the work per cycle is bounded.
+        Queries the shared profile vector index, which spans the entire
+        ``candidate_profile_embedding`` table. Falls back to scanning the
+        most-recently-updated rows (capped by ``cache_scan_limit``) when the
+        index is unavailable or has not loaded yet.
         """
+        index = self.profile_index
+        try:
+            index.refresh_from_db()
+            use_index = bool(index.ready and len(index))
+        except Exception as e:
+            logger.debug(f"FuzzyMatcher: profile index unavailable: {e}")
+            use_index = False
+        if use_index:
+            return self._top_candidates_from_index(index, target_vector, exclude_ids)
+        return self._scan_top_candidates_by_cosine(target_vector, exclude_ids)
+
+    def _top_candidates_from_index(
+        self,
+        index,
+        target_vector: List[float],
+        exclude_ids: Iterable[int],
+    ) -> List[Tuple[int, float, str, str]]:
+        """Top-k via the vector index, hydrated with name + snippet from the DB."""
+        from models import CandidateProfileEmbedding
+
+        hits = [
+            (cid, max(-1.0, min(1.0, sim)))
+            for cid, sim in index.top_k(target_vector, self.pre_filter_top_n, exclude=exclude_ids)
+            if sim >= self.pre_filter_cosine_threshold
+        ]
+        if not hits:
+            return []
+        details = {
+            cid: (name, snippet)
+            for cid, name, snippet in (
+                CandidateProfileEmbedding.query
+                .with_entities(
+                    CandidateProfileEmbedding.bullhorn_candidate_id,
+                    CandidateProfileEmbedding.candidate_name,
+                    CandidateProfileEmbedding.profile_text_snippet,
+                )
+                .filter(CandidateProfileEmbedding.bullhorn_candidate_id.in_([c for c, _ in hits]))
+                .all()
+            )
+        }
+        results: List[Tuple[int, float, str, str]] = []
+        for cid, sim in hits:
+            if cid not in details:
+                index.remove(cid)  # row deleted since the index loaded it
+                continue
+            name, snippet = details[cid]
+            results.append((cid, sim, name or '', snippet or ''))
+        return results
+
+    def _scan_top_candidates_by_cosine(
+        self,
+        target_vector: List[float],
+        exclude_ids: Iterable[int],
+    ) -> List[Tuple[int, float, str, str]]:
+        """Legacy bounded DB scan used when the vector index can't serve."""
         from models import CandidateProfileEmbedding
         try:
             import numpy as np
@@ -21,6 +21,7 @@ import base64
 import logging
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
 
 import requests
@@ -46,6 +47,10 @@ _MESSAGE_SELECT = (
 
 _MAX_429_RETRIES = 4
 
+# Graph JSON batching accepts at most 20 sub-requests per $batch call.
+_BATCH_LIMIT = 20
+_BATCH_CONCURRENCY = 4
+
 
 class GraphMailService:
     """Read the connected applicant mailbox via Microsoft Graph and adapt each
@@ -63,7 +68,8 @@ class GraphMailService:
 
     # ── HTTP helpers (401 refresh + 429 backoff) ──────────────────────────
     def _request(self, method: str, url: str, *, params: Optional[Dict] = None,
-                 accept_json: bool = True) -> requests.Response:
+                 accept_json: bool = True,
+                 json_body: Optional[Dict] = None) -> requests.Response:
         attempt = 0
         while True:
             token = self._get_access_token()
@@ -71,14 +77,16 @@ class GraphMailService:
             if accept_json:
                 headers["Accept"] = "application/json"
             resp = requests.request(
-                method, url, headers=headers, params=params, timeout=60
+                method, url, headers=headers, params=params, json=json_body,
+                timeout=60
             )
             if resp.status_code == 401:
                 invalidate_graph_token_cache()
                 token = self._get_access_token()
                 headers["Authorization"] = f"Bearer {token}"
                 resp = requests.request(
-                    method, url, headers=headers, params=params, timeout=60
+                    method, url, headers=headers, params=params, json=json_body,
+                    timeout=60
                 )
             if resp.status_code == 429 and attempt < _MAX_429_RETRIES:
                 retry_after = resp.headers.get("Retry-After")
@@ -209,17 +217,75 @@ class GraphMailService:
         """Fetch file attachments for a message as
         [{filename, content_b64, content_type}]. Handles large attachments by
         fetching raw bytes individually when contentBytes is absent."""
-        out: List[Dict] = []
-        user_base = self._user_base()
         try:
-            data = self._get_json(f"{user_base}/messages/{message_id}/attachments")
+            data = self._get_json(
+                f"{self._user_base()}/messages/{message_id}/attachments"
+            )
         except Exception as e:  # noqa: BLE001
             logger.error(
                 f"GraphMail: failed to list attachments for {message_id[:40]}: {e}"
             )
-            return out
+            return []
+        return self._collect_attachments(message_id, data.get("value", []) or [])
 
-        for att in data.get("value", []) or []:
+    def get_attachments_batch(self, message_ids: List[str]) -> Dict[str, List[Dict]]:
+        """Fetch attachments for many messages via Graph JSON ``$batch``.
+
+        Listing calls are grouped ``_BATCH_LIMIT`` to a request and the groups
+        are sent concurrently (at most ``_BATCH_CONCURRENCY`` at once). Any
+        sub-request that fails, and any group whose ``$batch`` call fails
+        outright, falls back to :meth:`get_attachments` for those messages, so
+        the result always has an entry per id in the same shape.
+        """
+        ids = list(dict.fromkeys(m for m in message_ids if m))
+        if not ids:
+            return {}
+        chunks = [ids[i:i + _BATCH_LIMIT] for i in range(0, len(ids), _BATCH_LIMIT)]
+        out: Dict[str, List[Dict]] = {}
+        with ThreadPoolExecutor(
+            max_workers=min(_BATCH_CONCURRENCY, len(chunks)),
+            thread_name_prefix="graph-batch",
+        ) as pool:
+            for result in pool.map(self._get_attachments_chunk, chunks):
+                out.update(result)
+        return out
+
+    def _get_attachments_chunk(self, message_ids: List[str]) -> Dict[str, List[Dict]]:
+        user_base = self._user_base()
+        body = {"requests": [
+            {"id": str(i), "method": "GET",
+             "url": f"{user_base}/messages/{mid}/attachments"}
+            for i, mid in enumerate(message_ids)
+        ]}
+        out: Dict[str, List[Dict]] = {}
+        try:
+            data = self._request(
+                "POST", f"{GRAPH_BASE_URL}/$batch", json_body=body
+            ).json()
+            for resp in data.get("responses", []) or []:
+                try:
+                    mid = message_ids[int(resp.get("id"))]
+                except (TypeError, ValueError, IndexError):
+                    continue
+                if resp.get("status") == 200:
+                    items = (resp.get("body") or {}).get("value", []) or []
+                    out[mid] = self._collect_attachments(mid, items)
+        except Exception as e:  # noqa: BLE001
+            logger.warning(
+                f"GraphMail: $batch attachment fetch failed for "
+                f"{len(message_ids)} messages, falling back per message: {e}"
+            )
+        for mid in message_ids:
+            if mid not in out:
+                out[mid] = self.get_attachments(mid)
+        return out
+
+    def _collect_attachments(self, message_id: str, items: List[Dict]) -> List[Dict]:
+        """Normalize Graph attachment objects into the payload shape, pulling
+        raw bytes for large attachments that arrive without contentBytes."""
+        out: List[Dict] = []
+        user_base = self._user_base()
+        for att in items:
             odata_type = att.get("@odata.type", "")
             if "fileAttachment" not in odata_type and att.get("contentBytes") is None:
                 if "fileAttachment" not in odata_type:
@@ -0,0 +1,479 @@
+"""
+Inbound Email Queue — durable, bounded work queue for applicant email.
+
+The SendGrid Inbound Parse webhook used to start one ``threading.Thread`` per
+POST to run résumé parsing, OpenAI extraction and Bullhorn writes inside the
+web worker. A SendGrid retry burst after an outage could therefore start
+hundreds of concurrent pipelines in a single gunicorn process.
+
+Every inbound message is now persisted as an ``InboundEmailJob`` row the moment
+it is received (so the webhook can ack immediately and nothing is lost on a
+restart) and drained by a bounded set of worker threads:
+
+    * at most ``INBOUND_QUEUE_WORKERS`` drain threads run per process; they
+      are started on demand by ``enqueue`` / ``kick`` and exit once no job is
+      claimable, so idle web workers carry no extra threads
+    * jobs are claimed lowest ``priority`` first (live webhook mail ahead of
+      poller mail ahead of backfill), with ``FOR UPDATE SKIP LOCKED`` on
+      PostgreSQL plus a conditional status flip so concurrent processes never
+      run the same row twice
+    * a handler exception re-queues the job with exponential backoff until
+      ``INBOUND_QUEUE_MAX_ATTEMPTS``, after which it is dead-lettered
+      (``status='dead'``) for an operator to inspect
+    * a running job's lease (``locked_at``) is renewed every
+      ``LEASE_HEARTBEAT_SECONDS`` while its handler runs, so a slow pipeline
+      is never reclaimed and run twice; only a ``running`` row whose lease
+      expired (worker killed mid-job) becomes claimable again
+
+The mailbox poller and the outage backfill enqueue their messages here too and
+wait on the results, so recovery drains in parallel within the same limit.
+
+Handlers are resolved lazily by dotted path, so this module never imports the
+route or task layers at import time.
+"""
+
+import base64
+import importlib
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.environ.get(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+WORKERS = max(0, _env_int('INBOUND_QUEUE_WORKERS', 4))
+MAX_ATTEMPTS = max(1, _env_int('INBOUND_QUEUE_MAX_ATTEMPTS', 5))
+RETRY_BASE_SECONDS = max(1, _env_int('INBOUND_QUEUE_RETRY_BASE_SECONDS', 30))
+RETRY_MAX_SECONDS = max(1, _env_int('INBOUND_QUEUE_RETRY_MAX_SECONDS', 1800))
+LEASE_SECONDS = max(60, _env_int('INBOUND_QUEUE_LEASE_SECONDS', 900))
+LEASE_HEARTBEAT_SECONDS = max(1, LEASE_SECONDS // 3)
+
+KIND_INBOUND = 'inbound'
+KIND_SCOUT_VETTING = 'scout_vetting'
+KIND_SCOUT_SUPPORT = 'scout_support'
+KIND_MAILBOX = 'mailbox'
+
+PRIORITY_LIVE = 0
+PRIORITY_POLL = 5
+PRIORITY_BACKFILL = 9
+
+# kind -> "module:function"; each handler is called as handler(app, kind, payload)
+# and returns an optional result dict. Raising means "retry later".
+_HANDLERS = {
+    KIND_INBOUND: 'routes.email:run_queued_inbound_email',
+    KIND_SCOUT_VETTING: 'routes.email:run_queued_inbound_email',
+    KIND_SCOUT_SUPPORT: 'routes.email:run_queued_inbound_email',
+    KIND_MAILBOX: 'tasks.mailbox_pull:process_queued_mailbox_message',
+}
+
+_RESULT_KEYS = ('success', 'duplicate', 'is_duplicate', 'ignored', 'candidate_id', 'message')
+_B64_MARKER = '__b64__'
+
+
+# ── Payload encoding ─────────────────────────────────────────────────────────
+
+def _encode_default(value):
+    if isinstance(value, (bytes, bytearray)):
+        return {_B64_MARKER: base64.b64encode(bytes(value)).decode('ascii')}
+    raise TypeError(f'{type(value).__name__} is not JSON serializable')
+
+
+def _decode_hook(obj):
+    if len(obj) == 1 and _B64_MARKER in obj:
+        return base64.b64decode(obj[_B64_MARKER])
+    return obj
+
+
+def encode_payload(payload: Dict) -> str:
+    """Serialize a webhook/Graph payload; raw attachment bytes survive as base64."""
+    return json.dumps(payload, default=_encode_default)
+
+
+def decode_payload(data: Optional[str]) -> Dict:
+    return json.loads(data, object_hook=_decode_hook) if data else {}
+
+
+def _resolve_handler(kind: str):
+    target = _HANDLERS.get(kind)
+    if not target:
+        raise ValueError(f'No inbound queue handler for kind {kind!r}')
+    module_name, func_name = target.split(':')
+    return getattr(importlib.import_module(module_name), func_name)
+
+
+def retry_delay(attempts: int) -> int:
+    """Backoff before the next attempt after ``attempts`` failures."""
+    return min(RETRY_BASE_SECONDS * (2 ** max(0, attempts - 1)), RETRY_MAX_SECONDS)
+
+
+# ── Queue operations ────────────────────────────────────────────────────────
+
+def enqueue(kind: str, payload: Dict, priority: int = PRIORITY_LIVE,
+            dedupe_key: Optional[str] = None, app=None) -> int:
+    """Persist a job and return its id.
+
+    When ``dedupe_key`` matches a job that is still queued or running, that
+    job's id is returned instead of adding a second copy. Passing ``app``
+    starts a drain thread for it right away. Raises on database errors so the
+    caller can refuse the delivery instead of dropping it.
+    """
+    from extensions import db
+    from models import InboundEmailJob
+
+    if kind not in _HANDLERS:
+        raise ValueError(f'Unknown inbound queue kind {kind!r}')
+
+    dedupe_key = (dedupe_key or '')[:255] or None
+    try:
+        if dedupe_key:
+            existing = db.session.query(InboundEmailJob.id).filter(
+                InboundEmailJob.dedupe_key == dedupe_key,
+                InboundEmailJob.status.in_(('queued', 'running')),
+            ).first()
+            if existing:
+                return existing[0]
+
+        now = datetime.utcnow()
+        job = InboundEmailJob(
+            kind=kind,
+            priority=priority,
+            status='queued',
+            dedupe_key=dedupe_key,
+            payload_json=encode_payload(payload),
+            next_attempt_at=now,
+            created_at=now,
+        )
+        db.session.add(job)
+        db.session.commit()
+        job_id = job.id
+    except Exception:
+        db.session.rollback()
+        raise
+
+    if app is not None:
+        kick(app)
+    return job_id
+
+
+def claim_next(worker: str = ''):
+    """Claim the most urgent runnable job, or return None when there is none."""
+    from sqlalchemy import and_, or_, update
+    from extensions import db
+    from models import InboundEmailJob
+
+    now = datetime.utcnow()
+    stale = now - timedelta(seconds=LEASE_SECONDS)
+    query = InboundEmailJob.query.filter(or_(
+        and_(InboundEmailJob.status == 'queued', InboundEmailJob.next_attempt_at <= now),
+        and_(InboundEmailJob.status == 'running', InboundEmailJob.locked_at < stale),
+    )).order_by(InboundEmailJob.priority.asc(), InboundEmailJob.id.asc())
+    if db.engine.dialect.name == 'postgresql':
+        query = query.with_for_update(skip_locked=True)
+
+    try:
+        candidate = query.first()
+        if candidate is None:
+            db.session.rollback()
+            return None
+        if candidate.status == 'running':
+            logger.warning(
+                f"📬 Inbound queue: reclaiming job {candidate.id} "
+                f"(lease held by {candidate.locked_by} expired)"
+            )
+
+        # Conditional flip: on databases without SKIP LOCKED another process
+        # may have claimed the same row between our SELECT and this UPDATE.
+        claimed = db.session.execute(
+            update(InboundEmailJob)
+            .where(
+                InboundEmailJob.id == candidate.id,
+                InboundEmailJob.status == candidate.status,
+                InboundEmailJob.attempts == candidate.attempts,
+            )
+            .values(
+                status='running',
+                attempts=candidate.attempts + 1,
+                locked_at=now,
+                locked_by=worker[:64] or None,
+            )
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        if claimed != 1:
+            db.session.rollback()
+            return None
+        db.session.commit()
+        db.session.refresh(candidate)
+        return candidate
+    except Exception:
+        db.session.rollback()
+        raise
+
+
+def _finish(job_id: int, result: Optional[Dict] = None, error: Optional[str] = None):
+    """Record the outcome of an attempt; the row is re-read because the
+    handler may have rolled back or replaced the session."""
+    from extensions import db
+    from models import InboundEmailJob
+
+    job = db.session.get(InboundEmailJob, job_id)
+    if job is None:
+        return
+    now = datetime.utcnow()
+    job.locked_at = None
+    job.locked_by = None
+    if error is None:
+        job.status = 'done'
+        job.completed_at = now
+        job.payload_json = None
+        job.last_error = None
+        if result:
+            job.result_json = json.dumps(
+                {k: result[k] for k in _RESULT_KEYS if k in result}, default=str
+            )
+    elif job.attempts >= MAX_ATTEMPTS:
+        job.status = 'dead'
+        job.completed_at = now
+        job.last_error = error[:2000]
+        logger.error(
+            f"📬 Inbound queue: job {job.id} ({job.kind}) dead-lettered after "
+            f"{job.attempts} attempts: {error[:200]}"
+        )
+    else:
+        delay = retry_delay(job.attempts)
+        job.status = 'queued'
+        job.next_attempt_at = now + timedelta(seconds=delay)
+        job.last_error = error[:2000]
+        logger.warning(
+            f"📬 Inbound queue: job {job.id} ({job.kind}) attempt {job.attempts} "
+            f"failed, retrying in {delay}s: {error[:200]}"
+        )
+    db.session.commit()
+
+
+@contextmanager
+def _hold_lease(engine, job_id: int, attempts: int):
+    """Keep renewing the job's ``locked_at`` until the block exits.
+
+    Renewals go through their own connection (the handler owns the session)
+    and only touch the row while it is still this attempt's running claim.
+    """
+    from sqlalchemy import update
+    from models import InboundEmailJob
+
+    stop = threading.Event()
+
+    def _renew():
+        while not stop.wait(LEASE_HEARTBEAT_SECONDS):
+            try:
+                with engine.begin() as conn:
+                    conn.execute(
+                        update(InboundEmailJob)
+                        .where(
+                            InboundEmailJob.id == job_id,
+                            InboundEmailJob.status == 'running',
+                            InboundEmailJob.attempts == attempts,
+                        )
+                        .values(locked_at=datetime.utcnow())
+                    )
+            except Exception as e:  # noqa: BLE001
+                logger.warning(f"📬 Inbound queue: lease renewal for job {job_id} failed: {e}")
+
+    thread = threading.Thread(target=_renew, name=f'inbound-lease-{job_id}', daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        stop.set()
+        thread.join()
+
+
+def run_next(app, worker: str = '') -> bool:
+    """Claim and run one job in a fresh app context. Returns False when idle."""
+    from extensions import db
+
+    with app.app_context():
+        try:
+            job = claim_next(worker)
+            if job is None:
+                return False
+            job_id, kind, payload_json = job.id, job.kind, job.payload_json
+            try:
+                handler = _resolve_handler(kind)
+                with _hold_lease(db.engine, job_id, job.attempts):
+                    result = handler(app, kind, decode_payload(payload_json))
+            except Exception as e:  # noqa: BLE001
+                logger.error(f"📬 Inbound queue: job {job_id} ({kind}) raised: {e}", exc_info=True)
+                db.session.rollback()
+                _finish(job_id, error=f'{type(e).__name__}: {e}')
+            else:
+                db.session.rollback()
+                _finish(job_id, result=result if isinstance(result, dict) else None)
+            return True
+        finally:
+            db.session.remove()
+
+
+# ── Drain threads ───────────────────────────────────────────────────────────
+
+class _DrainPool:
+    """At most ``size`` drain threads per process, started on demand."""
+
+    def __init__(self, size: int):
+        self.size = size
+        self._lock = threading.Lock()
+        self._active = 0
+        self._seq = 0
+        self._pid = os.getpid()
+
+    @property
+    def active(self) -> int:
+        return self._active
+
+    def kick(self, app) -> int:
+        """Top the pool up to ``size`` threads; returns how many were started."""
+        started = 0
+        with self._lock:
+            if self._pid != os.getpid():
+                # Forked (gunicorn preload): the parent's threads did not survive.
+                self._pid = os.getpid()
+                self._active = 0
+            while self._active < self.size:
+                self._seq += 1
+                name = f'inbound-queue-{os.getpid()}-{self._seq}'
+                thread = threading.Thread(
+                    target=self._drain, args=(app, name), name=name, daemon=True
+                )
+                self._active += 1
+                try:
+                    thread.start()
+                except Exception:
+                    self._active -= 1
+                    raise
+                started += 1
+        return started
+
+    def _drain(self, app, name: str):
+        try:
+            while True:
+                try:
+                    if not run_next(app, worker=name):
+                        return
+                except Exception as e:  # noqa: BLE001
+                    logger.error(f"📬 Inbound queue worker {name} error: {e}", exc_info=True)
+                    time.sleep(1)
+                    return
+        finally:
+            with self._lock:
+                self._active = max(0, self._active - 1)
+
+
+_POOL = _DrainPool(WORKERS)
+
+
+def kick(app) -> int:
+    """Make sure drain threads are running for any claimable jobs."""
+    return _POOL.kick(app)
+
+
+def drain(app, max_jobs: int = 100) -> int:
+    """Run up to ``max_jobs`` jobs on the calling thread; returns the count."""
+    ran = 0
+    while ran < max_jobs and run_next(app, worker=f'inline-{os.getpid()}'):
+        ran += 1
+    return ran
+
+
+def wait_for(app, job_ids: Iterable[int], timeout: float = 300,
+             poll_interval: float = 0.25) -> Dict[int, Dict]:
+    """Block until every job has settled or ``timeout`` elapses.
+
+    A job is settled once it is done, dead-lettered, or waiting on a retry
+    after a failed attempt. Returns ``{job_id: {'status', 'result', 'error'}}``;
+    jobs still in flight at the deadline are reported with status 'pending'.
+    With no drain threads configured the caller runs the jobs itself.
+    """
+    from extensions import db
+    from models import InboundEmailJob
+
+    pending = set(job_ids)
+    outcome: Dict[int, Dict] = {}
+    deadline = time.monotonic() + timeout
+    while pending:
+        rows = db.session.query(
+            InboundEmailJob.id, InboundEmailJob.status, InboundEmailJob.attempts,
+            InboundEmailJob.result_json, InboundEmailJob.last_error,
+        ).filter(InboundEmailJob.id.in_(list(pending))).all()
+        db.session.rollback()
+        for job_id, status, attempts, result_json, last_error in rows:
+            retrying = status == 'queued' and attempts > 0
+            if status in ('done', 'dead') or retrying:
+                outcome[job_id] = {
+                    'status': 'retrying' if retrying else status,
+                    'result': json.loads(result_json) if result_json else {},
+                    'error': last_error,
+                }
+                pending.discard(job_id)
+        for job_id in pending - {r[0] for r in rows}:
+            outcome[job_id] = {'status': 'missing', 'result': {}, 'error': None}
+            pending.discard(job_id)
+        if not pending:
+            break
+        if time.monotonic() >= deadline:
+            for job_id in pending:
+                outcome[job_id] = {'status': 'pending', 'result': {}, 'error': None}
+            break
+        if _POOL.size == 0:
+            if not drain(app, max_jobs=1):
+                time.sleep(poll_interval)
+        else:
+            kick(app)
+            time.sleep(poll_interval)
+    return outcome
+
+
+def queue_depth() -> Dict:
+    """Queue metrics for dashboards: counts by status, backlog by kind, lag."""
+    from sqlalchemy import func
+    from extensions import db
+    from models import InboundEmailJob
+
+    by_status = dict(
+        db.session.query(InboundEmailJob.status, func.count(InboundEmailJob.id))
+        .group_by(InboundEmailJob.status).all()
+    )
+    queued_by_kind = dict(
+        db.session.query(InboundEmailJob.kind, func.count(InboundEmailJob.id))
+        .filter(InboundEmailJob.status == 'queued')
+        .group_by(InboundEmailJob.kind).all()
+    )
+    retrying = db.session.query(func.count(InboundEmailJob.id)).filter(
+        InboundEmailJob.status == 'queued', InboundEmailJob.attempts > 0
+    ).scalar() or 0
+    oldest = db.session.query(func.min(InboundEmailJob.created_at)).filter(
+        InboundEmailJob.status.in_(('queued', 'running'))
+    ).scalar()
+    return {
+        'queued': by_status.get('queued', 0),
+        'running': by_status.get('running', 0),
+        'retrying': retrying,
+        'dead': by_status.get('dead', 0),
+        'done': by_status.get('done', 0),
+        'queued_by_kind': queued_by_kind,
+        'oldest_pending_age_seconds': (
+            int((datetime.utcnow() - oldest).total_seconds()) if oldest else 0
+        ),
+        'workers_active': _POOL.active,
+        'workers_max': _POOL.size,
+    }
@@ -24,6 +24,110 @@ from tearsheet_config import TearsheetConfig
 from email_service import EmailService
 from utils.field_mappers import map_employment_type, map_remote_type
 
+class XMLFeedDocument:
+    """In-memory view of the feed file for one monitoring cycle.
+
+    The file is parsed once and a ``bhatsid -> <job>`` index is built up
+    front, so every add/remove/update during the cycle is a dict lookup plus
+    a tree splice instead of a full re-parse and linear ``.//job`` scan.
+    Nothing touches disk until ``commit()``, which writes the tree once.
+    """
+
+    def __init__(self, xml_file: str, tree, parser=None, created: bool = False):
+        self.xml_file = xml_file
+        self.tree = tree
+        self.root = tree.getroot()
+        self.parser = parser
+        self.dirty = created
+        self._index: Dict[str, etree._Element] = {}
+        for job_elem in self.root.findall('.//job'):
+            job_id = self._job_id(job_elem)
+            # First occurrence wins, matching the old find-first scan.
+            if job_id and job_id not in self._index:
+                self._index[job_id] = job_elem
+
+    @classmethod
+    def load(cls, xml_file: str, parser=None) -> 'XMLFeedDocument':
+        """Parse ``xml_file``, or start from an empty scaffold if it is missing
+        (Render's ephemeral filesystem wipes it on every deploy)."""
+        if os.path.exists(xml_file):
+            return cls(xml_file, etree.parse(xml_file, parser), parser)
+        root = etree.Element('source')
+        etree.SubElement(root, 'title').text = 'Myticas Consulting'
+        etree.SubElement(root, 'link').text = 'https://www.myticas.com'
+        etree.SubElement(root, 'publisherurl').text = 'https://www.myticas.com'
+        return cls(xml_file, etree.ElementTree(root), parser, created=True)
+
+    @staticmethod
+    def _job_id(job_elem) -> str:
+        bhatsid_elem = job_elem.find('.//bhatsid')
+        if bhatsid_elem is None or not bhatsid_elem.text:
+            return ''
+        text = bhatsid_elem.text
+        if '<![CDATA[' in text:
+            text = re.sub(r'<!\[CDATA\[(.*?)\]\]>', r'\1', text, flags=re.DOTALL)
+        return text.strip()
+
+    def __contains__(self, job_id) -> bool:
+        return str(job_id) in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def job_ids(self) -> Set[str]:
+        return set(self._index)
+
+    def elements(self) -> Dict[str, etree._Element]:
+        return dict(self._index)
+
+    def add(self, job_elem) -> bool:
+        """Insert a new <job> right after the publisher header."""
+        job_id = self._job_id(job_elem)
+        publisher_url = self.root.find('publisherurl')
+        if publisher_url is not None:
+            self.root.insert(self.root.index(publisher_url) + 1, job_elem)
+        else:
+            self.root.append(job_elem)
+        if job_id and job_id not in self._index:
+            self._index[job_id] = job_elem
+        self.dirty = True
+        return True
+
+    def remove(self, job_id) -> bool:
+        job_elem = self._index.pop(str(job_id), None)
+        if job_elem is None:
+            return False
+        parent = job_elem.getparent()
+        if parent is not None:
+            parent.remove(job_elem)
+        self.dirty = True
+        return True
+
+    def replace(self, job_id, new_job_elem) -> bool:
+        """Swap the existing <job> in place, keeping its position in the feed."""
+        job_id = str(job_id)
+        job_elem = self._index.get(job_id)
+        if job_elem is None:
+            return False
+        parent = job_elem.getparent()
+        parent.replace(job_elem, new_job_elem)
+        self._index[job_id] = new_job_elem
+        self.dirty = True
+        return True
+
+    def commit(self, writer) -> bool:
+        """Persist pending changes with a single ``writer(xml_file, tree)`` call.
+
+        Returns True when there was nothing to write.
+        """
+        if not self.dirty:
+            return True
+        if not writer(self.xml_file, self.tree):
+            return False
+        self.dirty = False
+        return True
+
+
 class IncrementalMonitoringService:
     """Simplified incremental monitoring service"""
     
@@ -87,13 +191,12 @@ class IncrementalMonitoringService:
                     
                     credentials = {}
                     for key in ['bullhorn_client_id', 'bullhorn_client_secret', 'bullhorn_username', 'bullhorn_password']:
-                        setting = GlobalSettings.query.filter_by(setting_key=key).first()
-                        if setting and setting.setting_value:
-                            credentials[key] = setting.setting_value.strip()
+                        value = GlobalSettings.settings.get_str(key)
+                        if value:
+                            credentials[key] = value
                     
                     # Get alert email from global settings
-                    alert_setting = GlobalSettings.query.filter_by(setting_key='alert_email').first()
-                    self.alert_email = alert_setting.setting_value if alert_setting else 'kroots@myticas.com'
+                    self.alert_email = GlobalSettings.settings.get('alert_email', 'kroots@myticas.com')
                     
                     # Initialize email service
                     self.email_service = EmailService(db=db, EmailDeliveryLog=EmailDeliveryLog)
@@ -130,7 +233,8 @@ class IncrementalMonitoringService:
             # Step 2: Load current XML and compare
             self.logger.info("\n📄 Step 2: Loading current XML and comparing...")
             self.logger.info("  🔍 About to call _load_xml_jobs()...")
-            current_xml_jobs = self._load_xml_jobs(xml_file)
+            feed_doc = self._open_feed_document(xml_file)
+            current_xml_jobs = self._load_xml_jobs(xml_file, document=feed_doc)
             self.logger.info(f"  ✅ XML LOAD COMPLETED: {len(current_xml_jobs)} jobs")
             self.logger.info(f"  Current XML has {len(current_xml_jobs)} jobs")
             
@@ -167,71 +271,25 @@ class IncrementalMonitoringService:
             # Step 3: Apply changes incrementally
             self.logger.info("\n🔄 Step 3: Applying incremental changes...")
             
-            # Add new jobs (preserve any existing reference numbers if they somehow exist)
-            jobs_needing_requirements = []  # Collect jobs for batch requirements extraction
+            # Add new jobs (preserve any existing reference numbers if they somehow exist).
+            # Counting, requirements extraction and alerts wait until the feed is written.
+            added_jobs = []
             
             for job_id in jobs_to_add:
                 try:
                     job_data = bullhorn_jobs[job_id]
                     # Map to XML format with proper field trimming
                     xml_job = self._map_to_xml_format(job_data)
-                    if self._add_job_to_xml(xml_file, xml_job):
-                        cycle_results['jobs_added'] += 1
-                        job_title = job_data.get('title', 'Untitled Position')
-                        self.logger.info(f"  ✅ Added job {job_id}: {job_title}")
-                        
-                        # Queue for requirements extraction
-                        jobs_needing_requirements.append({
-                            'id': job_id,
-                            'title': job_title,
-                            'description': job_data.get('publicDescription', '') or job_data.get('description', '')
-                        })
-                        
-                        # Send email notification for new job
-                        if self.email_service and self.alert_email:
-                            try:
-                                # Determine monitor name from job data if available
-                                monitor_name = None
-                                if hasattr(self, 'current_monitor_name'):
-                                    monitor_name = self.current_monitor_name
-                                
-                                self.email_service.send_new_job_notification(
-                                    to_email=self.alert_email,
-                                    job_id=str(job_id),
-                                    job_title=job_title,
-                                    monitor_name=monitor_name
-                                )
-                                self.logger.info(f"  📧 Email notification sent for new job {job_id}")
-                            except Exception as email_error:
-                                self.logger.warning(f"  ⚠️ Failed to send email for job {job_id}: {str(email_error)}")
-                                # Don't fail the whole cycle if email fails
+                    if feed_doc.add(self._create_job_element(xml_job)):
+                        added_jobs.append((job_id, job_data))
                 except Exception as e:
                     self.logger.error(f"  ❌ Failed to add job {job_id}: {str(e)}")
                     cycle_results['errors'].append(f"Add job {job_id}: {str(e)}")
             
-            # Extract requirements for new jobs (so they're available for review before vetting)
-            if jobs_needing_requirements:
-                try:
-                    from flask import current_app
-                    from app import app as flask_app
-                    from candidate_vetting_service import CandidateVettingService
-                    
-                    # Ensure we have app context for database operations
-                    with flask_app.app_context():
-                        vetting_service = CandidateVettingService()
-                        req_results = vetting_service.extract_requirements_for_jobs(jobs_needing_requirements)
-                        self.logger.info(f"  📋 Extracted requirements for {req_results.get('extracted', 0)} new jobs")
-                        cycle_results['requirements_extracted'] = req_results.get('extracted', 0)
-                except RuntimeError as ctx_error:
-                    # Handle case where app context isn't available
-                    self.logger.warning(f"  ⚠️ App context not available for requirements extraction: {str(ctx_error)}")
-                except Exception as req_error:
-                    self.logger.warning(f"  ⚠️ Failed to extract job requirements: {str(req_error)}")
-            
             # Remove jobs no longer in Bullhorn
             for job_id in jobs_to_remove:
                 try:
-                    if self._remove_job_from_xml(xml_file, job_id):
+                    if feed_doc.remove(job_id):
                         cycle_results['jobs_removed'] += 1
                         self.logger.info(f"  ✅ Removed job {job_id}")
                 except Exception as e:
@@ -251,7 +309,7 @@ class IncrementalMonitoringService:
                         preserved_ref = xml_job.get('referencenumber', '')
                         xml_updated = self._map_to_xml_format(job_data, preserved_ref)
                         
-                        if self._update_job_in_xml(xml_file, job_id, xml_updated):
+                        if feed_doc.replace(job_id, self._create_job_element(xml_updated)):
                             updates_made += 1
                             self.logger.info(f"  ✅ Updated job {job_id}: {job_data.get('title', '')}")
                 except Exception as e:
@@ -260,13 +318,75 @@ class IncrementalMonitoringService:
             
             cycle_results['jobs_updated'] = updates_made
             
+            # All changes were applied in memory; write the feed exactly once.
+            feed_written = feed_doc.commit(self._write_xml_atomically)
+            if not feed_written:
+                cycle_results['errors'].append("XML write failed")
+                # Nothing reached the file; the next cycle will see these jobs as new again.
+                added_jobs = []
+            
+            jobs_needing_requirements = []  # Collect jobs for batch requirements extraction
+            
+            for job_id, job_data in added_jobs:
+                cycle_results['jobs_added'] += 1
+                job_title = job_data.get('title', 'Untitled Position')
+                self.logger.info(f"  ✅ Added job {job_id}: {job_title}")
+                
+                # Queue for requirements extraction
+                jobs_needing_requirements.append({
+                    'id': job_id,
+                    'title': job_title,
+                    'description': job_data.get('publicDescription', '') or job_data.get('description', '')
+                })
+                
+                # Send email notification for new job
+                if self.email_service and self.alert_email:
+                    try:
+                        # Determine monitor name from job data if available
+                        monitor_name = None
+                        if hasattr(self, 'current_monitor_name'):
+                            monitor_name = self.current_monitor_name
+                        
+                        self.email_service.send_new_job_notification(
+                            to_email=self.alert_email,
+                            job_id=str(job_id),
+                            job_title=job_title,
+                            monitor_name=monitor_name
+                        )
+                        self.logger.info(f"  📧 Email notification sent for new job {job_id}")
+                    except Exception as email_error:
+                        self.logger.warning(f"  ⚠️ Failed to send email for job {job_id}: {str(email_error)}")
+                        # Don't fail the whole cycle if email fails
+            
+            # Extract requirements for new jobs (so they're available for review before vetting)
+            if jobs_needing_requirements:
+                try:
+                    from flask import current_app
+                    from app import app as flask_app
+                    from candidate_vetting_service import CandidateVettingService
+                    
+                    # Ensure we have app context for database operations
+                    with flask_app.app_context():
+                        vetting_service = CandidateVettingService()
+                        req_results = vetting_service.extract_requirements_for_jobs(jobs_needing_requirements)
+                        self.logger.info(f"  📋 Extracted requirements for {req_results.get('extracted', 0)} new jobs")
+                        cycle_results['requirements_extracted'] = req_results.get('extracted', 0)
+                except RuntimeError as ctx_error:
+                    # Handle case where app context isn't available
+                    self.logger.warning(f"  ⚠️ App context not available for requirements extraction: {str(ctx_error)}")
+                except Exception as req_error:
+                    self.logger.warning(f"  ⚠️ Failed to extract job requirements: {str(req_error)}")
+            
             # Count total jobs
-            cycle_results['total_jobs'] = len(self._load_xml_jobs(xml_file))
+            cycle_results['total_jobs'] = len(feed_doc)
             
             # Step 4: Manual workflow - SFTP auto-upload disabled
             self.logger.info("\n📊 Step 4: Monitoring complete - ready for manual download")
-            cycle_results['cycle_success'] = True  # Manual workflow cycle always 'succeeds'
-            self.logger.info("  ✅ XML updated locally - use manual download for publishing")
+            cycle_results['cycle_success'] = feed_written
+            if feed_written:
+                self.logger.info("  ✅ XML updated locally - use manual download for publishing")
+            else:
+                self.logger.error("  ❌ XML write failed - feed left unchanged on disk")
             
             # Include excluded job count in reporting
             excluded_count = getattr(self.bullhorn_service, 'excluded_count', 0) if self.bullhorn_service else 0
@@ -736,29 +856,38 @@ This alert was triggered by the zero-job detection safeguard.
         
         return all_jobs
     
-    def _load_xml_jobs(self, xml_file: str) -> Dict[str, Dict]:
-        """Load jobs from XML file"""
+    def _open_feed_document(self, xml_file: str) -> XMLFeedDocument:
+        """Parse the feed once for this cycle; fall back to an empty scaffold."""
+        try:
+            document = XMLFeedDocument.load(xml_file, self.parser)
+            if document.dirty:
+                self.logger.info(f"Creating XML scaffold: {xml_file}")
+            return document
+        except Exception as e:
+            self.logger.error(f"Error loading XML feed document: {str(e)}")
+            raise
+    
+    def _load_xml_jobs(self, xml_file: str, document: Optional[XMLFeedDocument] = None) -> Dict[str, Dict]:
+        """Load jobs from XML file (or from an already-parsed feed document)"""
         jobs = {}
         
         try:
-            if not os.path.exists(xml_file):
-                return jobs
-            
-            tree = etree.parse(xml_file, self.parser)
-            root = tree.getroot()
-            
-            for job_elem in root.findall('.//job'):
-                # Extract job ID
-                bhatsid_elem = job_elem.find('.//bhatsid')
-                if bhatsid_elem is None:
-                    continue
-                
-                job_id = self._extract_text(bhatsid_elem)
-                if not job_id:
-                    continue
-                
+            if document is not None:
+                job_elems = document.elements()
+            else:
+                if not os.path.exists(xml_file):
+                    return jobs
+                tree = etree.parse(xml_file, self.parser)
+                job_elems = {}
+                for job_elem in tree.getroot().findall('.//job'):
+                    # Extract job ID
+                    job_id = self._extract_text(job_elem.find('.//bhatsid'))
+                    if job_id:
+                        job_elems[job_id] = job_elem
+            
+            for job_id, job_elem in job_elems.items():
                 # Extract all job fields
-                job_data = {
+                jobs[job_id] = {
                     'id': job_id,
                     'title': self._extract_text(job_elem.find('.//title')),
                     'company': self._extract_text(job_elem.find('.//company')),
@@ -777,8 +906,6 @@ This alert was triggered by the zero-job detection safeguard.
                     'senioritylevel': self._extract_text(job_elem.find('.//senioritylevel'))
                 }
                 
-                jobs[job_id] = job_data
-                
         except Exception as e:
             self.logger.error(f"Error loading XML jobs: {str(e)}")
         
@@ -986,38 +1113,14 @@ This alert was triggered by the zero-job detection safeguard.
         
         return False
     
+    # Single-change helpers. run_monitoring_cycle batches everything through
+    # one XMLFeedDocument; these stay for callers that touch a single job.
     def _add_job_to_xml(self, xml_file: str, job_data: Dict) -> bool:
         """Add job to XML file with atomic write"""
         try:
-            # Bootstrap empty XML scaffold if file doesn't exist
-            # (Render's ephemeral filesystem wipes it on every deploy)
-            if not os.path.exists(xml_file):
-                self.logger.info(f"Creating XML scaffold: {xml_file}")
-                root = etree.Element('source')
-                etree.SubElement(root, 'title').text = 'Myticas Consulting'
-                etree.SubElement(root, 'link').text = 'https://www.myticas.com'
-                etree.SubElement(root, 'publisherurl').text = 'https://www.myticas.com'
-                tree = etree.ElementTree(root)
-                self._write_xml_atomically(xml_file, tree)
-
-            # Read current XML
-            tree = etree.parse(xml_file, self.parser)
-            root = tree.getroot()
-            
-            # Create job element
-            job_elem = self._create_job_element(job_data)
-            
-            # Add after publisher info
-            publisher_url = root.find('.//publisherurl')
-            if publisher_url is not None:
-                index = list(root).index(publisher_url) + 1
-                root.insert(index, job_elem)
-            else:
-                root.append(job_elem)
-            
-            # Write atomically
-            return self._write_xml_atomically(xml_file, tree)
-            
+            document = XMLFeedDocument.load(xml_file, self.parser)
+            document.add(self._create_job_element(job_data))
+            return document.commit(self._write_xml_atomically)
         except Exception as e:
             self.logger.error(f"Error adding job: {str(e)}")
             return False
@@ -1025,25 +1128,10 @@ This alert was triggered by the zero-job detection safeguard.
     def _remove_job_from_xml(self, xml_file: str, job_id: str) -> bool:
         """Remove job from XML file with atomic write"""
         try:
-            # Read current XML
-            tree = etree.parse(xml_file, self.parser)
-            root = tree.getroot()
-            
-            # Find and remove job
-            removed = False
-            for job_elem in root.findall('.//job'):
-                bhatsid_elem = job_elem.find('.//bhatsid')
-                if bhatsid_elem is not None:
-                    if self._extract_text(bhatsid_elem) == str(job_id):
-                        root.remove(job_elem)
-                        removed = True
-                        break
-            
-            if removed:
-                return self._write_xml_atomically(xml_file, tree)
-            
-            return False
-            
+            document = XMLFeedDocument(xml_file, etree.parse(xml_file, self.parser), self.parser)
+            if not document.remove(job_id):
+                return False
+            return document.commit(self._write_xml_atomically)
         except Exception as e:
             self.logger.error(f"Error removing job: {str(e)}")
             return False
@@ -1051,34 +1139,10 @@ This alert was triggered by the zero-job detection safeguard.
     def _update_job_in_xml(self, xml_file: str, job_id: str, job_data: Dict) -> bool:
         """Update job in XML file preserving reference number"""
         try:
-            # Read current XML
-            tree = etree.parse(xml_file, self.parser)
-            root = tree.getroot()
-            
-            # Find and update job
-            updated = False
-            for job_elem in root.findall('.//job'):
-                bhatsid_elem = job_elem.find('.//bhatsid')
-                if bhatsid_elem is not None:
-                    if self._extract_text(bhatsid_elem) == str(job_id):
-                        # Get parent and index
-                        parent = job_elem.getparent()
-                        index = list(parent).index(job_elem)
-                        
-                        # Create new element with updated data
-                        new_job_elem = self._create_job_element(job_data)
-                        
-                        # Replace old with new
-                        parent.remove(job_elem)
-                        parent.insert(index, new_job_elem)
-                        updated = True
-                        break
-            
-            if updated:
-                return self._write_xml_atomically(xml_file, tree)
-            
-            return False
-            
+            document = XMLFeedDocument(xml_file, etree.parse(xml_file, self.parser), self.parser)
+            if not document.replace(job_id, self._create_job_element(job_data)):
+                return False
+            return document.commit(self._write_xml_atomically)
         except Exception as e:
             self.logger.error(f"Error updating job: {str(e)}")
             return False
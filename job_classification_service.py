@@ -7,11 +7,13 @@ import os
 import json
 import re
 import logging
+import threading
 import time
 from typing import Dict, List, Optional, Any, Union
 # the newest OpenAI model is "gpt-5" which was released August 7, 2025.
 # do not change this unless explicitly requested by the user
 from openai import OpenAI
+from services.openai_governor import shared_http_client
 
 class AIJobClassifier:
     """AI-powered classifier using OpenAI with LinkedIn's official categories"""
@@ -24,7 +26,7 @@ class AIJobClassifier:
         if not api_key:
             raise ValueError("OPENAI_API_KEY environment variable is required")
         
-        self.client = OpenAI(api_key=api_key)
+        self.client = OpenAI(api_key=api_key, http_client=shared_http_client())
         
         # LinkedIn Job Functions (28 categories) - from linkedin_categories.md
         self.job_functions = [
@@ -188,6 +190,109 @@ Context-specific guidance:
             }
 
 
+def _trie_pattern(words) -> str:
+    """Regex source for ``words`` laid out as a character trie, so the regex
+    engine walks shared prefixes once instead of trying each word in turn.
+    Longer words are preferred where one word is a prefix of another."""
+    trie: Dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[''] = {}
+
+    def _build(node) -> str:
+        branches = [re.escape(ch) + _build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        return '(?:' + body + ')?' if '' in node else body
+
+    return _build(trie)
+
+
+class _KeywordScanner:
+    """
+    Multi-pattern matcher for the InternalJobClassifier keyword tables.
+
+    All keywords are compiled into one trie-shaped regex that reports the
+    longest keyword starting at every offset, in a single pass of the C regex
+    engine. Any keyword occurring in the text is a prefix of the longest match
+    at its own offset, so expanding each distinct match to the keywords it
+    contains yields exactly the set ``{kw for kw in keywords if kw in text}``.
+    """
+
+    def __init__(self, keywords):
+        keywords = sorted({kw for kw in keywords if kw})
+        first_chars = ''.join(sorted({kw[0] for kw in keywords}))
+        self._pattern = re.compile(
+            '(?=[' + re.escape(first_chars) + '])(?=(' + _trie_pattern(keywords) + '))'
+        ) if keywords else None
+        self._contained = {kw: frozenset(k for k in keywords if k in kw) for kw in keywords}
+
+    def hits(self, text: str) -> set:
+        """Keywords that occur in ``text`` as substrings."""
+        found = set()
+        if self._pattern is None or not text:
+            return found
+        for match in set(self._pattern.findall(text)):
+            found |= self._contained[match]
+        return found
+
+
+def _best_category(categories, title_hits: set, desc_hits: set, default: str) -> str:
+    """Highest-scoring category (title hit 3, description-only hit 1); the
+    first category wins ties and nothing beats a score of 0."""
+    best_name, best_score = default, 0
+    for name, keywords in categories:
+        score = sum(3 if kw in title_hits else (1 if kw in desc_hits else 0) for kw in keywords)
+        if score > best_score:
+            best_score = score
+            best_name = name
+    return best_name
+
+
+class _KeywordTables:
+    """Function and industry tables plus one scanner covering both."""
+
+    def __init__(self, function_keywords: Dict[str, List[str]], industry_keywords: Dict[str, List[str]]):
+        self.functions = tuple((name, tuple(kws)) for name, kws in function_keywords.items())
+        self.industries = tuple((name, tuple(kws)) for name, kws in industry_keywords.items())
+        self.scanner = _KeywordScanner(
+            kw for _, kws in self.functions + self.industries for kw in kws
+        )
+
+
+# Seniority tiers in precedence order; keywords match on letter boundaries.
+_SENIORITY_TIERS = (
+    ("Executive", ['ceo', 'cto', 'cfo', 'chief', 'president', 'vp', 'vice president', 'executive']),
+    ("Director", ['director', 'head of', 'managing']),
+    ("Mid-Senior level", ['senior', 'sr.', 'sr ', 'lead', 'principal', 'staff']),
+    ("Entry level", ['junior', 'jr.', 'jr ', 'entry', 'associate', 'assistant']),
+    ("Internship", ['intern', 'internship', 'co-op']),
+)
+_SENIORITY_PATTERNS = tuple(
+    (level, re.compile(r'(?<![a-z])(?:' + '|'.join(re.escape(kw) for kw in keywords) + r')(?![a-z])'))
+    for level, keywords in _SENIORITY_TIERS
+)
+
+# Compiled once per process per distinct pair of keyword tables.
+_TABLES_CACHE: Dict[tuple, _KeywordTables] = {}
+_TABLES_LOCK = threading.Lock()
+
+
+def _keyword_tables(function_keywords: Dict[str, List[str]], industry_keywords: Dict[str, List[str]]) -> _KeywordTables:
+    key = (
+        tuple((name, tuple(kws)) for name, kws in function_keywords.items()),
+        tuple((name, tuple(kws)) for name, kws in industry_keywords.items()),
+    )
+    with _TABLES_LOCK:
+        tables = _TABLES_CACHE.get(key)
+        if tables is None:
+            tables = _TABLES_CACHE[key] = _KeywordTables(function_keywords, industry_keywords)
+        return tables
+
+
 class InternalJobClassifier:
     """Sophisticated keyword-based classifier - fast, reliable, deterministic"""
     
@@ -248,6 +353,8 @@ class InternalJobClassifier:
             'Wholesale': ['wholesale', 'distribution', 'distributor', 'b2b sales']
         }
         
+        self._tables = _keyword_tables(self.function_keywords, self.industry_keywords)
+        
         self.logger.info("🔧 Enhanced keyword classifier initialized (28 functions, 20 industries, 5 seniority levels)")
     
     def classify_job(self, title: str, description: str) -> Dict[str, Any]:
@@ -259,38 +366,20 @@ class InternalJobClassifier:
             title_lower = (title or "").lower().strip()
             desc_lower = (description or "").lower().strip()
             
-            # Find best function (title keywords weighted 3x higher than description)
-            job_function = "Operations"  # Neutral default
-            best_score = 0
-            for func, keywords in self.function_keywords.items():
-                score = sum(3 if kw in title_lower else (1 if kw in desc_lower else 0) for kw in keywords)
-                if score > best_score:
-                    best_score = score
-                    job_function = func
-            
-            # Find best industry (title keywords weighted 3x higher than description)
-            industry = "Professional Services"  # Neutral default
-            best_score = 0
-            for ind, keywords in self.industry_keywords.items():
-                score = sum(3 if kw in title_lower else (1 if kw in desc_lower else 0) for kw in keywords)
-                if score > best_score:
-                    best_score = score
-                    industry = ind
+            # One pass over each text finds every function and industry keyword
+            tables = self._tables
+            title_hits = tables.scanner.hits(title_lower)
+            desc_hits = tables.scanner.hits(desc_lower)
             
-            def _word_match(keyword, text):
-                return bool(re.search(r'(?<![a-z])' + re.escape(keyword) + r'(?![a-z])', text))
+            # Find best function / industry (title keywords weighted 3x higher than description)
+            job_function = _best_category(tables.functions, title_hits, desc_hits, "Operations")  # Neutral default
+            industry = _best_category(tables.industries, title_hits, desc_hits, "Professional Services")  # Neutral default
 
             seniority = "Mid-Senior level"
-            if any(_word_match(kw, title_lower) for kw in ['ceo', 'cto', 'cfo', 'chief', 'president', 'vp', 'vice president', 'executive']):
-                seniority = "Executive"
-            elif any(_word_match(kw, title_lower) for kw in ['director', 'head of', 'managing']):
-                seniority = "Director"
-            elif any(_word_match(kw, title_lower) for kw in ['senior', 'sr.', 'sr ', 'lead', 'principal', 'staff']):
-                seniority = "Mid-Senior level"
-            elif any(_word_match(kw, title_lower) for kw in ['junior', 'jr.', 'jr ', 'entry', 'associate', 'assistant']):
-                seniority = "Entry level"
-            elif any(_word_match(kw, title_lower) for kw in ['intern', 'internship', 'co-op']):
-                seniority = "Internship"
+            for level, pattern in _SENIORITY_PATTERNS:
+                if pattern.search(title_lower):
+                    seniority = level
+                    break
             
             # ALWAYS return success with populated fields
             return {
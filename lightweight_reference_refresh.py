@@ -172,16 +172,11 @@ def save_references_to_database(xml_content):
     Called during manual refresh and uploads to maintain reference state
     """
     try:
-        from app import db
-        from models import JobReferenceNumber
-        
         # Parse XML content to extract job references
         parser = etree.XMLParser(strip_cdata=False)
         root = etree.fromstring(xml_content.encode('utf-8'), parser)
         
-        saved_count = 0
-        updated_count = 0
-        
+        rows = []
         for job in root.findall('.//job'):
             job_id_elem = job.find('bhatsid')
             ref_elem = job.find('referencenumber')
@@ -191,36 +186,122 @@ def save_references_to_database(xml_content):
                 job_id = job_id_elem.text.strip() if job_id_elem.text else ""
                 ref_text = ref_elem.text.strip() if ref_elem.text else ""
                 job_title = title_elem.text.strip() if title_elem and title_elem.text else ""
-                
-                if job_id and ref_text:
-                    # Check if this job reference already exists
-                    existing_ref = JobReferenceNumber.query.filter_by(bullhorn_job_id=job_id).first()
-                    
-                    if existing_ref:
-                        # Update existing reference if it changed
-                        if existing_ref.reference_number != ref_text:
-                            existing_ref.reference_number = ref_text
-                            existing_ref.job_title = job_title
-                            updated_count += 1
-                    else:
-                        # Create new reference entry
-                        new_ref = JobReferenceNumber(
-                            bullhorn_job_id=job_id,
-                            reference_number=ref_text,
-                            job_title=job_title
-                        )
-                        db.session.add(new_ref)
-                        saved_count += 1
+                rows.append((job_id, ref_text, job_title))
+        
+    except Exception as e:
+        logger.error(f"❌ Error saving references to database: {str(e)}")
+        return False
+    
+    return save_reference_rows_to_database(rows)
+
+
+# Rows per INSERT ... ON CONFLICT statement (keeps bind-parameter counts sane).
+REFERENCE_UPSERT_CHUNK = 500
+
+
+def save_reference_rows_to_database(rows):
+    """
+    Persist (bullhorn_job_id, reference_number, job_title) rows. The streaming
+    feed writer collects these while serializing, so it never has to re-parse
+    the document it just wrote.
+
+    Rows are written with bulk ``INSERT ... ON CONFLICT DO UPDATE`` statements
+    instead of a lookup per job; an existing row is only touched when its
+    reference number actually differs (its title is refreshed alongside).
+    """
+    try:
+        from app import db
+        from models import JobReferenceNumber
+        
+        # Last row wins for a repeated job id: ON CONFLICT cannot touch the
+        # same row twice in one statement.
+        deduped = {}
+        for job_id, ref_text, job_title in rows:
+            if job_id and ref_text:
+                deduped[job_id] = (ref_text, job_title)
+        
+        if not deduped:
+            logger.info("💾 Database saved: no reference numbers to write")
+            return True
+        
+        dialect = db.engine.dialect.name
+        if dialect == 'postgresql':
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        elif dialect == 'sqlite':
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        else:
+            return _save_reference_rows_one_by_one(db, JobReferenceNumber, deduped)
+        
+        now = datetime.utcnow()
+        values = [
+            {
+                'bullhorn_job_id': job_id,
+                'reference_number': ref_text,
+                'job_title': job_title,
+                'created_at': now,
+                'updated_at': now,
+            }
+            for job_id, (ref_text, job_title) in deduped.items()
+        ]
+        
+        written = 0
+        for start in range(0, len(values), REFERENCE_UPSERT_CHUNK):
+            stmt = dialect_insert(JobReferenceNumber).values(values[start:start + REFERENCE_UPSERT_CHUNK])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=['bullhorn_job_id'],
+                set_={
+                    'reference_number': stmt.excluded.reference_number,
+                    'job_title': stmt.excluded.job_title,
+                    'updated_at': stmt.excluded.updated_at,
+                },
+                where=JobReferenceNumber.reference_number != stmt.excluded.reference_number,
+            )
+            written += db.session.execute(stmt).rowcount or 0
         
         db.session.commit()
-        logger.info(f"💾 Database saved: {saved_count} new, {updated_count} updated reference numbers")
+        logger.info(f"💾 Database saved: {written} new/changed of {len(values)} reference numbers (bulk upsert)")
         return True
         
     except Exception as e:
         logger.error(f"❌ Error saving references to database: {str(e)}")
+        try:
+            from app import db
+            db.session.rollback()
+        except Exception:
+            pass
         return False
 
 
+def _save_reference_rows_one_by_one(db, JobReferenceNumber, deduped):
+    """Fallback for databases without ON CONFLICT support."""
+    saved_count = 0
+    updated_count = 0
+    
+    existing = {
+        ref.bullhorn_job_id: ref
+        for ref in JobReferenceNumber.query.filter(JobReferenceNumber.bullhorn_job_id.in_(list(deduped))).all()
+    }
+    for job_id, (ref_text, job_title) in deduped.items():
+        existing_ref = existing.get(job_id)
+        if existing_ref:
+            # Update existing reference if it changed
+            if existing_ref.reference_number != ref_text:
+                existing_ref.reference_number = ref_text
+                existing_ref.job_title = job_title
+                updated_count += 1
+        else:
+            db.session.add(JobReferenceNumber(
+                bullhorn_job_id=job_id,
+                reference_number=ref_text,
+                job_title=job_title
+            ))
+            saved_count += 1
+    
+    db.session.commit()
+    logger.info(f"💾 Database saved: {saved_count} new, {updated_count} updated reference numbers")
+    return True
+
+
 def refresh_all_feed_references(generator):
     """Rotate reference numbers for every job across all published XML feeds.
 
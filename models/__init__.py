@@ -5,11 +5,12 @@ Every class previously imported via `from models import X` continues to work.
 
 Domain layout:
     user         — User auth + activity (User, PasswordResetToken, UserActivityLog, RecruiterMapping)
-    scheduling   — XML schedules, processing logs, global settings, scheduler lock
-    ats          — Bullhorn monitors, activity, tearsheet history, parsed emails, owner reassignment cooldown
+    scheduling   — XML schedules, processing logs, global settings, scheduler lock, job leases / run metrics
+    ats          — Bullhorn monitors, activity, tearsheet history, parsed emails, owner reassignment cooldown, inbound email queue
     health       — Environment status / alerts, health checks, log monitoring, backups, OneDrive sync
     vetting      — Candidate vetting logs, job matches, requirements, config, scout vetting sessions, audit, escalation
-    candidate    — Resume cache, profile embedding, merge log, fuzzy queue
+    settings_cache — Process-local cached reads for VettingConfig / GlobalSettings (``Model.settings``)
+    candidate    — Resume cache, profile embedding, merge log, fuzzy queue, contact-key index
     embedding    — Job-side embeddings + filter audit
     automation   — Automation Hub task / log / chat
     support      — Scout Support tickets, conversations, attachments, actions, knowledge hub
@@ -30,6 +31,8 @@ from models.scheduling import (
     GlobalSettings,
     EmailParsingConfig,  # Backward-compat alias for GlobalSettings
     SchedulerLock,
+    SchedulerJobLease,
+    SchedulerJobRun,
 )
 from models.ats import (
     BullhornMonitor,
@@ -39,6 +42,7 @@ from models.ats import (
     ParsedEmail,
     OwnerReassignmentCooldown,
     ApplyPageVisit,
+    InboundEmailJob,
 )
 from models.health import (
     EnvironmentStatus,
@@ -67,9 +71,11 @@ from models.candidate import (
     CandidateMergeLog,
     CandidateProfileEmbedding,
     FuzzyEvaluationQueue,
+    CandidateContactKey,
 )
 from models.embedding import (
     JobEmbedding,
+    EmbeddingCacheEntry,
     EmbeddingFilterLog,
     EmbeddingABLog,
     ScreeningABLog,
@@ -93,7 +99,12 @@ from models.prospector import (
     ProspectorRun,
     Prospect,
 )
-from models.openai_telemetry import OpenAICallLog
+from models.openai_telemetry import (
+    OpenAICallLog,
+    OpenAICallRollupHourly,
+    OpenAICallRollupDaily,
+    OpenAICallRollupState,
+)
 from models.cost_forecast import CostForecastOverride, CostForecastScenario
 from models.placement_margin import PlacementMarginCalcLog
 from models.client_onboarding_notify import ClientOnboardingNotifyLog
@@ -110,10 +121,11 @@ __all__ = [
     'AVAILABLE_MODULES', 'User', 'UserActivityLog', 'RecruiterMapping', 'PasswordResetToken',
     # scheduling
     'ScheduleConfig', 'ProcessingLog', 'JobReferenceNumber', 'RefreshLog',
-    'GlobalSettings', 'EmailParsingConfig', 'SchedulerLock',
+    'GlobalSettings', 'EmailParsingConfig', 'SchedulerLock', 'SchedulerJobLease', 'SchedulerJobRun',
     # ats
     'BullhornMonitor', 'BullhornActivity', 'TearsheetJobHistory',
     'EmailDeliveryLog', 'ParsedEmail', 'OwnerReassignmentCooldown', 'ApplyPageVisit',
+    'InboundEmailJob',
     # health
     'EnvironmentStatus', 'EnvironmentAlert', 'VettingHealthCheck',
     'LogMonitoringRun', 'LogMonitoringIssue', 'BackupLog', 'OneDriveSyncFolder',
@@ -123,9 +135,9 @@ __all__ = [
     'VettingConversationTurn', 'VettingAuditLog', 'RecruiterNotificationPref', 'RecruiterNotificationLedger',
     # candidate
     'ParsedResumeCache', 'CandidateCountryCorrectionLog', 'CandidateMergeLog',
-    'CandidateProfileEmbedding', 'FuzzyEvaluationQueue',
+    'CandidateProfileEmbedding', 'FuzzyEvaluationQueue', 'CandidateContactKey',
     # embedding
-    'JobEmbedding', 'EmbeddingFilterLog', 'EmbeddingABLog', 'ScreeningABLog',
+    'JobEmbedding', 'EmbeddingCacheEntry', 'EmbeddingFilterLog', 'EmbeddingABLog', 'ScreeningABLog',
     # automation
     'AutomationTask', 'AutomationLog', 'AutomationChat',
     # support
@@ -134,7 +146,7 @@ __all__ = [
     # prospector
     'ProspectorProfile', 'ProspectorRun', 'Prospect',
     # telemetry
-    'OpenAICallLog',
+    'OpenAICallLog', 'OpenAICallRollupHourly', 'OpenAICallRollupDaily', 'OpenAICallRollupState',
     # placement margin
     'PlacementMarginCalcLog',
     'ClientOnboardingNotifyLog',
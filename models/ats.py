@@ -1,4 +1,4 @@
-"""Bullhorn / ATS integration models: monitors, activity, history, email logs, parsed emails, owner reassignment cooldown."""
+"""Bullhorn / ATS integration models: monitors, activity, history, email logs, parsed emails, owner reassignment cooldown, inbound email queue."""
 from datetime import datetime, timedelta
 from extensions import db
 
@@ -275,3 +275,44 @@ class ApplyPageVisit(db.Model):
             f'<ApplyPageVisit {self.id} job={self.bullhorn_job_id} '
             f'src={self.resolved_source} completed={self.completed}>'
         )
+
+
+class InboundEmailJob(db.Model):
+    """Durable work item for the inbound applicant-email queue.
+
+    The SendGrid webhook and the mailbox puller persist each message here and
+    return immediately; drain threads (``inbound_email_queue``, at most
+    ``INBOUND_QUEUE_WORKERS`` per process, started on demand and exiting once
+    the queue is idle) work through the table by priority with retry/backoff.
+    ``locked_at`` is the running attempt's lease, renewed while it runs. Attachment bytes are
+    base64-encoded inside ``payload_json``, which is cleared once the job
+    reaches a terminal state so finished rows stay small.
+    """
+    __tablename__ = 'inbound_email_job'
+
+    id = db.Column(db.Integer, primary_key=True)
+    kind = db.Column(db.String(32), nullable=False)  # 'inbound', 'scout_vetting', 'scout_support', 'mailbox'
+    priority = db.Column(db.Integer, nullable=False, default=0)  # lower runs first
+    status = db.Column(db.String(16), nullable=False, default='queued')  # 'queued', 'running', 'done', 'dead'
+    dedupe_key = db.Column(db.String(255), nullable=True, index=True)  # Message-ID when known
+    payload_json = db.Column(db.Text, nullable=True)
+    result_json = db.Column(db.Text, nullable=True)
+
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    next_attempt_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    locked_at = db.Column(db.DateTime, nullable=True)
+    locked_by = db.Column(db.String(64), nullable=True)
+    last_error = db.Column(db.Text, nullable=True)
+
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    completed_at = db.Column(db.DateTime, nullable=True)
+
+    __table_args__ = (
+        db.Index('idx_inbound_email_job_claim', 'status', 'priority', 'next_attempt_at'),
+    )
+
+    def __repr__(self):
+        return (
+            f'<InboundEmailJob {self.id} kind={self.kind} status={self.status} '
+            f'attempts={self.attempts}>'
+        )
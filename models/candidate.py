@@ -216,3 +216,28 @@ class FuzzyEvaluationQueue(db.Model):
             f'<FuzzyEvaluationQueue candidate_id={self.bullhorn_candidate_id} '
             f'attempts={self.attempts}>'
         )
+
+
+class CandidateContactKey(db.Model):
+    """Normalised email / E.164 phone → Bullhorn candidate index for dedup.
+
+    Maintained incrementally from the candidate pulls the duplicate-merge
+    service already makes (see ``candidate_contact_index``). Candidates that
+    share a key are found with one indexed self-join instead of two Bullhorn
+    searches per candidate; Bullhorn is only asked to confirm the matches.
+    """
+    __tablename__ = 'candidate_contact_key'
+
+    id = db.Column(db.Integer, primary_key=True)
+    bullhorn_candidate_id = db.Column(db.Integer, nullable=False, index=True)
+    kind = db.Column(db.String(10), nullable=False)  # 'email' | 'phone'
+    value = db.Column(db.String(255), nullable=False)
+    seen_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+    __table_args__ = (
+        db.Index('idx_contact_key_lookup', 'kind', 'value', 'bullhorn_candidate_id'),
+        db.Index('idx_contact_key_seen_at', 'seen_at'),
+    )
+
+    def __repr__(self):
+        return f'<CandidateContactKey {self.kind}={self.value} candidate_id={self.bullhorn_candidate_id}>'
@@ -15,6 +15,10 @@ class JobEmbedding(db.Model):
     job_title = db.Column(db.String(500), nullable=True)
     description_hash = db.Column(db.String(64), nullable=False)  # SHA-256 of description text
     embedding_vector = db.Column(db.Text, nullable=False)  # JSON-serialized float array (1536 dims)
+    # Packed little-endian float32 copy of embedding_vector (4 bytes/dim).
+    # Preferred by readers and the in-process JobEmbeddingIndex; NULL on rows
+    # written before it existed, which fall back to the JSON column.
+    embedding_blob = db.Column(db.LargeBinary, nullable=True)
     embedding_model = db.Column(db.String(50), nullable=False, default='text-embedding-3-large')
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -37,6 +41,31 @@ class JobEmbedding(db.Model):
         return f'<JobEmbedding job_id={self.bullhorn_job_id}>'
 
 
+class EmbeddingCacheEntry(db.Model):
+    """Content-addressed embedding cache (DB tier behind the in-process LRU).
+
+    One row per (model, SHA-256 of whitespace-normalised input text), shared
+    by every embedding call site via services.embedding_cache. Written with
+    INSERT ... ON CONFLICT DO NOTHING, so rows are immutable once stored.
+    """
+    __tablename__ = 'embedding_cache'
+
+    id = db.Column(db.Integer, primary_key=True)
+    model = db.Column(db.String(60), nullable=False)
+    text_hash = db.Column(db.String(64), nullable=False)
+    dims = db.Column(db.Integer, nullable=True)
+    embedding_blob = db.Column(db.LargeBinary, nullable=False)  # packed float32
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        db.UniqueConstraint('model', 'text_hash', name='uq_embedding_cache_model_hash'),
+        db.Index('ix_embedding_cache_created_at', 'created_at'),
+    )
+
+    def __repr__(self):
+        return f'<EmbeddingCacheEntry model={self.model} hash={self.text_hash[:12]}>'
+
+
 class EmbeddingFilterLog(db.Model):
     """Audit trail of candidate-job pairs filtered by the embedding pre-filter (Layer 1)"""
     __tablename__ = 'embedding_filter_log'
@@ -1,10 +1,11 @@
 """OpenAI call telemetry — per-invocation usage + estimated cost log.
 
-Single append-only table populated by `services.openai_helper.log_call()`.
-Powers the AI Cost dashboard tile and Phase 1 cost-reduction monitoring.
+Append-only `openai_call_log` populated by `services.openai_helper.log_call()`,
+plus hourly / daily rollups of it that the AI Cost dashboards, the spend
+alert and the forecaster read so their cost does not grow with log history.
 """
 from datetime import datetime
-from sqlalchemy import BigInteger, Index, Integer
+from sqlalchemy import BigInteger, Index, Integer, UniqueConstraint
 
 from extensions import db
 
@@ -46,3 +47,56 @@ class OpenAICallLog(db.Model):
         Index('ix_openai_call_log_tenant_created', 'tenant_id', 'created_at'),
         Index('ix_openai_call_log_customer_created', 'customer_id', 'created_at'),
     )
+
+
+class _OpenAICallRollupMixin:
+    """Shared columns for the hourly / daily `openai_call_log` rollups.
+
+    Keyed by (bucket_start, call_site_id, model, tenant_id). `tenant_id` is
+    '' rather than NULL for untenanted calls so the unique key dedupes.
+    Maintained by `services.ai_cost_rollup.refresh_rollups()`.
+    """
+    id = db.Column(BigInteger().with_variant(Integer, 'sqlite'), primary_key=True, autoincrement=True)
+    bucket_start = db.Column(db.DateTime, nullable=False, index=True)
+    call_site_id = db.Column(db.String(80), nullable=False)
+    model = db.Column(db.String(80), nullable=False)
+    tenant_id = db.Column(db.String(80), nullable=False, default='')
+
+    calls = db.Column(db.Integer, default=0, nullable=False)
+    failures = db.Column(db.Integer, default=0, nullable=False)
+    input_tokens = db.Column(BigInteger, default=0, nullable=False)
+    output_tokens = db.Column(BigInteger, default=0, nullable=False)
+    cached_input_tokens = db.Column(BigInteger, default=0, nullable=False)
+    estimated_cost_usd = db.Column(db.Numeric(14, 6), default=0, nullable=False)
+    # SUM / COUNT of non-null duration_ms, so averages stay exact when merged.
+    duration_ms_sum = db.Column(BigInteger, default=0, nullable=False)
+    duration_count = db.Column(db.Integer, default=0, nullable=False)
+
+
+class OpenAICallRollupHourly(_OpenAICallRollupMixin, db.Model):
+    """Per-hour aggregate of `openai_call_log`."""
+    __tablename__ = 'openai_call_rollup_hourly'
+
+    __table_args__ = (
+        UniqueConstraint('bucket_start', 'call_site_id', 'model', 'tenant_id',
+                         name='uq_openai_call_rollup_hourly_key'),
+    )
+
+
+class OpenAICallRollupDaily(_OpenAICallRollupMixin, db.Model):
+    """Per-UTC-day aggregate of `openai_call_log`."""
+    __tablename__ = 'openai_call_rollup_daily'
+
+    __table_args__ = (
+        UniqueConstraint('bucket_start', 'call_site_id', 'model', 'tenant_id',
+                         name='uq_openai_call_rollup_daily_key'),
+    )
+
+
+class OpenAICallRollupState(db.Model):
+    """Single-row watermark: raw rows before `rolled_up_to` are in the rollups."""
+    __tablename__ = 'openai_call_rollup_state'
+
+    id = db.Column(db.Integer, primary_key=True)
+    rolled_up_to = db.Column(db.DateTime, nullable=False)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
@@ -2,6 +2,7 @@
 import os
 from datetime import datetime, timedelta
 from extensions import db
+from models.settings_cache import SettingsCache
 
 
 class ScheduleConfig(db.Model):
@@ -138,6 +139,9 @@ class GlobalSettings(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    # Cached whole-table reads for configuration (see models.settings_cache).
+    settings = SettingsCache()
+
     def __repr__(self):
         return f'<GlobalSettings {self.setting_key}: {self.setting_value}>'
 
@@ -208,6 +212,8 @@ class GlobalSettings(db.Model):
                 'now': now,
             })
         db.session.commit()
+        # Raw SQL bypasses the ORM flush hooks that normally invalidate this.
+        cls.settings.invalidate()
         return cls.query.filter_by(setting_key=key).first()
 
 
@@ -326,3 +332,53 @@ class SchedulerLock(db.Model):
 
     def __repr__(self):
         return f'<SchedulerLock owner={self.owner_process_id} env={self.environment}>'
+
+
+class SchedulerJobLease(db.Model):
+    """Per-job execution lease for the lease-based scheduler backend.
+
+    One row per APScheduler job id. A worker runs a job only after claiming
+    its row (``lease_token`` set, ``lease_expires_at`` in the future); the
+    holder heartbeats the expiry while the job runs, so a killed worker's
+    lease lapses and another worker picks the job up. ``next_due_at`` is the
+    shared schedule every worker's local trigger is checked against.
+    See ``scheduler_leases``.
+    """
+    __tablename__ = 'scheduler_job_lease'
+
+    job_id = db.Column(db.String(191), primary_key=True)
+    owner = db.Column(db.String(100), nullable=True)
+    lease_token = db.Column(db.String(36), nullable=True)
+    lease_expires_at = db.Column(db.DateTime, nullable=True)
+    heartbeat_at = db.Column(db.DateTime, nullable=True)
+    next_due_at = db.Column(db.DateTime, nullable=True)
+    last_started_at = db.Column(db.DateTime, nullable=True)
+    last_finished_at = db.Column(db.DateTime, nullable=True)
+    last_outcome = db.Column(db.String(20), nullable=True)
+
+    def __repr__(self):
+        return f'<SchedulerJobLease {self.job_id} owner={self.owner}>'
+
+
+class SchedulerJobRun(db.Model):
+    """One executed scheduler job run: duration, outcome and start lag."""
+    __tablename__ = 'scheduler_job_run'
+
+    id = db.Column(db.Integer, primary_key=True)
+    job_id = db.Column(db.String(191), nullable=False)
+    owner = db.Column(db.String(100), nullable=True)
+    due_at = db.Column(db.DateTime, nullable=True)
+    started_at = db.Column(db.DateTime, nullable=False)
+    finished_at = db.Column(db.DateTime, nullable=False)
+    duration_ms = db.Column(db.Integer, nullable=False)
+    lag_ms = db.Column(db.Integer, nullable=True)
+    outcome = db.Column(db.String(20), nullable=False)  # 'success' | 'error'
+    error = db.Column(db.Text, nullable=True)
+
+    __table_args__ = (
+        db.Index('idx_scheduler_job_run_job_started', 'job_id', 'started_at'),
+        db.Index('idx_scheduler_job_run_started', 'started_at'),
+    )
+
+    def __repr__(self):
+        return f'<SchedulerJobRun {self.job_id} {self.outcome} {self.duration_ms}ms>'
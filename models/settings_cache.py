@@ -0,0 +1,195 @@
+"""Process-local read cache for the key/value settings tables.
+
+``VettingConfig`` and ``GlobalSettings`` are read by key from all over the
+codebase — a single vetting cycle used to issue hundreds of one-row lookups
+for the same handful of thresholds and flags. Each table now exposes a
+``settings`` cache that loads every row in one query and serves typed reads
+from memory:
+
+    VettingConfig.settings.get_float('match_threshold', 80.0)
+    GlobalSettings.settings.get_bool('sftp_enabled')
+
+Freshness:
+    * Writes committed through this process's session invalidate the cache
+      immediately (session ``after_commit`` hook, including bulk
+      ``query.update()/delete()``).
+    * Writes from other workers are picked up by a cheap fingerprint query
+      (row count, max id, max updated_at) run at most every
+      ``SETTINGS_CACHE_CHECK_SECONDS``; the table is only re-read when the
+      fingerprint moves.
+    * A full reload every ``SETTINGS_CACHE_TTL_SECONDS`` is the backstop.
+
+The cache reads on its own connection, so it only ever sees committed data.
+It is meant for configuration. Coordination state (cursors, single-flight
+markers, progress keys) must keep using ``get_value`` / ``set_value``, which
+always go to the database.
+"""
+import logging
+import os
+import threading
+import time
+from typing import Dict, Iterable, Optional
+
+from sqlalchemy import event, func, select
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+SETTINGS_CACHE_CHECK_SECONDS = float(os.environ.get('SETTINGS_CACHE_CHECK_SECONDS', '2'))
+SETTINGS_CACHE_TTL_SECONDS = float(os.environ.get('SETTINGS_CACHE_TTL_SECONDS', '60'))
+
+_TRUE_VALUES = frozenset({'true', '1', 'yes', 'on'})
+_FALSE_VALUES = frozenset({'false', '0', 'no', 'off'})
+
+# model class -> SettingsCache, for the session hooks below.
+_CACHES: Dict[type, 'SettingsCache'] = {}
+_PENDING_KEY = 'settings_cache_pending'
+
+
+class SettingsCache:
+    """Whole-table, typed, invalidation-aware view of one settings model.
+
+    Declared as a class attribute on the model; ``__set_name__`` binds it.
+    """
+
+    def __init__(self):
+        self.model = None
+        self._lock = threading.Lock()
+        self._values: Optional[Dict[str, Optional[str]]] = None
+        self._fingerprint = None
+        self._loaded_at = 0.0
+        self._checked_at = 0.0
+
+    def __set_name__(self, owner, name):
+        self.model = owner
+        _CACHES[owner] = self
+
+    # -- loading ---------------------------------------------------------
+
+    def _fingerprint_stmt(self):
+        m = self.model
+        return select(func.count(m.id), func.max(m.id), func.max(m.updated_at))
+
+    def _load(self):
+        from extensions import db
+        m = self.model
+        rows_stmt = select(m.setting_key, m.setting_value, m.updated_at, m.id)
+        with db.engine.connect() as conn:
+            fingerprint = tuple(conn.execute(self._fingerprint_stmt()).one())
+            rows = conn.execute(rows_stmt).all()
+        # Oldest first so the newest row wins when a key is duplicated
+        # (global_settings historically had no unique index on setting_key).
+        rows.sort(key=lambda r: (r.updated_at is not None, r.updated_at or 0, r.id))
+        return {r.setting_key: r.setting_value for r in rows}, fingerprint
+
+    def _current_fingerprint(self):
+        from extensions import db
+        with db.engine.connect() as conn:
+            return tuple(conn.execute(self._fingerprint_stmt()).one())
+
+    def values(self) -> Dict[str, Optional[str]]:
+        """Return the current key -> raw value mapping (do not mutate)."""
+        now = time.monotonic()
+        values = self._values
+        if (values is not None
+                and now - self._loaded_at < SETTINGS_CACHE_TTL_SECONDS
+                and now - self._checked_at < SETTINGS_CACHE_CHECK_SECONDS):
+            return values
+
+        with self._lock:
+            now = time.monotonic()
+            if self._values is not None and now - self._loaded_at < SETTINGS_CACHE_TTL_SECONDS:
+                if now - self._checked_at < SETTINGS_CACHE_CHECK_SECONDS:
+                    return self._values
+                if self._current_fingerprint() == self._fingerprint:
+                    self._checked_at = now
+                    return self._values
+            self._values, self._fingerprint = self._load()
+            self._loaded_at = self._checked_at = time.monotonic()
+            return self._values
+
+    def invalidate(self):
+        """Drop the cached table; the next read reloads it."""
+        self._values = None
+
+    # -- typed accessors -------------------------------------------------
+
+    def get(self, key: str, default=None) -> Optional[str]:
+        """Raw stored value, or ``default`` when the key has no row."""
+        values = self.values()
+        return values[key] if key in values else default
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Optional[str]]:
+        """Raw values for the requested keys that have a row."""
+        values = self.values()
+        return {k: values[k] for k in keys if k in values}
+
+    def get_str(self, key: str, default: str = '') -> str:
+        """Stripped string value; ``default`` when missing or blank."""
+        value = self.get(key)
+        if value is None or not str(value).strip():
+            return default
+        return str(value).strip()
+
+    def get_bool(self, key: str, default: bool = False) -> bool:
+        """``true/1/yes/on`` → True, ``false/0/no/off`` → False, else ``default``."""
+        value = self.get_str(key).lower()
+        if value in _TRUE_VALUES:
+            return True
+        if value in _FALSE_VALUES:
+            return False
+        return default
+
+    def get_int(self, key: str, default: int = 0, minimum: Optional[int] = None,
+                maximum: Optional[int] = None) -> int:
+        """Integer value clamped to [minimum, maximum]; ``default`` if unparseable."""
+        try:
+            result = int(self.get_str(key))
+        except (TypeError, ValueError):
+            return default
+        if minimum is not None:
+            result = max(minimum, result)
+        if maximum is not None:
+            result = min(maximum, result)
+        return result
+
+    def get_float(self, key: str, default: float = 0.0) -> float:
+        """Float value; ``default`` if missing or unparseable."""
+        try:
+            return float(self.get_str(key))
+        except (TypeError, ValueError):
+            return default
+
+
+def _pending(session):
+    return session.info.setdefault(_PENDING_KEY, set())
+
+
+@event.listens_for(Session, 'after_flush')
+def _note_flushed_settings(session, flush_context):
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        cache = _CACHES.get(type(obj))
+        if cache is not None:
+            _pending(session).add(cache)
+
+
+@event.listens_for(Session, 'do_orm_execute')
+def _note_bulk_settings_writes(orm_execute_state):
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete
+            or orm_execute_state.is_insert):
+        return
+    mapper = orm_execute_state.bind_mapper
+    cache = _CACHES.get(mapper.class_) if mapper is not None else None
+    if cache is not None:
+        _pending(orm_execute_state.session).add(cache)
+
+
+@event.listens_for(Session, 'after_commit')
+def _invalidate_committed_settings(session):
+    for cache in session.info.pop(_PENDING_KEY, ()):
+        cache.invalidate()
+
+
+@event.listens_for(Session, 'after_rollback')
+def _discard_pending_settings(session):
+    session.info.pop(_PENDING_KEY, None)
@@ -1,7 +1,9 @@
 """Candidate vetting, screening, scout vetting sessions, audit, and config models."""
 from datetime import datetime
+from sqlalchemy.orm import validates
 from extensions import db
 from models.environment import default_environment_id
+from models.settings_cache import SettingsCache
 from utils.sqlalchemy_types import SafeString, SafeText
 
 
@@ -26,6 +28,11 @@ class CandidateVettingLog(db.Model):
 
     # Resume data
     resume_text = db.Column(SafeText, nullable=True)  # Extracted resume content
+    # Whitespace-normalised md5 of resume_text (fraud_detection.signals.
+    # resume_content_hash), kept in step by _hash_resume_text below. Powers the
+    # fraud resume-reuse signal as an indexed equality instead of hashing
+    # every stored resume per assessment.
+    resume_text_hash = db.Column(db.String(32), nullable=True, index=True)
     resume_file_id = db.Column(db.Integer, nullable=True)  # Bullhorn file ID
 
     # Analysis status
@@ -79,6 +86,12 @@ class CandidateVettingLog(db.Model):
     job_matches = db.relationship('CandidateJobMatch', backref='vetting_log', lazy='dynamic',
                                    cascade='all, delete-orphan')
 
+    @validates('resume_text')
+    def _hash_resume_text(self, key, value):
+        from fraud_detection.signals import resume_content_hash
+        self.resume_text_hash = None if value is None else resume_content_hash(value)
+        return value
+
     def __repr__(self):
         return f'<CandidateVettingLog {self.bullhorn_candidate_id} - {self.candidate_name}>'
 
@@ -233,12 +246,19 @@ class VettingConfig(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    # Cached whole-table reads for configuration (see models.settings_cache).
+    settings = SettingsCache()
+
     def __repr__(self):
         return f'<VettingConfig {self.setting_key}>'
 
     @classmethod
     def get_value(cls, key, default=None):
-        """Get a config value by key"""
+        """Get a config value by key, straight from the database.
+
+        Use ``VettingConfig.settings`` for configuration reads; this stays
+        uncached for cursors, markers and other coordination state.
+        """
         config = cls.query.filter_by(setting_key=key).first()
         return config.setting_value if config else default
 
@@ -19,6 +19,7 @@ logger = logging.getLogger(__name__)
 # OpenAI for AI-assisted formatting
 try:
     from openai import OpenAI
+    from services.openai_governor import shared_http_client
     OPENAI_AVAILABLE = True
 except ImportError:
     OPENAI_AVAILABLE = False
@@ -116,7 +117,7 @@ class ResumeParser:
         
         api_key = os.environ.get('OPENAI_API_KEY')
         if api_key:
-            self.openai_client = OpenAI(api_key=api_key)
+            self.openai_client = OpenAI(api_key=api_key, http_client=shared_http_client())
             logger.info("OpenAI client initialized for AI resume formatting")
         else:
             logger.warning("OPENAI_API_KEY not set - AI-assisted PDF formatting disabled")
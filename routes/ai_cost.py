@@ -6,10 +6,11 @@ Super-admin-only. Four routes:
   /admin/ai-cost/embedding-ab   — shadow-mode embedding A/B analysis (S3 Phase A)
   /admin/ai-cost/screening-ab   — shadow-mode screening A/B analysis (S2 Phase A)
 
-The first two read from `openai_call_log`. The forecaster additionally
-reads/writes `cost_forecast_override` and `cost_forecast_scenario`.
-The embedding A/B page reads from `embedding_ab_log`. The screening
-A/B page reads from `screening_ab_log`.
+The first two read `openai_call_log` via the hourly / daily rollups in
+services/ai_cost_rollup.py. The forecaster additionally reads/writes
+`cost_forecast_override` and `cost_forecast_scenario`. The embedding A/B
+page reads from `embedding_ab_log`. The screening A/B page reads from
+`screening_ab_log`.
 """
 import logging
 import math
@@ -21,6 +22,7 @@ from flask_login import login_required, current_user
 from sqlalchemy import text
 
 from extensions import db
+from services.ai_cost_rollup import aggregate, totals
 from services.cost_forecaster import (
     MODULE_DEFINITIONS,
     derive_unit_costs,
@@ -51,20 +53,8 @@ def ai_cost_dashboard():
     since = datetime.utcnow() - timedelta(hours=hours)
 
     try:
-        rows = db.session.execute(
-            text(
-                "SELECT call_site_id, model, "
-                "       COUNT(*) AS calls, "
-                "       COALESCE(SUM(input_tokens), 0) AS in_tok, "
-                "       COALESCE(SUM(output_tokens), 0) AS out_tok, "
-                "       COALESCE(SUM(estimated_cost_usd), 0) AS cost "
-                "FROM openai_call_log "
-                "WHERE created_at >= :since "
-                "GROUP BY call_site_id, model "
-                "ORDER BY cost DESC"
-            ),
-            {'since': since},
-        ).fetchall()
+        grouped = aggregate(since, group_by=('call_site_id', 'model'))
+        rows = sorted(grouped.items(), key=lambda kv: kv[1]['cost'], reverse=True)
     except Exception as exc:
         logger.warning(f"AI cost query failed: {exc}")
         try:
@@ -77,14 +67,14 @@ def ai_cost_dashboard():
     total_cost = 0.0
     total_calls = 0
     total_tokens = 0
-    for r in rows:
-        cost = float(r[5] or 0)
-        calls = int(r[2] or 0)
-        in_tok = int(r[3] or 0)
-        out_tok = int(r[4] or 0)
+    for (site, model), m in rows:
+        cost = m['cost']
+        calls = m['calls']
+        in_tok = m['input_tokens']
+        out_tok = m['output_tokens']
         breakdown.append({
-            'call_site_id': r[0],
-            'model': r[1],
+            'call_site_id': site,
+            'model': model,
             'calls': calls,
             'input_tokens': in_tok,
             'output_tokens': out_tok,
@@ -100,27 +90,14 @@ def ai_cost_dashboard():
     trend_since = datetime.utcnow() - timedelta(days=7)
     trend = []
     try:
-        trend_rows = db.session.execute(
-            text(
-                "SELECT DATE(created_at) AS day, "
-                "       COUNT(*) AS calls, "
-                "       COALESCE(SUM(input_tokens + output_tokens), 0) AS tokens, "
-                "       COALESCE(SUM(estimated_cost_usd), 0) AS cost, "
-                "       COALESCE(SUM(CASE WHEN success = FALSE THEN 1 ELSE 0 END), 0) AS failures "
-                "FROM openai_call_log "
-                "WHERE created_at >= :since "
-                "GROUP BY DATE(created_at) "
-                "ORDER BY day DESC"
-            ),
-            {'since': trend_since},
-        ).fetchall()
-        for r in trend_rows:
+        trend_rows = aggregate(trend_since, group_by=('day',))
+        for (day,), m in sorted(trend_rows.items(), reverse=True):
             trend.append({
-                'day': r[0].isoformat() if r[0] else '',
-                'calls': int(r[1] or 0),
-                'tokens': int(r[2] or 0),
-                'cost': float(r[3] or 0),
-                'failures': int(r[4] or 0),
+                'day': day.isoformat() if day else '',
+                'calls': m['calls'],
+                'tokens': m['input_tokens'] + m['output_tokens'],
+                'cost': m['cost'],
+                'failures': m['failures'],
             })
     except Exception as exc:
         logger.warning(f"AI cost trend query failed: {exc}")
@@ -719,18 +696,8 @@ def _audit_finding_breakdown(since):
 
 
 def _audit_cost(since):
-    sql = """
-        SELECT
-            COUNT(*) AS calls,
-            COALESCE(SUM(input_tokens), 0) AS in_tok,
-            COALESCE(SUM(output_tokens), 0) AS out_tok,
-            COALESCE(SUM(estimated_cost_usd), 0) AS cost,
-            COALESCE(AVG(duration_ms), 0) AS avg_ms
-        FROM openai_call_log
-        WHERE call_site_id = 'vetting_audit' AND created_at >= :since
-    """
     try:
-        row = db.session.execute(text(sql), {'since': since}).fetchone()
+        m = totals(since, call_site_id='vetting_audit')
     except Exception as exc:
         logger.warning(f"audit cost query failed: {exc}")
         try:
@@ -738,16 +705,14 @@ def _audit_cost(since):
         except Exception:
             pass
         return {'calls': 0, 'tokens': 0, 'cost': 0.0, 'avg_cost': 0.0, 'avg_ms': 0.0}
-    if not row:
-        return {'calls': 0, 'tokens': 0, 'cost': 0.0, 'avg_cost': 0.0, 'avg_ms': 0.0}
-    calls = int(row[0] or 0)
-    cost = float(row[3] or 0)
+    calls = m['calls']
+    cost = m['cost']
     return {
         'calls': calls,
-        'tokens': int(row[1] or 0) + int(row[2] or 0),
+        'tokens': m['input_tokens'] + m['output_tokens'],
         'cost': cost,
         'avg_cost': (cost / calls) if calls else 0.0,
-        'avg_ms': float(row[4] or 0),
+        'avg_ms': (m['duration_ms_sum'] / m['duration_count']) if m['duration_count'] else 0.0,
     }
 
 
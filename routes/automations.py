@@ -356,6 +356,21 @@ def scheduler_status():
     return jsonify(jobs)
 
 
+@automations_bp.route('/automations/scheduler-job-runs')
+@login_required
+def scheduler_job_runs():
+    """Per-job run count, duration, errors and start lag (``?hours=``, default 24)."""
+    _require_admin()
+    from scheduler_leases import job_run_stats
+
+    hours = request.args.get('hours', 24, type=int) or 24
+    try:
+        return jsonify({'hours': hours, 'jobs': job_run_stats(hours=max(1, min(hours, 24 * 30)))})
+    except Exception as e:
+        logger.error(f"Failed to get scheduler job run stats: {e}")
+        return jsonify({'error': str(e)}), 500
+
+
 @automations_bp.route('/automations/scheduler-jobs/<job_id>/pause', methods=['POST'])
 @login_required
 def scheduler_job_pause(job_id):
@@ -57,24 +57,50 @@ def scout_vetting_dashboard():
 
 
 def _process_email_in_background(app_ref, payload, is_scout_vetting=False):
-    """Process an inbound email in a background thread to keep workers free."""
+    """Process an inbound email on an inbound-queue worker thread.
+
+    Exceptions are logged and re-raised so the queue retries the job with
+    backoff; an unsuccessful-but-handled result is returned, not retried.
+    """
     with app_ref.app_context():
         try:
             if is_scout_vetting:
                 logger.info("📧 [BG] Processing Scout Vetting inbound email")
                 _handle_scout_vetting_inbound_bg(app_ref, payload)
+                return None
+            from email_inbound_service import EmailInboundService
+            service = EmailInboundService()
+            result = service.process_email(payload)
+            if result['success']:
+                logger.info(f"✅ [BG] Email processed successfully: candidate {result.get('candidate_id')}")
             else:
-                from email_inbound_service import EmailInboundService
-                service = EmailInboundService()
-                result = service.process_email(payload)
-                if result['success']:
-                    logger.info(f"✅ [BG] Email processed successfully: candidate {result.get('candidate_id')}")
-                else:
-                    logger.warning(f"⚠️ [BG] Email processing failed: {result.get('message')}")
+                logger.warning(f"⚠️ [BG] Email processing failed: {result.get('message')}")
+            return result
         except Exception as e:
             logger.error(f"❌ [BG] Email processing error: {str(e)}")
             import traceback
             logger.error(traceback.format_exc())
+            raise
+
+
+def run_queued_inbound_email(app_ref, kind, payload):
+    """Inbound-queue handler for webhook deliveries (see inbound_email_queue)."""
+    from inbound_email_queue import KIND_SCOUT_SUPPORT, KIND_SCOUT_VETTING
+
+    if kind == KIND_SCOUT_SUPPORT:
+        _handle_scout_support_inbound_bg(app_ref, payload)
+        return None
+    return _process_email_in_background(
+        app_ref, payload, is_scout_vetting=(kind == KIND_SCOUT_VETTING)
+    )
+
+
+def _inbound_dedupe_key(payload):
+    """Message-ID of a webhook payload, used to collapse SendGrid re-deliveries."""
+    headers = payload.get('headers') or ''
+    if isinstance(headers, str) and 'Message-ID' in headers:
+        return headers.split('Message-ID:')[-1].split('\n')[0].strip() or None
+    return None
 
 
 def _decode_mime_header(value):
@@ -654,24 +680,39 @@ def email_inbound_webhook():
         
         subject = payload.get('subject', 'unknown')
         logger.info(f"📧 Queuing email for background processing: {subject[:80]}")
-        
-        app_ref = current_app._get_current_object()
 
+        import inbound_email_queue
         if is_scout_support:
-            thread = threading.Thread(
-                target=_handle_scout_support_inbound_bg,
-                args=(app_ref, payload),
-                daemon=True
-            )
+            kind = inbound_email_queue.KIND_SCOUT_SUPPORT
+        elif is_scout_vetting:
+            kind = inbound_email_queue.KIND_SCOUT_VETTING
         else:
-            thread = threading.Thread(
-                target=_process_email_in_background,
-                args=(app_ref, payload, is_scout_vetting),
-                daemon=True
+            kind = inbound_email_queue.KIND_INBOUND
+
+        # Persist before acking: once the row is committed the email survives a
+        # worker restart, and a bounded drain pool (not a thread per request)
+        # does the heavy lifting. If it cannot be persisted, refuse with 503 so
+        # SendGrid keeps the message and retries delivery.
+        try:
+            job_id = inbound_email_queue.enqueue(
+                kind, payload,
+                priority=inbound_email_queue.PRIORITY_LIVE,
+                dedupe_key=_inbound_dedupe_key(payload),
+                app=current_app._get_current_object(),
             )
-        thread.start()
-        
-        return jsonify({'success': True, 'message': 'Email accepted for processing'}), 200
+        except Exception as e:
+            logger.error(f"❌ Could not persist inbound email for processing: {e}")
+            return jsonify({
+                'success': False,
+                'error': 'queue_unavailable',
+                'message': 'Email could not be queued; please retry delivery.',
+            }), 503
+
+        return jsonify({
+            'success': True,
+            'message': 'Email accepted for processing',
+            'job_id': job_id,
+        }), 200
             
     except Exception as e:
         logger.error(f"❌ Email inbound webhook error: {str(e)}")
@@ -994,10 +1035,31 @@ def api_email_parsing_stats():
             'duplicate_rate': round((duplicates / completed * 100) if completed > 0 else 0, 1)
         },
         'by_source': {source or 'Unknown': count for source, count in source_stats},
-        'daily': {str(date): count for date, count in daily_stats}
+        'daily': {str(date): count for date, count in daily_stats},
+        'queue': _inbound_queue_depth_safe(),
     })
 
 
+def _inbound_queue_depth_safe():
+    try:
+        from inbound_email_queue import queue_depth
+        return queue_depth()
+    except Exception as e:
+        logger.error(f"Inbound queue metrics error: {e}")
+        db.session.rollback()
+        return None
+
+
+@email_bp.route('/api/email/queue')
+@login_required
+def api_inbound_queue_stats():
+    """Inbound email queue depth, retry/dead-letter counts and drain lag."""
+    depth = _inbound_queue_depth_safe()
+    if depth is None:
+        return jsonify({'success': False, 'error': 'queue metrics unavailable'}), 500
+    return jsonify({'success': True, 'queue': depth})
+
+
 @email_bp.route('/api/email/clear-stuck', methods=['POST'])
 @login_required
 def api_clear_stuck_emails():
@@ -574,7 +574,8 @@ def optimize_job_requirements(job_id):
             return jsonify({'success': False, 'error': 'No requirements text provided.'}), 400
 
         from openai import OpenAI
-        client = OpenAI()
+        from services.openai_governor import shared_http_client
+        client = OpenAI(http_client=shared_http_client())
 
         system_prompt = (
             "You are a prompt engineer specializing in AI-powered candidate screening systems. "
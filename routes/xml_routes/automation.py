@@ -19,6 +19,7 @@ def _manual_upload_all_feeds():
     from tasks.xml_feeds import _upload_single_file
     from feeds.feed_config import (
         channel_feeds_for_upload,
+        upload_cycle_tearsheet_ids,
         SOURCE_LINKEDIN,
         V2_FILENAME,
         V2_FILENAME_DEV,
@@ -59,27 +60,29 @@ def _manual_upload_all_feeds():
         }
 
     generator = SimplifiedXMLGenerator(db=db)
-    v2_xml, v2_stats = generator.generate_fresh_xml(source_channel=SOURCE_LINKEDIN)
-
-    channel_results = {}
-    for feed_cfg in channel_feeds_for_upload():
-        key = feed_cfg['key']
-        tearsheet_ids = [] if feed_cfg.get('force_empty') else feed_cfg['tearsheet_ids']
-        xml_content, stats = generator.generate_fresh_xml(
-            tearsheet_ids=tearsheet_ids,
-            source_channel=feed_cfg['source_channel'],
-            allow_empty=True if feed_cfg.get('force_empty') else feed_cfg.get('allow_empty', False),
-            publisher_title=feed_cfg.get('publisher_title'),
-            publisher_link=feed_cfg.get('publisher_link'),
-        )
-        channel_results[key] = {
-            'xml': xml_content,
-            'stats': stats,
-            'filenames': {
-                'production': feed_cfg['filename'],
-                'development': feed_cfg.get('filename_dev', feed_cfg['filename']),
-            },
-        }
+    # One concurrent Bullhorn pull shared by v2 and every channel feed.
+    with generator.cycle_snapshot(upload_cycle_tearsheet_ids()):
+        v2_xml, v2_stats = generator.generate_fresh_xml(source_channel=SOURCE_LINKEDIN)
+
+        channel_results = {}
+        for feed_cfg in channel_feeds_for_upload():
+            key = feed_cfg['key']
+            tearsheet_ids = [] if feed_cfg.get('force_empty') else feed_cfg['tearsheet_ids']
+            xml_content, stats = generator.generate_fresh_xml(
+                tearsheet_ids=tearsheet_ids,
+                source_channel=feed_cfg['source_channel'],
+                allow_empty=True if feed_cfg.get('force_empty') else feed_cfg.get('allow_empty', False),
+                publisher_title=feed_cfg.get('publisher_title'),
+                publisher_link=feed_cfg.get('publisher_link'),
+            )
+            channel_results[key] = {
+                'xml': xml_content,
+                'stats': stats,
+                'filenames': {
+                    'production': feed_cfg['filename'],
+                    'development': feed_cfg.get('filename_dev', feed_cfg['filename']),
+                },
+            }
 
     try:
         port_value = int(sftp_port_raw) if sftp_port_raw else 2222
@@ -0,0 +1,423 @@
+"""
+Scheduler Leases — per-job database leases and run metrics for APScheduler.
+
+By default (``SCHEDULER_BACKEND=lock``) APScheduler runs only in the gunicorn
+worker that wins the fcntl lock in ``scheduler_setup``, so every background
+job shares one process and thread pool: a stalled job delays the others on
+that host and throughput cannot grow past one worker.
+
+With ``SCHEDULER_BACKEND=lease`` every worker (on every node) runs the
+scheduler and exclusivity moves to the job level. Before a job runs, the
+executor claims the job's ``scheduler_job_lease`` row:
+
+    * the row is locked with ``FOR UPDATE SKIP LOCKED`` on PostgreSQL, plus a
+      conditional update on the lease token so databases without SKIP LOCKED
+      still never hand one job to two workers
+    * a job is claimable only when no unexpired lease is held and it is due
+      (``next_due_at``); workers whose local trigger fired off-schedule skip
+      and re-align their trigger to the shared due time
+    * the holder heartbeats ``lease_expires_at`` every ``HEARTBEAT_SECONDS``
+      while the job runs, so a killed worker's lease lapses after
+      ``LEASE_SECONDS`` and the job is picked up elsewhere
+    * on completion the lease is released and ``next_due_at`` advanced from
+      the job's trigger
+
+Both backends record every executed run in ``scheduler_job_run`` (duration,
+outcome, and lag between when the run was due and when it started), so jobs
+that starve the others are visible at ``/automations/scheduler-job-runs``.
+
+Lease bookkeeping uses its own engine connections, never the job thread's
+scoped ``db.session``.
+"""
+
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+
+from apscheduler.events import EVENT_JOB_ERROR
+from apscheduler.executors.base import run_job
+from apscheduler.executors.pool import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+SCHEDULER_BACKEND = os.environ.get('SCHEDULER_BACKEND', 'lock').strip().lower()
+LEASE_SECONDS = int(os.environ.get('SCHEDULER_LEASE_SECONDS', '120'))
+HEARTBEAT_SECONDS = int(os.environ.get('SCHEDULER_HEARTBEAT_SECONDS', '30'))
+SCHEDULER_MAX_WORKERS = int(os.environ.get('SCHEDULER_MAX_WORKERS', '10'))
+
+# A local trigger firing this close to the shared due time counts as on time.
+DUE_SLACK_SECONDS = 2
+RUN_ERROR_MAX_CHARS = 2000
+
+
+def lease_backend_enabled() -> bool:
+    return SCHEDULER_BACKEND == 'lease'
+
+
+def worker_id() -> str:
+    """Identifies this process in lease and run rows (host:pid)."""
+    return f"{socket.gethostname()}:{os.getpid()}"[:100]
+
+
+def _naive_utc(dt: Optional[datetime]) -> Optional[datetime]:
+    if dt is None or dt.tzinfo is None:
+        return dt
+    return dt.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+class JobLease:
+    """A claimed lease; ``due_at`` is when the claimed run was due."""
+
+    __slots__ = ('job_id', 'token', 'due_at')
+
+    def __init__(self, job_id: str, token: str, due_at: Optional[datetime]):
+        self.job_id = job_id
+        self.token = token
+        self.due_at = due_at
+
+
+# ── Lease operations ────────────────────────────────────────────────────────
+
+def claim_job(job_id: str, now: Optional[datetime] = None) -> Tuple[Optional[JobLease], Optional[datetime]]:
+    """Try to take the lease for ``job_id``.
+
+    Returns ``(lease, None)`` on success. When the job is not claimable,
+    returns ``(None, next_due_at)`` — ``next_due_at`` is set only when the
+    job is free but not yet due, so the caller can re-align its trigger.
+    Raises on database errors.
+    """
+    from sqlalchemy import insert, select, update
+    from sqlalchemy.exc import IntegrityError
+    from extensions import db
+    from models import SchedulerJobLease
+
+    table = SchedulerJobLease.__table__
+    now = now or datetime.utcnow()
+    token = str(uuid.uuid4())
+    claim_values = {
+        'owner': worker_id(),
+        'lease_token': token,
+        'lease_expires_at': now + timedelta(seconds=LEASE_SECONDS),
+        'heartbeat_at': now,
+        'last_started_at': now,
+    }
+
+    try:
+        with db.engine.begin() as conn:
+            query = select(table).where(table.c.job_id == job_id)
+            if conn.dialect.name == 'postgresql':
+                query = query.with_for_update(skip_locked=True)
+            row = conn.execute(query).first()
+
+            if row is None:
+                exists = conn.execute(
+                    select(table.c.job_id).where(table.c.job_id == job_id)
+                ).first()
+                if exists:
+                    return None, None  # row locked by a concurrent claim
+                # First run anywhere: a concurrent insert loses on the key.
+                conn.execute(insert(table).values(job_id=job_id, **claim_values))
+                return JobLease(job_id, token, None), None
+
+            if row.lease_expires_at is not None and row.lease_expires_at > now:
+                return None, None
+            if row.next_due_at is not None and row.next_due_at > now + timedelta(seconds=DUE_SLACK_SECONDS):
+                return None, row.next_due_at
+
+            if row.lease_token is not None:
+                logger.warning(
+                    f"⏱️ Scheduler lease: reclaiming '{job_id}' "
+                    f"(lease held by {row.owner} expired at {row.lease_expires_at})"
+                )
+            token_match = (table.c.lease_token.is_(None) if row.lease_token is None
+                           else table.c.lease_token == row.lease_token)
+            claimed = conn.execute(
+                update(table).where(table.c.job_id == job_id, token_match).values(**claim_values)
+            ).rowcount
+            if claimed != 1:
+                return None, None
+            return JobLease(job_id, token, row.next_due_at), None
+    except IntegrityError:
+        return None, None
+
+
+def heartbeat(leases: List[JobLease], now: Optional[datetime] = None) -> List[str]:
+    """Extend the given leases; returns the job ids whose lease was lost."""
+    from sqlalchemy import update
+    from extensions import db
+    from models import SchedulerJobLease
+
+    table = SchedulerJobLease.__table__
+    now = now or datetime.utcnow()
+    lost = []
+    with db.engine.begin() as conn:
+        for lease in leases:
+            extended = conn.execute(
+                update(table)
+                .where(table.c.job_id == lease.job_id, table.c.lease_token == lease.token)
+                .values(lease_expires_at=now + timedelta(seconds=LEASE_SECONDS), heartbeat_at=now)
+            ).rowcount
+            if extended != 1:
+                lost.append(lease.job_id)
+    return lost
+
+
+def finish_run(job_id: str, lease: Optional[JobLease], due_at: Optional[datetime],
+               started_at: datetime, finished_at: datetime, outcome: str,
+               error: Optional[str] = None, next_due_at: Optional[datetime] = None):
+    """Record one executed run and, when ``lease`` is given, release it."""
+    from sqlalchemy import insert, update
+    from extensions import db
+    from models import SchedulerJobLease, SchedulerJobRun
+
+    lease_table = SchedulerJobLease.__table__
+    run_table = SchedulerJobRun.__table__
+    lag_ms = None
+    if due_at is not None:
+        lag_ms = max(0, int((started_at - due_at).total_seconds() * 1000))
+
+    with db.engine.begin() as conn:
+        if lease is not None:
+            released = conn.execute(
+                update(lease_table)
+                .where(lease_table.c.job_id == job_id, lease_table.c.lease_token == lease.token)
+                .values(
+                    owner=None,
+                    lease_token=None,
+                    lease_expires_at=None,
+                    last_finished_at=finished_at,
+                    last_outcome=outcome,
+                    next_due_at=next_due_at,
+                )
+            ).rowcount
+            if released != 1:
+                logger.warning(
+                    f"⏱️ Scheduler lease for '{job_id}' was taken over while the job ran "
+                    f"({int((finished_at - started_at).total_seconds())}s) — another worker "
+                    f"may have run it concurrently"
+                )
+        conn.execute(insert(run_table).values(
+            job_id=job_id,
+            owner=worker_id(),
+            due_at=due_at,
+            started_at=started_at,
+            finished_at=finished_at,
+            duration_ms=int((finished_at - started_at).total_seconds() * 1000),
+            lag_ms=lag_ms,
+            outcome=outcome,
+            error=(error or '')[:RUN_ERROR_MAX_CHARS] or None,
+        ))
+
+
+def mark_due(job_id: str, when: Optional[datetime] = None):
+    """Make ``job_id`` due now (manual "run now"), so the worker whose
+    trigger was just advanced can claim it."""
+    from sqlalchemy import insert, update
+    from sqlalchemy.exc import IntegrityError
+    from extensions import db
+    from models import SchedulerJobLease
+
+    table = SchedulerJobLease.__table__
+    when = when or datetime.utcnow()
+    with db.engine.begin() as conn:
+        updated = conn.execute(
+            update(table).where(table.c.job_id == job_id).values(next_due_at=when)
+        ).rowcount
+    if updated:
+        return
+    try:
+        with db.engine.begin() as conn:
+            conn.execute(insert(table).values(job_id=job_id, next_due_at=when))
+    except IntegrityError:
+        pass
+
+
+def job_run_stats(hours: int = 24) -> List[Dict]:
+    """Per-job run count, errors, duration and lag over the last ``hours``,
+    slowest first, with the current lease holder."""
+    from sqlalchemy import case, func
+    from extensions import db
+    from models import SchedulerJobLease, SchedulerJobRun
+
+    since = datetime.utcnow() - timedelta(hours=hours)
+    R = SchedulerJobRun
+    rows = db.session.query(
+        R.job_id,
+        func.count(R.id),
+        func.sum(case((R.outcome == 'error', 1), else_=0)),
+        func.avg(R.duration_ms),
+        func.max(R.duration_ms),
+        func.sum(R.duration_ms),
+        func.avg(R.lag_ms),
+        func.max(R.lag_ms),
+        func.max(R.started_at),
+    ).filter(R.started_at >= since).group_by(R.job_id).all()
+    leases = {lease.job_id: lease for lease in SchedulerJobLease.query.all()}
+
+    now = datetime.utcnow()
+    out = []
+    for job_id, runs, errors, avg_ms, max_ms, total_ms, avg_lag, max_lag, last_started in rows:
+        lease = leases.get(job_id)
+        held = lease is not None and lease.lease_expires_at is not None and lease.lease_expires_at > now
+        out.append({
+            'job_id': job_id,
+            'runs': runs,
+            'errors': int(errors or 0),
+            'avg_duration_ms': int(avg_ms or 0),
+            'max_duration_ms': int(max_ms or 0),
+            'total_duration_ms': int(total_ms or 0),
+            'avg_lag_ms': int(avg_lag) if avg_lag is not None else None,
+            'max_lag_ms': int(max_lag) if max_lag is not None else None,
+            'last_started_at': last_started.isoformat() if last_started else None,
+            'lease_owner': lease.owner if held else None,
+            'next_due_at': lease.next_due_at.isoformat() if lease and lease.next_due_at else None,
+        })
+    out.sort(key=lambda r: r['total_duration_ms'], reverse=True)
+    return out
+
+
+# ── Executor ────────────────────────────────────────────────────────────────
+
+class _Heartbeat:
+    """Daemon thread that keeps this process's held leases from expiring."""
+
+    def __init__(self, app):
+        self._app = app
+        self._held: Dict[str, JobLease] = {}
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def hold(self, lease: JobLease):
+        with self._lock:
+            self._held[lease.job_id] = lease
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._loop, name='scheduler-lease-heartbeat', daemon=True)
+                self._thread.start()
+
+    def drop(self, lease: JobLease):
+        with self._lock:
+            if self._held.get(lease.job_id) is lease:
+                del self._held[lease.job_id]
+
+    def _loop(self):
+        while True:
+            time.sleep(HEARTBEAT_SECONDS)
+            with self._lock:
+                leases = list(self._held.values())
+            if not leases:
+                continue
+            try:
+                with self._app.app_context():
+                    lost = heartbeat(leases)
+                for job_id in lost:
+                    logger.error(f"⏱️ Scheduler lease for running job '{job_id}' was lost")
+            except Exception as e:
+                logger.warning(f"Scheduler lease heartbeat failed: {e}")
+
+
+class LeasedThreadPoolExecutor(ThreadPoolExecutor):
+    """APScheduler thread pool that records every run and, on the lease
+    backend, runs a job only while holding its lease.
+
+    A run this worker does not get to execute (lease held elsewhere, not due,
+    job paused) produces no APScheduler events, so the last-run listeners
+    only see runs that actually happened.
+    """
+
+    def __init__(self, app, max_workers: int = SCHEDULER_MAX_WORKERS,
+                 use_leases: Optional[bool] = None):
+        super().__init__(max_workers)
+        self._app = app
+        self._use_leases = lease_backend_enabled() if use_leases is None else use_leases
+        self._heartbeat = _Heartbeat(app)
+
+    def _do_submit_job(self, job, run_times):
+        def callback(f):
+            exc, tb = (f.exception_info() if hasattr(f, 'exception_info')
+                       else (f.exception(), getattr(f.exception(), '__traceback__', None)))
+            if exc:
+                self._run_job_error(job.id, exc, tb)
+            else:
+                self._run_job_success(job.id, f.result())
+
+        f = self._pool.submit(self._run_leased, job, job._jobstore_alias, run_times,
+                              self._logger.name)
+        f.add_done_callback(callback)
+
+    def _run_leased(self, job, jobstore_alias, run_times, logger_name):
+        scheduled = run_times[-1]
+        due_at = _naive_utc(scheduled)
+        lease = None
+
+        if self._use_leases:
+            with self._app.app_context():
+                if self._is_paused(job.id):
+                    return []
+                try:
+                    lease, next_due = claim_job(job.id)
+                except Exception as e:
+                    # Exclusivity can't be guaranteed without the lease table.
+                    logger.warning(f"Scheduler lease claim failed for '{job.id}', skipping run: {e}")
+                    return []
+            if lease is None:
+                if next_due is not None:
+                    self._align_local_trigger(job.id, jobstore_alias, next_due)
+                return []
+            due_at = lease.due_at or due_at
+            self._heartbeat.hold(lease)
+
+        started_at = datetime.utcnow()
+        try:
+            events = run_job(job, jobstore_alias, run_times, logger_name)
+        finally:
+            if lease is not None:
+                self._heartbeat.drop(lease)
+        finished_at = datetime.utcnow()
+
+        error_event = next((e for e in events if e.code == EVENT_JOB_ERROR), None)
+        error = None
+        if error_event is not None:
+            error = f"{type(error_event.exception).__name__}: {error_event.exception}"
+        try:
+            next_due_at = _naive_utc(job.trigger.get_next_fire_time(scheduled, scheduled))
+        except Exception:
+            next_due_at = None
+
+        try:
+            with self._app.app_context():
+                finish_run(job.id, lease, due_at, started_at, finished_at,
+                           'error' if error_event is not None else 'success',
+                           error=error, next_due_at=next_due_at)
+        except Exception as e:
+            logger.warning(f"Could not record scheduler run for '{job.id}': {e}")
+        return events
+
+    @staticmethod
+    def _is_paused(job_id: str) -> bool:
+        # Pause/resume only reaches the worker that served the request; the
+        # persisted list applies it on every worker.
+        import json
+        from models import GlobalSettings
+        try:
+            return job_id in json.loads(GlobalSettings.settings.get('scheduler_paused_jobs', '[]') or '[]')
+        except Exception:
+            return False
+
+    def _align_local_trigger(self, job_id, jobstore_alias, next_due: datetime):
+        """Move this worker's next local fire to the shared due time so
+        interval jobs stay on one schedule across workers."""
+        try:
+            local = self._scheduler.get_job(job_id, jobstore_alias)
+            if local is None or local.next_run_time is None:
+                return
+            target = next_due.replace(tzinfo=timezone.utc)
+            if abs((local.next_run_time - target).total_seconds()) > DUE_SLACK_SECONDS:
+                self._scheduler.modify_job(job_id, jobstore_alias, next_run_time=target)
+        except Exception as e:
+            logger.debug(f"Could not align local trigger for '{job_id}': {e}")
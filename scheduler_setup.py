@@ -3,6 +3,8 @@ Scheduler Setup — APScheduler job definitions and configuration.
 
 Contains:
 - acquire_scheduler_lock: Attempt to acquire the primary-worker lock file
+  (every worker is primary under SCHEDULER_BACKEND=lease — jobs are then
+  made exclusive per run by scheduler_leases)
 - release_scheduler_lock: Release the lock on process exit
 - configure_scheduler_jobs: Register all background jobs with APScheduler
 - process_bullhorn_monitors: Incremental Bullhorn tearsheet monitoring job (closure)
@@ -50,6 +52,17 @@ def acquire_scheduler_lock():
     """
     global _lock_fd
     worker_pid = os.getpid()
+
+    from scheduler_leases import lease_backend_enabled
+    if lease_backend_enabled():
+        print(
+            f"✅ SCHEDULER INIT: Process {worker_pid} running scheduler with per-job"
+            " database leases (SCHEDULER_BACKEND=lease)",
+            flush=True,
+        )
+        logger.info(f"✅ Process {worker_pid} will schedule jobs under per-job leases")
+        return True
+
     print("🔒 SCHEDULER INIT: Attempting to acquire scheduler lock...", flush=True)
     try:
         fd = os.open(_LOCK_FILE, os.O_CREAT | os.O_WRONLY)
@@ -270,6 +283,15 @@ def configure_scheduler_jobs(app, scheduler, is_primary_worker):
                     app.logger.info(f"🔄 Active job IDs cache refreshed: {len(result)} jobs")
                 except Exception as e:
                     app.logger.error(f"Error refreshing active job IDs cache: {e}")
+                    return
+                # Pre-warm Layer 1 job vectors so the first candidate of the
+                # cycle never pays for a tearsheet's worth of cache misses.
+                try:
+                    warmed = svc.embedding_service.prewarm_job_embeddings(active_jobs)
+                    if warmed:
+                        app.logger.info(f"📦 Job embedding pre-warm: {warmed} job(s) embedded")
+                except Exception as e:
+                    app.logger.warning(f"Job embedding pre-warm failed: {e}")
 
         scheduler.add_job(
             func=refresh_active_job_ids_cache,
@@ -361,6 +383,23 @@ def configure_scheduler_jobs(app, scheduler, is_primary_worker):
         )
         app.logger.info("🩺 Scheduled vetting system health check (every 10 minutes)")
 
+    # ── OpenAI Cost Rollups (every 10 minutes) ────────────────────────────────
+    # Hourly / daily aggregates of openai_call_log read by the AI cost
+    # dashboards, the spend alert below and the forecaster.
+    if is_primary_worker:
+        from tasks import run_ai_cost_rollup
+        scheduler.add_job(
+            func=run_ai_cost_rollup,
+            trigger='interval',
+            minutes=10,
+            id='ai_cost_rollup',
+            name='OpenAI Cost Rollups (hourly/daily)',
+            replace_existing=True,
+            misfire_grace_time=600,
+            coalesce=True
+        )
+        app.logger.info("📊 Scheduled OpenAI cost rollups (every 10 minutes)")
+
     # ── OpenAI Spend Alert (every 30 minutes) ─────────────────────────────────
     # The health check above only tests connectivity, so a runaway loop making
     # successful calls keeps it green. This is the spend dimension it misses.
@@ -580,6 +619,20 @@ def configure_scheduler_jobs(app, scheduler, is_primary_worker):
         )
         app.logger.info("🔍 Requirements maintenance enabled — auto-extracts for new jobs and re-interprets modified descriptions every 5 minutes")
 
+    # ── Resume Hash Backfill (every 30 minutes) ──────────────────────────────
+    if is_primary_worker:
+        from tasks import run_resume_hash_backfill
+        scheduler.add_job(
+            func=run_resume_hash_backfill,
+            trigger=IntervalTrigger(minutes=30),
+            id='resume_hash_backfill',
+            name='Resume Hash Backfill — Fraud Reuse Index (30 min)',
+            replace_existing=True,
+            misfire_grace_time=600,
+            coalesce=True
+        )
+        app.logger.info("🧬 Resume hash backfill enabled — fills resume_text_hash for older vetting logs every 30 minutes")
+
     # ── Sales Rep Display Name Sync (every 30 minutes) ───────────────────────
     if is_primary_worker:
         from utils.bullhorn_helpers import get_bullhorn_service
@@ -823,6 +876,32 @@ def configure_scheduler_jobs(app, scheduler, is_primary_worker):
             print(f"❌ SCHEDULER INIT: Failed to register mailbox-pull: {e}", flush=True)
             app.logger.error(f"Failed to register mailbox-pull ingestion: {e}")
 
+    # ── Inbound Email Queue Drain (every 60 seconds) ─────────────────────────
+    # Webhook and mailbox-pull messages are persisted to inbound_email_job and
+    # drained by a bounded per-process thread pool that exits when idle. This
+    # tick restarts it so jobs waiting on a retry backoff or an expired lease
+    # are picked up even when no new mail arrives.
+    if is_primary_worker:
+        from tasks import run_inbound_queue_drain
+
+        def inbound_queue_drain():
+            run_inbound_queue_drain(app)
+
+        try:
+            scheduler.add_job(
+                func=inbound_queue_drain,
+                trigger=IntervalTrigger(seconds=60),
+                id='inbound_email_queue_drain',
+                name='Inbound Email Queue Drain (60 sec)',
+                replace_existing=True,
+                max_instances=1,
+                coalesce=True,
+            )
+            print("✅ SCHEDULER INIT: Inbound email queue drain registered (60 sec)", flush=True)
+        except Exception as e:
+            print(f"❌ SCHEDULER INIT: Failed to register inbound queue drain: {e}", flush=True)
+            app.logger.error(f"Failed to register inbound email queue drain: {e}")
+
     # ── Résumé Recovery Sweep (every 30 minutes) ─────────────────────────────
     # Auto-heals applicants ingested without their résumé (status=completed but
     # resume_file_id IS NULL) by re-fetching the original mailbox message and
@@ -142,9 +142,10 @@ Only include companies with genuine hiring signals or staffing needs."""
 
     def execute(self, profile, criteria):
         import openai
+        from services.openai_governor import shared_http_client
         import os
 
-        client = openai.OpenAI(api_key=os.environ.get('OPENAI_API_KEY'))
+        client = openai.OpenAI(api_key=os.environ.get('OPENAI_API_KEY'), http_client=shared_http_client())
 
         industries_str = ', '.join(criteria.get('industries', [])) or 'Any'
         sizes_str = ', '.join(criteria.get('company_sizes', [])) or 'Any'
@@ -495,12 +496,13 @@ class ProspectorService:
 
     def refine_criteria(self, description):
         import openai
+        from services.openai_governor import shared_http_client
         import os
 
         if not description or not description.strip():
             return None
 
-        client = openai.OpenAI(api_key=os.environ.get('OPENAI_API_KEY'))
+        client = openai.OpenAI(api_key=os.environ.get('OPENAI_API_KEY'), http_client=shared_http_client())
 
         prompt = f"""A staffing company recruiter described their ideal client as:
 
@@ -25,6 +25,7 @@ from datetime import datetime
 from typing import Dict, List, Optional
 
 from openai import OpenAI
+from services.openai_governor import shared_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -407,7 +408,7 @@ class ConversationMixin:
 
     def _analyze_reopened_ticket(self, ticket, user_message: str, full_history: str, attachment_content: str = '') -> Optional[str]:
         try:
-            client = OpenAI()
+            client = OpenAI(http_client=shared_http_client())
 
             prompt = (
                 f"A previously resolved/closed support ticket has been reopened by the user.\n\n"
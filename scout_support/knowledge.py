@@ -12,10 +12,14 @@ import json
 import logging
 import math
 import os
+import threading
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 
 from openai import OpenAI
+from services.openai_governor import shared_http_client
+
+from services.vector_index import FlatVectorIndex
 
 logger = logging.getLogger(__name__)
 
@@ -39,11 +43,80 @@ KNOWLEDGE_CATEGORIES = {
 }
 
 
+# In-process chunk-embedding matrix for retrieve_relevant_knowledge. Built once
+# per corpus version (rows keyed by KnowledgeEntry.id, content NOT loaded) and
+# dropped by invalidate_knowledge_cache() whenever this process changes the
+# corpus. The fingerprint check catches changes made by other workers.
+_chunk_index: Optional[FlatVectorIndex] = None
+_chunk_index_fingerprint: Optional[Tuple] = None
+_chunk_index_lock = threading.Lock()
+
+
+def invalidate_knowledge_cache() -> None:
+    """Drop the cached chunk matrix; the next retrieval rebuilds it."""
+    global _chunk_index, _chunk_index_fingerprint
+    with _chunk_index_lock:
+        _chunk_index = None
+        _chunk_index_fingerprint = None
+
+
+def _corpus_fingerprint(dim: int) -> Tuple:
+    """Cheap aggregate that changes whenever active chunks are added/removed."""
+    from extensions import db
+    from models import KnowledgeEntry, KnowledgeDocument
+
+    row = db.session.query(
+        db.func.count(KnowledgeEntry.id),
+        db.func.max(KnowledgeEntry.id),
+        db.func.max(KnowledgeDocument.updated_at),
+    ).join(KnowledgeDocument).filter(
+        KnowledgeDocument.status == 'active',
+        KnowledgeEntry.embedding_vector.isnot(None),
+    ).one()
+    return (dim, row[0], row[1], row[2])
+
+
+def _get_chunk_index(dim: int) -> Optional[FlatVectorIndex]:
+    """Return the chunk matrix for ``dim``-sized query vectors, rebuilding if stale.
+
+    Returns None when NumPy is unavailable so the caller uses the row loop.
+    """
+    global _chunk_index, _chunk_index_fingerprint
+    from extensions import db
+    from models import KnowledgeEntry, KnowledgeDocument
+
+    fingerprint = _corpus_fingerprint(dim)
+    with _chunk_index_lock:
+        if _chunk_index is not None and _chunk_index_fingerprint == fingerprint:
+            return _chunk_index
+        index = FlatVectorIndex(name='knowledge_chunk')
+        if not index.available:
+            return None
+        rows = db.session.query(KnowledgeEntry.id, KnowledgeEntry.embedding_vector).join(
+            KnowledgeDocument
+        ).filter(
+            KnowledgeDocument.status == 'active',
+            KnowledgeEntry.embedding_vector.isnot(None),
+        ).all()
+        for entry_id, vector_json in rows:
+            try:
+                vec = json.loads(vector_json)
+            except (json.JSONDecodeError, TypeError):
+                continue
+            # Chunks embedded under a different model can't be compared
+            if vec and len(vec) == dim:
+                index.upsert(entry_id, vec)
+        _chunk_index = index
+        _chunk_index_fingerprint = fingerprint
+        logger.info(f"📚 Knowledge chunk matrix built: {len(index)} chunk(s)")
+        return index
+
+
 class KnowledgeService:
 
     def __init__(self):
         api_key = os.environ.get('OPENAI_API_KEY')
-        self.openai_client = OpenAI(api_key=api_key) if api_key else None
+        self.openai_client = OpenAI(api_key=api_key, http_client=shared_http_client()) if api_key else None
 
     def process_uploaded_document(self, title: str, file_storage, category: str = 'other',
                                   description: str = '', uploaded_by: str = '') -> Optional['KnowledgeDocument']:
@@ -81,6 +154,7 @@ class KnowledgeService:
 
         doc.status = 'active'
         db.session.commit()
+        invalidate_knowledge_cache()
         logger.info(f"Processed document '{title}' ({filename}): {len(chunks)} chunks created")
         return doc
 
@@ -121,6 +195,7 @@ class KnowledgeService:
 
         doc.status = 'active'
         db.session.commit()
+        invalidate_knowledge_cache()
         logger.info(f"Learned resolution from ticket {ticket.ticket_number}: {len(chunks)} chunks")
         return doc
 
@@ -174,6 +249,7 @@ class KnowledgeService:
 
         doc.status = 'active'
         db.session.commit()
+        invalidate_knowledge_cache()
         logger.info(f"📚 Learned escalation lesson from ticket {ticket.ticket_number}: {len(chunks)} chunks")
         return doc
 
@@ -311,6 +387,14 @@ class KnowledgeService:
         if not query_embedding:
             return []
 
+        try:
+            index = _get_chunk_index(len(query_embedding))
+        except Exception as e:
+            logger.warning(f"Knowledge chunk matrix unavailable, scanning rows: {e}")
+            index = None
+        if index is not None:
+            return self._retrieve_from_index(index, query_embedding, top_k, threshold)
+
         entries = KnowledgeEntry.query.join(KnowledgeDocument).filter(
             KnowledgeDocument.status == 'active',
             KnowledgeEntry.embedding_vector.isnot(None),
@@ -347,6 +431,38 @@ class KnowledgeService:
 
         return results
 
+    def _retrieve_from_index(self, index: FlatVectorIndex, query_embedding: List[float],
+                             top_k: int, threshold: float) -> List[Dict]:
+        """One mat-vec + argpartition top-k; chunk content loads only for winners."""
+        from models import KnowledgeEntry
+
+        winners = [(eid, score) for eid, score in index.top_k(query_embedding, top_k)
+                   if score >= threshold]
+        if not winners:
+            return []
+
+        entries = {
+            e.id: e for e in KnowledgeEntry.query.filter(
+                KnowledgeEntry.id.in_([eid for eid, _ in winners])
+            ).all()
+        }
+        results = []
+        for entry_id, score in winners:
+            entry = entries.get(entry_id)
+            if entry is None:
+                continue
+            doc = entry.document
+            results.append({
+                'content': entry.content,
+                'title': doc.title,
+                'category': doc.category,
+                'doc_type': doc.doc_type,
+                'similarity': round(score, 4),
+                'entry_id': entry.id,
+                'document_id': doc.id,
+            })
+        return results
+
     def build_knowledge_context(self, ticket_subject: str, ticket_description: str,
                                  ticket_category: str = '') -> str:
         query = f"{ticket_subject}\n{ticket_description}"
@@ -415,6 +531,7 @@ class KnowledgeService:
 
         db.session.delete(doc)
         db.session.commit()
+        invalidate_knowledge_cache()
         logger.info(f"Deleted knowledge document {document_id}: {doc.title}")
         return True
 
@@ -622,13 +739,20 @@ class KnowledgeService:
         try:
             text = text[:30000]
             from services.openai_helper import resolve_model, log_call
+            from services.embedding_cache import get_embedding_cache
             _model = resolve_model('scout_support.knowledge_embed', EMBEDDING_MODEL)
+            cache = get_embedding_cache()
+            cached = cache.get(_model, text)
+            if cached is not None:
+                return cached
             response = self.openai_client.embeddings.create(
                 model=_model,
                 input=text,
             )
             log_call('scout_support.knowledge_embed', _model, response)
-            return response.data[0].embedding
+            embedding = response.data[0].embedding
+            cache.put(_model, text, embedding)
+            return embedding
         except Exception as e:
             logger.error(f"Embedding generation failed: {e}")
             return None
@@ -27,6 +27,7 @@ from datetime import datetime
 from typing import Dict, Optional, List
 
 from openai import OpenAI
+from services.openai_governor import shared_http_client
 
 from scout_support.email import EmailMixin
 from scout_support.ai_analysis import AIAnalysisMixin
@@ -108,7 +109,7 @@ class ScoutSupportService(
         else:
             self.bullhorn_service = self._init_bullhorn()
         api_key = os.environ.get('OPENAI_API_KEY')
-        self.openai_client = OpenAI(api_key=api_key) if api_key else None
+        self.openai_client = OpenAI(api_key=api_key, http_client=shared_http_client()) if api_key else None
         logger.info(f"Scout Support Service initialized (Bullhorn: {'connected' if self.bullhorn_service else 'unavailable'})")
 
     def _init_bullhorn(self):
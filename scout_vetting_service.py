@@ -54,12 +54,13 @@ class ScoutVettingService:
         if self._openai_client is None:
             try:
                 import openai
+                from services.openai_governor import shared_http_client
             except ImportError:
                 raise ImportError("The `openai` library is required for Scout Vetting. Install with: pip install openai")
             api_key = os.getenv('OPENAI_API_KEY')
             if not api_key:
                 raise ValueError("OPENAI_API_KEY not set in environment")
-            self._openai_client = openai.OpenAI(api_key=api_key)
+            self._openai_client = openai.OpenAI(api_key=api_key, http_client=shared_http_client())
         return self._openai_client
 
     # ═══════════════════════════════════════════════════════════════
@@ -6,6 +6,7 @@ Contains:
 - CandidateDataAccessMixin: Bullhorn data access methods
   - _fetch_latest_job_submission: Latest JobSubmission lookup with retry
   - _fetch_candidate_details: Full candidate entity fetch
+  - _fetch_candidate_details_batch: Same fields for many candidates via multi-ID GETs
   - _fetch_applied_job: Single job fetch for applied-job injection
   - _mark_application_vetted: Mark ParsedEmail as vetted
   - get_candidate_resume: Download newest Resume-typed file from Bullhorn
@@ -34,6 +35,11 @@ logger = logging.getLogger(__name__)
 
 _RESUME_DOC_EXTENSIONS = ('.pdf', '.doc', '.docx', '.rtf', '.txt', '.odt')
 
+_CANDIDATE_DETAIL_FIELDS = (
+    'id,firstName,lastName,email,phone,address,status,dateAdded,'
+    'dateLastModified,source,occupation,description'
+)
+
 
 def _file_date_added_ms(file_info: Dict) -> int:
     """Best-effort Bullhorn ``dateAdded`` (ms) for newest-file selection."""
@@ -233,7 +239,7 @@ class CandidateDataAccessMixin:
         try:
             url = f"{bullhorn.base_url}entity/Candidate/{candidate_id}"
             params = {
-                'fields': 'id,firstName,lastName,email,phone,address,status,dateAdded,dateLastModified,source,occupation,description',
+                'fields': _CANDIDATE_DETAIL_FIELDS,
                 'BhRestToken': bullhorn.rest_token
             }
 
@@ -250,6 +256,23 @@ class CandidateDataAccessMixin:
             logger.error(f"Error fetching candidate {candidate_id}: {str(e)}")
             return None
 
+    def _fetch_candidate_details_batch(self, bullhorn, candidate_ids: List[int]) -> Dict[int, Dict]:
+        """
+        Fetch details for many candidates at once (multi-ID entity GETs).
+
+        Args:
+            bullhorn: Authenticated Bullhorn service
+            candidate_ids: Bullhorn candidate IDs (duplicates allowed)
+
+        Returns:
+            Dict of candidate ID -> candidate data; missing IDs are absent
+        """
+        try:
+            return bullhorn.get_entities('Candidate', candidate_ids, fields=_CANDIDATE_DETAIL_FIELDS)
+        except Exception as e:
+            logger.error(f"Error fetching {len(candidate_ids)} candidates: {str(e)}")
+            return {}
+
     def _fetch_applied_job(self, bullhorn, job_id: int) -> Optional[Dict]:
         """
         Fetch a single job by ID from Bullhorn for applied-job injection.
@@ -8,15 +8,24 @@ Contains:
   - _is_paused_by_recruiter_decision: Per-job recruiter-decisioned skip
   - _is_paused_by_recruiter_activity: Recruiter-activity gate wrapper
   - _has_recent_recruiter_activity: Bullhorn Note search for recruiter touches
+  - _fetch_candidate_notes_with_retry: Notes association fetch with one retry
+
+Both note-reading gates share one fetch per candidate per cycle through
+bullhorn_service.notes_cache.
 """
 
 import logging
 import time
 from datetime import datetime, timedelta
-from typing import Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import requests
 
+from bullhorn_service.notes_cache import (
+    CANDIDATE_NOTES_FIELDS,
+    candidate_notes_cache,
+    parse_candidate_notes,
+)
 from models import CandidateVettingLog, CandidateJobMatch, VettingConfig
 
 logger = logging.getLogger(__name__)
@@ -272,40 +281,30 @@ class CandidateDeduplicationMixin:
 
         # Step 3: pull notes (action + commenter + date) and find the most
         # recent Scout Screen note. Then check for any human note after it.
-        url = f"{bullhorn.base_url}entity/Candidate/{candidate_id}"
-        params = {
-            'fields': 'notes(id,dateAdded,action,commentingPerson(id))',
-            'BhRestToken': bullhorn.rest_token,
-        }
-        try:
-            resp = bullhorn.session.get(url, params=params, timeout=15)
-            if resp.status_code != 200:
+        notes = candidate_notes_cache.get(bullhorn.base_url, candidate_id)
+        if notes is None:
+            url = f"{bullhorn.base_url}entity/Candidate/{candidate_id}"
+            params = {
+                'fields': CANDIDATE_NOTES_FIELDS,
+                'BhRestToken': bullhorn.rest_token,
+            }
+            try:
+                resp = bullhorn.session.get(url, params=params, timeout=15)
+                if resp.status_code != 200:
+                    logger.warning(
+                        f"⚠️ Recruiter-decision gate: Bullhorn HTTP {resp.status_code} "
+                        f"for candidate {candidate_id}; failing open"
+                    )
+                    return False
+                body = resp.json() or {}
+            except (requests.RequestException, ValueError) as req_err:
                 logger.warning(
-                    f"⚠️ Recruiter-decision gate: Bullhorn HTTP {resp.status_code} "
-                    f"for candidate {candidate_id}; failing open"
+                    f"⚠️ Recruiter-decision gate: Bullhorn lookup failed for candidate "
+                    f"{candidate_id} ({type(req_err).__name__}: {req_err}); failing open"
                 )
                 return False
-            body = resp.json() or {}
-        except (requests.RequestException, ValueError) as req_err:
-            logger.warning(
-                f"⚠️ Recruiter-decision gate: Bullhorn lookup failed for candidate "
-                f"{candidate_id} ({type(req_err).__name__}: {req_err}); failing open"
-            )
-            return False
-
-        candidate_data = body.get('data') if isinstance(body, dict) else None
-        if not isinstance(candidate_data, dict):
-            return False
-        notes_assoc = candidate_data.get('notes')
-        if isinstance(notes_assoc, dict):
-            notes_raw = notes_assoc.get('data')
-        elif isinstance(notes_assoc, list):
-            notes_raw = notes_assoc
-        else:
-            notes_raw = []
-        if not isinstance(notes_raw, list):
-            return False
-        notes = [n for n in notes_raw if isinstance(n, dict)]
+            notes = parse_candidate_notes(body)
+            candidate_notes_cache.put(bullhorn.base_url, candidate_id, notes)
         if not notes:
             return False
 
@@ -496,9 +495,58 @@ class CandidateDeduplicationMixin:
 
         since_dt = datetime.utcnow() - timedelta(minutes=lookback_minutes)
         since_ms = int(since_dt.timestamp() * 1000)
+        notes = candidate_notes_cache.get(bullhorn.base_url, candidate_id)
+        if notes is None:
+            notes = self._fetch_candidate_notes_with_retry(bullhorn, candidate_id)
+            if notes is None:
+                return (False, None)
+            candidate_notes_cache.put(bullhorn.base_url, candidate_id, notes)
+
+        now_ms = int(datetime.utcnow().timestamp() * 1000)
+
+        # Sort newest-first so we report the MOST recent
+        # recruiter touch (matches the prior search-based
+        # `sort=-dateAdded` semantics).
+        def _date_key(n):
+            try:
+                return int(n.get('dateAdded') or 0)
+            except (TypeError, ValueError, AttributeError):
+                return 0
+        notes_sorted = sorted(notes, key=_date_key, reverse=True)
+
+        for note in notes_sorted:
+            note_added = _date_key(note)
+            # Filter to the lookback window in code (entity
+            # endpoint doesn't support a date filter on the
+            # association). Newest-first iteration means we
+            # can break once we fall out of the window.
+            if note_added and note_added < since_ms:
+                break
+            cp = note.get('commentingPerson') or {}
+            cp_id = cp.get('id')
+            is_human = False
+            if cp_id is None:
+                is_human = True  # conservative: unknown author = recruiter
+            else:
+                try:
+                    is_human = int(cp_id) not in api_user_id_set
+                except (TypeError, ValueError):
+                    is_human = True
+            if is_human:
+                effective_added = note_added or now_ms
+                minutes_ago = max(0, int((now_ms - effective_added) / 60000))
+                return (True, minutes_ago)
+        return (False, None)
+
+    def _fetch_candidate_notes_with_retry(self, bullhorn, candidate_id: int) -> Optional[List[Dict]]:
+        """
+        Fetch a candidate's notes association, retrying once on transient
+        failures (5xx, network, JSON parse). Malformed payloads parse to []
+        (fail-open). Returns None when the lookup failed after the retry.
+        """
         url = f"{bullhorn.base_url}entity/Candidate/{candidate_id}"
         params = {
-            'fields': 'notes(id,dateAdded,commentingPerson(id))',
+            'fields': CANDIDATE_NOTES_FIELDS,
             'BhRestToken': bullhorn.rest_token,
         }
 
@@ -519,65 +567,7 @@ class CandidateDeduplicationMixin:
                             time.sleep(1)
                             continue
                         break
-
-                    candidate_data = body.get('data')
-                    if not isinstance(candidate_data, dict):
-                        candidate_data = {}
-                    notes_assoc = candidate_data.get('notes')
-                    # Bullhorn returns to-many associations as either a
-                    # wrapped object ({'data': [...], 'total': N}) or, on
-                    # some endpoints/versions, a bare list. Handle both.
-                    if isinstance(notes_assoc, dict):
-                        notes_raw = notes_assoc.get('data')
-                    elif isinstance(notes_assoc, list):
-                        notes_raw = notes_assoc
-                    else:
-                        notes_raw = []
-                    # Defensive: enforce list-of-dicts. Anything else (a
-                    # malformed upstream payload like a dict/string in
-                    # `notes.data`, or non-dict note items) is treated as
-                    # "no notes" — preserving the fail-open guarantee
-                    # rather than raising AttributeError below.
-                    if not isinstance(notes_raw, list):
-                        notes = []
-                    else:
-                        notes = [n for n in notes_raw if isinstance(n, dict)]
-
-                    now_ms = int(datetime.utcnow().timestamp() * 1000)
-
-                    # Sort newest-first so we report the MOST recent
-                    # recruiter touch (matches the prior search-based
-                    # `sort=-dateAdded` semantics).
-                    def _date_key(n):
-                        try:
-                            return int(n.get('dateAdded') or 0)
-                        except (TypeError, ValueError, AttributeError):
-                            return 0
-                    notes_sorted = sorted(notes, key=_date_key, reverse=True)
-
-                    for note in notes_sorted:
-                        note_added = _date_key(note)
-                        # Filter to the lookback window in code (entity
-                        # endpoint doesn't support a date filter on the
-                        # association). Newest-first iteration means we
-                        # can break once we fall out of the window.
-                        if note_added and note_added < since_ms:
-                            break
-                        cp = note.get('commentingPerson') or {}
-                        cp_id = cp.get('id')
-                        is_human = False
-                        if cp_id is None:
-                            is_human = True  # conservative: unknown author = recruiter
-                        else:
-                            try:
-                                is_human = int(cp_id) not in api_user_id_set
-                            except (TypeError, ValueError):
-                                is_human = True
-                        if is_human:
-                            effective_added = note_added or now_ms
-                            minutes_ago = max(0, int((now_ms - effective_added) / 60000))
-                            return (True, minutes_ago)
-                    return (False, None)
+                    return parse_candidate_notes(body)
 
                 if 500 <= resp.status_code < 600:
                     last_error = f"HTTP {resp.status_code}"
@@ -607,4 +597,4 @@ class CandidateDeduplicationMixin:
             f"after retry ({last_error}, status={last_status}); "
             f"failing open — candidate will proceed to vet (gate degraded)"
         )
-        return (False, None)
+        return None
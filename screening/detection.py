@@ -52,10 +52,9 @@ def _parse_api_user_ids_for_screening() -> List[int]:
     Mirrors `tasks.owner_reassignment._parse_api_user_ids` semantics.
     """
     try:
-        row = VettingConfig.query.filter_by(setting_key='api_user_ids').first()
+        raw = VettingConfig.settings.get_str('api_user_ids')
     except Exception:
         return []
-    raw = (row.setting_value if row else '') or ''
     out: List[int] = []
     for part in raw.split(','):
         part = part.strip()
@@ -71,14 +70,9 @@ def _screening_skip_human_owned() -> bool:
     the default even on a fresh DB.
     """
     try:
-        row = VettingConfig.query.filter_by(
-            setting_key='screening_skip_human_owned'
-        ).first()
+        return VettingConfig.settings.get_bool('screening_skip_human_owned', default=True)
     except Exception:
         return True
-    if row is None or row.setting_value is None:
-        return True
-    return str(row.setting_value).strip().lower() in ('true', '1', 'yes', 'on')
 
 
 def _is_human_owned(candidate: Dict, api_user_ids: List[int]) -> bool:
@@ -1209,11 +1203,16 @@ class CandidateDetectionMixin(CandidateDeduplicationMixin, CandidateDataAccessMi
                               f"Will retry next cycle.")
                 return []
             
+            details = self._fetch_candidate_details_batch(
+                bullhorn, [pe.bullhorn_candidate_id for pe in candidates_needing_details]
+            )
             for parsed_email in candidates_needing_details:
                 candidate_id = parsed_email.bullhorn_candidate_id
-                candidate_data = self._fetch_candidate_details(bullhorn, candidate_id)
+                candidate_data = details.get(candidate_id)
                 
                 if candidate_data:
+                    # Copy: one candidate can have several pending applications.
+                    candidate_data = dict(candidate_data)
                     candidate_data['_parsed_email_id'] = parsed_email.id
                     candidate_data['_applied_job_id'] = parsed_email.bullhorn_job_id
                     candidate_data['_is_duplicate'] = parsed_email.is_duplicate_candidate
@@ -228,9 +228,9 @@ class JobManagementMixin:
             # Get Bullhorn credentials
             credentials = {}
             for key in ['bullhorn_client_id', 'bullhorn_client_secret', 'bullhorn_username', 'bullhorn_password']:
-                setting = GlobalSettings.query.filter_by(setting_key=key).first()
-                if setting and setting.setting_value:
-                    credentials[key] = setting.setting_value.strip()
+                value = GlobalSettings.settings.get_str(key)
+                if value:
+                    credentials[key] = value
             
             bullhorn = BullhornService(
                 client_id=credentials.get('bullhorn_client_id'),
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Keyword Classifier Benchmark
+Compares per-job cost of InternalJobClassifier.classify_job against the
+original per-keyword substring scan on synthetic job descriptions.
+"""
+
+import sys
+import argparse
+import random
+import re
+import timeit
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from job_classification_service import InternalJobClassifier
+
+_FILLER = (
+    "the successful candidate will work closely with cross functional teams to deliver "
+    "high quality results in a fast paced environment while maintaining excellent "
+    "communication with stakeholders and leadership across multiple locations"
+).split()
+
+
+def legacy_classify(clf, title, description):
+    """Original algorithm: one substring test per keyword, fresh regex per seniority keyword."""
+    title_lower = (title or "").lower().strip()
+    desc_lower = (description or "").lower().strip()
+
+    def best(table, default):
+        name, best_score = default, 0
+        for cat, keywords in table.items():
+            score = sum(3 if kw in title_lower else (1 if kw in desc_lower else 0) for kw in keywords)
+            if score > best_score:
+                best_score, name = score, cat
+        return name
+
+    def word(kw):
+        return bool(re.search(r'(?<![a-z])' + re.escape(kw) + r'(?![a-z])', title_lower))
+
+    job_function = best(clf.function_keywords, "Operations")
+    industry = best(clf.industry_keywords, "Professional Services")
+    seniority = "Mid-Senior level"
+    for level, kws in (
+        ("Executive", ['ceo', 'cto', 'cfo', 'chief', 'president', 'vp', 'vice president', 'executive']),
+        ("Director", ['director', 'head of', 'managing']),
+        ("Mid-Senior level", ['senior', 'sr.', 'sr ', 'lead', 'principal', 'staff']),
+        ("Entry level", ['junior', 'jr.', 'jr ', 'entry', 'associate', 'assistant']),
+        ("Internship", ['intern', 'internship', 'co-op']),
+    ):
+        if any(word(kw) for kw in kws):
+            seniority = level
+            break
+    return job_function, industry, seniority
+
+
+def make_jobs(clf, count, words, keyword_ratio, seed):
+    rng = random.Random(seed)
+    keywords = sorted({kw for table in (clf.function_keywords, clf.industry_keywords)
+                       for kws in table.values() for kw in kws})
+    jobs = []
+    for _ in range(count):
+        title = ' '.join(rng.choice(keywords) for _ in range(3)).title()
+        desc = ' '.join(
+            rng.choice(keywords) if rng.random() < keyword_ratio else rng.choice(_FILLER)
+            for _ in range(words)
+        )
+        jobs.append((title, desc))
+    return jobs
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the keyword job classifier')
+    parser.add_argument('--jobs', type=int, default=200, help='Number of synthetic jobs')
+    parser.add_argument('--words', type=int, default=700, help='Words per description (~5KB at 700)')
+    parser.add_argument('--keyword-ratio', type=float, default=0.05, help='Share of description words that are keywords')
+    parser.add_argument('--repeat', type=int, default=5, help='Timing repeats (best is reported)')
+    args = parser.parse_args()
+
+    clf = InternalJobClassifier()
+    jobs = make_jobs(clf, args.jobs, args.words, args.keyword_ratio, seed=42)
+
+    for title, desc in jobs:
+        result = clf.classify_job(title, desc)
+        current = (result['job_function'], result['industries'], result['seniority_level'])
+        assert current == legacy_classify(clf, title, desc), (title, current)
+
+    def run_legacy():
+        for title, desc in jobs:
+            legacy_classify(clf, title, desc)
+
+    def run_current():
+        for title, desc in jobs:
+            clf.classify_job(title, desc)
+
+    legacy = min(timeit.repeat(run_legacy, number=1, repeat=args.repeat)) / len(jobs)
+    current = min(timeit.repeat(run_current, number=1, repeat=args.repeat)) / len(jobs)
+
+    avg_len = sum(len(d) for _, d in jobs) / len(jobs)
+    print(f"{len(jobs)} jobs, avg description {avg_len:,.0f} chars, results identical")
+    print(f"  before (per-keyword scan): {legacy * 1e6:8.1f} us/job")
+    print(f"  after  (single-pass scan): {current * 1e6:8.1f} us/job")
+    print(f"  speedup: {legacy / current:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
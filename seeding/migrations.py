@@ -94,6 +94,12 @@ def run_schema_migrations(db):
         # Scout Screening snapshot list; backfill existing rows so we do not
         # re-email historical specs (Aug 2026).
         ("job_vetting_requirements", "spec_create_notified_at", "TIMESTAMP"),
+        # Packed float32 job embedding — read by the in-process Layer 1
+        # matrix index instead of JSON-decoding every vector (Oct 2026).
+        ("job_embedding", "embedding_blob", "BYTEA"),
+        # Résumé content hash — fraud résumé-reuse counts compare 32-char
+        # digests instead of full résumé text (Oct 2026).
+        ("candidate_vetting_log", "resume_text_hash", "VARCHAR(32)"),
     ]
 
     _SAFE_IDENTIFIER = re.compile(r'^[a-zA-Z_][a-zA-Z0-9_]*$')
@@ -186,6 +192,27 @@ def run_schema_migrations(db):
         db.session.rollback()
         logger.warning(f"⚠️ Index ensure skipped for candidate_linkedin_url: {str(e)}")
 
+    # Index the résumé content hash for the fraud resume-reuse lookup
+    # (added Oct 2026). Same name as SQLAlchemy's auto-generated index.
+    try:
+        exists = db.session.execute(text(
+            "SELECT 1 FROM pg_indexes "
+            "WHERE indexname = 'ix_candidate_vetting_log_resume_text_hash'"
+        )).fetchone()
+        if exists:
+            logger.info("✅ Ensured index ix_candidate_vetting_log_resume_text_hash")
+        else:
+            db.session.execute(text("SET LOCAL lock_timeout = '5s'"))
+            db.session.execute(text(
+                'CREATE INDEX IF NOT EXISTS ix_candidate_vetting_log_resume_text_hash '
+                'ON candidate_vetting_log (resume_text_hash)'
+            ))
+            db.session.commit()
+            logger.info("✅ Ensured index ix_candidate_vetting_log_resume_text_hash")
+    except Exception as e:
+        db.session.rollback()
+        logger.warning(f"⚠️ Index ensure skipped for resume_text_hash: {str(e)}")
+
     # Index the multi-tenant environment_id discriminator on each ATS-scoped
     # table (Task #100). Mirrors the name SQLAlchemy auto-generates
     # (ix_<table>_environment_id) so a fresh-DB create_all() and this ALTER path
@@ -587,21 +587,12 @@ class AdminHealthService:
     def tile_ai_cost_24h(self) -> HealthTile:
         """Estimated OpenAI spend over the last 24h from openai_call_log."""
         try:
-            from extensions import db
-            from sqlalchemy import text
+            from services.ai_cost_rollup import totals
             since = self._now - timedelta(hours=24)
-            row = db.session.execute(
-                text(
-                    "SELECT COALESCE(SUM(estimated_cost_usd), 0) AS total, "
-                    "COALESCE(SUM(input_tokens + output_tokens), 0) AS tokens, "
-                    "COUNT(*) AS calls "
-                    "FROM openai_call_log WHERE created_at >= :since"
-                ),
-                {'since': since},
-            ).fetchone()
-            total = float(row[0] or 0) if row else 0.0
-            tokens = int(row[1] or 0) if row else 0
-            calls = int(row[2] or 0) if row else 0
+            m = totals(since)
+            total = m['cost']
+            tokens = m['input_tokens'] + m['output_tokens']
+            calls = m['calls']
 
             # Thresholds: green < $80/day, amber < $200/day, red >= $200/day.
             if total < 80:
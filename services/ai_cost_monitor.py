@@ -133,41 +133,25 @@ def _read_state() -> Tuple[Optional[str], Optional[datetime]]:
 # ── Data access ───────────────────────────────────────────────────────────────
 
 def _fetch_spend_window(since: datetime) -> Dict:
-    from extensions import db
-    from sqlalchemy import text
-    row = db.session.execute(
-        text(
-            "SELECT COALESCE(SUM(estimated_cost_usd), 0) AS total, "
-            "COUNT(*) AS calls "
-            "FROM openai_call_log WHERE created_at >= :since"
-        ),
-        {'since': since},
-    ).fetchone()
+    from services.ai_cost_rollup import totals
+    m = totals(since)
     return {
-        'total_usd': float(row[0] or 0) if row else 0.0,
-        'calls': int(row[1] or 0) if row else 0,
+        'total_usd': m['cost'],
+        'calls': m['calls'],
     }
 
 
 def _fetch_top_sites(since: datetime, limit: int = 6) -> List[Dict]:
-    from extensions import db
-    from sqlalchemy import text
-    rows = db.session.execute(
-        text(
-            "SELECT call_site_id, COUNT(*) AS calls, "
-            "COALESCE(SUM(estimated_cost_usd), 0) AS cost "
-            "FROM openai_call_log WHERE created_at >= :since "
-            "GROUP BY call_site_id ORDER BY cost DESC LIMIT :limit"
-        ),
-        {'since': since, 'limit': limit},
-    ).fetchall()
+    from services.ai_cost_rollup import aggregate
+    grouped = aggregate(since, group_by=('call_site_id',))
+    ranked = sorted(grouped.items(), key=lambda kv: kv[1]['cost'], reverse=True)
     return [
         {
-            'site': r[0] or 'unknown',
-            'calls': int(r[1] or 0),
-            'cost': float(r[2] or 0),
+            'site': site or 'unknown',
+            'calls': m['calls'],
+            'cost': m['cost'],
         }
-        for r in rows
+        for (site,), m in ranked[:limit]
     ]
 
 
@@ -179,19 +163,13 @@ def _fetch_calls_per_run(since: datetime) -> Optional[float]:
     """
     from extensions import db
     from sqlalchemy import text
+    from services.ai_cost_rollup import totals
+    scoring_calls = totals(since, call_site_id='screening.scoring')['calls']
     row = db.session.execute(
-        text(
-            "SELECT "
-            "(SELECT COUNT(*) FROM openai_call_log "
-            " WHERE call_site_id = 'screening.scoring' AND created_at >= :since), "
-            "(SELECT COUNT(*) FROM candidate_vetting_log WHERE created_at >= :since)"
-        ),
+        text("SELECT COUNT(*) FROM candidate_vetting_log WHERE created_at >= :since"),
         {'since': since},
     ).fetchone()
-    if not row:
-        return None
-    scoring_calls = int(row[0] or 0)
-    runs = int(row[1] or 0)
+    runs = int(row[0] or 0) if row else 0
     if runs <= 0:
         return None
     return scoring_calls / runs
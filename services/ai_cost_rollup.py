@@ -0,0 +1,312 @@
+"""Hourly / daily rollups of `openai_call_log` for the AI cost readers.
+
+The cost dashboard, the 7-day trend, the auditor cost panel, the spend alert,
+the System Health tile and the forecaster all used to GROUP BY over raw
+`openai_call_log` for windows of up to 30 days, so every page load and every
+alert tick got slower as log history built up. They now go through
+:func:`aggregate`, which stitches a window together from:
+
+    raw rows    [since, next hour)            ≤ 1 hour of raw rows
+    hourly      [next hour, next midnight)    ≤ 24 buckets per key
+    daily       whole days                    ≤ 1 bucket per key per day
+    hourly      [last midnight, watermark)    ≤ 24 buckets per key
+    raw rows    [watermark, until)            ≈ ROLLUP_LAG + 1 hour of rows
+
+(a window ending before the watermark stops the rollups at the hour `until`
+falls in and reads the rest of that hour raw)
+
+so the amount of work is bounded by the number of (site, model, tenant) keys,
+not by how many calls were logged. Results are exact — the raw edges cover
+the partial hours a rollup cannot.
+
+:func:`refresh_rollups` is the watermark job (scheduled every 10 minutes). It
+rolls every complete hour older than ROLLUP_LAG into both tables in one
+transaction together with the new watermark, so a crash never double counts.
+ROLLUP_LAG leaves room for rows still sitting in the telemetry writer's
+buffer (see services/openai_helper.py). Before the first refresh there is no
+watermark and :func:`aggregate` simply reads the raw table.
+"""
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Dict, Iterable, Optional, Tuple
+
+from sqlalchemy import text
+
+from extensions import db
+
+logger = logging.getLogger(__name__)
+
+ROLLUP_LAG = timedelta(minutes=10)
+
+GROUP_COLUMNS = ('day', 'call_site_id', 'model', 'tenant_id')
+
+METRICS = (
+    'calls', 'failures', 'input_tokens', 'output_tokens',
+    'cached_input_tokens', 'cost', 'duration_ms_sum', 'duration_count',
+)
+
+_ROLLUP_STATE_ID = 1
+
+
+def empty_metrics() -> Dict[str, float]:
+    out: Dict[str, float] = {m: 0 for m in METRICS}
+    out['cost'] = 0.0
+    return out
+
+
+# ── Time bucketing ────────────────────────────────────────────────────────────
+
+def floor_hour(dt: datetime) -> datetime:
+    return dt.replace(minute=0, second=0, microsecond=0)
+
+
+def ceil_hour(dt: datetime) -> datetime:
+    floored = floor_hour(dt)
+    return floored if floored == dt else floored + timedelta(hours=1)
+
+
+def floor_day(dt: datetime) -> datetime:
+    return dt.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def ceil_day(dt: datetime) -> datetime:
+    floored = floor_day(dt)
+    return floored if floored == dt else floored + timedelta(days=1)
+
+
+def _truncate_sql(unit: str) -> str:
+    """SQL expression truncating `created_at` to the hour / day."""
+    if db.engine.dialect.name == 'postgresql':
+        return f"date_trunc('{unit}', created_at)"
+    fmt = '%Y-%m-%d %H:00:00' if unit == 'hour' else '%Y-%m-%d 00:00:00'
+    return f"strftime('{fmt}', created_at)"
+
+
+def _as_datetime(value) -> Optional[datetime]:
+    if value is None or isinstance(value, datetime):
+        return value
+    return datetime.strptime(str(value)[:19], '%Y-%m-%d %H:%M:%S')
+
+
+# ── Raw + rollup sources ──────────────────────────────────────────────────────
+
+def _raw_rows(start: datetime, end: datetime, unit: str,
+              call_site_id: Optional[str]) -> Iterable[Tuple]:
+    """(bucket_start, site, model, tenant, *METRICS) grouped from raw rows."""
+    if start >= end:
+        return []
+    bucket = _truncate_sql(unit)
+    site_filter = "AND call_site_id = :site " if call_site_id else ""
+    return db.session.execute(
+        text(
+            f"SELECT {bucket} AS bucket, call_site_id, model, "
+            "       COALESCE(tenant_id, '') AS tenant, "
+            "       COUNT(*), "
+            "       COALESCE(SUM(CASE WHEN success = FALSE THEN 1 ELSE 0 END), 0), "
+            "       COALESCE(SUM(input_tokens), 0), "
+            "       COALESCE(SUM(output_tokens), 0), "
+            "       COALESCE(SUM(cached_input_tokens), 0), "
+            "       COALESCE(SUM(estimated_cost_usd), 0), "
+            "       COALESCE(SUM(duration_ms), 0), "
+            "       COUNT(duration_ms) "
+            "FROM openai_call_log "
+            "WHERE created_at >= :start AND created_at < :end "
+            f"{site_filter}"
+            f"GROUP BY {bucket}, call_site_id, model, COALESCE(tenant_id, '')"
+        ),
+        {'start': start, 'end': end, 'site': call_site_id},
+    ).fetchall()
+
+
+def _rollup_rows(model, start: datetime, end: datetime,
+                 call_site_id: Optional[str]) -> Iterable[Tuple]:
+    if start >= end:
+        return []
+    q = db.session.query(
+        model.bucket_start, model.call_site_id, model.model, model.tenant_id,
+        model.calls, model.failures, model.input_tokens, model.output_tokens,
+        model.cached_input_tokens, model.estimated_cost_usd,
+        model.duration_ms_sum, model.duration_count,
+    ).filter(model.bucket_start >= start, model.bucket_start < end)
+    if call_site_id:
+        q = q.filter(model.call_site_id == call_site_id)
+    return q.all()
+
+
+def get_watermark() -> Optional[datetime]:
+    """Raw rows with created_at before this are in the rollup tables."""
+    from models.openai_telemetry import OpenAICallRollupState
+    state = db.session.get(OpenAICallRollupState, _ROLLUP_STATE_ID)
+    return state.rolled_up_to if state else None
+
+
+def aggregate(
+    since: datetime,
+    until: Optional[datetime] = None,
+    group_by: Tuple[str, ...] = ('call_site_id', 'model'),
+    call_site_id: Optional[str] = None,
+) -> Dict[Tuple, Dict[str, float]]:
+    """Aggregate `openai_call_log` over [since, until) keyed by `group_by`.
+
+    `group_by` is any subset of GROUP_COLUMNS; 'day' keys are `date` objects
+    (UTC). Pass ``group_by=()`` for window totals under the key ``()``.
+    Returns ``{key_tuple: metrics}`` with METRICS as the metric names.
+    Database errors propagate — callers keep their own rollback handling.
+    """
+    unknown = set(group_by) - set(GROUP_COLUMNS)
+    if unknown:
+        raise ValueError(f"unknown group_by column(s): {sorted(unknown)}")
+    from models.openai_telemetry import OpenAICallRollupDaily, OpenAICallRollupHourly
+
+    until = until or datetime.utcnow()
+    watermark = get_watermark()
+    # Rollup buckets are whole hours: never read one that `until` cuts.
+    edge = min(watermark, floor_hour(until)) if watermark is not None else None
+    sources = []
+    if edge is None or edge <= since:
+        sources.append(_raw_rows(since, until, 'day', call_site_id))
+    else:
+        head_end = min(ceil_hour(since), edge)
+        first_day = min(ceil_day(head_end), edge)
+        last_day = max(floor_day(edge), first_day)
+        sources.extend([
+            _raw_rows(since, head_end, 'day', call_site_id),
+            _rollup_rows(OpenAICallRollupHourly, head_end, first_day, call_site_id),
+            _rollup_rows(OpenAICallRollupDaily, first_day, last_day, call_site_id),
+            _rollup_rows(OpenAICallRollupHourly, last_day, edge, call_site_id),
+            _raw_rows(edge, until, 'day', call_site_id),
+        ])
+
+    positions = [GROUP_COLUMNS.index(c) for c in group_by]
+    out: Dict[Tuple, Dict[str, float]] = {}
+    for rows in sources:
+        for row in rows:
+            key_values = (_as_datetime(row[0]).date(), row[1], row[2], row[3] or '')
+            key = tuple(key_values[p] for p in positions)
+            bucket = out.get(key)
+            if bucket is None:
+                bucket = out[key] = empty_metrics()
+            for name, value in zip(METRICS, row[4:]):
+                if name == 'cost':
+                    bucket[name] += float(value or 0)
+                else:
+                    bucket[name] += int(value or 0)
+    return out
+
+
+def totals(since: datetime, until: Optional[datetime] = None,
+           call_site_id: Optional[str] = None) -> Dict[str, float]:
+    """Window totals (all sites unless `call_site_id` is given)."""
+    return aggregate(since, until, group_by=(), call_site_id=call_site_id).get((), empty_metrics())
+
+
+# ── Watermark job ─────────────────────────────────────────────────────────────
+
+def refresh_rollups(now: Optional[datetime] = None) -> Dict[str, int]:
+    """Roll complete hours older than ROLLUP_LAG into the rollup tables.
+
+    Idempotent and safe to run on a schedule: hourly buckets past the
+    watermark are always new, daily buckets are merged, and the watermark
+    advances in the same commit.
+    """
+    from models.openai_telemetry import (
+        OpenAICallLog,
+        OpenAICallRollupDaily,
+        OpenAICallRollupHourly,
+        OpenAICallRollupState,
+    )
+
+    now = now or datetime.utcnow()
+    target = floor_hour(now - ROLLUP_LAG)
+
+    state = db.session.get(OpenAICallRollupState, _ROLLUP_STATE_ID)
+    if state is not None:
+        start = state.rolled_up_to
+    else:
+        oldest = db.session.query(db.func.min(OpenAICallLog.created_at)).scalar()
+        start = floor_hour(oldest) if oldest else target
+    if start >= target:
+        if state is None:
+            db.session.add(OpenAICallRollupState(
+                id=_ROLLUP_STATE_ID, rolled_up_to=target, updated_at=now,
+            ))
+            db.session.commit()
+        return {'hours': 0, 'hourly_rows': 0, 'daily_rows': 0}
+
+    try:
+        hourly_rows = _raw_rows(start, target, 'hour', None)
+
+        daily: Dict[Tuple, Dict[str, float]] = {}
+        hourly_objects = []
+        for row in hourly_rows:
+            bucket_start = _as_datetime(row[0])
+            metrics = dict(zip(METRICS, row[4:]))
+            hourly_objects.append(_new_rollup(OpenAICallRollupHourly, bucket_start, row, metrics))
+            day_key = (floor_day(bucket_start), row[1], row[2], row[3] or '')
+            agg = daily.setdefault(day_key, empty_metrics())
+            for name, value in metrics.items():
+                agg[name] += float(value or 0) if name == 'cost' else int(value or 0)
+        db.session.add_all(hourly_objects)
+
+        if daily:
+            days = {k[0] for k in daily}
+            existing = {
+                (r.bucket_start, r.call_site_id, r.model, r.tenant_id): r
+                for r in OpenAICallRollupDaily.query.filter(
+                    OpenAICallRollupDaily.bucket_start.in_(days)
+                ).all()
+            }
+            for key, metrics in daily.items():
+                row = existing.get(key)
+                if row is None:
+                    db.session.add(_new_rollup(OpenAICallRollupDaily, key[0], (None,) + key[1:], metrics))
+                else:
+                    _add_metrics(row, metrics)
+
+        if state is None:
+            state = OpenAICallRollupState(id=_ROLLUP_STATE_ID, rolled_up_to=target)
+            db.session.add(state)
+        state.rolled_up_to = target
+        state.updated_at = now
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+
+    hours = int((target - start).total_seconds() // 3600)
+    logger.info(
+        f"AI cost rollup: {hours}h rolled up to {target.isoformat()} "
+        f"({len(hourly_objects)} hourly / {len(daily)} daily key(s))"
+    )
+    return {'hours': hours, 'hourly_rows': len(hourly_objects), 'daily_rows': len(daily)}
+
+
+def _new_rollup(model, bucket_start: datetime, key_row: Tuple, metrics: Dict):
+    return model(
+        bucket_start=bucket_start,
+        call_site_id=key_row[1],
+        model=key_row[2],
+        tenant_id=key_row[3] or '',
+        calls=int(metrics['calls'] or 0),
+        failures=int(metrics['failures'] or 0),
+        input_tokens=int(metrics['input_tokens'] or 0),
+        output_tokens=int(metrics['output_tokens'] or 0),
+        cached_input_tokens=int(metrics['cached_input_tokens'] or 0),
+        estimated_cost_usd=Decimal(str(metrics['cost'] or 0)),
+        duration_ms_sum=int(metrics['duration_ms_sum'] or 0),
+        duration_count=int(metrics['duration_count'] or 0),
+    )
+
+
+def _add_metrics(row, metrics: Dict) -> None:
+    row.calls += int(metrics['calls'])
+    row.failures += int(metrics['failures'])
+    row.input_tokens += int(metrics['input_tokens'])
+    row.output_tokens += int(metrics['output_tokens'])
+    row.cached_input_tokens += int(metrics['cached_input_tokens'])
+    row.estimated_cost_usd = Decimal(str(row.estimated_cost_usd or 0)) + Decimal(str(metrics['cost']))
+    row.duration_ms_sum += int(metrics['duration_ms_sum'])
+    row.duration_count += int(metrics['duration_count'])
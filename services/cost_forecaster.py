@@ -1,6 +1,7 @@
 """Module-Based AI Cost Forecaster.
 
-Derives per-module unit costs from `openai_call_log` and projects monthly
+Derives per-module unit costs from `openai_call_log` (via the hourly /
+daily rollups in services/ai_cost_rollup.py) and projects monthly
 cost for arbitrary combinations of active modules at arbitrary volumes.
 
 Each MODULE_DEFINITIONS entry maps a logical module (the user-facing
@@ -31,9 +32,8 @@ from datetime import datetime, timedelta
 from decimal import Decimal
 from typing import Any, Optional
 
-from sqlalchemy import text
-
 from extensions import db
+from services.ai_cost_rollup import aggregate
 
 logger = logging.getLogger(__name__)
 
@@ -185,9 +185,10 @@ MODULE_DEFINITIONS: list[ModuleDef] = [
 MODULE_BY_KEY: dict[str, ModuleDef] = {m.key: m for m in MODULE_DEFINITIONS}
 
 
-def _safe_query(sql: str, params: dict) -> list:
+def _safe_site_totals(since: datetime) -> list:
+    """[(call_site_id, calls, cost)] since `since`, read via the rollups."""
     try:
-        return db.session.execute(text(sql), params).fetchall()
+        grouped = aggregate(since, group_by=('call_site_id',))
     except Exception as exc:
         logger.warning(f"cost_forecaster query failed: {exc}")
         try:
@@ -195,6 +196,7 @@ def _safe_query(sql: str, params: dict) -> list:
         except Exception:
             pass
         return []
+    return [(site, m['calls'], m['cost']) for (site,), m in grouped.items()]
 
 
 def derive_unit_costs(window_days: int = 14) -> dict[str, dict[str, Any]]:
@@ -216,15 +218,7 @@ def derive_unit_costs(window_days: int = 14) -> dict[str, dict[str, Any]]:
         for s in m.sites:
             site_to_module[s] = m
 
-    rows = _safe_query(
-        "SELECT call_site_id, "
-        "       COUNT(*) AS calls, "
-        "       COALESCE(SUM(estimated_cost_usd), 0) AS cost "
-        "FROM openai_call_log "
-        "WHERE created_at >= :since "
-        "GROUP BY call_site_id",
-        {'since': since},
-    )
+    rows = _safe_site_totals(since)
 
     per_module_cost: dict[str, float] = {m.key: 0.0 for m in MODULE_DEFINITIONS}
     per_module_primary_calls: dict[str, int] = {m.key: 0 for m in MODULE_DEFINITIONS}
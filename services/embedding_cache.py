@@ -0,0 +1,193 @@
+"""Content-addressed embedding cache shared by every embedding call site.
+
+Keyed by ``(model, sha256(normalised text))`` so the same resume, profile
+text, job description or support query is embedded at most once per model:
+
+    Tier 1 — in-process LRU of packed float32 blobs (~12 KB per 3072-dim
+             vector, bounded by EMBEDDING_CACHE_LRU_SIZE entries).
+    Tier 2 — the ``embedding_cache`` table, shared across workers and
+             restarts. Read/written on a short-lived isolated connection so a
+             cache write can never roll back (or be rolled back by) the
+             caller's ORM session.
+
+Normalisation is whitespace-only (same rule as
+``EmbeddingService.compute_description_hash``): re-flowed text maps to the same
+key, but any content change is a miss. Everything is fail-soft — a cache error
+just means the caller pays for the API call it would have made anyway.
+
+Kill-switch: EMBEDDING_CACHE_ENABLED=false bypasses both tiers.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from services.vector_index import pack_vector, unpack_vector
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LRU_SIZE = 2048
+
+
+def _lru_size() -> int:
+    raw = os.environ.get('EMBEDDING_CACHE_LRU_SIZE', str(DEFAULT_LRU_SIZE))
+    try:
+        n = int(raw)
+        return n if n >= 0 else DEFAULT_LRU_SIZE
+    except (TypeError, ValueError):
+        return DEFAULT_LRU_SIZE
+
+
+def text_hash(text: str) -> str:
+    """SHA-256 of whitespace-normalised text."""
+    normalized = " ".join((text or '').split())
+    return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+
+
+class EmbeddingCache:
+    """Two-tier (LRU → DB) embedding cache. Thread-safe."""
+
+    def __init__(self, max_entries: Optional[int] = None):
+        self.max_entries = _lru_size() if max_entries is None else max_entries
+        self._lru: 'OrderedDict[Tuple[str, str], bytes]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.db_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def enabled() -> bool:
+        return os.environ.get('EMBEDDING_CACHE_ENABLED', 'true').lower() not in ('false', '0', 'no')
+
+    def clear(self) -> None:
+        with self._lock:
+            self._lru.clear()
+            self.hits = self.db_hits = self.misses = 0
+
+    # ── Tier 1 ──────────────────────────────────────────────────────────
+
+    def _lru_get(self, key: Tuple[str, str]) -> Optional[bytes]:
+        with self._lock:
+            blob = self._lru.get(key)
+            if blob is not None:
+                self._lru.move_to_end(key)
+            return blob
+
+    def _lru_put(self, key: Tuple[str, str], blob: bytes) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._lru[key] = blob
+            self._lru.move_to_end(key)
+            while len(self._lru) > self.max_entries:
+                self._lru.popitem(last=False)
+
+    # ── Tier 2 ──────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _db_get_many(model: str, hashes: Sequence[str]) -> Dict[str, bytes]:
+        if not hashes:
+            return {}
+        try:
+            from app import db
+            from sqlalchemy import bindparam, text as _text
+            sql = _text(
+                "SELECT text_hash, embedding_blob FROM embedding_cache "
+                "WHERE model = :model AND text_hash IN :hashes"
+            ).bindparams(bindparam('hashes', expanding=True))
+            with db.engine.connect() as conn:
+                rows = conn.execute(sql, {'model': model, 'hashes': list(hashes)}).fetchall()
+            return {h: bytes(b) for h, b in rows if b}
+        except Exception as exc:
+            logger.debug(f"embedding_cache DB read failed: {exc}")
+            return {}
+
+    @staticmethod
+    def _db_put_many(model: str, rows: Sequence[Tuple[str, bytes, int]]) -> None:
+        if not rows:
+            return
+        try:
+            from app import db
+            from sqlalchemy import text as _text
+            sql = _text(
+                "INSERT INTO embedding_cache (model, text_hash, dims, embedding_blob, created_at) "
+                "VALUES (:model, :text_hash, :dims, :embedding_blob, :created_at) "
+                "ON CONFLICT (model, text_hash) DO NOTHING"
+            )
+            now = datetime.utcnow()
+            payload = [
+                {'model': model, 'text_hash': h, 'dims': dims, 'embedding_blob': blob, 'created_at': now}
+                for h, blob, dims in rows
+            ]
+            with db.engine.begin() as conn:
+                conn.execute(sql, payload)
+        except Exception as exc:
+            logger.debug(f"embedding_cache DB write failed: {exc}")
+
+    # ── Public API ──────────────────────────────────────────────────────
+
+    def get_many(self, model: str, texts: Sequence[str]) -> List[Optional[List[float]]]:
+        """Cached vectors aligned with ``texts`` (None where not cached)."""
+        results: List[Optional[List[float]]] = [None] * len(texts)
+        if not self.enabled() or not model:
+            return results
+        keys = [(model, text_hash(t)) for t in texts]
+        db_wanted: Dict[str, List[int]] = {}
+        for i, key in enumerate(keys):
+            blob = self._lru_get(key)
+            if blob is not None:
+                results[i] = unpack_vector(blob)
+                self.hits += 1
+            else:
+                db_wanted.setdefault(key[1], []).append(i)
+        if db_wanted:
+            found = self._db_get_many(model, list(db_wanted))
+            for h, blob in found.items():
+                vector = unpack_vector(blob)
+                if vector is None:
+                    continue
+                self._lru_put((model, h), blob)
+                for i in db_wanted[h]:
+                    results[i] = vector
+                self.db_hits += len(db_wanted[h])
+            self.misses += sum(len(v) for h, v in db_wanted.items() if h not in found)
+        return results
+
+    def get(self, model: str, text: str) -> Optional[List[float]]:
+        return self.get_many(model, [text])[0]
+
+    def put_many(self, model: str, items: Sequence[Tuple[str, Sequence[float]]]) -> None:
+        """Store (text, vector) pairs in both tiers."""
+        if not self.enabled() or not model:
+            return
+        rows = []
+        for text, vector in items:
+            if not vector:
+                continue
+            h = text_hash(text)
+            blob = pack_vector(vector)
+            self._lru_put((model, h), blob)
+            rows.append((h, blob, len(vector)))
+        self._db_put_many(model, rows)
+
+    def put(self, model: str, text: str, vector: Sequence[float]) -> None:
+        self.put_many(model, [(text, vector)])
+
+
+_cache: Optional[EmbeddingCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """Return the process-wide EmbeddingCache singleton."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = EmbeddingCache()
+    return _cache
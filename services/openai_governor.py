@@ -0,0 +1,338 @@
+"""Process-wide adaptive concurrency governor for OpenAI requests.
+
+The vetting cycle fans out twice (candidates × per-candidate job pool), and
+escalations / zero-score re-verification stack more calls on top. Without a
+shared limit the in-flight request count is unbounded and the first signal of
+trouble is a 429 storm. This module puts every OpenAI HTTP request — chat,
+responses and embeddings — behind one per-model gate:
+
+    Concurrency (AIMD)
+        Each model has a dynamic in-flight limit. Every successful response
+        grows it additively (+1 per ``limit`` completions, i.e. ~+1 per
+        round-trip window); a 429 halves it and pauses the model until the
+        server's retry-after / reset time. Throughput converges just below
+        the account limit instead of oscillating through rate-limit errors.
+
+    Token buckets
+        Once OpenAI's ``x-ratelimit-*`` headers have been seen for a model,
+        requests and tokens are metered against ``limit × OPENAI_GOVERNOR_HEADROOM``
+        per minute, and the local bucket is pulled down to the server's
+        ``remaining`` figure on every response.
+
+It is wired in at the transport layer (:func:`governed_http_client`), so every
+call site behind a governed client is covered — including the SDK's own
+retries. ``OpenAI(...)`` constructors pass :func:`shared_http_client`, one
+process-wide governed client, so constructing an SDK client (per call or per
+service instance) never opens a new connection pool.
+
+Fail-open: a request never waits longer than OPENAI_GOVERNOR_MAX_WAIT seconds
+for a slot; after that it is sent anyway and the normal 429 handling applies.
+Kill-switch: OPENAI_GOVERNOR_ENABLED=false.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+import threading
+import time
+from typing import Dict, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+INITIAL_CONCURRENCY = _env_float('OPENAI_GOVERNOR_INITIAL_CONCURRENCY', 8)
+MAX_CONCURRENCY = _env_float('OPENAI_GOVERNOR_MAX_CONCURRENCY', 64)
+HEADROOM = _env_float('OPENAI_GOVERNOR_HEADROOM', 0.9)  # Fraction of the published limit to use
+MAX_WAIT_SECONDS = _env_float('OPENAI_GOVERNOR_MAX_WAIT', 120)
+DEFAULT_BACKOFF_SECONDS = 2.0
+
+_DURATION_PART = re.compile(r'(\d+(?:\.\d+)?)(ms|h|m|s)')
+
+
+def governor_enabled() -> bool:
+    return os.environ.get('OPENAI_GOVERNOR_ENABLED', 'true').lower() not in ('false', '0', 'no')
+
+
+def parse_reset(value: Optional[str]) -> Optional[float]:
+    """Parse OpenAI reset durations ("1s", "6m0s", "250ms", "0.5") into seconds."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    parts = _DURATION_PART.findall(value)
+    if not parts:
+        return None
+    scale = {'ms': 0.001, 's': 1.0, 'm': 60.0, 'h': 3600.0}
+    return sum(float(n) * scale[unit] for n, unit in parts)
+
+
+def _header_int(headers, name: str) -> Optional[int]:
+    raw = headers.get(name)
+    if raw is None:
+        return None
+    try:
+        return int(float(raw))
+    except (TypeError, ValueError):
+        return None
+
+
+class _Bucket:
+    """Token bucket refilled continuously at ``capacity`` per minute."""
+
+    __slots__ = ('capacity', 'level', 'updated')
+
+    def __init__(self, capacity: float):
+        self.capacity = capacity
+        self.level = capacity
+        self.updated = time.monotonic()
+
+    def refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.capacity / 60.0)
+        self.updated = now
+
+    def wait_for(self, amount: float) -> float:
+        """Seconds until ``amount`` is available (0 when it already is)."""
+        amount = min(amount, self.capacity)
+        if self.level >= amount:
+            return 0.0
+        return (amount - self.level) * 60.0 / self.capacity
+
+
+class ModelLimiter:
+    """Concurrency + rate gate for a single model."""
+
+    def __init__(self, model: str):
+        self.model = model
+        self.limit = float(INITIAL_CONCURRENCY)
+        self.in_flight = 0
+        self.paused_until = 0.0
+        self.requests: Optional[_Bucket] = None
+        self.tokens: Optional[_Bucket] = None
+        self.throttled = 0
+        self.completed = 0
+        self._cond = threading.Condition()
+
+    def _wait_seconds(self, est_tokens: int, now: float) -> float:
+        if self.paused_until > now:
+            return self.paused_until - now
+        if self.in_flight >= max(1, int(self.limit)):
+            return 0.25  # Woken by release(); the timeout is only a backstop
+        wait = 0.0
+        for bucket, amount in ((self.requests, 1), (self.tokens, est_tokens)):
+            if bucket is not None:
+                bucket.refill(now)
+                wait = max(wait, bucket.wait_for(amount))
+        return wait
+
+    def acquire(self, est_tokens: int) -> None:
+        deadline = time.monotonic() + MAX_WAIT_SECONDS
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                wait = self._wait_seconds(est_tokens, now)
+                if wait <= 0:
+                    break
+                if now + wait > deadline:
+                    remaining = deadline - now
+                    if remaining <= 0:
+                        logger.warning(
+                            f"🚦 OpenAI governor: {self.model} slot wait exceeded "
+                            f"{MAX_WAIT_SECONDS:.0f}s, sending anyway "
+                            f"(in-flight {self.in_flight}, limit {self.limit:.1f})"
+                        )
+                        break
+                    wait = remaining
+                self._cond.wait(wait)
+            self.in_flight += 1
+            if self.requests is not None:
+                self.requests.level -= 1
+            if self.tokens is not None:
+                self.tokens.level -= est_tokens
+
+    def release(self, response: Optional[httpx.Response]) -> None:
+        with self._cond:
+            self.in_flight = max(0, self.in_flight - 1)
+            if response is not None:
+                self._observe(response)
+            self._cond.notify_all()
+
+    def _observe(self, response: httpx.Response) -> None:
+        headers = response.headers
+        now = time.monotonic()
+        self._sync_bucket('requests', headers, now)
+        self._sync_bucket('tokens', headers, now)
+
+        if response.status_code == 429:
+            self.throttled += 1
+            # Requests already in flight when the first 429 landed come back
+            # throttled too; halve once per pause, not once per response.
+            if self.paused_until <= now:
+                self.limit = max(1.0, self.limit / 2.0)
+            backoff = (
+                parse_reset(headers.get('retry-after'))
+                or parse_reset(headers.get('x-ratelimit-reset-requests'))
+                or parse_reset(headers.get('x-ratelimit-reset-tokens'))
+                or DEFAULT_BACKOFF_SECONDS
+            )
+            self.paused_until = max(self.paused_until, now + backoff)
+            logger.info(
+                f"🚦 OpenAI governor: 429 on {self.model} — concurrency → "
+                f"{self.limit:.1f}, pausing {backoff:.1f}s"
+            )
+        elif response.status_code < 500:
+            self.completed += 1
+            self.limit = min(MAX_CONCURRENCY, self.limit + 1.0 / self.limit)
+
+    def _sync_bucket(self, kind: str, headers, now: float) -> None:
+        limit = _header_int(headers, f'x-ratelimit-limit-{kind}')
+        remaining = _header_int(headers, f'x-ratelimit-remaining-{kind}')
+        if not limit:
+            return
+        capacity = limit * HEADROOM
+        bucket = getattr(self, kind)
+        if bucket is None or bucket.capacity != capacity:
+            bucket = _Bucket(capacity)
+            setattr(self, kind, bucket)
+        bucket.refill(now)
+        if remaining is not None:
+            # The server's view includes other workers/processes on the key
+            bucket.level = min(bucket.level, remaining - limit * (1.0 - HEADROOM))
+
+    def stats(self) -> Dict[str, float]:
+        with self._cond:
+            return {
+                'limit': round(self.limit, 2),
+                'in_flight': self.in_flight,
+                'completed': self.completed,
+                'throttled': self.throttled,
+                'paused_for': round(max(0.0, self.paused_until - time.monotonic()), 2),
+            }
+
+
+class OpenAIGovernor:
+    """Registry of per-model limiters."""
+
+    def __init__(self):
+        self._limiters: Dict[str, ModelLimiter] = {}
+        self._lock = threading.Lock()
+
+    def limiter(self, model: str) -> ModelLimiter:
+        model = model or 'unknown'
+        limiter = self._limiters.get(model)
+        if limiter is None:
+            with self._lock:
+                limiter = self._limiters.setdefault(model, ModelLimiter(model))
+        return limiter
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        return {model: limiter.stats() for model, limiter in list(self._limiters.items())}
+
+
+_governor: Optional[OpenAIGovernor] = None
+_governor_lock = threading.Lock()
+
+
+def get_openai_governor() -> OpenAIGovernor:
+    """Return the process-wide OpenAIGovernor singleton."""
+    global _governor
+    if _governor is None:
+        with _governor_lock:
+            if _governor is None:
+                _governor = OpenAIGovernor()
+    return _governor
+
+
+def _request_model_and_tokens(request: httpx.Request):
+    """Read ``model`` and a rough token estimate from a JSON request body."""
+    try:
+        body = request.content
+    except httpx.RequestNotRead:
+        return 'unknown', 1
+    try:
+        payload = json.loads(body) if body else {}
+    except (TypeError, ValueError):
+        payload = {}
+    model = payload.get('model') if isinstance(payload, dict) else None
+    est = max(1, len(body or b'') // 4)  # ~4 bytes per token
+    if isinstance(payload, dict):
+        est += int(
+            payload.get('max_completion_tokens')
+            or payload.get('max_output_tokens')
+            or payload.get('max_tokens')
+            or 0
+        )
+    return model or 'unknown', est
+
+
+class GovernedTransport(httpx.BaseTransport):
+    """httpx transport that acquires a governor slot around each request."""
+
+    def __init__(self, transport: Optional[httpx.BaseTransport] = None,
+                 governor: Optional[OpenAIGovernor] = None):
+        self._transport = transport or httpx.HTTPTransport()
+        self._governor = governor
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if not governor_enabled():
+            return self._transport.handle_request(request)
+        model, est_tokens = _request_model_and_tokens(request)
+        limiter = (self._governor or get_openai_governor()).limiter(model)
+        limiter.acquire(est_tokens)
+        response = None
+        try:
+            response = self._transport.handle_request(request)
+            return response
+        finally:
+            limiter.release(response)
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+def governed_http_client(**kwargs) -> httpx.Client:
+    """An ``http_client`` for ``OpenAI(...)`` that routes through the governor.
+
+    Uses the SDK's DefaultHttpxClient so timeouts and redirect behaviour
+    stay at the SDK defaults. httpx ignores ``limits`` once a transport is
+    supplied, so the SDK's connection limits are set on the inner transport.
+    """
+    try:
+        from openai import DEFAULT_CONNECTION_LIMITS, DefaultHttpxClient
+    except ImportError:  # pragma: no cover - very old SDKs
+        DEFAULT_CONNECTION_LIMITS = httpx.Limits(max_connections=1000, max_keepalive_connections=100)
+        DefaultHttpxClient = httpx.Client
+    inner = httpx.HTTPTransport(limits=DEFAULT_CONNECTION_LIMITS)
+    return DefaultHttpxClient(transport=GovernedTransport(inner), **kwargs)
+
+
+_shared_client: Optional[httpx.Client] = None
+_shared_client_lock = threading.Lock()
+
+
+def shared_http_client() -> httpx.Client:
+    """The process-wide governed ``http_client``.
+
+    Every ``OpenAI(...)`` constructor passes this, so SDK clients built per
+    call or per service instance share one connection pool. Callers must
+    not close it.
+    """
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        with _shared_client_lock:
+            if _shared_client is None or _shared_client.is_closed:
+                _shared_client = governed_http_client()
+    return _shared_client
@@ -9,20 +9,31 @@ Two public functions:
     log_call(site_id, model, response=None, duration_ms=None,
              entity_type=None, entity_id=None, tenant_id=None,
              success=True, error_type=None) -> None
-        Fire-and-forget background insert into `openai_call_log`. NEVER
-        raises — wrapping the OpenAI call site MUST NOT introduce new
-        failure modes. Token counts are read from `response.usage` when
+        Fire-and-forget insert into `openai_call_log`. NEVER raises —
+        wrapping the OpenAI call site MUST NOT introduce new failure
+        modes. Token counts are read from `response.usage` when
         available; cost is estimated from the central PRICING dict.
 
+Rows are not written inline. `log_call` appends the payload to a bounded
+in-memory buffer drained by a single daemon writer thread, which flushes
+with one multi-row INSERT every OPENAI_TELEMETRY_BATCH_SIZE rows or
+OPENAI_TELEMETRY_FLUSH_MS milliseconds, whichever comes first. When the
+buffer is full (OPENAI_TELEMETRY_BUFFER_SIZE) new rows are dropped and
+counted rather than blocking the caller. Pending rows are flushed at
+interpreter shutdown. `telemetry_stats()` exposes the counters.
+
 PRICING is in USD per 1M tokens. Update entries as OpenAI's published
 pricing changes. Models not in the table fall back to a conservative
 default so we never report $0 for a real call.
 """
 from __future__ import annotations
 
+import atexit
 import logging
 import os
 import threading
+import time
+from collections import deque
 from datetime import datetime
 from decimal import Decimal
 from typing import Any, Optional
@@ -30,6 +41,19 @@ from typing import Any, Optional
 logger = logging.getLogger(__name__)
 
 
+def _env_int(name: str, default: int) -> int:
+    try:
+        return max(1, int(os.environ.get(name, default)))
+    except (TypeError, ValueError):
+        return default
+
+
+BUFFER_SIZE = _env_int('OPENAI_TELEMETRY_BUFFER_SIZE', 10_000)
+BATCH_SIZE = _env_int('OPENAI_TELEMETRY_BATCH_SIZE', 200)
+FLUSH_INTERVAL_MS = _env_int('OPENAI_TELEMETRY_FLUSH_MS', 2_000)
+SHUTDOWN_FLUSH_TIMEOUT_SECONDS = 5.0
+
+
 # USD per 1,000,000 tokens. (input, cached_input, output)
 PRICING: dict[str, tuple[float, float, float]] = {
     'gpt-5':            (1.25, 0.125, 10.00),
@@ -139,28 +163,179 @@ def _extract_usage(response: Any) -> tuple[int, int, int]:
     return (input_tokens, cached, output_tokens)
 
 
-def _persist(payload: dict) -> None:
-    """Insert one row in a short-lived app context. Swallows all errors."""
+def _resolve_app():
+    from flask import current_app
+    try:
+        return current_app._get_current_object()  # type: ignore[attr-defined]
+    except RuntimeError:
+        from app import app as flask_app  # late import to avoid cycle
+        return flask_app
+
+
+def _persist_batch(payloads: list[dict], app=None) -> bool:
+    """Insert rows with one multi-row INSERT. Swallows all errors.
+
+    Returns True when the batch was committed.
+    """
+    if not payloads:
+        return True
     try:
         from extensions import db
-        from flask import current_app
-        try:
-            app = current_app._get_current_object()  # type: ignore[attr-defined]
-        except RuntimeError:
-            from app import app as flask_app  # late import to avoid cycle
-            app = flask_app
+        app = app or _resolve_app()
         with app.app_context():
             from models.openai_telemetry import OpenAICallLog
-            row = OpenAICallLog(**payload)
-            db.session.add(row)
-            db.session.commit()
+            try:
+                # executemany — SQLAlchemy 2.x renders batched multi-VALUES
+                # statements ("insertmanyvalues") on psycopg2.
+                db.session.execute(OpenAICallLog.__table__.insert(), payloads)
+                db.session.commit()
+                return True
+            except Exception:
+                db.session.rollback()
+                raise
     except Exception as e:
+        logger.debug(f"openai_helper telemetry batch persist failed ({len(payloads)} rows): {e}")
+        return False
+
+
+def _persist(payload: dict) -> None:
+    """Insert one row synchronously. Swallows all errors."""
+    _persist_batch([payload])
+
+
+class _TelemetryWriter:
+    """Bounded buffer + single background writer for `openai_call_log` rows."""
+
+    def __init__(self, capacity: int = BUFFER_SIZE, batch_size: int = BATCH_SIZE,
+                 flush_interval_ms: int = FLUSH_INTERVAL_MS):
+        self.capacity = capacity
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval_ms / 1000.0
+        self._buffer: deque = deque()
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+        self._app = None
+        self.enqueued = 0
+        self.dropped = 0
+        self.written = 0
+        self.failed = 0
+        self.flushes = 0
+
+    def submit(self, payload: dict) -> bool:
+        """Queue one row. Returns False (and counts a drop) when full."""
+        if self._app is None:
+            # Capture the caller's app so the writer thread need not import
+            # `app` itself; outside a context it falls back in _persist_batch.
+            try:
+                from flask import current_app
+                self._app = current_app._get_current_object()  # type: ignore[attr-defined]
+            except Exception:
+                pass
+        with self._cond:
+            if len(self._buffer) >= self.capacity:
+                self.dropped += 1
+                if self.dropped == 1 or self.dropped % 1000 == 0:
+                    logger.warning(
+                        f"openai_helper telemetry buffer full ({self.capacity}) — "
+                        f"{self.dropped} row(s) dropped so far"
+                    )
+                return False
+            self._buffer.append(payload)
+            self.enqueued += 1
+            self._ensure_thread()
+            if len(self._buffer) >= self.batch_size:
+                self._cond.notify()
+        return True
+
+    def _ensure_thread(self) -> None:
+        # Caller holds self._cond.
+        if self._stopping or (self._thread is not None and self._thread.is_alive()):
+            return
+        self._thread = threading.Thread(
+            target=self._run, name='openai-telemetry-writer', daemon=True
+        )
+        self._thread.start()
+
+    def _take_batch(self) -> list[dict]:
+        # Caller holds self._cond.
+        n = min(self.batch_size, len(self._buffer))
+        return [self._buffer.popleft() for _ in range(n)]
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                deadline = time.monotonic() + self.flush_interval
+                while not self._stopping and len(self._buffer) < self.batch_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                batch = self._take_batch()
+                stopping = self._stopping
+            if batch:
+                self._write(batch)
+            if stopping:
+                return
+
+    def _write(self, batch: list[dict]) -> None:
+        ok = _persist_batch(batch, self._app)
+        with self._cond:
+            self.flushes += 1
+            if ok:
+                self.written += len(batch)
+            else:
+                self.failed += len(batch)
+
+    def flush(self) -> None:
+        """Synchronously write everything currently buffered."""
+        while True:
+            with self._cond:
+                batch = self._take_batch()
+            if not batch:
+                return
+            self._write(batch)
+
+    def shutdown(self, timeout: float = SHUTDOWN_FLUSH_TIMEOUT_SECONDS) -> None:
+        """Stop the writer thread and flush the remainder. Never raises."""
         try:
-            from extensions import db as _db
-            _db.session.rollback()
-        except Exception:
-            pass
-        logger.debug(f"openai_helper.log_call persist failed: {e}")
+            with self._cond:
+                self._stopping = True
+                self._cond.notify_all()
+                thread = self._thread
+            if thread is not None and thread.is_alive():
+                thread.join(timeout)
+            self.flush()
+        except Exception as e:
+            logger.debug(f"openai_helper telemetry shutdown flush failed: {e}")
+
+    def stats(self) -> dict[str, int]:
+        with self._cond:
+            return {
+                'buffered': len(self._buffer),
+                'enqueued': self.enqueued,
+                'written': self.written,
+                'dropped': self.dropped,
+                'failed': self.failed,
+                'flushes': self.flushes,
+            }
+
+
+_writer = _TelemetryWriter()
+atexit.register(_writer.shutdown)
+
+
+def telemetry_stats() -> dict[str, int]:
+    """Counters for the buffered telemetry writer (buffered/written/dropped/...)."""
+    return _writer.stats()
+
+
+def flush_telemetry() -> None:
+    """Write all buffered telemetry rows now. Never raises."""
+    try:
+        _writer.flush()
+    except Exception as e:
+        logger.debug(f"openai_helper.flush_telemetry failed: {e}")
 
 
 def log_call(
@@ -206,7 +381,6 @@ def log_call(
             'error_type': (error_type[:120] if error_type else None),
         }
 
-        t = threading.Thread(target=_persist, args=(payload,), daemon=True)
-        t.start()
+        _writer.submit(payload)
     except Exception as e:
         logger.debug(f"openai_helper.log_call dispatch failed: {e}")
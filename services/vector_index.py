@@ -0,0 +1,412 @@
+"""In-process flat vector index + packed float32 storage helpers.
+
+Embedding vectors used to travel as JSON text (``json.dumps`` of a 3072-float
+list) and every similarity was a pure-Python ``sum(a*b ...)``. This module
+holds the primitives that replace that:
+
+    pack_vector(vec) -> bytes / unpack_vector(blob) -> list[float]
+        Little-endian float32 (4 bytes/dim) for ``LargeBinary`` columns —
+        ~12 KB per 3072-dim vector instead of ~60 KB of JSON, and decoding
+        is a single ``np.frombuffer`` instead of a JSON parse.
+
+    FlatVectorIndex
+        Exact (brute-force) cosine index: a contiguous, L2-normalised
+        float32 matrix keyed by an integer id. Scoring one query against
+        every row is a single mat-vec product. Each key carries an opaque
+        ``tag`` (e.g. a description hash) so callers can tell whether the
+        in-memory row is still current without touching the database.
+
+    ProfileEmbeddingIndex / get_profile_embedding_index()
+        The whole ``candidate_profile_embedding`` table as one FlatVectorIndex,
+        shared by the fuzzy duplicate matcher and the fraud near-dup signal.
+        Snapshotted to disk and memory-mapped on start-up, then kept current
+        by an ``updated_at`` watermark plus direct upserts from
+        ``FuzzyDuplicateMatcher.get_or_create_profile_embedding``.
+
+NumPy is imported lazily with a graceful fallback (same convention as
+fuzzy_duplicate_matcher): when it is unavailable the index reports
+``available == False`` and callers keep their per-row code path.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import struct
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore
+
+_INITIAL_CAPACITY = 256
+
+PROFILE_INDEX_DIR = os.environ.get('PROFILE_INDEX_DIR', '/tmp/scoutgenius_vector_index')
+PROFILE_INDEX_REFRESH_SECONDS = 60
+PROFILE_INDEX_SNAPSHOT_SECONDS = 600  # Re-write the on-disk snapshot at most this often
+
+
+def pack_vector(vector: Sequence[float]) -> bytes:
+    """Serialise an embedding as packed little-endian float32."""
+    if np is not None:
+        return np.asarray(vector, dtype='<f4').tobytes()
+    return struct.pack(f'<{len(vector)}f', *vector)
+
+
+def unpack_vector(blob: Optional[bytes]) -> Optional[List[float]]:
+    """Inverse of :func:`pack_vector`. Returns None for empty/corrupt blobs."""
+    if not blob or len(blob) % 4:
+        return None
+    if np is not None:
+        return np.frombuffer(bytes(blob), dtype='<f4').astype(float).tolist()
+    return list(struct.unpack(f'<{len(blob) // 4}f', bytes(blob)))
+
+
+class FlatVectorIndex:
+    """Thread-safe exact cosine index over L2-normalised float32 rows.
+
+    Rows live in a pre-allocated matrix that doubles on growth, so an
+    ``upsert`` is amortised O(dim). Deleted rows are swapped with the last
+    row to keep the live region contiguous for the mat-vec.
+    """
+
+    def __init__(self, name: str = 'vectors'):
+        self.name = name
+        self._lock = threading.RLock()
+        self._matrix = None  # np.ndarray (capacity, dim) float32
+        self._dim: Optional[int] = None
+        self._size = 0
+        self._row_of: Dict[Hashable, int] = {}
+        self._key_at: List[Hashable] = []
+        self._tag_of: Dict[Hashable, Optional[str]] = {}
+
+    @property
+    def available(self) -> bool:
+        return np is not None
+
+    @property
+    def dim(self) -> Optional[int]:
+        return self._dim
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._row_of
+
+    def get_tag(self, key: Hashable) -> Optional[str]:
+        return self._tag_of.get(key)
+
+    def has_current(self, key: Hashable, tag: Optional[str]) -> bool:
+        """True when ``key`` is indexed and its tag matches ``tag``."""
+        return key in self._row_of and self._tag_of.get(key) == tag
+
+    def clear(self) -> None:
+        with self._lock:
+            self._matrix = None
+            self._dim = None
+            self._size = 0
+            self._row_of.clear()
+            self._key_at.clear()
+            self._tag_of.clear()
+
+    @staticmethod
+    def _normalise(vector) -> Optional['np.ndarray']:
+        arr = np.asarray(vector, dtype=np.float32).reshape(-1)
+        norm = float(np.linalg.norm(arr))
+        if arr.size == 0 or norm == 0.0 or not np.isfinite(norm):
+            return None
+        return arr / norm
+
+    def upsert(self, key: Hashable, vector, tag: Optional[str] = None) -> bool:
+        """Insert or replace ``key``. Returns False if the vector is unusable.
+
+        A vector whose dimension differs from the index (embedding model
+        switch) resets the index — mixing dimensions would make every score
+        meaningless, and the caller's refresh repopulates it.
+        """
+        if np is None or vector is None:
+            return False
+        arr = self._normalise(vector)
+        if arr is None:
+            self.remove(key)
+            return False
+        with self._lock:
+            if self._dim is not None and arr.shape[0] != self._dim:
+                logger.info(
+                    f"🧮 {self.name} index: dimension changed {self._dim} → "
+                    f"{arr.shape[0]}, resetting {self._size} row(s)"
+                )
+                self.clear()
+            if self._matrix is None:
+                self._dim = int(arr.shape[0])
+                self._matrix = np.zeros((_INITIAL_CAPACITY, self._dim), dtype=np.float32)
+            row = self._row_of.get(key)
+            if row is None:
+                if self._size >= self._matrix.shape[0]:
+                    grown = np.zeros((self._matrix.shape[0] * 2, self._dim), dtype=np.float32)
+                    grown[:self._size] = self._matrix[:self._size]
+                    self._matrix = grown
+                row = self._size
+                self._size += 1
+                self._row_of[key] = row
+                self._key_at.append(key)
+            self._matrix[row] = arr
+            self._tag_of[key] = tag
+            return True
+
+    def remove(self, key: Hashable) -> None:
+        with self._lock:
+            row = self._row_of.pop(key, None)
+            self._tag_of.pop(key, None)
+            if row is None:
+                return
+            last = self._size - 1
+            if row != last:
+                moved_key = self._key_at[last]
+                self._matrix[row] = self._matrix[last]
+                self._key_at[row] = moved_key
+                self._row_of[moved_key] = row
+            self._key_at.pop()
+            self._size = last
+
+    def _query_array(self, query):
+        arr = self._normalise(query)
+        if arr is None or self._dim is None or arr.shape[0] != self._dim:
+            return None
+        return arr
+
+    def similarities(self, query, keys: Iterable[Hashable]) -> Dict[Hashable, float]:
+        """Cosine similarity of ``query`` against each indexed key in ``keys``.
+
+        Keys that are not indexed are simply absent from the result, as is
+        everything when the query dimension doesn't match the index.
+        """
+        if np is None:
+            return {}
+        with self._lock:
+            q = self._query_array(query)
+            if q is None:
+                return {}
+            wanted = [k for k in keys if k in self._row_of]
+            if not wanted:
+                return {}
+            rows = np.fromiter((self._row_of[k] for k in wanted), dtype=np.intp, count=len(wanted))
+            scores = self._matrix[rows] @ q
+        return {k: float(s) for k, s in zip(wanted, scores)}
+
+    def top_k(self, query, k: int, exclude: Iterable[Hashable] = ()) -> List[Tuple[Hashable, float]]:
+        """Return up to ``k`` (key, cosine) pairs, best first."""
+        if np is None or k <= 0:
+            return []
+        excluded = set(exclude)
+        with self._lock:
+            q = self._query_array(query)
+            if q is None or self._size == 0:
+                return []
+            scores = self._matrix[:self._size] @ q
+            want = min(self._size, k + len(excluded))
+            if want < self._size:
+                idx = np.argpartition(-scores, want - 1)[:want]
+            else:
+                idx = np.arange(self._size)
+            idx = idx[np.argsort(-scores[idx], kind='stable')]
+            out: List[Tuple[Hashable, float]] = []
+            for i in idx:
+                key = self._key_at[int(i)]
+                if key in excluded:
+                    continue
+                out.append((key, float(scores[int(i)])))
+                if len(out) >= k:
+                    break
+        return out
+
+    # ── Snapshot persistence ────────────────────────────────────────────
+
+    def save(self, path_prefix: str, meta: Optional[Dict[str, Any]] = None) -> bool:
+        """Write ``<prefix>.npy`` (live rows) + ``<prefix>.json`` (keys/tags/meta).
+
+        Both files are written to temp names and swapped in with os.replace so
+        a concurrent ``load`` never sees a half-written snapshot.
+        """
+        if np is None:
+            return False
+        with self._lock:
+            if self._matrix is None:
+                return False
+            matrix = np.array(self._matrix[:self._size], dtype=np.float32)
+            header = {
+                'dim': self._dim,
+                'keys': list(self._key_at),
+                'tags': [self._tag_of.get(k) for k in self._key_at],
+                'meta': meta or {},
+            }
+        try:
+            os.makedirs(os.path.dirname(path_prefix) or '.', exist_ok=True)
+            tmp_npy = f'{path_prefix}.{os.getpid()}.tmp.npy'
+            tmp_json = f'{path_prefix}.{os.getpid()}.tmp.json'
+            np.save(tmp_npy, matrix)
+            with open(tmp_json, 'w') as fh:
+                json.dump(header, fh)
+            os.replace(tmp_npy, f'{path_prefix}.npy')
+            os.replace(tmp_json, f'{path_prefix}.json')
+            return True
+        except Exception as e:
+            logger.warning(f"{self.name} index: snapshot write failed: {e}")
+            return False
+
+    def load(self, path_prefix: str) -> Optional[Dict[str, Any]]:
+        """Memory-map a snapshot written by :meth:`save`. Returns its meta.
+
+        The matrix is opened copy-on-write, so pages are read lazily and
+        in-place upserts never touch the file. Growth past the snapshot size
+        moves the matrix into RAM.
+        """
+        if np is None:
+            return None
+        try:
+            with open(f'{path_prefix}.json') as fh:
+                header = json.load(fh)
+            matrix = np.load(f'{path_prefix}.npy', mmap_mode='c')
+            keys = header.get('keys') or []
+            tags = header.get('tags') or [None] * len(keys)
+            if matrix.ndim != 2 or matrix.shape[0] != len(keys):
+                raise ValueError(f"shape {matrix.shape} does not match {len(keys)} keys")
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"{self.name} index: ignoring unreadable snapshot: {e}")
+            return None
+        with self._lock:
+            self.clear()
+            if keys:
+                self._matrix = matrix
+                self._dim = int(matrix.shape[1])
+                self._size = len(keys)
+                self._key_at = list(keys)
+                self._row_of = {k: i for i, k in enumerate(keys)}
+                self._tag_of = dict(zip(keys, tags))
+        return header.get('meta') or {}
+
+
+class ProfileEmbeddingIndex(FlatVectorIndex):
+    """Every cached candidate-profile embedding, keyed by Bullhorn candidate id.
+
+    Tags are ``profile_hash``. ``refresh_from_db`` pulls only rows whose
+    ``updated_at`` is at or past the last watermark, so steady-state cost is
+    proportional to the rows written since the previous refresh — not to the
+    table size. There is deliberately no recency cap: a re-applicant from
+    months ago is as visible as one from this morning.
+    """
+
+    def __init__(self, snapshot_dir: str = PROFILE_INDEX_DIR,
+                 refresh_seconds: int = PROFILE_INDEX_REFRESH_SECONDS):
+        super().__init__(name='candidate_profile')
+        self.path_prefix = os.path.join(snapshot_dir, 'candidate_profile')
+        self.refresh_seconds = refresh_seconds
+        self._watermark: Optional[datetime] = None
+        self._bootstrapped = False
+        self._last_refresh = 0.0
+        self._last_snapshot = 0.0
+        self._refresh_lock = threading.Lock()
+
+    @property
+    def ready(self) -> bool:
+        """True once at least one refresh has completed against the DB."""
+        return self.available and self._bootstrapped
+
+    def _bootstrap_from_snapshot(self) -> None:
+        meta = self.load(self.path_prefix)
+        if meta and meta.get('watermark'):
+            try:
+                self._watermark = datetime.fromisoformat(meta['watermark'])
+                logger.info(
+                    f"🧮 Profile index: mapped snapshot with {len(self)} row(s), "
+                    f"watermark {self._watermark.isoformat()}"
+                )
+            except (TypeError, ValueError):
+                self.clear()
+
+    def refresh_from_db(self, force: bool = False) -> int:
+        """Load rows changed since the watermark. Returns rows (re)loaded.
+
+        Fail-soft: on any error the index keeps its current contents and
+        ``ready`` stays as it was.
+        """
+        if not self.available:
+            return 0
+        if not force and self._bootstrapped and time.monotonic() - self._last_refresh < self.refresh_seconds:
+            return 0
+        if not self._refresh_lock.acquire(blocking=False):
+            return 0
+        try:
+            from models import CandidateProfileEmbedding
+            from extensions import db
+
+            if not self._bootstrapped and self._watermark is None:
+                self._bootstrap_from_snapshot()
+
+            q = db.session.query(
+                CandidateProfileEmbedding.bullhorn_candidate_id,
+                CandidateProfileEmbedding.profile_hash,
+                CandidateProfileEmbedding.embedding_vector,
+                CandidateProfileEmbedding.updated_at,
+            )
+            if self._watermark is not None:
+                # >= not >: rows sharing the watermark timestamp may have
+                # landed after the last read. Tag checks make re-reads cheap.
+                q = q.filter(CandidateProfileEmbedding.updated_at >= self._watermark)
+            loaded = 0
+            watermark = self._watermark
+            for cid, profile_hash, vector_json, updated_at in q.yield_per(500):
+                if updated_at is not None and (watermark is None or updated_at > watermark):
+                    watermark = updated_at
+                if self.has_current(cid, profile_hash):
+                    continue
+                try:
+                    vector = json.loads(vector_json) if vector_json else None
+                except (TypeError, ValueError):
+                    vector = None
+                if vector and self.upsert(cid, vector, profile_hash):
+                    loaded += 1
+            self._watermark = watermark
+            self._bootstrapped = True
+            self._last_refresh = time.monotonic()
+            if loaded:
+                logger.info(f"🧮 Profile index: loaded {loaded} row(s), {len(self)} total")
+                if time.monotonic() - self._last_snapshot >= PROFILE_INDEX_SNAPSHOT_SECONDS:
+                    self.snapshot()
+            return loaded
+        except Exception as e:
+            logger.warning(f"Profile index refresh failed: {e}")
+            return 0
+        finally:
+            self._refresh_lock.release()
+
+    def snapshot(self) -> bool:
+        """Persist the index so the next process start maps it instead of rebuilding."""
+        meta = {'watermark': self._watermark.isoformat() if self._watermark else None}
+        ok = self.save(self.path_prefix, meta)
+        if ok:
+            self._last_snapshot = time.monotonic()
+        return ok
+
+
+_profile_index: Optional[ProfileEmbeddingIndex] = None
+_profile_index_lock = threading.Lock()
+
+
+def get_profile_embedding_index() -> ProfileEmbeddingIndex:
+    """Return the process-wide ProfileEmbeddingIndex singleton."""
+    global _profile_index
+    if _profile_index is None:
+        with _profile_index_lock:
+            if _profile_index is None:
+                _profile_index = ProfileEmbeddingIndex()
+    return _profile_index
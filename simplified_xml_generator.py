@@ -4,9 +4,14 @@ Directly pulls from tearsheets and generates clean XML with proper formatting
 """
 
 import os
+import copy
 import json
 import logging
-from typing import Dict, List, Optional
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional
 from datetime import datetime
 
 try:
@@ -17,6 +22,7 @@ except ImportError:
 
 from bullhorn_service import BullhornService
 from xml_integration_service import XMLIntegrationService
+from xml_integration_service.mapping import MAPPING_VERSION
 from xml_processor import XMLProcessor
 from feeds.feed_config import (
     V2_TEARSHEET_IDS,
@@ -25,6 +31,157 @@ from feeds.feed_config import (
 )
 
 
+# Parallel Bullhorn tearsheet pulls when building a cycle snapshot.
+TEARSHEET_FETCH_WORKERS = max(1, int(os.environ.get('XML_TEARSHEET_FETCH_WORKERS', '4') or 4))
+
+# Jobs mapped per batch while a feed is built; bounds how many mapped jobs
+# are held at once, independent of the tearsheet size.
+MAP_CHUNK_SIZE = max(1, int(os.environ.get('XML_MAP_CHUNK_SIZE', '100') or 100))
+
+# Byte budget for serialized <job> fragments kept between cycles (0 disables
+# the cache). v2 plus the channel feeds is a few hundred jobs per feed at
+# ~5-12 KB per fragment, so one cycle's working set fits well within 16 MB.
+FRAGMENT_CACHE_MAX_BYTES = max(0, int(float(os.environ.get('XML_FRAGMENT_CACHE_MAX_MB', '16') or 0) * 1024 * 1024))
+
+
+class _CountingWriter:
+    """Binary file wrapper that counts bytes as lxml's incremental writer emits them."""
+
+    def __init__(self, fh):
+        self._fh = fh
+        self.bytes_written = 0
+
+    def write(self, data):
+        self._fh.write(data)
+        self.bytes_written += len(data)
+
+
+class JobFragmentCache:
+    """
+    Process-wide LRU of serialized ``<job>`` elements, so each feed build only
+    re-maps the jobs that changed since the previous cycle.
+
+    The key covers every input of the mapping that can vary for the same job
+    payload (source channel, feed name, monitor, preserved reference number,
+    recruiter mappings) plus Bullhorn's ``dateLastModified`` and
+    ``MAPPING_VERSION``. Jobs without a ``dateLastModified`` are never cached,
+    and nothing is cached while the recruiter mappings can't be read.
+
+    The cache is bounded by the total size of its fragments. Keys change
+    whenever a job does, so ``end_cycle`` also drops every entry the cycle
+    did not read or write, instead of keeping superseded versions until the
+    byte budget pushes them out.
+    """
+
+    def __init__(self, max_bytes: int = FRAGMENT_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._entries: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._open_cycles = 0
+        self._touched: Optional[set] = None
+
+    @staticmethod
+    def key_for(job_data: Dict, existing_ref: str, monitor_name: str,
+                source_channel: str, feed_name: Optional[str],
+                mapping_fingerprint: Optional[str]) -> Optional[tuple]:
+        modified = job_data.get('dateLastModified')
+        if modified is None or modified == '' or not mapping_fingerprint:
+            return None
+        return (
+            str(job_data.get('id', '')), str(modified), source_channel or '',
+            feed_name or '', monitor_name or '', existing_ref or '', MAPPING_VERSION,
+            mapping_fingerprint,
+        )
+
+    def get(self, key: Optional[tuple]) -> Optional[tuple]:
+        """Return ``(fragment_bytes, reference_row)`` or None."""
+        if key is None or not self.max_bytes:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                if self._touched is not None:
+                    self._touched.add(key)
+            return entry
+
+    def put(self, key: Optional[tuple], fragment: bytes, row: tuple):
+        if key is None or not self.max_bytes or len(fragment) > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.total_bytes -= len(old[0])
+            self._entries[key] = (fragment, row)
+            self.total_bytes += len(fragment)
+            if self._touched is not None:
+                self._touched.add(key)
+            while self.total_bytes > self.max_bytes:
+                _, (evicted, _) = self._entries.popitem(last=False)
+                self.total_bytes -= len(evicted)
+
+    def begin_cycle(self):
+        """Start recording which entries are used (cycles may nest/overlap)."""
+        with self._lock:
+            if self._open_cycles == 0:
+                self._touched = set()
+            self._open_cycles += 1
+
+    def end_cycle(self) -> int:
+        """Drop entries not used since the outermost begin_cycle; returns the count."""
+        with self._lock:
+            self._open_cycles = max(0, self._open_cycles - 1)
+            if self._open_cycles or self._touched is None:
+                return 0
+            stale = [key for key in self._entries if key not in self._touched]
+            for key in stale:
+                self.total_bytes -= len(self._entries.pop(key)[0])
+            self._touched = None
+            return len(stale)
+
+    def element(self, fragment: bytes):
+        """Parse a cached fragment back into a fresh <job> element."""
+        # lxml parsers must not be shared between threads.
+        parser = getattr(self._local, 'parser', None)
+        if parser is None:
+            parser = self._local.parser = etree.XMLParser(strip_cdata=False)
+        return etree.fromstring(fragment, parser)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.total_bytes = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+
+_FRAGMENT_CACHE = JobFragmentCache()
+
+
+class TearsheetSnapshot:
+    """
+    One Bullhorn tearsheet pull + reference map shared by every feed built in
+    a single upload cycle (v2 and each channel feed).
+
+    Jobs are stored raw and handed out as deep copies, because feed building
+    annotates job dicts (tearsheet_context) per feed. Tearsheets whose fetch
+    failed are not stored, so a feed that needs one falls back to a live pull.
+    """
+
+    def __init__(self, jobs_by_tearsheet: Dict[int, List[Dict]], references: Dict):
+        self.jobs_by_tearsheet = jobs_by_tearsheet
+        self.references = references
+
+    def covers(self, tearsheet_ids: Iterable[int]) -> bool:
+        return all(tid in self.jobs_by_tearsheet for tid in tearsheet_ids)
+
+    def jobs_for(self, tearsheet_id: int) -> List[Dict]:
+        return copy.deepcopy(self.jobs_by_tearsheet.get(tearsheet_id, []))
+
+
 class SimplifiedXMLGenerator:
     """
     Simplified service for generating clean XML directly from Bullhorn tearsheets
@@ -46,6 +203,71 @@ class SimplifiedXMLGenerator:
         # Thread lock for preventing concurrent generation
         self._generation_lock = False
 
+        # Set for the duration of cycle_snapshot(); see TearsheetSnapshot.
+        self._snapshot: Optional[TearsheetSnapshot] = None
+
+        # Shared across generator instances so fragments survive between cycles.
+        self.fragment_cache: JobFragmentCache = _FRAGMENT_CACHE
+
+    @contextmanager
+    def cycle_snapshot(self, tearsheet_ids: List[int]):
+        """
+        Fetch the given tearsheets once (concurrently) and serve every
+        generate_fresh_xml() call inside the block from that snapshot.
+
+        Fail-soft: if the snapshot cannot be built, calls inside the block
+        fetch from Bullhorn as they would without it.
+        """
+        try:
+            self._snapshot = self._build_cycle_snapshot(tearsheet_ids)
+        except Exception as e:
+            self.logger.warning(f"Tearsheet snapshot unavailable, feeds will fetch individually: {str(e)}")
+            self._snapshot = None
+        self.fragment_cache.begin_cycle()
+        try:
+            yield self._snapshot
+        finally:
+            self._snapshot = None
+            dropped = self.fragment_cache.end_cycle()
+            if dropped:
+                self.logger.info(f"♻️ Fragment cache: dropped {dropped} entries unused this cycle")
+
+    def _build_cycle_snapshot(self, tearsheet_ids: List[int]) -> TearsheetSnapshot:
+        references = self._load_references_from_database()
+
+        bullhorn_service = self._get_bullhorn_service()
+        if not bullhorn_service.authenticate():
+            raise Exception("Failed to authenticate with Bullhorn")
+
+        # requests.Session is not thread-safe: each fetch thread works on its
+        # own clone of the authenticated service.
+        local = threading.local()
+
+        def _fetch(tearsheet_id):
+            try:
+                service = getattr(local, 'service', None)
+                if service is None:
+                    service = local.service = bullhorn_service.worker_clone()
+                return tearsheet_id, service.get_tearsheet_jobs(tearsheet_id), None
+            except Exception as e:
+                return tearsheet_id, None, e
+
+        jobs_by_tearsheet: Dict[int, List[Dict]] = {}
+        workers = min(TEARSHEET_FETCH_WORKERS, max(1, len(tearsheet_ids)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for tearsheet_id, jobs, error in executor.map(_fetch, tearsheet_ids):
+                if error is not None:
+                    self.logger.error(f"Snapshot fetch failed for tearsheet {tearsheet_id}: {str(error)}")
+                    continue
+                jobs_by_tearsheet[tearsheet_id] = jobs or []
+
+        total = sum(len(jobs) for jobs in jobs_by_tearsheet.values())
+        self.logger.info(
+            f"📸 Tearsheet snapshot: {total} jobs from {len(jobs_by_tearsheet)}/{len(tearsheet_ids)} "
+            f"tearsheets ({workers} parallel fetches)"
+        )
+        return TearsheetSnapshot(jobs_by_tearsheet, references)
+
     def generate_fresh_xml(
         self,
         tearsheet_caps=None,
@@ -54,6 +276,7 @@ class SimplifiedXMLGenerator:
         allow_empty: bool = False,
         publisher_title: Optional[str] = None,
         publisher_link: Optional[str] = None,
+        output_path: Optional[str] = None,
     ) -> tuple[str, dict]:
         """
         Generate fresh XML by pulling directly from Bullhorn tearsheets.
@@ -67,9 +290,12 @@ class SimplifiedXMLGenerator:
             allow_empty: When True, return a valid empty <source> feed if no jobs found.
             publisher_title: Optional <source><title> override (STSI channel feeds).
             publisher_link: Optional <source><link> override (STSI channel feeds).
+            output_path: When set, stream the feed straight to this file instead
+                         of building it in memory, and return the path.
 
         Returns:
-            tuple: (xml_content_string, stats_dict)
+            tuple: (xml_content_string, stats_dict), or (output_path, stats_dict)
+                   in streaming mode
         """
         if self._generation_lock:
             raise Exception("XML generation already in progress")
@@ -87,16 +313,29 @@ class SimplifiedXMLGenerator:
                 f"{cap_label} (source={source_channel}, sheets={active_tearsheet_ids})"
             )
             
-            existing_references = self._load_references_from_database()
-            
-            bullhorn_service = self._get_bullhorn_service()
-            
-            if not bullhorn_service.authenticate():
-                raise Exception("Failed to authenticate with Bullhorn")
+            snapshot = self._snapshot
+            if snapshot is not None and snapshot.covers(active_tearsheet_ids):
+                self.logger.info("Using cycle tearsheet snapshot (no Bullhorn re-fetch)")
+                existing_references = dict(snapshot.references)
+                bullhorn_service = None
+            else:
+                # The cycle's reference map stays valid even when this feed's
+                # tearsheets were not part of the snapshot.
+                existing_references = (
+                    dict(snapshot.references) if snapshot is not None
+                    else self._load_references_from_database()
+                )
+                snapshot = None
+                
+                bullhorn_service = self._get_bullhorn_service()
+                
+                if not bullhorn_service.authenticate():
+                    raise Exception("Failed to authenticate with Bullhorn")
             
             all_jobs_with_context = self._get_jobs_from_tearsheets(
                 bullhorn_service, active_tearsheet_ids,
                 tearsheet_caps=tearsheet_caps,
+                snapshot=snapshot,
             )
             
             if not all_jobs_with_context:
@@ -104,28 +343,57 @@ class SimplifiedXMLGenerator:
                     raise Exception("No jobs found in any tearsheets")
                 self.logger.info("No jobs found — generating empty feed (allow_empty=True)")
             
-            xml_content, updated_references = self._build_clean_xml(
-                all_jobs_with_context,
-                existing_references,
-                source_channel=source_channel,
-                publisher_title=publisher_title,
-                publisher_link=publisher_link,
-            )
+            if output_path:
+                updated_references, xml_size_bytes, reference_rows = self._stream_clean_xml(
+                    output_path,
+                    all_jobs_with_context,
+                    existing_references,
+                    source_channel=source_channel,
+                    publisher_title=publisher_title,
+                    publisher_link=publisher_link,
+                )
+                xml_content = None
+            else:
+                reference_rows = []
+                xml_content, updated_references = self._build_clean_xml(
+                    all_jobs_with_context,
+                    existing_references,
+                    source_channel=source_channel,
+                    publisher_title=publisher_title,
+                    publisher_link=publisher_link,
+                    reference_rows=reference_rows,
+                )
+                xml_size_bytes = len(xml_content.encode('utf-8'))
             
             if all_jobs_with_context:
-                self._save_references_to_database(xml_content)
+                # existing_references mirrors the DB (fresh load, or the cycle
+                # map kept in step below), so only new/changed rows are written.
+                changed_rows = [
+                    row for row in reference_rows
+                    if row[0] and row[1] and existing_references.get(row[0]) != row[1]
+                ]
+                if changed_rows:
+                    self._save_reference_rows_to_database(changed_rows)
+                else:
+                    self.logger.info("💾 Reference numbers unchanged - no DATABASE write needed")
+                if self._snapshot is not None:
+                    # Keep the shared map in step with what was just saved so
+                    # later feeds in the cycle reuse the same reference numbers.
+                    self._snapshot.references.update(updated_references)
             
             stats = {
                 'job_count': len(all_jobs_with_context),
                 'tearsheets_processed': len(active_tearsheet_ids),
-                'xml_size_bytes': len(xml_content.encode('utf-8')),
+                'xml_size_bytes': xml_size_bytes,
                 'generated_at': datetime.now().isoformat(),
                 'source_channel': source_channel,
             }
+            if output_path:
+                stats['output_path'] = output_path
             
             self.logger.info(f"✅ Generated fresh XML: {stats['job_count']} jobs, {stats['xml_size_bytes']} bytes")
             
-            return xml_content, stats
+            return (output_path if output_path else xml_content), stats
             
         finally:
             self._generation_lock = False
@@ -191,10 +459,12 @@ class SimplifiedXMLGenerator:
             self.logger.error(f"Failed to query TearsheetJobHistory for cap on {tearsheet_id}: {e} — will fall back to job ID ordering")
             return None
 
-    def _get_jobs_from_tearsheets(self, bullhorn_service: BullhornService, tearsheet_ids: List[int],
-                                  tearsheet_caps: Optional[Dict[int, int]] = None) -> List[Dict]:
+    def _get_jobs_from_tearsheets(self, bullhorn_service: Optional[BullhornService], tearsheet_ids: List[int],
+                                  tearsheet_caps: Optional[Dict[int, int]] = None,
+                                  snapshot: Optional[TearsheetSnapshot] = None) -> List[Dict]:
         """
         Pull jobs from all tearsheets using the same proven method as main monitoring system.
+        When a cycle snapshot is given, jobs come from it instead of Bullhorn.
 
         Returns:
             List of job dictionaries with tearsheet_context added (ineligible jobs filtered out)
@@ -212,7 +482,10 @@ class SimplifiedXMLGenerator:
             try:
                 self.logger.info(f"Processing tearsheet {tearsheet_id}")
 
-                jobs = bullhorn_service.get_tearsheet_jobs(tearsheet_id)
+                if snapshot is not None:
+                    jobs = snapshot.jobs_for(tearsheet_id)
+                else:
+                    jobs = bullhorn_service.get_tearsheet_jobs(tearsheet_id)
 
                 if not jobs:
                     self.logger.warning(f"No jobs found in tearsheet {tearsheet_id}")
@@ -286,21 +559,13 @@ class SimplifiedXMLGenerator:
             self.logger.info(f"Total unique jobs found: {len(all_jobs)}")
         return all_jobs
     
-    def _build_clean_xml(
+    def _publisher_header(
         self,
-        jobs: List[Dict],
-        existing_references: Dict,
-        source_channel: str = SOURCE_LINKEDIN,
-        feed_name: Optional[str] = None,
-        publisher_title: Optional[str] = None,
-        publisher_link: Optional[str] = None,
-    ) -> tuple[str, Dict]:
-        """
-        Build clean XML from job data with proper CDATA wrapping
-        """
-        if not etree:
-            raise Exception("lxml not available, cannot generate XML")
-
+        source_channel: str,
+        publisher_title: Optional[str],
+        publisher_link: Optional[str],
+    ) -> tuple[str, str]:
+        """Resolve the <source><title>/<link> pair for a feed."""
         from feeds.feed_config import (
             V2_PUBLISHER_TITLE,
             V2_PUBLISHER_LINK,
@@ -317,25 +582,30 @@ class SimplifiedXMLGenerator:
         if publisher_link is None and source_channel in (SOURCE_INDEED, SOURCE_ZIPRECRUITER):
             publisher_link = STSI_PUBLISHER_LINK
 
-        root = etree.Element("source")
+        title = (publisher_title or V2_PUBLISHER_TITLE).strip() or V2_PUBLISHER_TITLE
+        link = (publisher_link or V2_PUBLISHER_LINK).strip() or V2_PUBLISHER_LINK
+        return title, link
 
-        title_elem = etree.SubElement(root, "title")
-        title_elem.text = (publisher_title or V2_PUBLISHER_TITLE).strip() or V2_PUBLISHER_TITLE
+    @staticmethod
+    def _job_element(xml_job: Dict):
+        job_elem = etree.Element("job")
+        for field_name, field_value in xml_job.items():
+            field_elem = etree.SubElement(job_elem, field_name)
+            field_elem.text = etree.CDATA(f" {field_value} ")
+        return job_elem
 
-        link_elem = etree.SubElement(root, "link")
-        link_elem.text = (publisher_link or V2_PUBLISHER_LINK).strip() or V2_PUBLISHER_LINK
-        
-        updated_references = existing_references.copy()
-        
-        if not jobs:
-            xml_string = etree.tostring(
-                root,
-                encoding='UTF-8',
-                xml_declaration=True,
-                pretty_print=True
-            ).decode('utf-8')
-            return xml_string, updated_references
-        
+    def _iter_xml_jobs(
+        self,
+        jobs: List[Dict],
+        existing_references: Dict,
+        updated_references: Dict,
+        source_channel: str = SOURCE_LINKEDIN,
+        feed_name: Optional[str] = None,
+    ) -> Iterator[Dict]:
+        """
+        Map Bullhorn jobs to XML field dicts one at a time, recording each
+        reference number in ``updated_references`` as it goes.
+        """
         existing_ref_map = {}
         monitor_name_map = {}
         
@@ -356,7 +626,11 @@ class SimplifiedXMLGenerator:
                 feed_name=feed_name,
                 source_channel=source_channel,
             )
-            
+        except Exception as batch_error:
+            self.logger.error(f"Batch processing failed: {str(batch_error)}")
+            xml_jobs = None
+        
+        if xml_jobs is not None:
             for xml_job in xml_jobs:
                 job_id = xml_job.get('bhatsid', '')
                 
@@ -364,52 +638,159 @@ class SimplifiedXMLGenerator:
                 if ref_number and job_id:
                     updated_references[job_id] = ref_number
                 
-                job_elem = etree.SubElement(root, "job")
-                
-                for field_name, field_value in xml_job.items():
-                    field_elem = etree.SubElement(job_elem, field_name)
-                    field_elem.text = etree.CDATA(f" {field_value} ")
+                yield xml_job
             
             self.logger.info(f"✅ Successfully processed {len(xml_jobs)} jobs with keyword classification")
+            return
+        
+        self.logger.warning("⚠️ Falling back to individual processing")
+        
+        for job_data in jobs:
+            try:
+                job_id = str(job_data.get('id', ''))
+                existing_ref = existing_ref_map.get(job_id, '')
+                monitor_name = monitor_name_map.get(job_id, 'default')
+                
+                xml_job = self.xml_integration.map_bullhorn_job_to_xml(
+                    job_data, 
+                    existing_reference_number=existing_ref,
+                    skip_ai_classification=True,
+                    monitor_name=monitor_name,
+                    feed_name=feed_name,
+                    source_channel=source_channel,
+                )
+                
+                if not xml_job:
+                    self.logger.warning(f"Failed to map job {job_id}, skipping")
+                    continue
+                
+                ref_number = xml_job.get('referencenumber')
+                if ref_number:
+                    updated_references[job_id] = ref_number
+                
+            except Exception as e:
+                tearsheet_context = job_data.get('tearsheet_context', {})
+                monitor_name = tearsheet_context.get('monitor_name', 'unknown')
+                self.logger.error(f"Error processing job {job_data.get('id', 'unknown')} from {monitor_name}: {str(e)}")
+                continue
             
-        except Exception as batch_error:
-            self.logger.error(f"Batch processing failed: {str(batch_error)}")
-            self.logger.warning("⚠️ Falling back to individual processing")
-            
-            for job_data in jobs:
-                try:
-                    job_id = str(job_data.get('id', ''))
-                    existing_ref = existing_ref_map.get(job_id, '')
-                    monitor_name = monitor_name_map.get(job_id, 'default')
-                    
-                    xml_job = self.xml_integration.map_bullhorn_job_to_xml(
-                        job_data, 
-                        existing_reference_number=existing_ref,
-                        skip_ai_classification=True,
-                        monitor_name=monitor_name,
-                        feed_name=feed_name,
-                        source_channel=source_channel,
-                    )
-                    
-                    if not xml_job:
-                        self.logger.warning(f"Failed to map job {job_id}, skipping")
-                        continue
-                    
-                    ref_number = xml_job.get('referencenumber')
-                    if ref_number:
-                        updated_references[job_id] = ref_number
-                    
-                    job_elem = etree.SubElement(root, "job")
-                    
-                    for field_name, field_value in xml_job.items():
-                        field_elem = etree.SubElement(job_elem, field_name)
-                        field_elem.text = etree.CDATA(f" {field_value} ")
-                    
-                except Exception as e:
-                    tearsheet_context = job_data.get('tearsheet_context', {})
-                    monitor_name = tearsheet_context.get('monitor_name', 'unknown')
-                    self.logger.error(f"Error processing job {job_data.get('id', 'unknown')} from {monitor_name}: {str(e)}")
+            yield xml_job
+
+    def _iter_job_elements(
+        self,
+        jobs: List[Dict],
+        existing_references: Dict,
+        updated_references: Dict,
+        source_channel: str = SOURCE_LINKEDIN,
+        feed_name: Optional[str] = None,
+    ) -> Iterator[tuple]:
+        """
+        Yield ``(<job> element, (bhatsid, referencenumber, title))`` in feed
+        order. Jobs unchanged since they were last mapped come straight from
+        the fragment cache; the rest go through _iter_xml_jobs in chunks of
+        ``MAP_CHUNK_SIZE``, each chunk yielded before the next is mapped.
+
+        Elements are indented for level 1 (a child of <source>), which is
+        what both the pretty-printed and the streamed output expect.
+        """
+        cache = self.fragment_cache
+        mapping_fingerprint = (
+            self.xml_integration.recruiter_mapping_fingerprint() if cache.max_bytes else None
+        )
+        reused = 0
+        for chunk_start in range(0, len(jobs), MAP_CHUNK_SIZE):
+            chunk = jobs[chunk_start:chunk_start + MAP_CHUNK_SIZE]
+            keys = {}
+            hits = {}
+            misses = []
+            for job_data in chunk:
+                job_id = str(job_data.get('id', ''))
+                monitor_name = job_data.get('tearsheet_context', {}).get('monitor_name', 'default')
+                key = cache.key_for(
+                    job_data, existing_references.get(job_id, ''), monitor_name, source_channel, feed_name,
+                    mapping_fingerprint,
+                )
+                keys[job_id] = key
+                entry = cache.get(key)
+                if entry is not None:
+                    hits[job_id] = entry
+                else:
+                    misses.append(job_data)
+            reused += len(hits)
+
+            mapped = {}
+            if misses:
+                lookup_errors = self.xml_integration.recruiter_lookup_errors
+                for xml_job in self._iter_xml_jobs(
+                    misses, existing_references, updated_references,
+                    source_channel=source_channel, feed_name=feed_name,
+                ):
+                    mapped[str(xml_job.get('bhatsid', '')).strip()] = xml_job
+                if self.xml_integration.recruiter_lookup_errors != lookup_errors:
+                    # Some recruiter tags fell back to raw names; don't keep them.
+                    self.logger.warning("⚠️ Recruiter mapping lookup failed; not caching newly mapped jobs")
+                    keys = {}
+
+            for job_data in chunk:
+                job_id = str(job_data.get('id', ''))
+                if job_id in hits:
+                    fragment, row = hits[job_id]
+                    if row[1]:
+                        updated_references[job_id] = row[1]
+                    yield cache.element(fragment), row
+                    continue
+
+                xml_job = mapped.pop(job_id, None)
+                if xml_job is None:
                     continue
+                job_elem = self._job_element(xml_job)
+                etree.indent(job_elem, space='  ', level=1)
+                row = (
+                    str(xml_job.get('bhatsid', '')).strip(),
+                    str(xml_job.get('referencenumber', '') or '').strip(),
+                    str(xml_job.get('title', '') or '').strip(),
+                )
+                cache.put(keys.get(job_id), etree.tostring(job_elem, encoding='UTF-8'), row)
+                yield job_elem, row
+
+        if reused:
+            self.logger.info(f"♻️ Fragment cache: reused {reused} unchanged jobs, mapped {len(jobs) - reused}")
+
+    def _build_clean_xml(
+        self,
+        jobs: List[Dict],
+        existing_references: Dict,
+        source_channel: str = SOURCE_LINKEDIN,
+        feed_name: Optional[str] = None,
+        publisher_title: Optional[str] = None,
+        publisher_link: Optional[str] = None,
+        reference_rows: Optional[List[tuple]] = None,
+    ) -> tuple[str, Dict]:
+        """
+        Build clean XML from job data with proper CDATA wrapping
+
+        When ``reference_rows`` is given, a (bhatsid, referencenumber, title)
+        row is appended to it for every job written.
+        """
+        if not etree:
+            raise Exception("lxml not available, cannot generate XML")
+
+        title, link = self._publisher_header(source_channel, publisher_title, publisher_link)
+
+        root = etree.Element("source")
+        etree.SubElement(root, "title").text = title
+        etree.SubElement(root, "link").text = link
+        
+        updated_references = existing_references.copy()
+        
+        if jobs:
+            for job_elem, row in self._iter_job_elements(
+                jobs, existing_references, updated_references,
+                source_channel=source_channel, feed_name=feed_name,
+            ):
+                root.append(job_elem)
+                if reference_rows is not None:
+                    reference_rows.append(row)
         
         xml_string = etree.tostring(
             root, 
@@ -419,6 +800,67 @@ class SimplifiedXMLGenerator:
         ).decode('utf-8')
         
         return xml_string, updated_references
+
+    def _stream_clean_xml(
+        self,
+        output_path: str,
+        jobs: List[Dict],
+        existing_references: Dict,
+        source_channel: str = SOURCE_LINKEDIN,
+        feed_name: Optional[str] = None,
+        publisher_title: Optional[str] = None,
+        publisher_link: Optional[str] = None,
+    ) -> tuple[Dict, int, List[tuple]]:
+        """
+        Streaming counterpart of _build_clean_xml: jobs are mapped in chunks
+        of ``MAP_CHUNK_SIZE`` and each chunk's <job> elements are serialized to
+        ``output_path`` before the next chunk is mapped, so neither the full
+        tree nor the full document string is ever held in memory. The bytes
+        are identical to the pretty-printed output of _build_clean_xml.
+
+        The file is written to a sibling temp path and renamed into place.
+
+        Returns:
+            tuple: (updated_references, bytes_written,
+                    [(bhatsid, referencenumber, title), ...] for DB persistence)
+        """
+        if not etree:
+            raise Exception("lxml not available, cannot generate XML")
+
+        title, link = self._publisher_header(source_channel, publisher_title, publisher_link)
+        updated_references = existing_references.copy()
+        reference_rows = []
+        tmp_path = f"{output_path}.tmp"
+
+        try:
+            with open(tmp_path, 'wb') as fh:
+                out = _CountingWriter(fh)
+                # Same declaration etree.tostring(xml_declaration=True) emits;
+                # xmlfile rejects text outside the root, so it is written raw.
+                out.write(b"<?xml version='1.0' encoding='UTF-8'?>\n")
+                with etree.xmlfile(out, encoding='UTF-8') as xf:
+                    with xf.element('source'):
+                        for tag, text in (('title', title), ('link', link)):
+                            header = etree.Element(tag)
+                            header.text = text
+                            xf.write('\n  ', header)
+                        if jobs:
+                            for job_elem, row in self._iter_job_elements(
+                                jobs, existing_references, updated_references,
+                                source_channel=source_channel, feed_name=feed_name,
+                            ):
+                                xf.write('\n  ', job_elem)
+                                reference_rows.append(row)
+                        xf.write('\n')
+                # Likewise for the newline after </source>.
+                out.write(b'\n')
+            os.replace(tmp_path, output_path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        return updated_references, out.bytes_written, reference_rows
     
     def _load_references_from_database(self) -> Dict:
         """Load existing reference number mappings from DATABASE (database-first approach)"""
@@ -453,14 +895,13 @@ class SimplifiedXMLGenerator:
         
         return {}
     
-    def _save_references_to_database(self, xml_content: str):
-        """Save reference numbers to DATABASE (database-first approach)"""
+    def _save_reference_rows_to_database(self, reference_rows: List[tuple]):
+        """Persist (bhatsid, referencenumber, title) rows captured while the
+        feed was built, via one bulk upsert instead of re-parsing the XML."""
         try:
-            from lightweight_reference_refresh import save_references_to_database
-            
-            success = save_references_to_database(xml_content)
+            from lightweight_reference_refresh import save_reference_rows_to_database
             
-            if success:
+            if save_reference_rows_to_database(reference_rows):
                 self.logger.info("💾 DATABASE-FIRST: Reference numbers saved to DATABASE successfully")
             else:
                 self.logger.critical("❌ CRITICAL: Failed to save reference numbers to DATABASE")
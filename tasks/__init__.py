@@ -5,6 +5,7 @@ from .monitoring import (
     run_vetting_health_check,
     send_vetting_health_alert,
     run_ai_cost_alert,
+    run_ai_cost_rollup,
     run_ops_early_warning,
 )
 from .cleanup import (
@@ -21,6 +22,7 @@ from .vetting import (
     run_candidate_vetting_cycle,
     run_requirements_maintenance,
     run_retry_failed_screening_notes,
+    run_resume_hash_backfill,
 )
 from .bullhorn_maintenance import (
     start_scheduler_manual,
@@ -34,6 +36,7 @@ from .owner_reassignment import reassign_api_user_candidates, run_owner_reassign
 from .mailbox_pull import (
     run_mailbox_pull_cycle,
     run_mailbox_backfill,
+    run_inbound_queue_drain,
     run_resume_recovery,
     run_resume_recovery_sweep,
 )
@@ -48,9 +51,11 @@ __all__ = [
     "run_vetting_health_check",
     "send_vetting_health_alert",
     "run_ai_cost_alert",
+    "run_ai_cost_rollup",
     "run_ops_early_warning",
     "run_candidate_vetting_cycle",
     "run_retry_failed_screening_notes",
+    "run_resume_hash_backfill",
     "reference_number_refresh",
     "automated_upload",
     "run_xml_change_monitor",
@@ -65,6 +70,7 @@ __all__ = [
     "run_owner_reassignment_daily",
     "run_mailbox_pull_cycle",
     "run_mailbox_backfill",
+    "run_inbound_queue_drain",
     "run_resume_recovery",
     "run_resume_recovery_sweep",
 ]
@@ -335,6 +335,9 @@ def run_data_retention_cleanup():
     - Legacy log monitoring runs/issues: 30 days (table retained; feature removed)
     - Vetting health checks: 7 days
     - Environment alerts: 30 days
+    - Embedding cache rows: 60 days (re-embedded on next use)
+    - Finished inbound email queue jobs: 14 days (dead-lettered jobs are kept)
+    - Scheduler job run metrics: 30 days
     """
     from app import app
     from extensions import db
@@ -383,6 +386,34 @@ def run_data_retention_cleanup():
                 total_deleted += expired_tokens
                 app.logger.info(f"Data cleanup: Deleted {expired_tokens} expired/used password reset tokens")
 
+            from models import EmbeddingCacheEntry
+            cache_retention_date = datetime.utcnow() - timedelta(days=60)
+            old_cache_rows = EmbeddingCacheEntry.query.filter(
+                EmbeddingCacheEntry.created_at < cache_retention_date
+            ).delete(synchronize_session=False)
+            if old_cache_rows:
+                total_deleted += old_cache_rows
+                app.logger.info(f"Data cleanup: Deleted {old_cache_rows} embedding cache rows older than 60 days")
+
+            from models import InboundEmailJob
+            queue_retention_date = datetime.utcnow() - timedelta(days=14)
+            old_queue_jobs = InboundEmailJob.query.filter(
+                InboundEmailJob.status == 'done',
+                InboundEmailJob.completed_at < queue_retention_date
+            ).delete(synchronize_session=False)
+            if old_queue_jobs:
+                total_deleted += old_queue_jobs
+                app.logger.info(f"Data cleanup: Deleted {old_queue_jobs} finished inbound email jobs older than 14 days")
+
+            from models import SchedulerJobRun
+            run_retention_date = datetime.utcnow() - timedelta(days=30)
+            old_job_runs = SchedulerJobRun.query.filter(
+                SchedulerJobRun.started_at < run_retention_date
+            ).delete(synchronize_session=False)
+            if old_job_runs:
+                total_deleted += old_job_runs
+                app.logger.info(f"Data cleanup: Deleted {old_job_runs} scheduler job run records older than 30 days")
+
             if total_deleted > 0:
                 db.session.commit()
                 app.logger.info(f"Data retention cleanup complete: {total_deleted} total records cleaned")
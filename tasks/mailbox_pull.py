@@ -19,6 +19,12 @@ production WITHOUT a republish):
     mailbox_pull_last_run       ISO8601 UTC     telemetry: last cycle time
     mailbox_pull_last_count     int             telemetry: processed last cycle
     mailbox_pull_last_error     str             telemetry: last error (or '')
+
+Messages are not processed on the scheduler thread: each one is enqueued on the
+durable inbound email queue (inbound_email_queue) and drained by its bounded
+worker pool, and the cycle/backfill wait on the job outcomes to keep their
+cursor and summary semantics. Attachments for each fetched batch are
+prefetched with Graph ``$batch`` and travel in the job payload.
 """
 
 import logging
@@ -28,6 +34,11 @@ logger = logging.getLogger(__name__)
 
 _DEFAULT_BATCH = 25
 _DEFAULT_BACKFILL_HOURS = 24
+# How long a cycle / backfill waits on its queued messages. Anything still in
+# flight at the deadline keeps running on the queue; the cycle just treats it
+# as not-yet-processed (cursor holds, next cycle re-attaches to the same job).
+_CYCLE_WAIT_SECONDS = 240
+_BACKFILL_WAIT_SECONDS = 3600
 
 
 def _utcnow_iso() -> str:
@@ -38,20 +49,103 @@ def _iso(dt: datetime) -> str:
     return dt.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
-def _process_one(service, msg) -> dict:
+def _process_one(service, msg, attachments=None) -> dict:
     """Adapt a single Graph message and run it through the existing pipeline.
 
-    Returns the process_email result dict (or a synthesized one on error).
+    ``attachments`` are the prefetched attachments for the message; when None
+    they are fetched here. Returns the process_email result dict (or a
+    synthesized one on error).
     """
     from email_inbound_service import EmailInboundService
 
-    attachments = []
-    if msg.get("hasAttachments"):
-        attachments = service.get_attachments(msg["id"])
+    if attachments is None:
+        attachments = []
+        if msg.get("hasAttachments"):
+            attachments = service.get_attachments(msg["id"])
     payload = service.to_payload(msg, attachments)
     return EmailInboundService().process_email(payload)
 
 
+def process_queued_mailbox_message(app, kind, payload):
+    """Inbound-queue handler: run one queued Graph message through the pipeline."""
+    from graph_mail_service import GraphMailService
+    return _process_one(
+        GraphMailService(), payload['message'], payload.get('attachments')
+    )
+
+
+def _message_dedupe_key(msg) -> str:
+    # Same identity to_payload() writes as Message-ID, so a webhook copy of the
+    # message that is still queued is joined rather than enqueued twice.
+    return msg.get("internetMessageId") or (
+        f"graph-id-{msg['id']}" if msg.get("id") else ""
+    )
+
+
+def _prefetch_attachments(app, service, messages) -> dict:
+    """Graph id -> attachments for every message that carries some.
+
+    Fetched up front with Graph ``$batch`` so queue workers go straight to the
+    pipeline instead of each making its own listing call. Messages whose
+    Message-ID is already in ParsedEmail are about to dedupe without reading
+    their attachments, so nothing is downloaded for them. On failure the
+    message is simply left out and its worker fetches attachments itself.
+    """
+    from models import ParsedEmail
+
+    wanted = {m["id"]: _message_dedupe_key(m) for m in messages
+              if m.get("hasAttachments") and m.get("id")}
+    if not wanted:
+        return {}
+    known = {
+        row[0] for row in ParsedEmail.query.with_entities(ParsedEmail.message_id)
+        .filter(ParsedEmail.message_id.in_([k for k in wanted.values() if k])).all()
+    }
+    out = {gid: [] for gid, key in wanted.items() if key in known}
+    to_fetch = [gid for gid in wanted if gid not in out]
+    if to_fetch:
+        try:
+            out.update(service.get_attachments_batch(to_fetch))
+        except Exception as e:  # noqa: BLE001
+            app.logger.warning(
+                f"📥 Mailbox-pull: attachment prefetch failed for "
+                f"{len(to_fetch)} messages; workers will fetch them: {e}"
+            )
+    return out
+
+
+def _enqueue_messages(app, service, messages, priority) -> list:
+    """Enqueue each message with its prefetched attachments; a message that
+    cannot be persisted maps to None."""
+    import inbound_email_queue
+
+    prefetched = _prefetch_attachments(app, service, messages)
+    job_ids = []
+    for msg in messages:
+        payload = {"message": msg}
+        if msg.get("id") in prefetched:
+            payload["attachments"] = prefetched[msg["id"]]
+        try:
+            job_ids.append(inbound_email_queue.enqueue(
+                inbound_email_queue.KIND_MAILBOX, payload,
+                priority=priority, dedupe_key=_message_dedupe_key(msg), app=app,
+            ))
+        except Exception as e:  # noqa: BLE001
+            app.logger.error(
+                f"📥 Mailbox-pull: could not enqueue message "
+                f"{msg.get('id', '')[:40]}: {e}"
+            )
+            job_ids.append(None)
+    return job_ids
+
+
+def _await_outcomes(app, job_ids, timeout) -> dict:
+    import inbound_email_queue
+
+    live = [j for j in job_ids if j is not None]
+    return inbound_email_queue.wait_for(app, live, timeout=timeout) if live else {}
+
+
 def run_mailbox_pull_cycle(app):
     """Scheduler entrypoint: poll the applicant mailbox once and process any new
     messages. Gated by the `mailbox_pull_enabled` DB flag; fully fail-soft."""
@@ -123,11 +217,16 @@ def run_mailbox_pull_cycle(app):
             high_water_advance = high_water
             contiguous_ok = True
 
-            for msg in messages:
+            from inbound_email_queue import PRIORITY_POLL
+            job_ids = _enqueue_messages(app, service, messages, PRIORITY_POLL)
+            outcomes = _await_outcomes(app, job_ids, _CYCLE_WAIT_SECONDS)
+
+            for msg, job_id in zip(messages, job_ids):
                 received = msg.get("receivedDateTime") or ""
                 ok = False
-                try:
-                    result = _process_one(service, msg)
+                outcome = outcomes.get(job_id) or {'status': 'not_queued'}
+                result = outcome.get('result') or {}
+                if outcome['status'] == 'done':
                     if result.get('duplicate') or result.get('is_duplicate'):
                         duplicates += 1
                     if result.get('success') or result.get('ignored'):
@@ -135,16 +234,13 @@ def run_mailbox_pull_cycle(app):
                         ok = True
                     else:
                         failures += 1
-                except Exception as e:  # noqa: BLE001
+                else:
                     failures += 1
                     app.logger.error(
-                        f"📥 Mailbox-pull: error processing message "
-                        f"{msg.get('id', '')[:40]}: {e}"
+                        f"📥 Mailbox-pull: message {msg.get('id', '')[:40]} "
+                        f"not processed (job {job_id} {outcome['status']}): "
+                        f"{(outcome.get('error') or '')[:200]}"
                     )
-                    try:
-                        db.session.rollback()
-                    except Exception:  # noqa: BLE001
-                        pass
 
                 if not ok:
                     contiguous_ok = False
@@ -207,16 +303,22 @@ def run_mailbox_backfill(app, since_iso, limit=500):
     this safe to re-run and prevents double-submission to Bullhorn. Does NOT touch
     the live poller high-water mark.
 
+    Messages are enqueued at backfill priority and drained in parallel by the
+    inbound queue's worker pool, behind any live mail. Jobs still in flight at
+    the wait deadline keep draining and are counted in ``pending`` (and as
+    failed, so callers that reconcile on failure stay conservative).
+
     Returns a summary dict.
     """
     summary = {
         'fetched': 0, 'processed': 0, 'duplicates': 0,
-        'failed': 0, 'since': since_iso, 'limit': limit,
+        'failed': 0, 'pending': 0, 'since': since_iso, 'limit': limit,
     }
     with app.app_context():
         from app import db
         try:
             from graph_mail_service import GraphMailService
+            from inbound_email_queue import PRIORITY_BACKFILL
             service = GraphMailService()
 
             remaining = max(1, int(limit))
@@ -229,6 +331,7 @@ def run_mailbox_backfill(app, since_iso, limit=500):
             # any double-submission to Bullhorn.
             next_link = None
             first = True
+            job_ids = []
 
             while remaining > 0:
                 page_size = min(remaining, 50)
@@ -241,34 +344,41 @@ def run_mailbox_backfill(app, since_iso, limit=500):
                 if not page:
                     break
 
+                fresh = []
                 for msg in page:
                     mid = msg.get("id")
                     if mid and mid in seen_ids:
                         continue
                     if mid:
                         seen_ids.add(mid)
-                    summary['fetched'] += 1
-                    try:
-                        result = _process_one(service, msg)
-                        if result.get('duplicate') or result.get('is_duplicate'):
-                            summary['duplicates'] += 1
-                        if result.get('success') or result.get('ignored'):
-                            summary['processed'] += 1
-                        else:
-                            summary['failed'] += 1
-                    except Exception as e:  # noqa: BLE001
-                        summary['failed'] += 1
-                        app.logger.error(
-                            f"📥 Backfill: error on message "
-                            f"{msg.get('id', '')[:40]}: {e}"
-                        )
+                    fresh.append(msg)
                     remaining -= 1
                     if remaining <= 0:
                         break
+                summary['fetched'] += len(fresh)
+                # Enqueue page by page so the drain pool starts working while
+                # later pages are still being listed.
+                job_ids.extend(_enqueue_messages(app, service, fresh, PRIORITY_BACKFILL))
 
                 if not next_link:
                     break
 
+            outcomes = _await_outcomes(app, job_ids, _BACKFILL_WAIT_SECONDS)
+            for job_id in job_ids:
+                outcome = outcomes.get(job_id) or {'status': 'not_queued'}
+                result = outcome.get('result') or {}
+                if outcome['status'] == 'pending':
+                    summary['pending'] += 1
+                if outcome['status'] != 'done':
+                    summary['failed'] += 1
+                    continue
+                if result.get('duplicate') or result.get('is_duplicate'):
+                    summary['duplicates'] += 1
+                if result.get('success') or result.get('ignored'):
+                    summary['processed'] += 1
+                else:
+                    summary['failed'] += 1
+
             app.logger.info(f"📥 Mailbox backfill complete: {summary}")
             return summary
         except Exception as e:  # noqa: BLE001
@@ -279,6 +389,19 @@ def run_mailbox_backfill(app, since_iso, limit=500):
             db.session.remove()
 
 
+def run_inbound_queue_drain(app):
+    """Scheduler entrypoint: wake the inbound queue's drain threads.
+
+    Drain threads exit once nothing is claimable, so jobs waiting on a retry
+    backoff or on an expired lease need a periodic nudge. Fail-soft.
+    """
+    try:
+        from inbound_email_queue import kick
+        kick(app)
+    except Exception as e:  # noqa: BLE001
+        app.logger.error(f"📬 Inbound queue drain kick error: {e}")
+
+
 def _reset_candidate_for_revet(db, candidate_id):
     """Clear a candidate's existing screening records so the next vetting cycle
     re-scores them with the now-attached résumé. Mirrors the manual
@@ -328,7 +328,8 @@ def run_vetting_health_check():
 
             try:
                 import openai
-                client = openai.OpenAI(api_key=os.environ.get('OPENAI_API_KEY'))
+                from services.openai_governor import shared_http_client
+                client = openai.OpenAI(api_key=os.environ.get('OPENAI_API_KEY'), http_client=shared_http_client())
                 if not os.environ.get('OPENAI_API_KEY'):
                     openai_status = False
                     openai_error = "OPENAI_API_KEY not configured"
@@ -567,6 +568,22 @@ def run_ai_cost_alert():
             app.logger.error(f"AI cost alert task error: {str(e)}")
 
 
+def run_ai_cost_rollup():
+    """Advance the hourly / daily `openai_call_log` rollups.
+
+    The AI cost dashboards, the spend alert and the forecaster read the
+    rollups plus a bounded raw tail past the watermark, so a missed run only
+    makes them slightly slower, never wrong.
+    """
+    from app import app
+    with app.app_context():
+        try:
+            from services.ai_cost_rollup import refresh_rollups
+            refresh_rollups()
+        except Exception as e:
+            app.logger.error(f"AI cost rollup task error: {str(e)}")
+
+
 def run_ops_early_warning():
     """Phase 1 ops early-warning: inbound/screening/scheduler/SFTP signals → email.
 
@@ -20,11 +20,16 @@ import logging
 import threading
 from collections import Counter
 from datetime import datetime, timedelta
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import requests as _requests
 
 from bullhorn_service import BullhornService
+from bullhorn_service.notes_cache import (
+    CANDIDATE_NOTES_FIELDS,
+    candidate_notes_cache,
+    parse_candidate_notes,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -797,39 +802,17 @@ def _parse_api_user_ids(raw: str) -> List[int]:
     return ids
 
 
-def _find_first_human_interactor(
+def _fetch_candidate_notes(
     base_url: str,
     headers: dict,
     candidate_id: int,
-    api_user_ids: List[int],
-) -> Tuple[Optional[int], Optional[str], Optional[str]]:
+) -> Optional[List[Dict]]:
     """
-    Return ``(corporateUser_id, firstName, lastName)`` of the EARLIEST
-    human (non-API) author who left a Note on this candidate, or
-    ``(None, None, None)`` if no human activity is found.
-
-    Bug #5 (May 2026): switched from ``search/Note?query=personReference.id:X``
-    to the canonical ``entity/Candidate/{id}?fields=notes(...)``
-    to-many association lookup. The search-index path returned ``total=0``
-    in production for candidates whose notes ARE visible in the Bullhorn
-    UI — most likely because UI-added notes link to a candidate via the
-    ``candidates`` to-many association rather than ``personReference``,
-    and the ``personReference`` filter on the search index therefore
-    misses them. The entity endpoint reads the live association and is
-    robust to whichever linkage (UI vs API) the note creator populated,
-    so manually-added recruiter notes are no longer invisible.
-
-    Returns ``(None, None, None)`` on any HTTP / parse error so the
-    caller does NOT reassign ownership to a phantom recruiter.
+    Fetch a candidate's notes association (one retry on 5xx / network
+    errors). Returns None on any HTTP / parse failure.
     """
     entity_url = f"{base_url}entity/Candidate/{candidate_id}"
-    params = {
-        'fields': (
-            'notes(id,commentingPerson(id,firstName,lastName),'
-            'dateAdded,action)'
-        ),
-    }
-    api_user_id_set = {int(uid) for uid in api_user_ids}
+    params = {'fields': CANDIDATE_NOTES_FIELDS}
 
     resp = None
     for attempt in range(2):
@@ -846,7 +829,7 @@ def _find_first_human_interactor(
                 f"Note lookup for candidate {candidate_id}: "
                 f"HTTP {resp.status_code}"
             )
-            return (None, None, None)
+            return None
         except Exception as exc:
             if attempt == 0:
                 time.sleep(1)
@@ -854,10 +837,10 @@ def _find_first_human_interactor(
             logger.warning(
                 f"Note lookup exception for candidate {candidate_id}: {exc}"
             )
-            return (None, None, None)
+            return None
 
     if resp is None or resp.status_code != 200:
-        return (None, None, None)
+        return None
 
     try:
         body = resp.json() or {}
@@ -866,25 +849,46 @@ def _find_first_human_interactor(
             f"Note lookup unparseable JSON for candidate {candidate_id}: "
             f"{exc}"
         )
-        return (None, None, None)
-
-    candidate_data = body.get('data')
-    if not isinstance(candidate_data, dict):
-        # Defensive: malformed responses (e.g. legacy search-shape
-        # ``{'data': [...]}`` or unexpected upstream errors) must not
-        # crash the cycle. Treat as "no notes found" → caller skips
-        # reassignment for this candidate.
-        candidate_data = {}
-    notes_assoc = candidate_data.get('notes')
-    # Bullhorn returns to-many associations as either a wrapped object
-    # (``{'data': [...], 'total': N}``) or, on some endpoints/versions,
-    # a bare list. Handle both shapes defensively.
-    if isinstance(notes_assoc, dict):
-        notes = notes_assoc.get('data') or []
-    elif isinstance(notes_assoc, list):
-        notes = notes_assoc
-    else:
-        notes = []
+        return None
+
+    # Malformed responses (e.g. legacy search-shape ``{'data': [...]}``)
+    # parse to "no notes" so the caller skips reassignment.
+    return parse_candidate_notes(body)
+
+
+def _find_first_human_interactor(
+    base_url: str,
+    headers: dict,
+    candidate_id: int,
+    api_user_ids: List[int],
+) -> Tuple[Optional[int], Optional[str], Optional[str]]:
+    """
+    Return ``(corporateUser_id, firstName, lastName)`` of the EARLIEST
+    human (non-API) author who left a Note on this candidate, or
+    ``(None, None, None)`` if no human activity is found.
+
+    Bug #5 (May 2026): switched from ``search/Note?query=personReference.id:X``
+    to the canonical ``entity/Candidate/{id}?fields=notes(...)``
+    to-many association lookup. The search-index path returned ``total=0``
+    in production for candidates whose notes ARE visible in the Bullhorn
+    UI — most likely because UI-added notes link to a candidate via the
+    ``candidates`` to-many association rather than ``personReference``,
+    and the ``personReference`` filter on the search index therefore
+    misses them. The entity endpoint reads the live association and is
+    robust to whichever linkage (UI vs API) the note creator populated,
+    so manually-added recruiter notes are no longer invisible.
+
+    Returns ``(None, None, None)`` on any HTTP / parse error so the
+    caller does NOT reassign ownership to a phantom recruiter.
+    """
+    api_user_id_set = {int(uid) for uid in api_user_ids}
+
+    notes = candidate_notes_cache.get(base_url, candidate_id)
+    if notes is None:
+        notes = _fetch_candidate_notes(base_url, headers, candidate_id)
+        if notes is None:
+            return (None, None, None)
+        candidate_notes_cache.put(base_url, candidate_id, notes)
 
     logger.info(
         f"_find_first_human_interactor: candidate {candidate_id} "
@@ -898,9 +902,7 @@ def _find_first_human_interactor(
             return int(n.get('dateAdded') or 0)
         except (TypeError, ValueError):
             return 0
-    notes.sort(key=_date_key)
-
-    for note in notes:
+    for note in sorted(notes, key=_date_key):
         person = note.get('commentingPerson') or {}
         person_id = person.get('id')
         if person_id is None:
@@ -1013,14 +1015,17 @@ def preview_reassign_candidates(limit: int = 5) -> dict:
                 params=search_params,
                 timeout=30,
             )
-            if resp.status_code == 401 and bh.authenticate():
-                headers['BhRestToken'] = bh.rest_token
-                resp = _requests.get(
-                    search_url,
-                    headers=headers,
-                    params=search_params,
-                    timeout=30,
-                )
+            if resp.status_code == 401:
+                # Drop the rejected token so authenticate() actually renews it.
+                bh.rest_token = None
+                if bh.authenticate():
+                    headers['BhRestToken'] = bh.rest_token
+                    resp = _requests.get(
+                        search_url,
+                        headers=headers,
+                        params=search_params,
+                        timeout=30,
+                    )
 
             if resp.status_code != 200:
                 return {
@@ -1265,9 +1270,9 @@ def _reassign_api_user_candidates_locked(
                 resp = _requests.get(
                     search_url, headers=headers, params=search_params, timeout=30
                 )
-                # Concurrent Bullhorn REST logins (other scheduler jobs) can
-                # invalidate a just-issued BhRestToken. One re-auth + retry
-                # clears the common transient 401 without alarming ops.
+                # A 401 here means the shared session was invalidated or
+                # expired. The session broker turns the re-auth below into a
+                # single login however many jobs hit the same 401.
                 if resp.status_code == 401:
                     logger.warning(
                         "owner_reassignment: candidate search HTTP 401 — "
@@ -1639,6 +1644,7 @@ def _reassign_api_user_candidates_locked(
                                     json=note_data,
                                     timeout=30,
                                 )
+                                candidate_notes_cache.invalidate(base_url, candidate_id)
                             except Exception as note_err:
                                 logger.warning(
                                     f"owner_reassignment: note creation failed for "
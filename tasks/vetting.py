@@ -189,6 +189,65 @@ def run_retry_failed_screening_notes(batch_size: int = 25) -> dict:
             return summary
 
 
+def run_resume_hash_backfill(batch_size: int = 500, max_batches: int = 20) -> dict:
+    """Fill ``CandidateVettingLog.resume_text_hash`` for rows written before
+    the column existed (new writes are hashed by the model itself).
+
+    Walks the NULL-hash rows in primary-key order, ``batch_size`` at a time
+    and at most ``max_batches`` per run, so a large backlog is spread over
+    several scheduler ticks and each run stays short. Once the backlog is
+    gone this is a single indexed query that returns nothing.
+    """
+    from app import app
+
+    summary = {'updated': 0, 'batches': 0}
+
+    with app.app_context():
+        from extensions import db
+        from sqlalchemy import update
+        from models import CandidateVettingLog
+        from fraud_detection.signals import resume_content_hash
+
+        try:
+            last_id = 0
+            for _ in range(max(1, int(max_batches))):
+                rows = (
+                    db.session.query(CandidateVettingLog.id, CandidateVettingLog.resume_text)
+                    .filter(
+                        CandidateVettingLog.resume_text_hash.is_(None),
+                        CandidateVettingLog.resume_text.isnot(None),
+                        CandidateVettingLog.id > last_id,
+                    )
+                    .order_by(CandidateVettingLog.id)
+                    .limit(batch_size)
+                    .all()
+                )
+                if not rows:
+                    break
+                db.session.execute(
+                    update(CandidateVettingLog),
+                    [{'id': row_id, 'resume_text_hash': resume_content_hash(text)} for row_id, text in rows],
+                )
+                db.session.commit()
+                last_id = rows[-1][0]
+                summary['updated'] += len(rows)
+                summary['batches'] += 1
+                if len(rows) < batch_size:
+                    break
+
+            if summary['updated']:
+                logger.info(
+                    f"run_resume_hash_backfill: hashed {summary['updated']} vetting logs "
+                    f"in {summary['batches']} batch(es)"
+                )
+        except Exception as e:
+            logger.error(f"run_resume_hash_backfill: error — {e}")
+            db.session.rollback()
+            summary['error'] = str(e)
+
+    return summary
+
+
 def run_requirements_maintenance():
     """
     Scheduled job (every 5 minutes): keep AI job requirements up to date automatically.
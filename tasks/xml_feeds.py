@@ -180,9 +180,29 @@ def _upload_single_file(ftp_service, xml_content, remote_filename, app):
         temp_path = temp_file.name
         temp_file.write(xml_content)
         temp_file.close()
+    except Exception as e:
+        app.logger.error(f"'{remote_filename}' upload error: {e}")
+        if temp_path:
+            try:
+                os.remove(temp_path)
+            except Exception:
+                pass
+        return False, str(e)
+
+    try:
+        return _upload_feed_file(ftp_service, temp_path, remote_filename, app)
+    finally:
+        try:
+            os.remove(temp_path)
+        except Exception:
+            pass
 
-        app.logger.info(f"Uploading '{remote_filename}' ({len(xml_content):,} bytes)...")
-        upload_result = ftp_service.upload_file(local_file_path=temp_path, remote_filename=remote_filename)
+
+def _upload_feed_file(ftp_service, local_path, remote_filename, app):
+    """Helper: upload an already-written feed file via SFTP. Returns (success, error_msg)."""
+    try:
+        app.logger.info(f"Uploading '{remote_filename}' ({os.path.getsize(local_path):,} bytes)...")
+        upload_result = ftp_service.upload_file(local_file_path=local_path, remote_filename=remote_filename)
 
         if isinstance(upload_result, dict):
             if upload_result.get('success'):
@@ -205,12 +225,6 @@ def _upload_single_file(ftp_service, xml_content, remote_filename, app):
     except Exception as e:
         app.logger.error(f"'{remote_filename}' upload error: {e}")
         return False, str(e)
-    finally:
-        if temp_path:
-            try:
-                os.remove(temp_path)
-            except Exception:
-                pass
 
 
 def automated_upload():
@@ -222,64 +236,76 @@ def automated_upload():
     from extensions import db
     from feeds.feed_config import (
         channel_feeds_for_upload,
+        upload_cycle_tearsheet_ids,
         V2_FILENAME,
         V2_FILENAME_DEV,
         SOURCE_LINKEDIN,
     )
     with app.app_context():
         app.logger.info("AUTOMATED UPLOAD: Function invoked by scheduler")
+        feed_dir = None
         try:
             from models import GlobalSettings
 
-            automation_setting = GlobalSettings.query.filter_by(setting_key='automated_uploads_enabled').first()
-            if not (automation_setting and automation_setting.setting_value == 'true'):
+            if GlobalSettings.settings.get('automated_uploads_enabled') != 'true':
                 app.logger.info("Automated uploads disabled in settings, skipping upload cycle")
                 return
 
-            sftp_enabled = GlobalSettings.query.filter_by(setting_key='sftp_enabled').first()
-            if not (sftp_enabled and sftp_enabled.setting_value == 'true'):
+            if GlobalSettings.settings.get('sftp_enabled') != 'true':
                 app.logger.warning("Automated upload skipped: SFTP not enabled")
                 return
 
             app.logger.info("Starting automated 30-minute upload cycle (v2 + STSI channel feeds)...")
 
+            import tempfile
             from simplified_xml_generator import SimplifiedXMLGenerator
             generator = SimplifiedXMLGenerator(db=db)
 
-            app.logger.info("Generating v2 feed (Myticas tearsheets + STSI LinkedIn)...")
-            v2_xml, v2_stats = generator.generate_fresh_xml(source_channel=SOURCE_LINKEDIN)
-            app.logger.info(f"v2 feed: {v2_stats['job_count']} jobs, {v2_stats['xml_size_bytes']:,} bytes")
-
-            channel_results = {}
-            for feed_cfg in channel_feeds_for_upload():
-                key = feed_cfg['key']
-                if feed_cfg.get('force_empty'):
+            # Feeds are streamed straight to files here and uploaded from disk,
+            # so no feed is ever held in memory as one string.
+            feed_dir = tempfile.TemporaryDirectory(prefix='xml_feeds_')
+
+            # One concurrent Bullhorn pull + reference load shared by v2 and
+            # every channel feed, instead of one full pull per feed.
+            with generator.cycle_snapshot(upload_cycle_tearsheet_ids()):
+                app.logger.info("Generating v2 feed (Myticas tearsheets + STSI LinkedIn)...")
+                v2_path, v2_stats = generator.generate_fresh_xml(
+                    source_channel=SOURCE_LINKEDIN,
+                    output_path=os.path.join(feed_dir.name, 'v2.xml'),
+                )
+                app.logger.info(f"v2 feed: {v2_stats['job_count']} jobs, {v2_stats['xml_size_bytes']:,} bytes")
+
+                channel_results = {}
+                for feed_cfg in channel_feeds_for_upload():
+                    key = feed_cfg['key']
+                    if feed_cfg.get('force_empty'):
+                        app.logger.info(
+                            f"Parking {key} XML feed (Indeed native Plan B enabled) — "
+                            f"uploading empty feed to retire XML syndication"
+                        )
+                        tearsheet_ids = []
+                    else:
+                        tearsheet_ids = feed_cfg['tearsheet_ids']
+                        app.logger.info(f"Generating {key} feed from tearsheets {tearsheet_ids}...")
+                    feed_path, stats = generator.generate_fresh_xml(
+                        tearsheet_ids=tearsheet_ids,
+                        source_channel=feed_cfg['source_channel'],
+                        allow_empty=True if feed_cfg.get('force_empty') else feed_cfg.get('allow_empty', False),
+                        publisher_title=feed_cfg.get('publisher_title'),
+                        publisher_link=feed_cfg.get('publisher_link'),
+                        output_path=os.path.join(feed_dir.name, f'{key}.xml'),
+                    )
+                    channel_results[key] = {
+                        'path': feed_path,
+                        'stats': stats,
+                        'filenames': {
+                            'production': feed_cfg['filename'],
+                            'development': feed_cfg.get('filename_dev', feed_cfg['filename']),
+                        },
+                    }
                     app.logger.info(
-                        f"Parking {key} XML feed (Indeed native Plan B enabled) — "
-                        f"uploading empty feed to retire XML syndication"
+                        f"{key} feed: {stats['job_count']} jobs, {stats['xml_size_bytes']:,} bytes"
                     )
-                    tearsheet_ids = []
-                else:
-                    tearsheet_ids = feed_cfg['tearsheet_ids']
-                    app.logger.info(f"Generating {key} feed from tearsheets {tearsheet_ids}...")
-                xml_content, stats = generator.generate_fresh_xml(
-                    tearsheet_ids=tearsheet_ids,
-                    source_channel=feed_cfg['source_channel'],
-                    allow_empty=True if feed_cfg.get('force_empty') else feed_cfg.get('allow_empty', False),
-                    publisher_title=feed_cfg.get('publisher_title'),
-                    publisher_link=feed_cfg.get('publisher_link'),
-                )
-                channel_results[key] = {
-                    'xml': xml_content,
-                    'stats': stats,
-                    'filenames': {
-                        'production': feed_cfg['filename'],
-                        'development': feed_cfg.get('filename_dev', feed_cfg['filename']),
-                    },
-                }
-                app.logger.info(
-                    f"{key} feed: {stats['job_count']} jobs, {stats['xml_size_bytes']:,} bytes"
-                )
 
             app.logger.info("CHECKPOINT 1: All XML feeds generated successfully")
             app.logger.info("Reference numbers loaded from DATABASE (database-first approach)")
@@ -289,16 +315,11 @@ def automated_upload():
             upload_error_message = None
 
             try:
-                sftp_hostname = GlobalSettings.query.filter_by(setting_key='sftp_hostname').first()
-                sftp_username = GlobalSettings.query.filter_by(setting_key='sftp_username').first()
-                sftp_password = GlobalSettings.query.filter_by(setting_key='sftp_password').first()
-                sftp_directory = GlobalSettings.query.filter_by(setting_key='sftp_directory').first()
-                sftp_port = GlobalSettings.query.filter_by(setting_key='sftp_port').first()
-
-                host_val = (sftp_hostname.setting_value or '').strip() if sftp_hostname else ''
-                user_val = (sftp_username.setting_value or '').strip() if sftp_username else ''
-                pass_val = (sftp_password.setting_value or '').strip() if sftp_password else ''
-                dir_val = (sftp_directory.setting_value or '/').strip() if sftp_directory else '/'
+                settings = GlobalSettings.settings
+                host_val = settings.get_str('sftp_hostname')
+                user_val = settings.get_str('sftp_username')
+                pass_val = settings.get_str('sftp_password')
+                dir_val = settings.get_str('sftp_directory', '/')
                 env_host = (os.environ.get('SFTP_HOSTNAME') or os.environ.get('SFTP_HOST') or '').strip()
                 if not host_val or host_val.startswith('{') or '.' not in host_val:
                     if env_host:
@@ -320,10 +341,7 @@ def automated_upload():
                     app.logger.info(f"Uploading to configured directory: '{target_directory}'")
 
                     from ftp_service import FTPService
-                    try:
-                        port_value = int(sftp_port.setting_value) if sftp_port and sftp_port.setting_value else 2222
-                    except ValueError:
-                        port_value = 2222
+                    port_value = settings.get_int('sftp_port', 2222)
                     if port_value == 22:
                         port_value = 2222
                     ftp_service = FTPService(
@@ -350,8 +368,8 @@ def automated_upload():
                     # One authenticated connection for all feeds in the cycle.
                     try:
                         with ftp_service.sftp_session():
-                            v2_upload_ok, v2_err = _upload_single_file(
-                                ftp_service, v2_xml, v2_filename, app
+                            v2_upload_ok, v2_err = _upload_feed_file(
+                                ftp_service, v2_path, v2_filename, app
                             )
 
                             if not v2_upload_ok:
@@ -360,8 +378,8 @@ def automated_upload():
                             for key, result in channel_results.items():
                                 remote_filename = result['filenames'][current_env]
                                 app.logger.info(f"{current_env.upper()}: uploading {remote_filename}")
-                                ok, err = _upload_single_file(
-                                    ftp_service, result['xml'], remote_filename, app
+                                ok, err = _upload_feed_file(
+                                    ftp_service, result['path'], remote_filename, app
                                 )
                                 channel_upload_ok[key] = ok
                                 if not ok:
@@ -493,6 +511,10 @@ def automated_upload():
 
         except Exception as e:
             app.logger.error(f"Automated upload error: {str(e)}")
+        finally:
+            # Covers generation failures too, not just the upload block.
+            if feed_dir is not None:
+                feed_dir.cleanup()
 
 
 def run_xml_change_monitor():
@@ -180,6 +180,34 @@ def _db_cleanup(app):
     except Exception:
         db.session.rollback()
 
+    # The embedding cache is process-wide (LRU + embedding_cache table); a
+    # vector cached by one test would otherwise satisfy a later test's mocked
+    # OpenAI call and skip the code path it is asserting on.
+    try:
+        from models import EmbeddingCacheEntry
+        from services.embedding_cache import get_embedding_cache
+        get_embedding_cache().clear()
+        EmbeddingCacheEntry.query.delete()
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+
+    # Candidate notes are cached process-wide for about a cycle; notes cached
+    # by one test would otherwise answer a later test's mocked Bullhorn call.
+    from bullhorn_service.notes_cache import candidate_notes_cache
+    candidate_notes_cache.clear()
+
+    # AI cost rollups carry a watermark; a stale one left by a rollup test
+    # would make later readers trust rollup rows for raw rows they deleted.
+    try:
+        from models import OpenAICallRollupDaily, OpenAICallRollupHourly, OpenAICallRollupState
+        OpenAICallRollupHourly.query.delete()
+        OpenAICallRollupDaily.query.delete()
+        OpenAICallRollupState.query.delete()
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+
     from models import User
     user = User.query.filter_by(username='testadmin').first()
     if user is None:
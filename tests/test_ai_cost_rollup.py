@@ -0,0 +1,184 @@
+"""Tests for services/ai_cost_rollup.py — watermark job + window reader."""
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+
+from app import app as flask_app
+from extensions import db
+from models.openai_telemetry import (
+    OpenAICallLog,
+    OpenAICallRollupDaily,
+    OpenAICallRollupHourly,
+    OpenAICallRollupState,
+)
+from services import ai_cost_rollup
+
+
+def _clear():
+    for model in (OpenAICallLog, OpenAICallRollupHourly, OpenAICallRollupDaily, OpenAICallRollupState):
+        db.session.query(model).delete()
+    db.session.commit()
+
+
+@pytest.fixture
+def app():
+    flask_app.config['TESTING'] = True
+    with flask_app.app_context():
+        _clear()
+        yield flask_app
+        _clear()
+
+
+def _log(created_at, site='screening.scoring', cost=0.01, success=True,
+         duration_ms=100, tenant_id=None, model='gpt-4.1-mini'):
+    db.session.add(OpenAICallLog(
+        created_at=created_at,
+        call_site_id=site,
+        model=model,
+        input_tokens=100,
+        output_tokens=50,
+        cached_input_tokens=0,
+        estimated_cost_usd=Decimal(f'{cost:.6f}'),
+        duration_ms=duration_ms,
+        tenant_id=tenant_id,
+        success=success,
+    ))
+
+
+def _seed(now):
+    # Spread across three days, with partial hours at both window edges.
+    for minutes in (5, 20, 70, 130, 600, 1500, 2900, 4000):
+        _log(now - timedelta(minutes=minutes))
+    _log(now - timedelta(minutes=45), site='vetting_audit', cost=0.5, duration_ms=300)
+    _log(now - timedelta(minutes=3000), site='vetting_audit', cost=0.25, duration_ms=None)
+    _log(now - timedelta(minutes=200), success=False, tenant_id='t1')
+    db.session.commit()
+
+
+def _snapshot(since, now, group_by):
+    return ai_cost_rollup.aggregate(since, now, group_by=group_by)
+
+
+def test_floor_and_ceil_helpers():
+    dt = datetime(2026, 10, 16, 13, 25, 7)
+    assert ai_cost_rollup.floor_hour(dt) == datetime(2026, 10, 16, 13)
+    assert ai_cost_rollup.ceil_hour(dt) == datetime(2026, 10, 16, 14)
+    assert ai_cost_rollup.ceil_hour(datetime(2026, 10, 16, 13)) == datetime(2026, 10, 16, 13)
+    assert ai_cost_rollup.floor_day(dt) == datetime(2026, 10, 16)
+    assert ai_cost_rollup.ceil_day(dt) == datetime(2026, 10, 17)
+
+
+def test_aggregate_without_watermark_reads_raw(app):
+    now = datetime.utcnow()
+    _seed(now)
+    m = ai_cost_rollup.totals(now - timedelta(days=7), now)
+    assert m['calls'] == 11
+    assert m['failures'] == 1
+    assert m['input_tokens'] == 1100
+    assert m['cost'] == pytest.approx(0.09 + 0.75)
+
+
+@pytest.mark.parametrize('group_by', [
+    (),
+    ('call_site_id', 'model'),
+    ('day',),
+    ('call_site_id', 'tenant_id'),
+])
+def test_rollup_matches_raw_for_every_window(app, group_by):
+    now = datetime.utcnow()
+    _seed(now)
+    windows = [now - timedelta(hours=h) for h in (1, 3, 24, 50, 24 * 7)]
+    expected = {since: _snapshot(since, now, group_by) for since in windows}
+
+    result = ai_cost_rollup.refresh_rollups(now)
+    assert result['hours'] > 0
+    assert ai_cost_rollup.get_watermark() == ai_cost_rollup.floor_hour(now - ai_cost_rollup.ROLLUP_LAG)
+
+    for since in windows:
+        got = _snapshot(since, now, group_by)
+        assert set(got) == set(expected[since])
+        for key, metrics in expected[since].items():
+            for name, value in metrics.items():
+                assert got[key][name] == pytest.approx(value), (since, key, name)
+
+
+@pytest.mark.parametrize('hours_back', [2, 26])
+def test_window_ending_mid_hour_behind_watermark(app, hours_back):
+    now = datetime.utcnow()
+    _seed(now)
+    # An `until` well behind the watermark that cuts an hour bucket in half.
+    until = ai_cost_rollup.floor_hour(now - timedelta(hours=hours_back)) + timedelta(minutes=30)
+    _log(until - timedelta(minutes=10))
+    _log(until + timedelta(minutes=10))
+    db.session.commit()
+    windows = [until - timedelta(hours=h) for h in (0.25, 1, 3, 24 * 7)]
+    expected = {since: _snapshot(since, until, ('day', 'call_site_id')) for since in windows}
+
+    ai_cost_rollup.refresh_rollups(now)
+    assert ai_cost_rollup.get_watermark() > until
+
+    for since in windows:
+        got = _snapshot(since, until, ('day', 'call_site_id'))
+        assert set(got) == set(expected[since])
+        for key, metrics in expected[since].items():
+            for name, value in metrics.items():
+                assert got[key][name] == pytest.approx(value), (since, key, name)
+
+
+def test_readers_use_rollups_not_raw_history(app):
+    now = datetime.utcnow()
+    _seed(now)
+    ai_cost_rollup.refresh_rollups(now)
+    # Rows behind the watermark are now served from the rollups alone.
+    watermark = ai_cost_rollup.get_watermark()
+    cutoff = ai_cost_rollup.floor_hour(now - timedelta(hours=30))
+    db.session.query(OpenAICallLog).filter(
+        OpenAICallLog.created_at >= cutoff,
+        OpenAICallLog.created_at < watermark,
+    ).delete()
+    db.session.commit()
+    m = ai_cost_rollup.totals(cutoff, now)
+    assert m['calls'] == sum(
+        1 for minutes in (5, 20, 45, 70, 130, 200, 600, 1500)
+        if now - timedelta(minutes=minutes) >= cutoff
+    )
+
+
+def test_refresh_is_incremental_and_merges_daily(app):
+    now = datetime.utcnow()
+    _seed(now)
+    ai_cost_rollup.refresh_rollups(now)
+
+    later = now + timedelta(hours=2)
+    _log(now + timedelta(minutes=30), site='vetting_audit', cost=1.0, duration_ms=500)
+    db.session.commit()
+    result = ai_cost_rollup.refresh_rollups(later)
+    assert result['hours'] == 2
+
+    rolled = db.session.query(OpenAICallLog).filter(
+        OpenAICallLog.created_at < ai_cost_rollup.get_watermark()
+    ).count()
+    daily_total = db.session.query(db.func.sum(OpenAICallRollupDaily.calls)).scalar()
+    hourly_total = db.session.query(db.func.sum(OpenAICallRollupHourly.calls)).scalar()
+    assert daily_total == hourly_total == rolled == 12
+
+    # A second run with nothing new is a no-op.
+    assert ai_cost_rollup.refresh_rollups(later)['hours'] == 0
+
+    audit = ai_cost_rollup.totals(now - timedelta(days=7), later, call_site_id='vetting_audit')
+    assert audit['calls'] == 3
+    assert audit['cost'] == pytest.approx(1.75)
+    assert audit['duration_count'] == 2
+    assert audit['duration_ms_sum'] == 800
+
+
+def test_refresh_on_empty_table_sets_watermark(app):
+    now = datetime.utcnow()
+    assert ai_cost_rollup.refresh_rollups(now)['hours'] == 0
+    assert ai_cost_rollup.get_watermark() == ai_cost_rollup.floor_hour(now - ai_cost_rollup.ROLLUP_LAG)
+
+
+def test_aggregate_rejects_unknown_group_column(app):
+    with pytest.raises(ValueError):
+        ai_cost_rollup.aggregate(datetime.utcnow(), group_by=('tenant',))
@@ -0,0 +1,155 @@
+"""
+Tests for BullhornService.get_entities (multi-ID entity GETs) and its use by
+unvetted-application detection.
+
+Candidate details are fetched as ``entity/Candidate/1,2,3`` in bounded,
+concurrent batches instead of one serial request per candidate.
+"""
+import threading
+from datetime import datetime
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+
+def _response(status, data=None):
+    resp = MagicMock()
+    resp.status_code = status
+    resp.headers = {'content-type': 'application/json'}
+    resp.text = '{}'
+    resp.json.return_value = {'data': data}
+    return resp
+
+
+@pytest.fixture
+def service():
+    from bullhorn_service import BullhornService
+    svc = BullhornService(client_id='c', client_secret='s', username='multi-id', password='p')
+    svc.rest_token = 'tok'
+    svc.base_url = 'https://rest.example/'
+    return svc
+
+
+def _sessions(service, fake_get):
+    """Route the per-worker sessions' GETs to ``fake_get``."""
+    return patch.object(service, '_new_page_session',
+                        side_effect=lambda: Mock(get=Mock(side_effect=fake_get)))
+
+
+def _ids_in(url):
+    return [int(i) for i in url.rsplit('/', 1)[1].split(',')]
+
+
+class TestGetEntities:
+    def test_batches_ids_into_multi_id_requests(self, service):
+        urls = []
+        lock = threading.Lock()
+
+        def fake_get(url, params=None, timeout=None):
+            with lock:
+                urls.append(url)
+            ids = _ids_in(url)
+            data = [{'id': i, 'firstName': f'C{i}'} for i in ids]
+            return _response(200, data if len(ids) > 1 else data[0])
+
+        with _sessions(service, fake_get):
+            result = service.get_entities('Candidate', list(range(1, 8)) + [3], fields='firstName',
+                                          batch_size=3, max_workers=2)
+
+        assert sorted(result) == list(range(1, 8))
+        assert result[5]['firstName'] == 'C5'
+        assert len(urls) == 3
+        assert sorted(len(_ids_in(u)) for u in urls) == [1, 3, 3]
+
+    def test_workers_do_not_share_the_service_session(self, service):
+        threads = {}
+        lock = threading.Lock()
+        made = []
+
+        def new_session():
+            session = Mock()
+            session.get.side_effect = lambda url, params=None, timeout=None: (
+                threads.setdefault(threading.get_ident(), set()).add(id(session))
+                or _response(200, [{'id': i} for i in _ids_in(url)])
+            )
+            with lock:
+                made.append(session)
+            return session
+
+        with patch.object(service.session, 'get') as shared_get, \
+                patch.object(service, '_new_page_session', side_effect=new_session):
+            result = service.get_entities('Candidate', list(range(1, 9)), batch_size=2, max_workers=2)
+
+        assert sorted(result) == list(range(1, 9))
+        shared_get.assert_not_called()
+        assert all(len(ids) == 1 for ids in threads.values())
+        assert all(s.close.called for s in made)
+
+    def test_401_reauthenticates_once_and_retries(self, service):
+        calls = []
+
+        def fake_get(url, params=None, timeout=None):
+            calls.append(params['BhRestToken'])
+            if params['BhRestToken'] == 'tok':
+                return _response(401)
+            return _response(200, [{'id': i} for i in _ids_in(url)])
+
+        def fake_auth():
+            service.rest_token = 'fresh'
+            return True
+
+        with _sessions(service, fake_get), \
+                patch.object(service, 'authenticate', side_effect=fake_auth) as auth:
+            result = service.get_entities('Candidate', [1, 2, 3, 4], batch_size=2)
+
+        assert auth.call_count == 1
+        assert sorted(result) == [1, 2, 3, 4]
+        assert calls.count('fresh') == 2
+
+    def test_failed_batch_falls_back_to_per_id(self, service):
+        def fake_get(url, params=None, timeout=None):
+            return _response(404)
+
+        with _sessions(service, fake_get), \
+                patch.object(service, 'get_entity',
+                             side_effect=lambda t, i, fields=None: {'id': i} if i != 2 else None) as single:
+            result = service.get_entities('Candidate', [1, 2, 3])
+
+        assert single.call_count == 3
+        assert sorted(result) == [1, 3]
+
+
+def test_detection_fetches_all_pending_candidates_in_one_call(app):
+    from extensions import db
+    from models import ParsedEmail
+    from candidate_vetting_service import CandidateVettingService
+
+    ids = [990801, 990802, 990803]
+    with app.app_context():
+        ParsedEmail.query.filter(ParsedEmail.bullhorn_candidate_id.in_(ids)).delete(
+            synchronize_session=False)
+        for n, cid in enumerate(ids + [ids[0]]):
+            db.session.add(ParsedEmail(
+                message_id=f'<multi-{n}@x>', sender_email='s@x', recipient_email='apply@x',
+                status='completed', bullhorn_candidate_id=cid, bullhorn_job_id=500 + n,
+                received_at=datetime.utcnow(), processed_at=datetime.utcnow()))
+        db.session.commit()
+
+        bullhorn = Mock()
+        bullhorn.authenticate.return_value = True
+        bullhorn.get_entities.return_value = {
+            cid: {'id': cid, 'firstName': 'F', 'lastName': str(cid)} for cid in ids[:2]}
+        service = CandidateVettingService(bullhorn_service=bullhorn)
+        try:
+            with patch('screening.detection._resolve_vetting_cutoff', return_value=None):
+                found = service.detect_unvetted_applications(limit=50)
+        finally:
+            ParsedEmail.query.filter(ParsedEmail.bullhorn_candidate_id.in_(ids)).delete(
+                synchronize_session=False)
+            db.session.commit()
+
+    bullhorn.get_entities.assert_called_once()
+    mine = [c for c in found if c['id'] in ids]
+    assert sorted(c['_applied_job_id'] for c in mine) == [500, 501, 503]
+    first, repeat = [c for c in mine if c['id'] == ids[0]]
+    assert first is not repeat
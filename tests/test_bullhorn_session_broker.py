@@ -0,0 +1,185 @@
+"""Tests for the process-wide Bullhorn session broker.
+
+Every BullhornService instance shares one REST session per credential set:
+fresh instances adopt it, concurrent logins collapse into one, a burst of
+401s on the same token triggers a single re-login, and sessions are renewed
+ahead of expiry.
+"""
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+
+@pytest.fixture
+def broker():
+    from bullhorn_service.session_broker import get_session_broker
+    b = get_session_broker()
+    b.reset()
+    yield b
+    b.reset()
+
+
+class _Logins:
+    """Stand-in for _direct_login that issues numbered tokens."""
+
+    def __init__(self, delay=0.0, ok=True):
+        self.count = 0
+        self.delay = delay
+        self.ok = ok
+        self._lock = threading.Lock()
+
+    def install(self):
+        calls = self
+
+        def fake_login(service):
+            with calls._lock:
+                calls.count += 1
+                n = calls.count
+            time.sleep(calls.delay)
+            if not calls.ok:
+                return False
+            service.rest_token = f'token-{n}'
+            service.base_url = 'https://rest.example/rest-services/x/'
+            service.user_id = 7
+            return True
+
+        from bullhorn_service import BullhornService
+        return patch.object(BullhornService, '_direct_login', fake_login)
+
+
+def _service():
+    from bullhorn_service import BullhornService
+    return BullhornService(client_id='cid', client_secret='sec', username='api', password='pw')
+
+
+def test_instances_share_one_login(broker):
+    logins = _Logins()
+    with logins.install():
+        first, second = _service(), _service()
+        assert first.authenticate()
+        assert second.authenticate()
+    assert logins.count == 1
+    assert second.rest_token == first.rest_token == 'token-1'
+    assert second.user_id == 7
+
+
+def test_concurrent_logins_are_single_flight(broker):
+    logins = _Logins(delay=0.2)
+    services = [_service() for _ in range(8)]
+    results = []
+    with logins.install():
+        threads = [threading.Thread(target=lambda s=s: results.append(s.authenticate()))
+                   for s in services]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    assert results == [True] * 8
+    assert logins.count == 1
+    assert {s.rest_token for s in services} == {'token-1'}
+
+
+def test_401_burst_on_same_token_relogs_once(broker):
+    logins = _Logins()
+    a, b = _service(), _service()
+    with logins.install():
+        a.authenticate()
+        b.authenticate()
+        # Both jobs see a 401 on token-1 and follow the drop-and-retry convention.
+        for svc in (a, b):
+            svc.rest_token = None
+            assert svc.authenticate()
+    assert logins.count == 2
+    assert a.rest_token == b.rest_token == 'token-2'
+
+
+def test_stale_holder_adopts_newer_session(broker):
+    logins = _Logins()
+    a, b = _service(), _service()
+    with logins.install():
+        a.authenticate()
+        b.authenticate()
+        a.rest_token = None
+        a.authenticate()
+        # b still holds token-1, which the re-login just invalidated.
+        assert b.rest_token == 'token-1'
+        assert b.authenticate()
+    assert b.rest_token == 'token-2'
+    assert logins.count == 2
+
+
+def test_idle_session_is_refreshed_ahead_of_expiry(broker, monkeypatch):
+    from bullhorn_service import session_broker
+    logins = _Logins()
+    svc = _service()
+    with logins.install():
+        svc.authenticate()
+        broker.peek(broker.key_for(svc)).last_used -= session_broker.IDLE_REFRESH_SECONDS + 1
+        assert svc.authenticate()
+    assert logins.count == 2
+    assert svc.rest_token == 'token-2'
+
+
+def test_failed_login_backs_off_process_wide(broker):
+    logins = _Logins(ok=False)
+    with logins.install():
+        assert not _service().authenticate()
+        assert not _service().authenticate()
+    assert logins.count == 1
+
+
+def test_failed_refresh_keeps_serving_previous_session(broker):
+    from bullhorn_service import session_broker
+    logins = _Logins()
+    svc = _service()
+    with logins.install():
+        svc.authenticate()
+        logins.ok = False
+        broker.peek(broker.key_for(svc)).obtained_at -= session_broker.MAX_AGE_SECONDS + 1
+        assert _service().authenticate()
+    assert logins.count == 2
+    assert svc.rest_token == 'token-1'
+
+
+def test_credential_sets_are_isolated(broker):
+    from bullhorn_service import BullhornService
+    logins = _Logins()
+    with logins.install():
+        _service().authenticate()
+        other = BullhornService(client_id='cid2', client_secret='s', username='other', password='p')
+        other.authenticate()
+    assert logins.count == 2
+    assert other.rest_token == 'token-2'
+
+
+def test_session_in_constant_use_is_not_refreshed(broker):
+    import requests
+    from requests.adapters import BaseAdapter
+    from bullhorn_service import session_broker
+
+    class _OK(BaseAdapter):
+        def send(self, request, **kwargs):
+            response = requests.Response()
+            response.status_code = 200
+            response.request = request
+            response.url = request.url
+            return response
+
+        def close(self):
+            pass
+
+    logins = _Logins()
+    svc = _service()
+    svc.session.mount('https://', _OK())
+    with logins.install():
+        svc.authenticate()
+        shared = broker.peek(broker.key_for(svc))
+        # Long past the idle window since the last authenticate() — but the
+        # job has been making REST calls on the token all along.
+        shared.last_used -= session_broker.IDLE_REFRESH_SECONDS + 1
+        svc.session.get(f'{svc.base_url}entity/Candidate/1', params={'BhRestToken': svc.rest_token})
+        assert _service().authenticate()
+    assert logins.count == 1
+    assert svc.rest_token == 'token-1'
@@ -0,0 +1,155 @@
+"""Tests for the candidate contact index behind the duplicate-merge bulk scan.
+
+Candidate pulls feed normalised email / E.164 phone keys into
+``candidate_contact_key``; shared keys are found with one SQL self-join and
+only the matched records are confirmed against Bullhorn.
+"""
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from candidate_contact_index import (
+    contact_keys,
+    find_shared_contact_pairs,
+    index_candidates,
+    normalize_email,
+    normalize_phone,
+    prune_unseen,
+)
+
+
+@pytest.fixture
+def contact_index(app):
+    from app import db
+    from models import CandidateContactKey
+    CandidateContactKey.query.delete()
+    db.session.commit()
+    yield
+    CandidateContactKey.query.delete()
+    db.session.commit()
+
+
+def _cand(cid, email='', phone='', mobile='', first='Jane', last='Doe', **extra):
+    return {'id': cid, 'firstName': first, 'lastName': last, 'email': email,
+            'phone': phone, 'mobile': mobile, 'status': 'Active', 'dateAdded': cid, **extra}
+
+
+@pytest.mark.parametrize('raw, expected', [
+    ('(555) 123-4567', '+15551234567'),
+    ('+1 555 123 4567', '+15551234567'),
+    ('1-555-123-4567', '+15551234567'),
+    ('+44 20 7946 0958', '+442079460958'),
+    ('0044 20 7946 0958', '+442079460958'),
+    ('555-1234', None),
+    ('', None),
+    (None, None),
+])
+def test_normalize_phone(raw, expected):
+    assert normalize_phone(raw) == expected
+
+
+def test_contact_keys_collects_every_email_and_phone():
+    keys = contact_keys(_cand(1, email=' Jane@Example.COM ', phone='5551234567',
+                              mobile='+1 (555) 123-4567', email2='jd@other.org', email3='bad'))
+    assert keys == {('email', 'jane@example.com'), ('email', 'jd@other.org'),
+                    ('phone', '+15551234567')}
+    assert normalize_email('not-an-email') is None
+
+
+def test_shared_keys_pair_candidates_once(contact_index):
+    index_candidates([
+        _cand(1, email='jane@example.com', phone='5551234567'),
+        _cand(2, email='JANE@example.com', phone='+1 555 123 4567'),
+        _cand(3, mobile='555.123.4567'),
+        _cand(4, email='someone@else.com'),
+    ])
+    assert find_shared_contact_pairs() == {1: {2, 3}, 2: {3}}
+
+
+def test_reindexing_replaces_a_candidates_keys(contact_index):
+    index_candidates([_cand(1, email='a@x.com'), _cand(2, email='a@x.com')])
+    index_candidates([_cand(2, email='b@x.com')])
+    assert find_shared_contact_pairs() == {}
+
+    index_candidates([_cand(1, email='b@x.com')])
+    assert find_shared_contact_pairs() == {1: {2}}
+
+    index_candidates([_cand(2, email='b@x.com', status='Archive')])
+    assert find_shared_contact_pairs() == {}
+
+
+def test_over_shared_keys_are_ignored(contact_index):
+    index_candidates([_cand(i, email='noemail@placeholder.com') for i in range(1, 6)])
+    assert find_shared_contact_pairs(max_group_size=4) == {}
+    assert len(find_shared_contact_pairs(max_group_size=5)) == 4
+
+
+def test_prune_unseen_drops_stale_candidates(contact_index):
+    old = datetime.utcnow() - timedelta(days=1)
+    index_candidates([_cand(1, email='a@x.com')], seen_at=old)
+    index_candidates([_cand(2, email='a@x.com')])
+    assert prune_unseen(datetime.utcnow() - timedelta(hours=1)) == 1
+    assert find_shared_contact_pairs() == {}
+
+
+def test_bulk_scan_confirms_only_index_matches(contact_index):
+    from duplicate_merge_service import DuplicateMergeService
+
+    page = [
+        _cand(101, email='jane@example.com'),
+        _cand(102, email='jane@example.com'),
+        _cand(103, phone='5559990000', first='Bob', last='Smith'),
+        _cand(104, phone='(555) 999-0000', first='Alice', last='Jones'),
+        _cand(105, email='solo@example.com'),
+    ]
+    service = DuplicateMergeService()
+    bullhorn = MagicMock()
+    bullhorn.authenticate.return_value = True
+    bullhorn.get_entities.side_effect = lambda t, ids, fields=None: {
+        c['id']: c for c in page if c['id'] in ids}
+    service._bullhorn = bullhorn
+
+    with patch.object(service, '_search_all_candidates_batch', return_value=page) as pull, \
+            patch.object(service, 'determine_primary', side_effect=lambda a, b: (a, b, 'x')), \
+            patch.object(service, 'merge_candidates') as merge, \
+            patch('duplicate_merge_service.time.sleep'):
+        stats = service.run_bulk_scan()
+
+    pull.assert_called_once()
+    bullhorn.session.get.assert_not_called()
+    bullhorn.get_entities.assert_called_once()
+    assert sorted(bullhorn.get_entities.call_args[0][1]) == [101, 102, 103, 104]
+    assert stats['candidates_scanned'] == 5
+    assert stats['index_pairs'] == 2
+    # 103/104 share a phone but not a name — rejected by the confirm step.
+    assert stats['skipped_below_threshold'] == 1
+    assert stats['merged'] == 1
+    merged = merge.call_args[0]
+    assert (merged[0]['id'], merged[1]['id'], merged[3]) == (101, 102, 'email')
+
+
+@pytest.mark.parametrize('pages, prunes', [
+    # Exact multiple of the page size: the final page comes back empty.
+    ([[_cand(1), _cand(2)], [_cand(3), _cand(4)], []], True),
+    ([[_cand(1), _cand(2)], [_cand(3)]], True),
+    # A fetch error after a full page is not the end of the data.
+    ([[_cand(1), _cand(2)], None], False),
+    ([[]], False),
+])
+def test_bulk_scan_prunes_only_after_complete_pull(contact_index, monkeypatch, pages, prunes):
+    import duplicate_merge_service
+    from duplicate_merge_service import DuplicateMergeService
+
+    monkeypatch.setattr(duplicate_merge_service, 'BATCH_SIZE', 2)
+    service = DuplicateMergeService()
+    service._bullhorn = MagicMock()
+
+    with patch.object(service, '_search_all_candidates_batch', side_effect=pages) as pull, \
+            patch('duplicate_merge_service.prune_unseen', return_value=0) as prune, \
+            patch('duplicate_merge_service.time.sleep'):
+        stats = service.run_bulk_scan()
+
+    assert pull.call_count == len(pages)
+    assert prune.called is prunes
+    assert stats['errors'] == (1 if None in pages else 0)
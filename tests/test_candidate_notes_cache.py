@@ -0,0 +1,117 @@
+"""
+Tests for the shared candidate-notes cache.
+
+The recruiter-activity / recruiter-decision gates and owner reassignment read
+the same ``entity/Candidate/{id}?fields=notes(...)`` association; within one
+cycle a candidate's notes should be fetched once, dropped when we write a
+note on the candidate, and never cached when the lookup failed.
+"""
+import time
+from unittest.mock import MagicMock, patch
+
+from bullhorn_service.notes_cache import (
+    CandidateNotesCache,
+    candidate_notes_cache,
+    parse_candidate_notes,
+)
+
+BASE_URL = 'https://rest.example/'
+
+
+def _notes_response(status=200, notes=None):
+    resp = MagicMock()
+    resp.status_code = status
+    resp.headers = {'content-type': 'application/json'}
+    resp.text = '{}'
+    resp.json.return_value = {'data': {'notes': {'data': notes or [], 'total': len(notes or [])}}}
+    return resp
+
+
+def _bullhorn(*responses):
+    bullhorn = MagicMock()
+    bullhorn.base_url = BASE_URL
+    bullhorn.rest_token = 'tok'
+    bullhorn.session.get.side_effect = list(responses)
+    return bullhorn
+
+
+def _make_cvs():
+    from candidate_vetting_service import CandidateVettingService
+    return CandidateVettingService.__new__(CandidateVettingService)
+
+
+def _human_note(minutes_ago=5):
+    return {
+        'id': 1,
+        'action': 'Phone Call',
+        'dateAdded': int((time.time() - minutes_ago * 60) * 1000),
+        'commentingPerson': {'id': 42, 'firstName': 'Rita', 'lastName': 'Recruiter'},
+    }
+
+
+def test_parse_accepts_wrapped_and_bare_associations():
+    note = {'id': 1}
+    assert parse_candidate_notes({'data': {'notes': {'data': [note, 'x']}}}) == [note]
+    assert parse_candidate_notes({'data': {'notes': [note]}}) == [note]
+    assert parse_candidate_notes({'data': None}) == []
+    assert parse_candidate_notes(None) == []
+
+
+def test_repeated_gate_reads_share_one_fetch():
+    cvs = _make_cvs()
+    bullhorn = _bullhorn(_notes_response(notes=[_human_note()]))
+
+    first = cvs._has_recent_recruiter_activity(bullhorn, 7001, 60, api_user_ids=[1])
+    second = cvs._has_recent_recruiter_activity(bullhorn, 7001, 60, api_user_ids=[1])
+
+    assert first[0] is True and second[0] is True
+    assert bullhorn.session.get.call_count == 1
+    assert candidate_notes_cache.hits == 1
+
+
+def test_failed_lookup_is_not_cached():
+    cvs = _make_cvs()
+    bullhorn = _bullhorn(_notes_response(status=404), _notes_response(notes=[_human_note()]))
+
+    assert cvs._has_recent_recruiter_activity(bullhorn, 7002, 60, api_user_ids=[1]) == (False, None)
+    assert candidate_notes_cache.get(BASE_URL, 7002) is None
+    active, _ = cvs._has_recent_recruiter_activity(bullhorn, 7002, 60, api_user_ids=[1])
+
+    assert active is True
+    assert bullhorn.session.get.call_count == 2
+
+
+def test_creating_a_note_invalidates_the_candidate():
+    from bullhorn_service import BullhornService
+    svc = BullhornService(client_id='c', client_secret='s', username='notes-cache', password='p')
+    svc.rest_token = 'tok'
+    svc.base_url = BASE_URL
+    candidate_notes_cache.put(BASE_URL, 7003, [_human_note()])
+    candidate_notes_cache.put(BASE_URL, 7004, [_human_note()])
+
+    put_resp = MagicMock(status_code=200)
+    put_resp.json.return_value = {'changedEntityId': 99}
+    with patch.object(svc.session, 'put', return_value=put_resp), \
+            patch.object(svc, '_safe_json_parse', return_value={'changedEntityId': 99}):
+        assert svc.create_candidate_note(7003, 'Screened') == 99
+
+    assert candidate_notes_cache.get(BASE_URL, 7003) is None
+    assert candidate_notes_cache.get(BASE_URL, 7004) is not None
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    cache = CandidateNotesCache(ttl=10)
+    clock = [1000.0]
+    monkeypatch.setattr('bullhorn_service.notes_cache.time.monotonic', lambda: clock[0])
+
+    cache.put(BASE_URL, '7005', [{'id': 1}])
+    assert cache.get(BASE_URL, 7005) == [{'id': 1}]
+    clock[0] += 11
+    assert cache.get(BASE_URL, 7005) is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_entries_are_scoped_per_rest_url():
+    cache = CandidateNotesCache()
+    cache.put(BASE_URL, 7006, [{'id': 1}])
+    assert cache.get('https://other.example/', 7006) is None
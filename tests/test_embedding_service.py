@@ -682,6 +682,241 @@ class TestJobEmbeddingCaching:
             db.session.commit()
 
 
+class TestJobEmbeddingIndex:
+    """Tests for packed float32 storage and the in-process job matrix."""
+    
+    def test_pack_unpack_round_trip(self):
+        """Packed float32 blobs decode back to the same vector."""
+        from services.vector_index import pack_vector, unpack_vector
+        
+        vec = [0.5, -0.25, 1.0, 0.0]
+        blob = pack_vector(vec)
+        
+        assert len(blob) == 4 * len(vec)
+        assert unpack_vector(blob) == vec
+        assert unpack_vector(b'') is None
+        assert unpack_vector(b'abc') is None
+    
+    def test_flat_index_scores_and_tags(self):
+        """Index rows are normalised, tag-checked, and scored by mat-vec."""
+        from services.vector_index import FlatVectorIndex
+        
+        index = FlatVectorIndex()
+        index.upsert(1, [2.0, 0.0, 0.0], 'h1')
+        index.upsert(2, [0.0, 3.0, 0.0], 'h2')
+        
+        assert index.has_current(1, 'h1')
+        assert not index.has_current(1, 'stale')
+        
+        scores = index.similarities([1.0, 0.0, 0.0], [1, 2, 3])
+        assert scores[1] == pytest.approx(1.0)
+        assert scores[2] == pytest.approx(0.0)
+        assert 3 not in scores
+        
+        index.remove(1)
+        assert len(index) == 1
+        assert index.top_k([0.0, 1.0, 0.0], 5) == [(2, pytest.approx(1.0))]
+    
+    def test_cache_miss_writes_blob_and_updates_index(self, app):
+        """A new job embedding is stored as float32 and lands in the index."""
+        from embedding_service import EmbeddingService, get_job_embedding_index
+        from models import JobEmbedding
+        from services.vector_index import unpack_vector
+        from app import db
+        
+        service = EmbeddingService()
+        new_vec = [0.25] * 8
+        service.generate_embedding = MagicMock(return_value=new_vec)
+        
+        with app.app_context():
+            description = "Index-backed job description"
+            service.get_job_embedding(996, description, "Indexed Job")
+            
+            cached = JobEmbedding.query.filter_by(bullhorn_job_id=996).first()
+            assert unpack_vector(cached.embedding_blob) == new_vec
+            assert get_job_embedding_index().has_current(
+                996, EmbeddingService.compute_description_hash(description)
+            )
+            
+            db.session.delete(cached)
+            db.session.commit()
+    
+    def test_filter_uses_index_without_per_job_lookup(self):
+        """Jobs already in the index are scored without get_job_embedding."""
+        from embedding_service import EmbeddingService, get_job_embedding_index
+        
+        service = EmbeddingService()
+        service.is_filter_enabled = MagicMock(return_value=True)
+        service.get_similarity_threshold = MagicMock(return_value=0.5)
+        service.generate_embedding = MagicMock(return_value=[1.0, 0.0, 0.0, 0.0, 0.0])
+        service.get_job_embedding = MagicMock()
+        service._save_filter_logs = MagicMock()
+        
+        index = get_job_embedding_index()
+        index.clear()
+        index.refresh_from_db = MagicMock(return_value=0)
+        jobs = [
+            {'id': 501, 'title': 'Close', 'description': 'close match'},
+            {'id': 502, 'title': 'Far', 'description': 'far match'},
+        ]
+        index.upsert(501, [0.9, 0.1, 0.0, 0.0, 0.0], EmbeddingService.compute_description_hash('close match'))
+        index.upsert(502, [0.0, 0.0, 1.0, 0.0, 0.0], EmbeddingService.compute_description_hash('far match'))
+        
+        try:
+            result, filtered_count = service.filter_relevant_jobs(
+                "Resume text", jobs, {'id': 100, 'name': 'Test'}, 1
+            )
+        finally:
+            index.clear()
+            del index.refresh_from_db
+        
+        assert [j['id'] for j in result] == [501]
+        assert filtered_count == 1
+        service.get_job_embedding.assert_not_called()
+
+
+class TestBatchJobEmbedding:
+    """Tests for the multi-input cache-miss path and pre-warm."""
+    
+    @staticmethod
+    def _fake_response(inputs):
+        data = [MagicMock(index=i, embedding=[float(len(t)), 1.0]) for i, t in enumerate(inputs)]
+        return MagicMock(data=list(reversed(data)), usage=None)
+    
+    def test_batches_respect_token_budget(self):
+        """Inputs are split across requests by token budget, results stay aligned."""
+        import embedding_service
+        from embedding_service import EmbeddingService
+        
+        service = EmbeddingService()
+        client = MagicMock()
+        client.embeddings.create.side_effect = lambda input, model: self._fake_response(input)
+        service.openai_client = client
+        service.count_tokens = MagicMock(return_value=40)
+        
+        with patch.object(embedding_service, 'EMBEDDING_BATCH_TOKEN_BUDGET', 100):
+            result = service.generate_embeddings_batch(['a', 'bb', '', 'ccc'])
+        
+        assert client.embeddings.create.call_count == 2
+        assert result == [[1.0, 1.0], [2.0, 1.0], None, [3.0, 1.0]]
+    
+    def test_embed_missing_jobs_skips_hits_and_upserts(self, app):
+        """Only stale/missing jobs are embedded; rows land in one commit."""
+        from embedding_service import EmbeddingService
+        from models import JobEmbedding
+        from app import db
+        
+        service = EmbeddingService()
+        service.openai_client = MagicMock()
+        service.generate_embeddings_batch = MagicMock(return_value=[[0.1, 0.2], [0.3, 0.4]])
+        
+        with app.app_context():
+            hit = JobEmbedding(
+                bullhorn_job_id=981,
+                job_title='Hit',
+                description_hash=EmbeddingService.compute_description_hash('unchanged'),
+                embedding_vector=json.dumps([1.0, 0.0]),
+                embedding_model='text-embedding-3-large'
+            )
+            stale = JobEmbedding(
+                bullhorn_job_id=982,
+                job_title='Stale',
+                description_hash='old',
+                embedding_vector=json.dumps([1.0, 0.0]),
+                embedding_model='text-embedding-3-large'
+            )
+            db.session.add_all([hit, stale])
+            db.session.commit()
+            
+            generated = service.embed_missing_jobs([
+                {'id': 981, 'title': 'Hit', 'description': 'unchanged'},
+                {'id': 982, 'title': 'Stale', 'description': 'changed'},
+                {'id': 983, 'title': 'New', 'description': 'brand new'},
+            ])
+            
+            assert set(generated) == {982, 983}
+            texts = service.generate_embeddings_batch.call_args[0][0]
+            assert texts == ['changed', 'brand new']
+            rows = {r.bullhorn_job_id: r for r in JobEmbedding.query.filter(
+                JobEmbedding.bullhorn_job_id.in_([981, 982, 983])).all()}
+            assert json.loads(rows[981].embedding_vector) == [1.0, 0.0]
+            assert json.loads(rows[983].embedding_vector) == [0.3, 0.4]
+            
+            for row in rows.values():
+                db.session.delete(row)
+            db.session.commit()
+
+
+class TestEmbeddingCache:
+    """Tests for the shared (model, text hash) embedding cache."""
+
+    @staticmethod
+    def _service(vector):
+        from embedding_service import EmbeddingService
+
+        service = EmbeddingService()
+        client = MagicMock()
+        client.embeddings.create.return_value = MagicMock(data=[MagicMock(embedding=vector)])
+        service.openai_client = client
+        return service, client
+
+    def test_repeat_text_is_served_from_cache(self, app):
+        """Whitespace-only differences hit the cache; the API is called once."""
+        service, client = self._service([0.5, 0.25])
+
+        first = service.generate_embedding("Senior  Python\nEngineer")
+        second = service.generate_embedding("Senior Python Engineer")
+
+        assert first == second == [0.5, 0.25]
+        client.embeddings.create.assert_called_once()
+
+    def test_db_tier_survives_lru_clear(self, app):
+        """A cold LRU (new worker) is refilled from the embedding_cache table."""
+        from models import EmbeddingCacheEntry
+        from services.embedding_cache import get_embedding_cache
+
+        service, client = self._service([0.5, 0.25])
+        service.generate_embedding("Data engineer resume")
+        assert EmbeddingCacheEntry.query.count() == 1
+
+        get_embedding_cache().clear()
+        assert service.generate_embedding("Data engineer resume") == [0.5, 0.25]
+        client.embeddings.create.assert_called_once()
+
+    def test_cache_is_keyed_by_model(self, app):
+        """The same text under a different model is a miss."""
+        service, client = self._service([0.5, 0.25])
+
+        service.generate_embedding("Cloud architect")
+        service._generate_with_model("Cloud architect", 'text-embedding-3-small', 'embedding_service.shadow')
+
+        assert client.embeddings.create.call_count == 2
+
+    def test_batch_only_sends_misses(self, app):
+        """generate_embeddings_batch skips texts already cached."""
+        service, client = self._service([0.5, 0.25])
+        service.generate_embedding("already cached")
+        client.embeddings.create.reset_mock()
+        client.embeddings.create.side_effect = lambda input, model: MagicMock(
+            data=[MagicMock(index=i, embedding=[1.0, float(i)]) for i in range(len(input))]
+        )
+
+        result = service.generate_embeddings_batch(["already cached", "fresh text"])
+
+        assert result == [[0.5, 0.25], [1.0, 0.0]]
+        assert client.embeddings.create.call_args[1]['input'] == ["fresh text"]
+
+    def test_kill_switch_bypasses_cache(self, app):
+        """EMBEDDING_CACHE_ENABLED=false calls the API every time."""
+        service, client = self._service([0.5, 0.25])
+
+        with patch.dict(os.environ, {'EMBEDDING_CACHE_ENABLED': 'false'}):
+            service.generate_embedding("Nurse practitioner")
+            service.generate_embedding("Nurse practitioner")
+
+        assert client.embeddings.create.call_count == 2
+
+
 class TestFilterLogCreation:
     """Tests for EmbeddingFilterLog audit trail."""
     
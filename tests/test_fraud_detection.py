@@ -1601,3 +1601,76 @@ def test_processing_enrich_skips_when_not_qualified(_fraud_db):
             {'id': 9504, 'email': 'nq@example.com'}, log,
         )
         mock_engine_cls.assert_not_called()
+
+
+def test_resume_content_hash_normalises_whitespace():
+    a = fsig.resume_content_hash("Senior  Engineer\n\nPython\tSQL ")
+    assert a == fsig.resume_content_hash("Senior Engineer Python SQL")
+    assert a == fsig.resume_content_hash("Senior Engineer\x00 Python SQL")
+    assert a != fsig.resume_content_hash("Senior Engineer Python")
+    assert fsig.resume_content_hash(None) == ""
+    assert fsig.resume_content_hash("  \n ") == ""
+
+
+def test_vetting_log_keeps_resume_hash_in_step(_fraud_db):
+    db, Assessment, VettingLog, VettingConfig = _fraud_db
+    log = VettingLog(bullhorn_candidate_id=7401, status="processing",
+                     resume_text="DATA ENGINEER " * 20)
+    assert log.resume_text_hash == fsig.resume_content_hash("DATA ENGINEER " * 20)
+    log.resume_text = None
+    assert log.resume_text_hash is None
+
+
+def test_engine_resume_reuse_matches_reformatted_resume(_fraud_db):
+    """The indexed lookup treats whitespace-only re-extractions as the same
+    résumé."""
+    db, Assessment, VettingLog, VettingConfig = _fraud_db
+    from fraud_detection.engine import FraudSignalEngine
+
+    base = "EXPERIENCED SOFTWARE ENGINEER " * 20
+    db.session.add(VettingLog(
+        bullhorn_candidate_id=7501, candidate_name="Alice Prior",
+        candidate_email="alice@x.com", status="completed",
+        resume_text=base.replace(" ", "\n")))
+    db.session.add(VettingLog(
+        bullhorn_candidate_id=7502, candidate_name="Sandbox Row",
+        candidate_email="sb@x.com", status="completed", is_sandbox=True,
+        resume_text=base))
+    log = VettingLog(bullhorn_candidate_id=7503, candidate_name="Carol Latest",
+                     candidate_email="carol@x.com", status="processing",
+                     resume_text=base)
+    db.session.add(log)
+    db.session.commit()
+
+    reuse = FraudSignalEngine()._count_resume_reuse(7503, log)
+    assert [item["candidate_id"] for item in reuse["genuine"]] == [7501]
+    assert reuse["duplicates"] == []
+
+
+def test_resume_hash_backfill_fills_legacy_rows(_fraud_db):
+    db, Assessment, VettingLog, VettingConfig = _fraud_db
+    from sqlalchemy import update
+    from tasks.vetting import run_resume_hash_backfill
+
+    texts = ["RESUME NUMBER %d " % i * 20 for i in range(5)]
+    for i, text in enumerate(texts):
+        db.session.add(VettingLog(bullhorn_candidate_id=7600 + i, status="completed", resume_text=text))
+    db.session.add(VettingLog(bullhorn_candidate_id=7699, status="completed"))
+    db.session.commit()
+    # Simulate rows written before the column existed.
+    db.session.execute(update(VettingLog).values(resume_text_hash=None))
+    db.session.commit()
+
+    summary = run_resume_hash_backfill(batch_size=2, max_batches=10)
+
+    assert summary == {'updated': 5, 'batches': 3}
+    db.session.expire_all()
+    hashes = {
+        row.bullhorn_candidate_id: row.resume_text_hash
+        for row in VettingLog.query.filter(VettingLog.bullhorn_candidate_id.between(7600, 7699))
+    }
+    assert hashes == {
+        **{7600 + i: fsig.resume_content_hash(t) for i, t in enumerate(texts)},
+        7699: None,
+    }
+    assert run_resume_hash_backfill(batch_size=2)['updated'] == 0
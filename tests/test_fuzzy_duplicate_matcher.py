@@ -15,6 +15,7 @@ from fuzzy_duplicate_matcher import (
     PRE_FILTER_COSINE_THRESHOLD,
     FuzzyDuplicateMatcher,
 )
+from services.vector_index import ProfileEmbeddingIndex
 
 
 # ── Profile text builder ────────────────────────────────────────────────────
@@ -30,10 +31,18 @@ def _make_matcher(**overrides):
 
     openai_client = overrides.pop('openai_client', MagicMock())
 
+    # Default to an index that never loads so the DB-scan path is exercised;
+    # index-backed tests pass their own populated index.
+    profile_index = overrides.pop('profile_index', None)
+    if profile_index is None:
+        profile_index = ProfileEmbeddingIndex(snapshot_dir='/nonexistent')
+        profile_index.refresh_from_db = MagicMock(return_value=0)
+
     return FuzzyDuplicateMatcher(
         bullhorn_service=bh,
         embedding_service=embedding_service,
         openai_client=openai_client,
+        profile_index=profile_index,
         **overrides,
     )
 
@@ -156,6 +165,54 @@ def test_cosine_prefilter_excludes_target_id(monkeypatch):
     assert 200 in ids
 
 
+def _loaded_index(vectors):
+    index = ProfileEmbeddingIndex(snapshot_dir='/nonexistent')
+    for cid, vec in vectors.items():
+        index.upsert(cid, vec, f'hash-{cid}')
+    index._bootstrapped = True
+    index.refresh_from_db = MagicMock(return_value=0)
+    return index
+
+
+def test_cosine_prefilter_uses_index_without_recency_cap(monkeypatch):
+    """The index path sees every cached row — no scan limit applies."""
+    import models as models_module
+
+    index = _loaded_index({
+        100: [1.0, 0.0, 0.0],   # target — excluded
+        300: [0.98, 0.02, 0.0],
+        301: [0.0, 1.0, 0.0],   # below threshold
+    })
+    fake_model = MagicMock()
+    (fake_model.query.with_entities.return_value
+     .filter.return_value.all.return_value) = [(300, 'Old Applicant', 'snippet')]
+    monkeypatch.setattr(models_module, 'CandidateProfileEmbedding', fake_model)
+
+    matcher = _make_matcher(profile_index=index, cache_scan_limit=0)
+    results = matcher.find_top_candidates_by_cosine([1.0, 0.0, 0.0], exclude_ids=[100])
+
+    assert [r[0] for r in results] == [300]
+    assert results[0][2] == 'Old Applicant'
+    fake_model.query.order_by.assert_not_called()
+
+
+def test_profile_index_snapshot_round_trip(tmp_path):
+    """A saved snapshot maps back with the same keys, tags and scores."""
+    index = ProfileEmbeddingIndex(snapshot_dir=str(tmp_path))
+    index.upsert(1, [1.0, 0.0], 'h1')
+    index.upsert(2, [0.0, 2.0], 'h2')
+    assert index.snapshot()
+
+    restored = ProfileEmbeddingIndex(snapshot_dir=str(tmp_path))
+    restored._bootstrap_from_snapshot()
+
+    assert len(restored) == 2
+    assert restored.has_current(2, 'h2')
+    assert restored.top_k([0.0, 1.0], 1)[0][0] == 2
+    restored.upsert(3, [1.0, 1.0], 'h3')  # grows past the mapped rows
+    assert len(restored) == 3
+
+
 # ── GPT scoring (Layer B) ───────────────────────────────────────────────────
 
 def _stub_openai_response(content):
@@ -0,0 +1,80 @@
+"""
+Tests for GraphMailService.get_attachments_batch — the Graph JSON $batch
+prefetch the mailbox poller uses instead of one listing call per message.
+"""
+import base64
+from unittest.mock import MagicMock, patch
+
+
+def _service():
+    with patch('graph_mail_service.resolve_graph_auth_mode', return_value='replit'):
+        from graph_mail_service import GraphMailService
+        svc = GraphMailService()
+    svc._user_base = lambda: '/me'
+    return svc
+
+
+def _att(name, content=b'data'):
+    return {
+        '@odata.type': '#microsoft.graph.fileAttachment',
+        'name': name,
+        'contentType': 'application/pdf',
+        'contentBytes': base64.b64encode(content).decode('ascii'),
+    }
+
+
+def _batch_response(requests_body, status_for=lambda mid: 200):
+    responses = []
+    for req in requests_body['requests']:
+        mid = req['url'].split('/messages/')[1].split('/')[0]
+        status = status_for(mid)
+        body = {'value': [_att(f'{mid}.pdf')]} if status == 200 else {'error': {}}
+        responses.append({'id': req['id'], 'status': status, 'body': body})
+    resp = MagicMock()
+    resp.json.return_value = {'responses': responses}
+    return resp
+
+
+class TestGetAttachmentsBatch:
+    def test_groups_requests_twenty_per_batch(self):
+        svc = _service()
+        calls = []
+
+        def fake_request(method, url, **kw):
+            calls.append((method, url, len(kw['json_body']['requests'])))
+            return _batch_response(kw['json_body'])
+
+        svc._request = fake_request
+        ids = [f'm{i}' for i in range(45)]
+        out = svc.get_attachments_batch(ids)
+
+        assert sorted(n for _, _, n in calls) == [5, 20, 20]
+        assert all(m == 'POST' and u.endswith('/$batch') for m, u, _ in calls)
+        assert set(out) == set(ids)
+        assert out['m7'] == [{
+            'filename': 'm7.pdf',
+            'content': base64.b64encode(b'data').decode('ascii'),
+            'type': 'application/pdf',
+        }]
+
+    def test_failed_sub_request_falls_back_to_single_fetch(self):
+        svc = _service()
+        svc._request = lambda method, url, **kw: _batch_response(
+            kw['json_body'], status_for=lambda mid: 429 if mid == 'b' else 200)
+        svc.get_attachments = MagicMock(return_value=[{'filename': 'retry.pdf'}])
+
+        out = svc.get_attachments_batch(['a', 'b', 'c'])
+
+        svc.get_attachments.assert_called_once_with('b')
+        assert out['b'] == [{'filename': 'retry.pdf'}]
+        assert out['a'][0]['filename'] == 'a.pdf'
+
+    def test_batch_call_failure_falls_back_per_message(self):
+        svc = _service()
+        svc._request = MagicMock(side_effect=RuntimeError('boom'))
+        svc.get_attachments = MagicMock(side_effect=lambda mid: [{'filename': mid}])
+
+        out = svc.get_attachments_batch(['x', 'y', 'x', None])
+
+        assert out == {'x': [{'filename': 'x'}], 'y': [{'filename': 'y'}]}
+        assert svc.get_attachments.call_count == 2
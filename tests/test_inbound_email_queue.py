@@ -0,0 +1,299 @@
+"""
+Tests for the durable inbound email queue (inbound_email_queue).
+
+The webhook and mailbox-pull persist each message as an InboundEmailJob and a
+bounded drain pool processes them by priority with retry/backoff. These tests
+drive the queue inline (pool size 0) so no background thread races them.
+"""
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+
+@pytest.fixture
+def queue(app, monkeypatch):
+    import inbound_email_queue
+    from extensions import db
+    from models import InboundEmailJob
+
+    monkeypatch.setattr(inbound_email_queue._POOL, 'size', 0)
+    with app.app_context():
+        InboundEmailJob.query.delete()
+        db.session.commit()
+        yield inbound_email_queue
+        db.session.rollback()
+        InboundEmailJob.query.delete()
+        db.session.commit()
+
+
+def _use_handler(monkeypatch, queue, handler):
+    monkeypatch.setattr(queue, '_resolve_handler', lambda kind: handler)
+
+
+class TestPayloadEncoding:
+    def test_bytes_and_info_dicts_round_trip(self):
+        from inbound_email_queue import decode_payload, encode_payload
+        payload = {
+            'from': 'a@example.com',
+            'attachment1': b'%PDF-1.4 \x00\xff',
+            'attachment1_info': {'filename': 'cv.pdf', 'content_type': 'application/pdf'},
+        }
+        assert decode_payload(encode_payload(payload)) == payload
+
+    def test_empty_payload_decodes_to_dict(self):
+        from inbound_email_queue import decode_payload
+        assert decode_payload(None) == {}
+
+
+class TestEnqueueAndClaim:
+    def test_dedupe_key_joins_pending_job(self, queue):
+        first = queue.enqueue('inbound', {'n': 1}, dedupe_key='<m1@x>')
+        again = queue.enqueue('inbound', {'n': 2}, dedupe_key='<m1@x>')
+        other = queue.enqueue('inbound', {'n': 3}, dedupe_key='<m2@x>')
+        assert first == again
+        assert other != first
+
+    def test_unknown_kind_rejected(self, queue):
+        with pytest.raises(ValueError):
+            queue.enqueue('bogus', {})
+
+    def test_claims_lowest_priority_first(self, queue):
+        backfill = queue.enqueue('mailbox', {}, priority=queue.PRIORITY_BACKFILL)
+        live = queue.enqueue('inbound', {}, priority=queue.PRIORITY_LIVE)
+        poll = queue.enqueue('mailbox', {}, priority=queue.PRIORITY_POLL)
+
+        order = []
+        while True:
+            job = queue.claim_next('t')
+            if job is None:
+                break
+            assert job.status == 'running' and job.attempts == 1
+            order.append(job.id)
+        assert order == [live, poll, backfill]
+
+    def test_stale_running_job_is_reclaimed(self, queue):
+        from extensions import db
+        from models import InboundEmailJob
+
+        job_id = queue.enqueue('inbound', {})
+        assert queue.claim_next('dead-worker').id == job_id
+        assert queue.claim_next('other') is None
+
+        job = db.session.get(InboundEmailJob, job_id)
+        job.locked_at = datetime.utcnow() - timedelta(seconds=queue.LEASE_SECONDS + 5)
+        db.session.commit()
+
+        reclaimed = queue.claim_next('other')
+        assert reclaimed.id == job_id
+        assert reclaimed.locked_by == 'other'
+        assert reclaimed.attempts == 2
+
+
+class TestRunAndRetry:
+    def test_lease_is_renewed_while_a_slow_handler_runs(self, app, queue, monkeypatch):
+        import time
+        from extensions import db
+        from models import InboundEmailJob
+
+        monkeypatch.setattr(queue, 'LEASE_HEARTBEAT_SECONDS', 0.05)
+        leases = []
+
+        def slow(a, kind, payload):
+            claimed = db.session.get(InboundEmailJob, job_id).locked_at
+            time.sleep(0.3)
+            db.session.rollback()
+            leases.append((claimed, db.session.get(InboundEmailJob, job_id).locked_at))
+            return {'success': True}
+
+        _use_handler(monkeypatch, queue, slow)
+        job_id = queue.enqueue('inbound', {})
+
+        assert queue.run_next(app) is True
+        claimed, renewed = leases[0]
+        assert renewed > claimed
+        assert db.session.get(InboundEmailJob, job_id).status == 'done'
+
+    def test_success_stores_result_and_drops_payload(self, app, queue, monkeypatch):
+        from extensions import db
+        from models import InboundEmailJob
+
+        seen = []
+        _use_handler(monkeypatch, queue, lambda a, kind, payload: seen.append(payload) or {
+            'success': True, 'candidate_id': 42, 'resume_text': 'not kept'})
+        job_id = queue.enqueue('inbound', {'attachment1': b'raw'})
+
+        assert queue.run_next(app) is True
+        assert seen == [{'attachment1': b'raw'}]
+        job = db.session.get(InboundEmailJob, job_id)
+        assert job.status == 'done'
+        assert job.payload_json is None
+        assert '"candidate_id": 42' in job.result_json
+        assert 'resume_text' not in job.result_json
+        assert queue.run_next(app) is False
+
+    def test_exception_backs_off_then_dead_letters(self, app, queue, monkeypatch):
+        from extensions import db
+        from models import InboundEmailJob
+
+        def boom(a, kind, payload):
+            raise RuntimeError('bullhorn down')
+
+        _use_handler(monkeypatch, queue, boom)
+        monkeypatch.setattr(queue, 'MAX_ATTEMPTS', 2)
+        job_id = queue.enqueue('inbound', {})
+
+        before = datetime.utcnow()
+        assert queue.run_next(app) is True
+        job = db.session.get(InboundEmailJob, job_id)
+        assert job.status == 'queued'
+        assert job.attempts == 1
+        assert 'bullhorn down' in job.last_error
+        assert job.next_attempt_at >= before + timedelta(seconds=queue.RETRY_BASE_SECONDS - 1)
+        # Backoff not elapsed yet → nothing claimable.
+        assert queue.run_next(app) is False
+
+        job.next_attempt_at = datetime.utcnow() - timedelta(seconds=1)
+        db.session.commit()
+        assert queue.run_next(app) is True
+        db.session.expire_all()
+        job = db.session.get(InboundEmailJob, job_id)
+        assert job.status == 'dead'
+        assert job.attempts == 2
+
+    def test_retry_delay_is_exponential_and_capped(self, queue):
+        base = queue.RETRY_BASE_SECONDS
+        assert queue.retry_delay(1) == base
+        assert queue.retry_delay(3) == base * 4
+        assert queue.retry_delay(50) == queue.RETRY_MAX_SECONDS
+
+    def test_wait_for_drains_inline_without_pool(self, app, queue, monkeypatch):
+        _use_handler(monkeypatch, queue, lambda a, kind, payload: {'success': payload['ok']})
+        ok = queue.enqueue('inbound', {'ok': True})
+        bad = queue.enqueue('inbound', {'ok': False})
+
+        outcome = queue.wait_for(app, [ok, bad], timeout=5)
+        assert outcome[ok]['status'] == 'done'
+        assert outcome[ok]['result'] == {'success': True}
+        assert outcome[bad]['result'] == {'success': False}
+
+
+class TestQueueDepth:
+    def test_counts_by_status_and_kind(self, queue):
+        from extensions import db
+        from models import InboundEmailJob
+
+        queue.enqueue('inbound', {})
+        queue.enqueue('mailbox', {})
+        retrying = queue.enqueue('mailbox', {})
+        db.session.get(InboundEmailJob, retrying).attempts = 1
+        db.session.commit()
+
+        depth = queue.queue_depth()
+        assert depth['queued'] == 3
+        assert depth['retrying'] == 1
+        assert depth['queued_by_kind'] == {'inbound': 1, 'mailbox': 2}
+        assert depth['workers_max'] == 0
+
+
+class TestWebhookEnqueues:
+    SECRET = 'queue-test-secret'
+
+    def test_webhook_persists_job_and_acks(self, client, queue, monkeypatch):
+        from extensions import db
+        from models import InboundEmailJob
+
+        monkeypatch.setenv('SENDGRID_INBOUND_WEBHOOK_SECRET', self.SECRET)
+        resp = client.post(
+            f'/api/email/inbound?webhook_secret={self.SECRET}',
+            data={'from': 'a@example.com', 'to': 'scout-vetting@parse.lyntrix.ai',
+                  'subject': 'Re: [SV-1]', 'headers': 'Message-ID: <abc@x>\n'},
+        )
+        assert resp.status_code == 200
+        body = resp.get_json()
+        db.session.rollback()
+        job = db.session.get(InboundEmailJob, body['job_id'])
+        assert job.kind == 'scout_vetting'
+        assert job.dedupe_key == '<abc@x>'
+        assert job.status == 'queued'
+
+    def test_webhook_returns_503_when_queue_unavailable(self, client, queue, monkeypatch):
+        monkeypatch.setenv('SENDGRID_INBOUND_WEBHOOK_SECRET', self.SECRET)
+        monkeypatch.setattr(queue, 'enqueue', MagicMock(side_effect=RuntimeError('db down')))
+        resp = client.post(
+            f'/api/email/inbound?webhook_secret={self.SECRET}',
+            data={'from': 'a@example.com', 'subject': 'Hi'},
+        )
+        assert resp.status_code == 503
+        assert resp.get_json()['error'] == 'queue_unavailable'
+
+
+class TestMailboxPullThroughQueue:
+    def test_cycle_advances_cursor_through_contiguous_successes(self, app, queue):
+        from models import VettingConfig
+        from tasks.mailbox_pull import run_mailbox_pull_cycle
+
+        messages = [
+            {'id': 'g1', 'internetMessageId': '<1@x>', 'receivedDateTime': '2026-01-01T00:00:01Z'},
+            {'id': 'g2', 'internetMessageId': '<2@x>', 'receivedDateTime': '2026-01-01T00:00:02Z'},
+            {'id': 'g3', 'internetMessageId': '<3@x>', 'receivedDateTime': '2026-01-01T00:00:03Z'},
+        ]
+        outcomes = {'g1': {'success': True}, 'g2': {'success': False}, 'g3': {'success': True}}
+        service = MagicMock()
+        service.list_messages.return_value = messages
+
+        VettingConfig.set_value('mailbox_pull_enabled', 'true')
+        VettingConfig.set_value('mailbox_pull_high_water', '2026-01-01T00:00:00Z')
+        try:
+            with patch('graph_mail_service.GraphMailService', return_value=service), \
+                    patch('tasks.mailbox_pull._process_one',
+                          side_effect=lambda svc, msg, atts=None: outcomes[msg['id']]) as proc:
+                run_mailbox_pull_cycle(app)
+
+            assert proc.call_count == 3
+            assert VettingConfig.get_value('mailbox_pull_high_water') == '2026-01-01T00:00:01Z'
+            assert VettingConfig.get_value('mailbox_pull_last_count') == '2'
+            assert queue.queue_depth()['done'] == 3
+        finally:
+            from extensions import db
+            db.session.rollback()
+            VettingConfig.query.filter(
+                VettingConfig.setting_key.like('mailbox_pull_%')
+            ).delete(synchronize_session=False)
+            db.session.commit()
+
+    def test_backfill_prefetches_attachments_and_skips_known_messages(self, app, queue):
+        from extensions import db
+        from models import ParsedEmail
+        from tasks.mailbox_pull import run_mailbox_backfill
+
+        db.session.add(ParsedEmail(
+            message_id='<seen@x>', sender_email='s@x', recipient_email='apply@x',
+            status='completed'))
+        db.session.commit()
+        messages = [
+            {'id': 'g1', 'internetMessageId': '<new@x>', 'hasAttachments': True},
+            {'id': 'g2', 'internetMessageId': '<seen@x>', 'hasAttachments': True},
+            {'id': 'g3', 'internetMessageId': '<plain@x>', 'hasAttachments': False},
+        ]
+        service = MagicMock()
+        service.list_messages_page.return_value = (messages, None)
+        service.get_attachments_batch.return_value = {'g1': [{'filename': 'cv.pdf'}]}
+        seen = {}
+
+        def fake_process(svc, msg, attachments=None):
+            seen[msg['id']] = attachments
+            return {'success': True}
+
+        try:
+            with patch('graph_mail_service.GraphMailService', return_value=service), \
+                    patch('tasks.mailbox_pull._process_one', side_effect=fake_process):
+                summary = run_mailbox_backfill(app, '2026-01-01T00:00:00Z', limit=10)
+
+            service.get_attachments_batch.assert_called_once_with(['g1'])
+            assert seen == {'g1': [{'filename': 'cv.pdf'}], 'g2': [], 'g3': None}
+            assert summary['processed'] == 3
+            assert summary['pending'] == 0
+        finally:
+            ParsedEmail.query.filter_by(message_id='<seen@x>').delete()
+            db.session.commit()
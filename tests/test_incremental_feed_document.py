@@ -0,0 +1,183 @@
+"""Tests for the batched feed document used by IncrementalMonitoringService.
+
+A monitoring cycle must parse the feed once, apply every add/remove/update
+in memory, and write the file exactly once no matter how many jobs changed.
+"""
+import logging
+from unittest.mock import MagicMock, patch
+
+from lxml import etree
+
+from incremental_monitoring_service import IncrementalMonitoringService, XMLFeedDocument
+
+
+def _init_svc():
+    svc = IncrementalMonitoringService.__new__(IncrementalMonitoringService)
+    svc.logger = logging.getLogger('test_incremental_feed_document')
+    svc.parser = etree.XMLParser(strip_cdata=False, recover=True)
+    return svc
+
+
+def _job(job_id, title='Engineer', ref='REF0000001'):
+    return {
+        'bhatsid': str(job_id), 'title': title, 'company': 'Myticas Consulting',
+        'date': 'January 01, 2026', 'referencenumber': ref, 'url': 'https://x',
+        'description': '<p>desc</p>', 'jobtype': 'Contract', 'city': 'Chicago',
+        'state': 'IL', 'country': 'United States',
+    }
+
+
+def _seed(tmp_path, svc, ids):
+    xml_file = str(tmp_path / 'feed.xml')
+    doc = XMLFeedDocument.load(xml_file, svc.parser)
+    for job_id in ids:
+        doc.add(svc._create_job_element(_job(job_id)))
+    assert doc.commit(svc._write_xml_atomically)
+    return xml_file
+
+
+def test_missing_file_starts_from_scaffold(tmp_path):
+    svc = _init_svc()
+    doc = XMLFeedDocument.load(str(tmp_path / 'absent.xml'), svc.parser)
+    assert doc.dirty
+    assert len(doc) == 0
+    assert doc.root.find('publisherurl') is not None
+
+
+def test_index_supports_add_remove_replace(tmp_path):
+    svc = _init_svc()
+    xml_file = _seed(tmp_path, svc, [101, 102, 103])
+    doc = XMLFeedDocument.load(xml_file, svc.parser)
+
+    assert doc.job_ids() == {'101', '102', '103'}
+    assert not doc.dirty
+
+    assert doc.remove(102)
+    assert not doc.remove(102)
+    assert doc.replace('103', svc._create_job_element(_job(103, title='Lead Engineer')))
+    assert not doc.replace('999', svc._create_job_element(_job(999)))
+    doc.add(svc._create_job_element(_job(104)))
+
+    assert doc.job_ids() == {'101', '103', '104'}
+    assert doc.commit(svc._write_xml_atomically)
+
+    jobs = svc._load_xml_jobs(xml_file)
+    assert set(jobs) == {'101', '103', '104'}
+    assert jobs['103']['title'] == 'Lead Engineer (103)'
+
+
+def test_replace_keeps_feed_position(tmp_path):
+    svc = _init_svc()
+    xml_file = _seed(tmp_path, svc, [1, 2, 3])
+    doc = XMLFeedDocument.load(xml_file, svc.parser)
+    before = [XMLFeedDocument._job_id(e) for e in doc.root.findall('job')]
+
+    doc.replace('2', svc._create_job_element(_job(2, title='Changed')))
+
+    after = [XMLFeedDocument._job_id(e) for e in doc.root.findall('job')]
+    assert after == before
+
+
+def test_commit_is_noop_when_clean(tmp_path):
+    svc = _init_svc()
+    xml_file = _seed(tmp_path, svc, [1])
+    doc = XMLFeedDocument.load(xml_file, svc.parser)
+    with patch.object(svc, '_write_xml_atomically') as writer:
+        assert doc.commit(writer)
+    writer.assert_not_called()
+
+
+def test_single_change_helpers_still_work(tmp_path):
+    svc = _init_svc()
+    xml_file = str(tmp_path / 'feed.xml')
+
+    assert svc._add_job_to_xml(xml_file, _job(7))
+    assert svc._update_job_in_xml(xml_file, '7', _job(7, title='Updated'))
+    assert svc._load_xml_jobs(xml_file)['7']['title'] == 'Updated (7)'
+    assert svc._remove_job_from_xml(xml_file, '7')
+    assert not svc._remove_job_from_xml(xml_file, '7')
+    assert svc._load_xml_jobs(xml_file) == {}
+
+
+def test_cycle_parses_and_writes_feed_once(tmp_path, monkeypatch):
+    svc = _init_svc()
+    monkeypatch.chdir(tmp_path)
+    xml_file = 'myticas-job-feed-v2.xml'
+    existing = {str(i): _job(i) for i in range(1, 11)}
+    doc = XMLFeedDocument.load(xml_file, svc.parser)
+    for data in existing.values():
+        doc.add(svc._create_job_element(data))
+    doc.commit(svc._write_xml_atomically)
+
+    # Keep 1-5 (5 changed), drop 6-10, add 11-15.
+    bullhorn_jobs = {str(i): {'id': i, 'title': f'Job {i}'} for i in list(range(1, 6)) + list(range(11, 16))}
+
+    svc.bullhorn_service = type('BH', (), {'test_connection': lambda self: True, 'excluded_count': 0})()
+    svc.email_service = None
+    svc.alert_email = None
+    svc.lock_file = str(tmp_path / 'feed.lock')
+
+    def fake_map(job, preserve_ref=''):
+        return _job(job['id'], title=job['title'], ref=preserve_ref or 'NEWREF0001')
+
+    writes = []
+    real_write = svc._write_xml_atomically
+
+    def counting_write(path, tree):
+        writes.append(path)
+        return real_write(path, tree)
+
+    real_parse = etree.parse
+    parses = []
+
+    def counting_parse(*args, **kwargs):
+        parses.append(args[0])
+        return real_parse(*args, **kwargs)
+
+    with patch.object(svc, '_fetch_all_tearsheet_jobs', return_value=bullhorn_jobs), \
+            patch.object(svc, '_map_to_xml_format', side_effect=fake_map), \
+            patch.object(svc, '_has_job_changed', side_effect=lambda bh, xml: bh['id'] == 5), \
+            patch.object(svc, '_write_xml_atomically', side_effect=counting_write), \
+            patch.object(svc, '_log_monitoring_activity'), \
+            patch('incremental_monitoring_service.etree.parse', side_effect=counting_parse), \
+            patch('candidate_vetting_service.CandidateVettingService'):
+        results = svc.run_monitoring_cycle()
+
+    assert results['jobs_added'] == 5
+    assert results['jobs_removed'] == 5
+    assert results['jobs_updated'] == 1
+    assert results['total_jobs'] == 10
+    assert writes == [xml_file]
+    assert parses == [xml_file]
+
+    jobs = svc._load_xml_jobs(xml_file)
+    assert set(jobs) == set(bullhorn_jobs)
+    assert jobs['5']['title'] == 'Job 5 (5)'
+    assert jobs['1']['referencenumber'] == 'REF0000001'
+
+
+def test_failed_write_sends_no_new_job_alerts(tmp_path, monkeypatch):
+    svc = _init_svc()
+    monkeypatch.chdir(tmp_path)
+    xml_file = 'myticas-job-feed-v2.xml'
+    _seed(tmp_path, svc, [])
+    (tmp_path / 'feed.xml').rename(tmp_path / xml_file)
+
+    svc.bullhorn_service = type('BH', (), {'test_connection': lambda self: True, 'excluded_count': 0})()
+    svc.email_service = MagicMock()
+    svc.alert_email = 'alerts@example.com'
+    svc.lock_file = str(tmp_path / 'feed.lock')
+
+    with patch.object(svc, '_fetch_all_tearsheet_jobs', return_value={'21': {'id': 21, 'title': 'Job 21'}}), \
+            patch.object(svc, '_map_to_xml_format', side_effect=lambda job, preserve_ref='': _job(job['id'])), \
+            patch.object(svc, '_write_xml_atomically', return_value=False), \
+            patch.object(svc, '_log_monitoring_activity'), \
+            patch('candidate_vetting_service.CandidateVettingService') as vetting:
+        results = svc.run_monitoring_cycle()
+
+    assert results['cycle_success'] is False
+    assert results['jobs_added'] == 0
+    assert 'XML write failed' in results['errors']
+    svc.email_service.send_new_job_notification.assert_not_called()
+    vetting.return_value.extract_requirements_for_jobs.assert_not_called()
+    assert svc._load_xml_jobs(xml_file) == {}
@@ -0,0 +1,87 @@
+"""InternalJobClassifier keyword engine must score exactly like the original
+per-keyword substring scan it replaced."""
+import random
+import re
+
+import pytest
+
+from job_classification_service import InternalJobClassifier, _KeywordScanner
+
+
+def _reference_classify(clf, title, description):
+    """The pre-scanner algorithm, kept verbatim as the oracle."""
+    title_lower = (title or "").lower().strip()
+    desc_lower = (description or "").lower().strip()
+
+    def best(table, default):
+        name, best_score = default, 0
+        for cat, keywords in table.items():
+            score = sum(3 if kw in title_lower else (1 if kw in desc_lower else 0) for kw in keywords)
+            if score > best_score:
+                best_score, name = score, cat
+        return name
+
+    def word(kw):
+        return bool(re.search(r'(?<![a-z])' + re.escape(kw) + r'(?![a-z])', title_lower))
+
+    seniority = "Mid-Senior level"
+    for level, kws in (
+        ("Executive", ['ceo', 'cto', 'cfo', 'chief', 'president', 'vp', 'vice president', 'executive']),
+        ("Director", ['director', 'head of', 'managing']),
+        ("Mid-Senior level", ['senior', 'sr.', 'sr ', 'lead', 'principal', 'staff']),
+        ("Entry level", ['junior', 'jr.', 'jr ', 'entry', 'associate', 'assistant']),
+        ("Internship", ['intern', 'internship', 'co-op']),
+    ):
+        if any(word(kw) for kw in kws):
+            seniority = level
+            break
+
+    return {
+        'success': True,
+        'job_function': best(clf.function_keywords, "Operations"),
+        'industries': best(clf.industry_keywords, "Professional Services"),
+        'seniority_level': seniority,
+    }
+
+
+@pytest.fixture(scope='module')
+def clf():
+    return InternalJobClassifier()
+
+
+@pytest.mark.parametrize('title,description', [
+    ('Senior Software Engineer', 'Build cloud SaaS products for a banking client.'),
+    ('Jr. Accountant', 'Accounts payable, general ledger and payroll for a hospital.'),
+    ('VP of Sales', 'Own the account executive team across retail stores.'),
+    ('Head of Engineering (W-4499)', '<p>Civil and structural engineering for substation construction.</p>'),
+    ('Summer Intern - Co-op', 'Agricultural research with our farming partners.'),
+    ('Staffing Coordinator', ''),
+    ('', ''),
+    (None, None),
+    ('Product Manager / Product Owner', 'Roadmap and product strategy for e-commerce.'),
+    ('Paralegal', 'Legal services firm - contract review and compliance.'),
+])
+def test_matches_reference_scoring(clf, title, description):
+    assert clf.classify_job(title, description) == _reference_classify(clf, title, description)
+
+
+def test_matches_reference_on_random_keyword_soup(clf):
+    rng = random.Random(20260115)
+    vocab = sorted({kw for table in (clf.function_keywords, clf.industry_keywords)
+                    for kws in table.values() for kw in kws})
+    vocab += ['the', 'with', 'and', 'team', 'senior', 'sr ', 'jr.', 'director', 'intern', '-', '/', 'x']
+    for _ in range(300):
+        title = ''.join(rng.choice(vocab) + rng.choice(['', ' ']) for _ in range(rng.randint(0, 6)))
+        desc = ''.join(rng.choice(vocab) + rng.choice(['', ' ', '. ']) for _ in range(rng.randint(0, 80)))
+        assert clf.classify_job(title, desc) == _reference_classify(clf, title, desc)
+
+
+def test_scanner_finds_overlapping_and_nested_keywords():
+    scanner = _KeywordScanner(['engineer', 'engineering', 'neer', 'ring', 'gin', 'test engineer'])
+    assert scanner.hits('test engineering') == {'engineer', 'engineering', 'neer', 'ring', 'gin', 'test engineer'}
+    assert scanner.hits('enginee') == {'gin'}
+    assert scanner.hits('') == set()
+
+
+def test_tables_are_compiled_once_per_process(clf):
+    assert InternalJobClassifier()._tables is clf._tables
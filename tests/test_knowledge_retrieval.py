@@ -0,0 +1,85 @@
+"""
+Tests for Knowledge Hub retrieval against the cached chunk matrix.
+
+Covers:
+- Top-k ranking + threshold via the vectorised path
+- Chunk content hydrated only for the winners
+- Cache invalidation when a document is deleted
+"""
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+
+@pytest.fixture
+def knowledge_docs(app):
+    from app import db
+    from models import KnowledgeDocument, KnowledgeEntry
+    from scout_support.knowledge import invalidate_knowledge_cache
+
+    docs = []
+    for title, vec in (
+        ('Password Reset SOP', [1.0, 0.0, 0.0]),
+        ('Timesheet Guide', [0.8, 0.6, 0.0]),
+        ('Unrelated Policy', [0.0, 0.0, 1.0]),
+    ):
+        doc = KnowledgeDocument(title=title, doc_type='uploaded', category='sop', status='active')
+        db.session.add(doc)
+        db.session.flush()
+        db.session.add(KnowledgeEntry(
+            document_id=doc.id, chunk_index=0, content=f'{title} body',
+            embedding_vector=json.dumps(vec),
+        ))
+        docs.append(doc)
+    db.session.commit()
+    invalidate_knowledge_cache()
+
+    yield docs
+
+    for doc in docs:
+        if db.session.get(KnowledgeDocument, doc.id) is not None:
+            db.session.delete(doc)
+    db.session.commit()
+    invalidate_knowledge_cache()
+
+
+def _service(query_vec):
+    from scout_support.knowledge import KnowledgeService
+
+    ks = KnowledgeService()
+    ks.openai_client = MagicMock()
+    ks._generate_embedding = MagicMock(return_value=query_vec)
+    return ks
+
+
+def test_retrieval_ranks_by_similarity_above_threshold(knowledge_docs):
+    ks = _service([1.0, 0.0, 0.0])
+
+    results = ks.retrieve_relevant_knowledge('reset my password', top_k=5, threshold=0.5)
+
+    assert [r['title'] for r in results] == ['Password Reset SOP', 'Timesheet Guide']
+    assert results[0]['similarity'] == pytest.approx(1.0)
+    assert results[0]['content'] == 'Password Reset SOP body'
+
+
+def test_retrieval_respects_top_k(knowledge_docs):
+    ks = _service([1.0, 0.0, 0.0])
+
+    results = ks.retrieve_relevant_knowledge('reset my password', top_k=1, threshold=0.0)
+
+    assert [r['title'] for r in results] == ['Password Reset SOP']
+
+
+def test_delete_document_invalidates_matrix(knowledge_docs):
+    from scout_support import knowledge
+
+    ks = _service([1.0, 0.0, 0.0])
+    ks.retrieve_relevant_knowledge('warm the cache', threshold=0.0)
+    assert knowledge._chunk_index is not None
+
+    assert ks.delete_document(knowledge_docs[0].id)
+    assert knowledge._chunk_index is None
+
+    results = ks.retrieve_relevant_knowledge('reset my password', threshold=0.5)
+    assert [r['title'] for r in results] == ['Timesheet Guide']
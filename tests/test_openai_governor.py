@@ -0,0 +1,203 @@
+"""
+Tests for the process-wide OpenAI concurrency governor.
+
+Covers:
+- Reset-duration parsing from rate-limit headers
+- AIMD: additive growth on success, halving + pause on 429 (once per pause)
+- Token buckets seeded from x-ratelimit-* headers
+- Concurrency cap across threads
+- Transport wiring, model extraction and the kill-switch
+- The shared per-process http_client
+"""
+import json
+import threading
+import time
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from services import openai_governor
+from services.openai_governor import (
+    GovernedTransport,
+    ModelLimiter,
+    OpenAIGovernor,
+    parse_reset,
+)
+
+
+def _request(model='gpt-5.4', **extra):
+    body = json.dumps({'model': model, 'input': 'hello', **extra}).encode()
+    return httpx.Request('POST', 'https://api.openai.com/v1/responses', content=body)
+
+
+def _transport(handler, governor):
+    return GovernedTransport(transport=httpx.MockTransport(handler), governor=governor)
+
+
+@pytest.mark.parametrize('raw, expected', [
+    ('1s', 1.0), ('6m0s', 360.0), ('250ms', 0.25), ('1m30.5s', 90.5), ('2', 2.0),
+    (None, None), ('', None), ('soon', None),
+])
+def test_parse_reset(raw, expected):
+    assert parse_reset(raw) == expected
+
+
+def test_success_grows_limit_additively():
+    limiter = ModelLimiter('gpt-5.4')
+    start = limiter.limit
+    for _ in range(int(start)):
+        limiter.acquire(10)
+        limiter.release(httpx.Response(200))
+    assert start + 0.9 < limiter.limit < start + 1.1
+
+
+def test_429_halves_limit_and_pauses_model():
+    governor = OpenAIGovernor()
+    transport = _transport(
+        lambda request: httpx.Response(429, headers={'retry-after': '3'}), governor)
+
+    transport.handle_request(_request())
+
+    stats = governor.stats()['gpt-5.4']
+    assert stats['limit'] == openai_governor.INITIAL_CONCURRENCY / 2
+    assert stats['throttled'] == 1
+    assert 2.0 < stats['paused_for'] <= 3.0
+    assert 'gpt-4.1-mini' not in governor.stats()  # Other models unaffected
+
+
+def test_concurrent_429s_halve_limit_once():
+    limiter = ModelLimiter('gpt-5.4')
+    for _ in range(3):
+        limiter.in_flight += 1  # Three requests already on the wire
+    for _ in range(3):
+        limiter.release(httpx.Response(429, headers={'retry-after': '3'}))
+
+    assert limiter.limit == openai_governor.INITIAL_CONCURRENCY / 2
+    assert limiter.throttled == 3
+
+
+def test_rate_limit_headers_seed_buckets():
+    governor = OpenAIGovernor()
+    headers = {
+        'x-ratelimit-limit-requests': '1000',
+        'x-ratelimit-remaining-requests': '200',
+        'x-ratelimit-limit-tokens': '60000',
+        'x-ratelimit-remaining-tokens': '59000',
+    }
+    transport = _transport(lambda request: httpx.Response(200, headers=headers), governor)
+
+    transport.handle_request(_request())
+
+    limiter = governor.limiter('gpt-5.4')
+    assert limiter.requests.capacity == pytest.approx(1000 * openai_governor.HEADROOM)
+    # Pulled down to the server's remaining figure, less the headroom reserve
+    assert limiter.requests.level <= 200 - 1000 * (1 - openai_governor.HEADROOM) + 1
+    assert limiter.tokens.capacity == pytest.approx(60000 * openai_governor.HEADROOM)
+
+
+def test_concurrency_cap_blocks_extra_requests():
+    limiter = ModelLimiter('gpt-5.4')
+    limiter.limit = 2.0
+    limiter.acquire(1)
+    limiter.acquire(1)
+
+    acquired = threading.Event()
+
+    def third():
+        limiter.acquire(1)
+        acquired.set()
+
+    t = threading.Thread(target=third)
+    t.start()
+    assert not acquired.wait(0.3)
+    limiter.release(None)
+    assert acquired.wait(2)
+    t.join()
+    assert limiter.in_flight == 2
+
+
+def test_max_wait_fails_open():
+    limiter = ModelLimiter('gpt-5.4')
+    limiter.paused_until = time.monotonic() + 60
+    with patch.object(openai_governor, 'MAX_WAIT_SECONDS', 0.2):
+        started = time.monotonic()
+        limiter.acquire(1)
+    assert time.monotonic() - started < 2
+    assert limiter.in_flight == 1
+
+
+def test_transport_keys_limiter_by_request_model():
+    governor = OpenAIGovernor()
+    transport = _transport(lambda request: httpx.Response(200), governor)
+
+    transport.handle_request(_request(model='text-embedding-3-large'))
+
+    assert governor.stats()['text-embedding-3-large']['completed'] == 1
+    assert governor.stats()['text-embedding-3-large']['in_flight'] == 0
+
+
+def test_transport_releases_slot_on_network_error():
+    governor = OpenAIGovernor()
+
+    def boom(request):
+        raise httpx.ConnectError('down')
+
+    transport = _transport(boom, governor)
+    with pytest.raises(httpx.ConnectError):
+        transport.handle_request(_request())
+    assert governor.limiter('gpt-5.4').in_flight == 0
+
+
+def test_kill_switch_bypasses_governor(monkeypatch):
+    monkeypatch.setenv('OPENAI_GOVERNOR_ENABLED', 'false')
+    governor = OpenAIGovernor()
+    transport = _transport(lambda request: httpx.Response(429), governor)
+
+    transport.handle_request(_request())
+
+    assert governor.stats() == {}
+
+
+def test_openai_client_routes_through_governor():
+    """An SDK client built with governed_http_client hits the governor."""
+    from openai import OpenAI
+
+    governor = OpenAIGovernor()
+    payload = {
+        'object': 'list', 'model': 'text-embedding-3-small',
+        'data': [{'object': 'embedding', 'index': 0, 'embedding': [0.1, 0.2]}],
+        'usage': {'prompt_tokens': 1, 'total_tokens': 1},
+    }
+    http_client = httpx.Client(transport=_transport(
+        lambda request: httpx.Response(200, json=payload), governor))
+    client = OpenAI(api_key='test', http_client=http_client, max_retries=0)
+
+    result = client.embeddings.create(input='hi', model='text-embedding-3-small')
+
+    assert result.data[0].embedding == [0.1, 0.2]
+    assert governor.stats()['text-embedding-3-small']['completed'] == 1
+
+
+def test_shared_http_client_is_reused(monkeypatch):
+    monkeypatch.setattr(openai_governor, '_shared_client', None)
+    client = openai_governor.shared_http_client()
+    try:
+        assert openai_governor.shared_http_client() is client
+        assert isinstance(client._transport, GovernedTransport)
+    finally:
+        client.close()
+    assert openai_governor.shared_http_client() is not client
+    openai_governor.shared_http_client().close()
+
+
+def test_governed_client_keeps_sdk_connection_limits():
+    from openai import DEFAULT_CONNECTION_LIMITS
+
+    client = openai_governor.governed_http_client()
+    try:
+        pool = client._transport._transport._pool
+        assert pool._max_connections == DEFAULT_CONNECTION_LIMITS.max_connections
+        assert pool._max_keepalive_connections == DEFAULT_CONNECTION_LIMITS.max_keepalive_connections
+    finally:
+        client.close()
@@ -157,3 +157,79 @@ def test_log_call_with_no_usage_does_not_raise(app):
 def test_pricing_contains_phase_1_models():
     for model in ('gpt-5.4', 'gpt-4.1-mini', 'gpt-4.1-nano', 'gpt-4o-mini', 'text-embedding-3-large'):
         assert model in openai_helper.PRICING, f'PRICING missing {model}'
+
+
+def _writer(monkeypatch, capacity=10, batch_size=3, ok=True):
+    # Drain the process-wide writer first: once _persist_batch is patched its
+    # interval flush would otherwise land rows from earlier tests in `batches`.
+    openai_helper.flush_telemetry()
+    batches = []
+
+    def _fake_persist_batch(payloads, app=None):
+        batches.append(list(payloads))
+        return ok
+
+    monkeypatch.setattr(openai_helper, '_persist_batch', _fake_persist_batch)
+    w = openai_helper._TelemetryWriter(capacity=capacity, batch_size=batch_size,
+                                       flush_interval_ms=50)
+    return w, batches
+
+
+def test_telemetry_writer_flushes_in_batches(monkeypatch):
+    w, batches = _writer(monkeypatch, batch_size=3)
+    for i in range(7):
+        assert w.submit({'i': i}) is True
+    w.shutdown()
+    assert [len(b) for b in batches if b] and sum(len(b) for b in batches) == 7
+    assert all(len(b) <= 3 for b in batches)
+    stats = w.stats()
+    assert stats['written'] == 7
+    assert stats['buffered'] == 0
+    assert stats['dropped'] == 0
+
+
+def test_telemetry_writer_flushes_partial_batch_on_interval(monkeypatch):
+    w, batches = _writer(monkeypatch, batch_size=100)
+    w.submit({'i': 1})
+    deadline = time.time() + 2
+    while not batches and time.time() < deadline:
+        time.sleep(0.02)
+    assert batches == [[{'i': 1}]]
+    w.shutdown()
+
+
+def test_telemetry_writer_drops_on_overflow(monkeypatch):
+    w, _ = _writer(monkeypatch, capacity=2, batch_size=100)
+    # Hold the writer off so the buffer stays full.
+    w._stopping = True
+    assert w.submit({'i': 1}) is True
+    assert w.submit({'i': 2}) is True
+    assert w.submit({'i': 3}) is False
+    stats = w.stats()
+    assert stats['dropped'] == 1
+    assert stats['buffered'] == 2
+
+
+def test_telemetry_writer_counts_failed_batches(monkeypatch):
+    w, _ = _writer(monkeypatch, ok=False)
+    w._stopping = True
+    w.submit({'i': 1})
+    w.submit({'i': 2})
+    w.shutdown()
+    stats = w.stats()
+    assert stats['failed'] == 2
+    assert stats['written'] == 0
+
+
+def test_log_call_enqueues_instead_of_spawning_threads(monkeypatch, app):
+    submitted = []
+    monkeypatch.setattr(openai_helper._writer, 'submit', submitted.append)
+    spawned = []
+    monkeypatch.setattr(openai_helper.threading, 'Thread',
+                        lambda *a, **k: spawned.append(1))
+    resp = _FakeResponse(_FakeUsage(prompt_tokens=10, completion_tokens=5))
+    openai_helper.log_call('test.buffered', 'gpt-4.1-mini', resp)
+    assert spawned == []
+    assert len(submitted) == 1
+    assert submitted[0]['call_site_id'] == 'test.buffered'
+    assert submitted[0]['input_tokens'] == 10
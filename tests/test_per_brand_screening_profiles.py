@@ -174,17 +174,15 @@ class TestConfigResolution:
         env = BullhornEnvironment(screening_config_overrides='{"only_this": "x"}')
         svc = self._service()
         svc._environment_cache = env
-        fake_cfg = MagicMock()
-        fake_cfg.setting_value = 'gpt-5.4'
         with patch('candidate_vetting_service.config.VettingConfig') as VC:
-            VC.query.filter_by.return_value.first.return_value = fake_cfg
+            VC.settings.get.return_value = 'gpt-5.4'
             assert svc.get_config_value('layer2_model', 'default') == 'gpt-5.4'
-            VC.query.filter_by.assert_called_once_with(setting_key='layer2_model')
+            VC.settings.get.assert_called_once_with('layer2_model', 'default')
 
     def test_default_env_uses_global_only_path(self, app):
         svc = self._service()
         svc._environment_cache = None
         with patch('candidate_vetting_service.config.VettingConfig') as VC:
-            VC.query.filter_by.return_value.first.return_value = None
+            VC.settings.get.side_effect = lambda key, default=None: default
             assert svc.get_config_value('missing_key', 'fallback') == 'fallback'
-            VC.query.filter_by.assert_called_once_with(setting_key='missing_key')
+            VC.settings.get.assert_called_once_with('missing_key', 'fallback')
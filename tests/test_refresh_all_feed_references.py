@@ -76,3 +76,68 @@ def test_refresh_all_feed_references_fails_when_db_save_fails():
     assert result['success'] is False
     assert result['database_saved'] is False
     assert 'database' in result['error'].lower()
+
+
+class TestReferenceRowUpsert:
+    """save_reference_rows_to_database writes via bulk ON CONFLICT upserts."""
+
+    def _rows(self, app):
+        from models import JobReferenceNumber
+        return {
+            r.bullhorn_job_id: (r.reference_number, r.job_title)
+            for r in JobReferenceNumber.query.filter(JobReferenceNumber.bullhorn_job_id.like('upsert-%')).all()
+        }
+
+    def _cleanup(self):
+        from app import db
+        from models import JobReferenceNumber
+        JobReferenceNumber.query.filter(JobReferenceNumber.bullhorn_job_id.like('upsert-%')).delete(
+            synchronize_session=False)
+        db.session.commit()
+
+    def test_inserts_then_only_touches_changed_rows(self, app):
+        from lightweight_reference_refresh import save_reference_rows_to_database
+
+        self._cleanup()
+        try:
+            assert save_reference_rows_to_database([
+                ('upsert-1', 'REF1', 'Dev (1)'),
+                ('upsert-2', 'REF2', 'Analyst (2)'),
+                ('', 'SKIP', 'no id'),
+                ('upsert-3', '', 'no ref'),
+            ])
+            assert self._rows(app) == {'upsert-1': ('REF1', 'Dev (1)'), 'upsert-2': ('REF2', 'Analyst (2)')}
+
+            assert save_reference_rows_to_database([
+                ('upsert-1', 'REF1', 'Renamed (1)'),
+                ('upsert-2', 'NEWREF2', 'Analyst II (2)'),
+                ('upsert-4', 'REF4', 'Clerk (4)'),
+            ])
+            assert self._rows(app) == {
+                # Unchanged reference: row left alone, title included.
+                'upsert-1': ('REF1', 'Dev (1)'),
+                'upsert-2': ('NEWREF2', 'Analyst II (2)'),
+                'upsert-4': ('REF4', 'Clerk (4)'),
+            }
+        finally:
+            self._cleanup()
+
+    def test_repeated_job_id_keeps_last_row(self, app):
+        from lightweight_reference_refresh import save_reference_rows_to_database
+
+        self._cleanup()
+        try:
+            assert save_reference_rows_to_database([
+                ('upsert-9', 'FIRST', 'A'),
+                ('upsert-9', 'SECOND', 'B'),
+            ])
+            assert self._rows(app) == {'upsert-9': ('SECOND', 'B')}
+        finally:
+            self._cleanup()
+
+    def test_empty_rows_skip_the_database(self, app):
+        from lightweight_reference_refresh import save_reference_rows_to_database
+
+        with patch('app.db.session.execute') as execute:
+            assert save_reference_rows_to_database([('', '', '')])
+        execute.assert_not_called()
@@ -0,0 +1,150 @@
+"""Tests for the lease-based scheduler backend and per-run job metrics.
+
+Every worker runs APScheduler under SCHEDULER_BACKEND=lease; a job executes
+only on the worker holding its ``scheduler_job_lease`` row, and every
+executed run is recorded in ``scheduler_job_run``.
+"""
+import json
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
+
+import scheduler_leases
+from scheduler_leases import LeasedThreadPoolExecutor, claim_job, finish_run, job_run_stats, mark_due
+
+
+@pytest.fixture
+def lease_tables(app):
+    from app import db
+    from models import SchedulerJobLease, SchedulerJobRun
+    SchedulerJobLease.query.delete()
+    SchedulerJobRun.query.delete()
+    db.session.commit()
+    yield
+    db.session.rollback()
+    SchedulerJobLease.query.delete()
+    SchedulerJobRun.query.delete()
+    db.session.commit()
+
+
+def _job(func, job_id='lease-test-job', minutes=5):
+    from apscheduler.schedulers.background import BackgroundScheduler
+    scheduler = BackgroundScheduler(timezone='UTC')
+    job = scheduler.add_job(func, 'interval', minutes=minutes, id=job_id)
+    # Pending jobs only get scheduler defaults on start(); fill them in.
+    job._modify(misfire_grace_time=None, coalesce=True, max_instances=1)
+    return job
+
+
+def _runs(job_id):
+    from models import SchedulerJobRun
+    return SchedulerJobRun.query.filter_by(job_id=job_id).order_by(SchedulerJobRun.id).all()
+
+
+def test_lease_is_exclusive_until_released(lease_tables):
+    lease, _ = claim_job('exclusive')
+    assert lease is not None
+    assert claim_job('exclusive') == (None, None)
+
+    now = datetime.utcnow()
+    finish_run('exclusive', lease, now, now, now, 'success', next_due_at=now + timedelta(minutes=5))
+    blocked, next_due = claim_job('exclusive')
+    assert blocked is None and next_due is not None
+
+    again, _ = claim_job('exclusive', now=now + timedelta(minutes=5))
+    assert again is not None and again.due_at == next_due
+
+
+def test_expired_lease_is_reclaimed(lease_tables):
+    first, _ = claim_job('crashed')
+    later = datetime.utcnow() + timedelta(seconds=scheduler_leases.LEASE_SECONDS + 1)
+    second, _ = claim_job('crashed', now=later)
+    assert second is not None and second.token != first.token
+
+    # The original holder's release no longer matches and must not clobber it.
+    finish_run('crashed', first, None, later, later, 'success')
+    assert claim_job('crashed', now=later) == (None, None)
+
+
+def test_heartbeat_extends_held_lease(lease_tables):
+    lease, _ = claim_job('long-job')
+    later = datetime.utcnow() + timedelta(seconds=scheduler_leases.LEASE_SECONDS - 5)
+    assert scheduler_leases.heartbeat([lease], now=later) == []
+    assert claim_job('long-job', now=later + timedelta(seconds=10)) == (None, None)
+
+
+def test_mark_due_makes_job_claimable(lease_tables):
+    lease, _ = claim_job('manual')
+    now = datetime.utcnow()
+    finish_run('manual', lease, now, now, now, 'success', next_due_at=now + timedelta(hours=1))
+    mark_due('manual')
+    claimed, _ = claim_job('manual')
+    assert claimed is not None
+
+
+def test_two_workers_run_a_due_job_once(app, lease_tables):
+    calls = []
+    job = _job(lambda: calls.append(1))
+    scheduled = datetime.now(timezone.utc) - timedelta(seconds=3)
+    worker_a = LeasedThreadPoolExecutor(app, use_leases=True)
+    worker_b = LeasedThreadPoolExecutor(app, use_leases=True)
+
+    events_a = worker_a._run_leased(job, 'default', [scheduled], 'apscheduler')
+    events_b = worker_b._run_leased(job, 'default', [scheduled + timedelta(seconds=30)], 'apscheduler')
+
+    assert calls == [1]
+    assert len(events_a) == 1 and events_b == []
+    runs = _runs(job.id)
+    assert len(runs) == 1
+    assert runs[0].outcome == 'success'
+    assert runs[0].lag_ms >= 3000
+    from models import SchedulerJobLease
+    row = SchedulerJobLease.query.get(job.id)
+    assert row.lease_token is None
+    assert row.next_due_at == (scheduled + timedelta(minutes=5)).replace(tzinfo=None)
+
+
+def test_failed_run_is_recorded_as_error(app, lease_tables):
+    def boom():
+        raise RuntimeError('bullhorn down')
+
+    job = _job(boom, job_id='failing-job')
+    LeasedThreadPoolExecutor(app, use_leases=False)._run_leased(
+        job, 'default', [datetime.now(timezone.utc)], 'apscheduler')
+
+    (run,) = _runs('failing-job')
+    assert run.outcome == 'error'
+    assert 'bullhorn down' in run.error
+    stats = {s['job_id']: s for s in job_run_stats()}
+    assert stats['failing-job']['errors'] == 1
+
+
+def test_paused_job_is_skipped_on_every_worker(app, lease_tables):
+    from models import GlobalSettings
+    calls = []
+    job = _job(lambda: calls.append(1), job_id='paused-job')
+    with patch.object(GlobalSettings.settings, 'get', return_value=json.dumps(['paused-job'])):
+        events = LeasedThreadPoolExecutor(app, use_leases=True)._run_leased(
+            job, 'default', [datetime.now(timezone.utc)], 'apscheduler')
+    assert events == [] and calls == []
+    assert _runs('paused-job') == []
+
+
+def test_lock_backend_runs_without_claiming(app, lease_tables):
+    calls = []
+    job = _job(lambda: calls.append(1), job_id='lock-mode-job')
+    with patch('scheduler_leases.claim_job') as claim:
+        LeasedThreadPoolExecutor(app, use_leases=False)._run_leased(
+            job, 'default', [datetime.now(timezone.utc)], 'apscheduler')
+    claim.assert_not_called()
+    assert calls == [1]
+    assert len(_runs('lock-mode-job')) == 1
+
+
+def test_lease_backend_makes_every_worker_primary(monkeypatch):
+    import scheduler_setup
+    monkeypatch.setattr(scheduler_leases, 'SCHEDULER_BACKEND', 'lease')
+    with patch('scheduler_setup.fcntl.flock') as flock:
+        assert scheduler_setup.acquire_scheduler_lock() is True
+    flock.assert_not_called()
@@ -400,3 +400,156 @@ class TestBullhornPackageSurface:
             + "\n  ".join(collisions)
         )
         assert BullhornService.__mro__[-1] is object
+
+
+class _FakePagedBullhorn:
+    """Serves Entity / association / Search pages for a tearsheet of N jobs."""
+
+    def __init__(self, total, fail_once=(), fail_always=()):
+        import threading
+        self.total = total
+        self.fail_once = set(fail_once)
+        self.fail_always = set(fail_always)
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def _response(self, payload, status=200):
+        resp = Mock()
+        resp.status_code = status
+        resp.headers = {'content-type': 'application/json'}
+        resp.text = json.dumps(payload)
+        resp.json.return_value = payload
+        return resp
+
+    def get(self, url, params=None, timeout=None):
+        params = params or {}
+        start = params.get('start', 0)
+        count = params.get('count', 200)
+        kind = 'search' if 'search/JobOrder' in url else ('assoc' if url.endswith('/jobOrders') else 'entity')
+        with self._lock:
+            self.calls.append((kind, start))
+            key = (kind, start)
+            if key in self.fail_always:
+                return self._response({}, status=500)
+            if key in self.fail_once:
+                self.fail_once.discard(key)
+                return self._response({}, status=500)
+        ids = list(range(1, self.total + 1))
+        if kind == 'entity':
+            first = [{'id': i} for i in ids[:5]]
+            return self._response({'data': {'jobOrders': {'total': self.total, 'data': first}}})
+        page = [{'id': i, 'title': f'Job {i}', 'isOpen': True, 'status': 'Accepting Candidates'}
+                for i in ids[start:start + count]]
+        if kind == 'assoc':
+            return self._response({'data': [{'id': j['id']} for j in page]})
+        return self._response({'data': page, 'total': self.total})
+
+    def close(self):
+        pass
+
+
+class TestWorkerClone:
+    """Threads get their own requests.Session but share the brokered token."""
+
+    def test_clone_has_its_own_session_and_keeps_the_token(self):
+        from bullhorn_service import BullhornService
+
+        service = BullhornService(client_id='cid', client_secret='sec', username='api', password='pw')
+        service.base_url, service.rest_token = 'https://rest.example/', 'tok'
+        service._session_token = 'tok'
+        clone = service.worker_clone()
+        assert clone.session is not service.session
+        assert clone.session.headers == service.session.headers
+        assert (clone.base_url, clone.rest_token, clone._session_token) == ('https://rest.example/', 'tok', 'tok')
+        assert clone.session.hooks['response'] == [clone._record_session_use]
+
+
+class TestTearsheetPagination:
+    """Pages after the first go out concurrently; order and completeness hold."""
+
+    def _service(self, fake, monkeypatch):
+        from bullhorn_service import BullhornService
+        import bullhorn_service.jobs as jobs_mod
+        monkeypatch.setattr(jobs_mod, 'TEARSHEET_PAGE_RETRY_DELAY', 0)
+        service = BullhornService(client_id='c', client_secret='s', username='u', password='p')
+        service.base_url = 'https://bh.example/rest/'
+        service.rest_token = 'tok'
+        service.session = fake
+        service._new_page_session = lambda: fake
+        service.normalize_job_address = lambda job: None
+        service.excluded_job_ids = set()
+        return service
+
+    def test_fetches_every_page_in_order(self, monkeypatch):
+        fake = _FakePagedBullhorn(total=950)
+        service = self._service(fake, monkeypatch)
+
+        jobs = service.get_tearsheet_jobs(1231)
+
+        assert [j['id'] for j in jobs] == list(range(1, 951))
+        search_starts = sorted(s for k, s in fake.calls if k == 'search')
+        assoc_starts = sorted(s for k, s in fake.calls if k == 'assoc')
+        assert search_starts == [0, 200, 400, 600, 800]
+        assert assoc_starts == [5, 205, 405, 605, 805]
+
+    def test_retries_a_failed_page(self, monkeypatch):
+        fake = _FakePagedBullhorn(total=450, fail_once={('search', 200), ('assoc', 205)})
+        service = self._service(fake, monkeypatch)
+
+        jobs = service.get_tearsheet_jobs(1231)
+
+        assert [j['id'] for j in jobs] == list(range(1, 451))
+        assert sum(1 for c in fake.calls if c == ('search', 200)) == 2
+
+    def test_persistent_page_failure_truncates_like_serial(self, monkeypatch):
+        fake = _FakePagedBullhorn(total=650, fail_always={('search', 200)})
+        service = self._service(fake, monkeypatch)
+
+        jobs = service.get_tearsheet_jobs(1231)
+
+        # Contiguous prefix only — pages after the gap are not stitched in.
+        assert [j['id'] for j in jobs] == list(range(1, 201))
+
+    def test_incomplete_entity_pass_disables_orphan_filtering(self, monkeypatch):
+        from bullhorn_service import jobs as jobs_mod
+        fake = _FakePagedBullhorn(total=450, fail_always={('assoc', 205)})
+        service = self._service(fake, monkeypatch)
+        seen = {}
+
+        def _spy(search_jobs, entity_job_ids, complete):
+            seen['complete'] = complete
+            return search_jobs
+
+        monkeypatch.setattr(jobs_mod, '_reconcile_tearsheet_search_results', _spy)
+        jobs = service.get_tearsheet_jobs(1231)
+
+        assert len(jobs) == 450
+        assert seen['complete'] is False
+
+    def test_page_workers_keep_the_credentials_read_at_start(self, monkeypatch):
+        fake = _FakePagedBullhorn(total=650)
+        service = self._service(fake, monkeypatch)
+        seen = []
+        serve = fake.get
+
+        def get(url, params=None, timeout=None):
+            seen.append((url.split('/rest/')[0], (params or {}).get('BhRestToken')))
+            # Another thread re-authenticates this shared instance mid-pass.
+            service.base_url = 'https://other.example/rest/'
+            service.rest_token = 'new-token'
+            return serve(url, params=params, timeout=timeout)
+
+        fake.get = get
+        jobs = service.get_tearsheet_jobs(1231)
+
+        assert len(jobs) == 650
+        assert set(seen) == {('https://bh.example', 'tok')}
+
+    def test_small_tearsheet_uses_entity_data_only(self, monkeypatch):
+        fake = _FakePagedBullhorn(total=4)
+        service = self._service(fake, monkeypatch)
+
+        jobs = service.get_tearsheet_jobs(1231)
+
+        assert [j['id'] for j in jobs] == [1, 2, 3, 4]
+        assert [k for k, _ in fake.calls] == ['entity']
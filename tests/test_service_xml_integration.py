@@ -25,13 +25,14 @@ class TestXMLIntegrationPackageSurface:
         from xml_integration_service.mapping import MappingMixin
         from xml_integration_service.validation import ValidationMixin
         from xml_integration_service.file_ops import FileOpsMixin
+        from xml_integration_service.feed_index import FeedIndexMixin
         from xml_integration_service.jobs import JobsMixin
         from xml_integration_service.sync import SyncMixin
 
         seen = {}
         collisions = []
         for mixin in (_XMLCore, MappingMixin, ValidationMixin,
-                      FileOpsMixin, JobsMixin, SyncMixin):
+                      FileOpsMixin, FeedIndexMixin, JobsMixin, SyncMixin):
             for name, val in vars(mixin).items():
                 if name.startswith('__') or not callable(val):
                     continue
@@ -84,3 +85,112 @@ class TestXMLIntegrationPackageSurface:
             '#LI-99 :Some Recruiter Name'
         )
         assert sanitized == '#LI-99'
+
+
+_FEED = """<?xml version='1.0' encoding='utf-8'?>
+<source>
+  <title>Myticas Consulting</title>
+  <link>https://www.myticas.com</link>
+  <publisherurl>https://www.myticas.com</publisherurl>
+  <job>
+    <title><![CDATA[ Existing Role (100) ]]></title>
+    <referencenumber><![CDATA[ REF100 ]]></referencenumber>
+    <bhatsid><![CDATA[ 100 ]]></bhatsid>
+    <jobfunction><![CDATA[ Engineering ]]></jobfunction>
+  </job>
+</source>
+"""
+
+
+def _fake_map(bullhorn_job, existing_reference_number=None, monitor_name=None, **kwargs):
+    job_id = str(bullhorn_job['id'])
+    return {
+        'title': f"{bullhorn_job['title']} ({job_id})",
+        'referencenumber': existing_reference_number or f"REF{job_id}",
+        'bhatsid': job_id,
+    }
+
+
+class TestFeedIndex:
+    def _svc(self, monkeypatch):
+        from xml_integration_service import XMLIntegrationService
+        svc = XMLIntegrationService()
+        monkeypatch.setattr(svc, 'map_bullhorn_job_to_xml', _fake_map)
+        return svc
+
+    def test_lookups_hit_index_and_reparse_only_on_file_change(self, tmp_path, monkeypatch):
+        import xml_integration_service.feed_index as feed_index
+        svc = self._svc(monkeypatch)
+        feed = tmp_path / 'feed.xml'
+        feed.write_text(_FEED, encoding='utf-8')
+
+        parses = []
+        real_parse = feed_index.etree.parse
+        monkeypatch.setattr(feed_index.etree, 'parse',
+                            lambda *a, **k: parses.append(1) or real_parse(*a, **k))
+
+        assert svc._find_feed_job(str(feed), '100') is not None
+        assert svc._verify_job_exists_in_xml(str(feed), '100')
+        assert svc._verify_job_added_to_xml(str(feed), '100', 'Existing Role')
+        assert not svc._verify_job_exists_in_xml(str(feed), '999')
+        assert len(parses) == 1
+
+        # Someone else rewrites the file: the signature changes, cache reloads.
+        feed.write_text(_FEED.replace('100', '200'), encoding='utf-8')
+        assert svc._find_feed_job(str(feed), '100') is None
+        assert svc._find_feed_job(str(feed), '200') is not None
+        assert len(parses) == 2
+
+    def test_sync_adds_share_one_parse_and_one_backup(self, tmp_path, monkeypatch):
+        import shutil
+        import xml_integration_service.feed_index as feed_index
+        import xml_integration_service.jobs as jobs_module
+        svc = self._svc(monkeypatch)
+        feed = tmp_path / 'feed.xml'
+        feed.write_text(_FEED, encoding='utf-8')
+
+        parses = []
+        real_parse = feed_index.etree.parse
+        monkeypatch.setattr(feed_index.etree, 'parse',
+                            lambda *a, **k: parses.append(1) or real_parse(*a, **k))
+        copies = []
+        real_copy = shutil.copy2
+        monkeypatch.setattr(jobs_module.shutil, 'copy2',
+                            lambda *a, **k: copies.append(a) or real_copy(*a, **k))
+
+        previous = [{'id': 100, 'title': 'Existing Role'}]
+        current = previous + [{'id': i, 'title': f'New Role {i}'} for i in (101, 102, 103)]
+        result = svc.sync_xml_with_bullhorn_jobs(str(feed), current, previous)
+
+        assert result['success'], result
+        assert result['added_count'] == 3
+        assert len(parses) == 1
+        assert len(copies) == 1  # the batch backup; no per-job copies
+        assert list(tmp_path.glob('feed.xml.backup*')) == []
+
+        from lxml import etree
+        ids = [e.text.strip() for e in etree.parse(str(feed)).getroot().iter('bhatsid')]
+        assert sorted(ids) == ['100', '101', '102', '103']
+
+    def test_add_skips_existing_job_via_index(self, tmp_path, monkeypatch):
+        svc = self._svc(monkeypatch)
+        feed = tmp_path / 'feed.xml'
+        feed.write_text(_FEED, encoding='utf-8')
+
+        assert svc.add_job_to_xml(str(feed), {'id': 100, 'title': 'Existing Role'})
+        assert feed.read_text(encoding='utf-8').count('<job>') == 1
+        assert svc._existing_ai_fields(svc._find_feed_job(str(feed), '100')) == {'jobfunction': 'Engineering'}
+
+    def test_failed_batch_restores_backup(self, tmp_path, monkeypatch):
+        import pytest
+        svc = self._svc(monkeypatch)
+        feed = tmp_path / 'feed.xml'
+        feed.write_text(_FEED, encoding='utf-8')
+
+        with pytest.raises(RuntimeError):
+            with svc.feed_batch(str(feed)):
+                assert svc.add_job_to_xml(str(feed), {'id': 101, 'title': 'New Role'})
+                raise RuntimeError('boom')
+
+        assert feed.read_text(encoding='utf-8') == _FEED
+        assert svc._find_feed_job(str(feed), '101') is None
@@ -0,0 +1,130 @@
+"""
+Tests for the process-local settings cache (models.settings_cache).
+
+VettingConfig / GlobalSettings expose a ``settings`` cache that loads the whole
+table in one query, is invalidated by this process's commits, and notices
+other workers' writes through a fingerprint check.
+"""
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+
+@pytest.fixture
+def vetting_settings(app):
+    from extensions import db
+    from models import VettingConfig
+
+    with app.app_context():
+        VettingConfig.query.filter(VettingConfig.setting_key.like('cache_test_%')).delete(
+            synchronize_session=False)
+        db.session.commit()
+        VettingConfig.settings.invalidate()
+        yield VettingConfig.settings
+        db.session.rollback()
+        VettingConfig.query.filter(VettingConfig.setting_key.like('cache_test_%')).delete(
+            synchronize_session=False)
+        db.session.commit()
+
+
+def _count_loads(cache):
+    return patch.object(cache, '_load', wraps=cache._load)
+
+
+class TestTypedAccessors:
+    def test_typed_reads(self, vetting_settings):
+        from models import VettingConfig
+        VettingConfig.set_value('cache_test_flag', 'Yes')
+        VettingConfig.set_value('cache_test_int', ' 250 ')
+        VettingConfig.set_value('cache_test_float', '72.5')
+        VettingConfig.set_value('cache_test_blank', '  ')
+
+        assert vetting_settings.get_bool('cache_test_flag') is True
+        assert vetting_settings.get_bool('cache_test_blank', default=True) is True
+        assert vetting_settings.get_int('cache_test_int', 25, maximum=100) == 100
+        assert vetting_settings.get_int('cache_test_float', 7) == 7
+        assert vetting_settings.get_float('cache_test_float') == 72.5
+        assert vetting_settings.get_str('cache_test_blank', 'dflt') == 'dflt'
+        assert vetting_settings.get('cache_test_missing', 'dflt') == 'dflt'
+        assert vetting_settings.get_many(['cache_test_flag', 'cache_test_missing']) == {
+            'cache_test_flag': 'Yes'}
+
+
+class TestInvalidation:
+    def test_reads_are_served_from_one_load(self, vetting_settings):
+        from models import VettingConfig
+        VettingConfig.set_value('cache_test_a', '1')
+        with _count_loads(vetting_settings) as load:
+            for _ in range(50):
+                vetting_settings.get('cache_test_a')
+                vetting_settings.get('cache_test_b')
+        assert load.call_count == 1
+
+    def test_commit_invalidates(self, vetting_settings):
+        from extensions import db
+        from models import VettingConfig
+        VettingConfig.set_value('cache_test_a', 'before')
+        assert vetting_settings.get('cache_test_a') == 'before'
+
+        row = VettingConfig.query.filter_by(setting_key='cache_test_a').first()
+        row.setting_value = 'after'
+        db.session.flush()
+        # Flushed but uncommitted writes are not visible through the cache.
+        assert vetting_settings.get('cache_test_a') == 'before'
+        db.session.commit()
+        assert vetting_settings.get('cache_test_a') == 'after'
+
+    def test_bulk_update_invalidates(self, vetting_settings):
+        from extensions import db
+        from models import VettingConfig
+        VettingConfig.set_value('cache_test_a', 'before')
+        assert vetting_settings.get('cache_test_a') == 'before'
+        VettingConfig.query.filter_by(setting_key='cache_test_a').update(
+            {'setting_value': 'bulk'}, synchronize_session=False)
+        db.session.commit()
+        assert vetting_settings.get('cache_test_a') == 'bulk'
+
+    def test_rollback_keeps_cache(self, vetting_settings):
+        from extensions import db
+        from models import VettingConfig
+        VettingConfig.set_value('cache_test_a', 'kept')
+        vetting_settings.get('cache_test_a')
+        db.session.add(VettingConfig(setting_key='cache_test_b', setting_value='x'))
+        db.session.flush()
+        db.session.rollback()
+        with _count_loads(vetting_settings) as load:
+            assert vetting_settings.get('cache_test_b') is None
+        assert load.call_count == 0
+
+    def test_other_worker_write_seen_after_fingerprint_check(self, vetting_settings, monkeypatch):
+        from sqlalchemy import text
+        from extensions import db
+        from models import VettingConfig
+        from models import settings_cache
+
+        VettingConfig.set_value('cache_test_a', 'mine')
+        assert vetting_settings.get('cache_test_a') == 'mine'
+
+        # Simulate another process: a committed write that never passes
+        # through this session's hooks.
+        with db.engine.begin() as conn:
+            conn.execute(text(
+                "UPDATE vetting_config SET setting_value = 'theirs', updated_at = :now "
+                "WHERE setting_key = 'cache_test_a'"), {'now': datetime.utcnow()})
+        assert vetting_settings.get('cache_test_a') == 'mine'
+
+        monkeypatch.setattr(settings_cache, 'SETTINGS_CACHE_CHECK_SECONDS', 0)
+        assert vetting_settings.get('cache_test_a') == 'theirs'
+
+    def test_unchanged_fingerprint_skips_reload(self, vetting_settings, monkeypatch):
+        from models import VettingConfig
+        from models import settings_cache
+
+        VettingConfig.set_value('cache_test_a', '1')
+        vetting_settings.get('cache_test_a')
+        monkeypatch.setattr(settings_cache, 'SETTINGS_CACHE_CHECK_SECONDS', 0)
+        with _count_loads(vetting_settings) as load:
+            vetting_settings.get('cache_test_a')
+            vetting_settings.get('cache_test_a')
+        assert load.call_count == 0
@@ -230,3 +230,38 @@ class TestFailureReporting:
         assert ok is True
         assert err is None
         assert svc.last_error is None
+
+
+class TestFeedWorkdir:
+    def test_feed_directory_is_removed_when_generation_fails(self, app):
+        import contextlib
+        import os
+        import tempfile
+
+        from models import GlobalSettings
+        from simplified_xml_generator import SimplifiedXMLGenerator
+        from tasks.xml_feeds import automated_upload
+
+        created = []
+        real_tempdir = tempfile.TemporaryDirectory
+
+        def tracking_tempdir(*args, **kwargs):
+            workdir = real_tempdir(*args, **kwargs)
+            workdir.cleanup = MagicMock(side_effect=workdir.cleanup)
+            created.append(workdir)
+            return workdir
+
+        def failing_generate(self, **kwargs):
+            raise RuntimeError('bullhorn down')
+
+        with patch.object(GlobalSettings.settings, 'get', return_value='true'), \
+                patch.object(tempfile, 'TemporaryDirectory', tracking_tempdir), \
+                patch.object(SimplifiedXMLGenerator, 'cycle_snapshot',
+                             lambda self, ids: contextlib.nullcontext()), \
+                patch.object(SimplifiedXMLGenerator, 'generate_fresh_xml', failing_generate):
+            automated_upload()
+
+        # Cleaned up explicitly, not left for the GC.
+        (workdir,) = created
+        workdir.cleanup.assert_called_once()
+        assert not os.path.exists(workdir.name)
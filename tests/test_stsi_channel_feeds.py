@@ -137,6 +137,116 @@ class TestEmptyFeedGeneration:
                 gen.generate_fresh_xml(tearsheet_ids=[TEARSHEET_STSI_INDEED])
 
 
+class TestCycleSnapshot:
+    """One Bullhorn pull per upload cycle, fanned out to every feed."""
+
+    def _gen(self, jobs_by_tearsheet):
+        from simplified_xml_generator import SimplifiedXMLGenerator
+        gen = SimplifiedXMLGenerator(db=MagicMock())
+        mock_bh = MagicMock()
+        mock_bh.authenticate.return_value = True
+        mock_bh.worker_clone.return_value = mock_bh
+        mock_bh.get_tearsheet_jobs.side_effect = lambda tid: [dict(j) for j in jobs_by_tearsheet.get(tid, [])]
+        return gen, mock_bh
+
+    def test_upload_cycle_tearsheet_ids_skips_parked_channel(self, monkeypatch):
+        from feeds.feed_config import upload_cycle_tearsheet_ids
+        monkeypatch.setenv('INDEED_TEARSHEET_PUBLISH_ENABLED', 'false')
+        assert TEARSHEET_STSI_INDEED in upload_cycle_tearsheet_ids()
+        monkeypatch.setenv('INDEED_TEARSHEET_PUBLISH_ENABLED', 'true')
+        ids = upload_cycle_tearsheet_ids()
+        assert TEARSHEET_STSI_INDEED not in ids
+        assert TEARSHEET_STSI_ZIPRECRUITER in ids
+        assert len(ids) == len(set(ids))
+
+    def test_feeds_share_one_fetch_per_tearsheet(self):
+        job = {'id': 101, 'title': 'Engineer', 'status': 'Accepting Candidates', 'isOpen': True}
+        gen, mock_bh = self._gen({TEARSHEET_STSI_INDEED: [job], TEARSHEET_STSI_ZIPRECRUITER: []})
+        built = []
+
+        def _fake_build(jobs, refs, **kwargs):
+            built.append((kwargs['source_channel'], [j['tearsheet_context']['tearsheet_id'] for j in jobs]))
+            return '<source/>', dict(refs)
+
+        with patch.object(gen, '_get_bullhorn_service', return_value=mock_bh), \
+             patch.object(gen, '_load_references_from_database', return_value={}) as load_refs, \
+             patch.object(gen, '_build_clean_xml', side_effect=_fake_build), \
+             patch.object(gen, '_save_reference_rows_to_database'):
+            with gen.cycle_snapshot([TEARSHEET_STSI_INDEED, TEARSHEET_STSI_ZIPRECRUITER]):
+                for _ in range(2):
+                    gen.generate_fresh_xml(tearsheet_ids=[TEARSHEET_STSI_INDEED], source_channel=SOURCE_INDEED)
+                gen.generate_fresh_xml(tearsheet_ids=[TEARSHEET_STSI_ZIPRECRUITER],
+                                       source_channel=SOURCE_ZIPRECRUITER, allow_empty=True)
+
+        assert mock_bh.authenticate.call_count == 1
+        assert load_refs.call_count == 1
+        assert sorted(c.args[0] for c in mock_bh.get_tearsheet_jobs.call_args_list) == \
+            sorted([TEARSHEET_STSI_INDEED, TEARSHEET_STSI_ZIPRECRUITER])
+        assert built[0] == (SOURCE_INDEED, [TEARSHEET_STSI_INDEED])
+        assert built[2] == (SOURCE_ZIPRECRUITER, [])
+        assert gen._snapshot is None
+
+    def test_snapshot_fetch_threads_do_not_share_a_session(self):
+        gen, mock_bh = self._gen({})
+        clones = []
+
+        def _clone():
+            clone = MagicMock()
+            clone.get_tearsheet_jobs.return_value = []
+            clones.append(clone)
+            return clone
+
+        mock_bh.worker_clone.side_effect = _clone
+        with patch.object(gen, '_get_bullhorn_service', return_value=mock_bh), \
+             patch.object(gen, '_load_references_from_database', return_value={}):
+            with gen.cycle_snapshot([TEARSHEET_STSI_INDEED, TEARSHEET_STSI_ZIPRECRUITER]) as snapshot:
+                assert snapshot is not None
+
+        assert mock_bh.get_tearsheet_jobs.call_count == 0
+        assert sum(c.get_tearsheet_jobs.call_count for c in clones) == 2
+
+    def test_snapshot_references_follow_saves(self):
+        job = {'id': 7, 'title': 'Analyst', 'status': 'Accepting Candidates', 'isOpen': True}
+        gen, mock_bh = self._gen({TEARSHEET_STSI_INDEED: [job]})
+        seen_refs = []
+
+        def _fake_build(jobs, refs, **kwargs):
+            seen_refs.append(dict(refs))
+            return '<source/>', {**refs, '7': 'REF-7'}
+
+        with patch.object(gen, '_get_bullhorn_service', return_value=mock_bh), \
+             patch.object(gen, '_load_references_from_database', return_value={}), \
+             patch.object(gen, '_build_clean_xml', side_effect=_fake_build), \
+             patch.object(gen, '_save_reference_rows_to_database'):
+            with gen.cycle_snapshot([TEARSHEET_STSI_INDEED]):
+                gen.generate_fresh_xml(tearsheet_ids=[TEARSHEET_STSI_INDEED])
+                gen.generate_fresh_xml(tearsheet_ids=[TEARSHEET_STSI_INDEED])
+
+        assert seen_refs == [{}, {'7': 'REF-7'}]
+
+    def test_uncovered_tearsheet_falls_back_to_live_fetch(self):
+        job = {'id': 5, 'title': 'Dev', 'status': 'Accepting Candidates', 'isOpen': True}
+        gen, mock_bh = self._gen({TEARSHEET_STSI_ZIPRECRUITER: [job]})
+
+        with patch.object(gen, '_get_bullhorn_service', return_value=mock_bh), \
+             patch.object(gen, '_load_references_from_database', return_value={}), \
+             patch.object(gen, '_build_clean_xml', return_value=('<source/>', {})), \
+             patch.object(gen, '_save_reference_rows_to_database'):
+            with gen.cycle_snapshot([TEARSHEET_STSI_INDEED]):
+                _, stats = gen.generate_fresh_xml(tearsheet_ids=[TEARSHEET_STSI_ZIPRECRUITER])
+
+        assert stats['job_count'] == 1
+        assert mock_bh.authenticate.call_count == 2
+
+    def test_snapshot_failure_is_fail_soft(self):
+        gen, mock_bh = self._gen({})
+        mock_bh.authenticate.return_value = False
+        with patch.object(gen, '_get_bullhorn_service', return_value=mock_bh), \
+             patch.object(gen, '_load_references_from_database', return_value={}):
+            with gen.cycle_snapshot([TEARSHEET_STSI_INDEED]) as snapshot:
+                assert snapshot is None
+
+
 class TestSourceAttributionChannels:
     def test_indeed_explicit_source(self):
         from source_attribution import resolve_source
@@ -149,3 +259,285 @@ class TestSourceAttributionChannels:
     def test_referrer_beats_explicit_for_direct_board(self):
         from source_attribution import resolve_source
         assert resolve_source('LinkedIn', 'https://www.indeed.com/viewjob', '') == 'Indeed Job Board'
+
+
+class TestStreamingFeedWriter:
+    _XML_JOBS = [
+        {'title': 'Dev & Ops (1)', 'bhatsid': '1', 'referencenumber': 'REF-1', 'description': '<p>x</p>'},
+        {'title': 'Analyst (2)', 'bhatsid': '2', 'referencenumber': 'REF-2', 'description': 'café'},
+    ]
+
+    def _gen(self):
+        from simplified_xml_generator import SimplifiedXMLGenerator
+        gen = SimplifiedXMLGenerator(db=MagicMock())
+        gen.xml_integration = MagicMock()
+        gen.xml_integration.map_bullhorn_jobs_to_xml_batch.return_value = [dict(j) for j in self._XML_JOBS]
+        return gen
+
+    def test_stream_matches_in_memory_build_byte_for_byte(self, tmp_path):
+        gen = self._gen()
+        jobs = [{'id': 1}, {'id': 2}]
+        for channel in (SOURCE_LINKEDIN, SOURCE_INDEED):
+            xml, refs = gen._build_clean_xml(jobs, {}, source_channel=channel)
+            out = tmp_path / f'{channel}.xml'
+            stream_refs, size, rows = gen._stream_clean_xml(str(out), jobs, {}, source_channel=channel)
+
+            data = out.read_bytes()
+            assert data == xml.encode('utf-8')
+            assert size == len(data)
+            assert stream_refs == refs == {'1': 'REF-1', '2': 'REF-2'}
+            assert rows == [('1', 'REF-1', 'Dev & Ops (1)'), ('2', 'REF-2', 'Analyst (2)')]
+
+    def test_empty_stream_matches_in_memory_build(self, tmp_path):
+        gen = self._gen()
+        xml, _ = gen._build_clean_xml([], {}, source_channel=SOURCE_ZIPRECRUITER)
+        out = tmp_path / 'empty.xml'
+        _, size, rows = gen._stream_clean_xml(str(out), [], {}, source_channel=SOURCE_ZIPRECRUITER)
+        assert out.read_bytes() == xml.encode('utf-8')
+        assert rows == []
+
+    def test_jobs_are_mapped_and_written_in_bounded_chunks(self, tmp_path, monkeypatch):
+        import simplified_xml_generator
+        monkeypatch.setattr(simplified_xml_generator, 'MAP_CHUNK_SIZE', 2)
+        gen = self._gen()
+        rows = []
+        calls = []
+
+        def _map(jobs_data, existing_references, **kw):
+            calls.append(([j['id'] for j in jobs_data], len(rows)))
+            return [{'title': f"Job ({j['id']})", 'bhatsid': str(j['id']),
+                     'referencenumber': f"REF-{j['id']}"} for j in jobs_data]
+
+        gen.xml_integration.map_bullhorn_jobs_to_xml_batch.side_effect = _map
+        gen._build_clean_xml([{'id': i} for i in range(1, 6)], {}, reference_rows=rows)
+
+        # Each chunk is written out before the next one is mapped.
+        assert calls == [([1, 2], 0), ([3, 4], 2), ([5], 4)]
+        assert [r[0] for r in rows] == ['1', '2', '3', '4', '5']
+
+    def test_generate_fresh_xml_streams_to_path(self, tmp_path):
+        gen = self._gen()
+        mock_bh = MagicMock()
+        mock_bh.authenticate.return_value = True
+        out = tmp_path / 'v2.xml'
+
+        with patch.object(gen, '_get_bullhorn_service', return_value=mock_bh), \
+             patch.object(gen, '_load_references_from_database', return_value={}), \
+             patch.object(gen, '_get_jobs_from_tearsheets', return_value=[{'id': 1}, {'id': 2}]), \
+             patch.object(gen, '_save_reference_rows_to_database') as save_rows:
+            result, stats = gen.generate_fresh_xml(source_channel=SOURCE_LINKEDIN, output_path=str(out))
+
+        assert result == str(out)
+        assert stats['output_path'] == str(out)
+        assert stats['job_count'] == 2
+        assert stats['xml_size_bytes'] == out.stat().st_size
+        save_rows.assert_called_once_with([('1', 'REF-1', 'Dev & Ops (1)'), ('2', 'REF-2', 'Analyst (2)')])
+        assert not (tmp_path / 'v2.xml.tmp').exists()
+
+
+class TestJobFragmentCache:
+    _JOBS = [
+        {'id': 1, 'dateLastModified': 1000, 'title': 'Dev'},
+        {'id': 2, 'dateLastModified': 2000, 'title': 'Analyst'},
+    ]
+
+    @staticmethod
+    def _mapped(job, ref=''):
+        job_id = str(job['id'])
+        return {'title': f"{job['title']} ({job_id})", 'bhatsid': job_id,
+                'referencenumber': ref or f'REF-{job_id}', 'description': '<p>x</p>'}
+
+    def _gen(self):
+        from simplified_xml_generator import SimplifiedXMLGenerator, JobFragmentCache
+        gen = SimplifiedXMLGenerator(db=MagicMock())
+        gen.fragment_cache = JobFragmentCache(max_bytes=1024 * 1024)
+        gen.xml_integration = MagicMock()
+        gen.xml_integration.recruiter_lookup_errors = 0
+        gen.xml_integration.recruiter_mapping_fingerprint.return_value = 'mappings-v1'
+        gen.xml_integration.map_bullhorn_jobs_to_xml_batch.side_effect = (
+            lambda jobs_data, existing_references, **kw: [
+                self._mapped(j, existing_references.get(str(j['id']), '')) for j in jobs_data
+            ]
+        )
+        return gen
+
+    def _mapped_ids(self, gen, call=-1):
+        kwargs = gen.xml_integration.map_bullhorn_jobs_to_xml_batch.call_args_list[call].kwargs
+        return [j['id'] for j in kwargs['jobs_data']]
+
+    def test_unchanged_jobs_are_spliced_from_cache(self, tmp_path):
+        gen = self._gen()
+        refs = {'1': 'REF-1', '2': 'REF-2'}
+        first, _ = gen._build_clean_xml([dict(j) for j in self._JOBS], refs)
+
+        second, second_refs = gen._build_clean_xml([dict(j) for j in self._JOBS], refs)
+        assert gen.xml_integration.map_bullhorn_jobs_to_xml_batch.call_count == 1
+        assert second == first
+        assert second_refs == refs
+
+        out = tmp_path / 'feed.xml'
+        _, _, rows = gen._stream_clean_xml(str(out), [dict(j) for j in self._JOBS], refs)
+        assert gen.xml_integration.map_bullhorn_jobs_to_xml_batch.call_count == 1
+        assert out.read_bytes() == first.encode('utf-8')
+        assert rows == [('1', 'REF-1', 'Dev (1)'), ('2', 'REF-2', 'Analyst (2)')]
+
+    def test_only_modified_jobs_are_remapped(self):
+        gen = self._gen()
+        refs = {'1': 'REF-1', '2': 'REF-2'}
+        gen._build_clean_xml([dict(j) for j in self._JOBS], refs)
+
+        changed = [dict(self._JOBS[0]), dict(self._JOBS[1], dateLastModified=3000, title='Lead')]
+        xml, _ = gen._build_clean_xml(changed, refs)
+
+        assert self._mapped_ids(gen) == [2]
+        assert xml.index('Dev (1)') < xml.index('Lead (2)')
+
+    def test_key_includes_channel_feed_and_reference(self):
+        gen = self._gen()
+        jobs = [dict(self._JOBS[0])]
+        gen._build_clean_xml(jobs, {'1': 'REF-1'})
+        gen._build_clean_xml(jobs, {'1': 'REF-1'}, source_channel=SOURCE_INDEED)
+        gen._build_clean_xml(jobs, {'1': 'REF-1'}, feed_name='pando')
+        gen._build_clean_xml(jobs, {'1': 'REF-9'})
+        assert gen.xml_integration.map_bullhorn_jobs_to_xml_batch.call_count == 4
+
+    def test_jobs_without_modified_date_are_not_cached(self):
+        gen = self._gen()
+        jobs = [{'id': 5, 'title': 'Clerk'}]
+        gen._build_clean_xml(jobs, {})
+        gen._build_clean_xml(jobs, {})
+        assert gen.xml_integration.map_bullhorn_jobs_to_xml_batch.call_count == 2
+        assert len(gen.fragment_cache) == 0
+
+    def test_recruiter_mapping_edit_invalidates_fragments(self):
+        gen = self._gen()
+        jobs = [dict(self._JOBS[0])]
+        gen._build_clean_xml(jobs, {'1': 'REF-1'})
+        gen._build_clean_xml(jobs, {'1': 'REF-1'})
+        assert gen.xml_integration.map_bullhorn_jobs_to_xml_batch.call_count == 1
+
+        gen.xml_integration.recruiter_mapping_fingerprint.return_value = 'mappings-v2'
+        gen._build_clean_xml(jobs, {'1': 'REF-1'})
+        assert gen.xml_integration.map_bullhorn_jobs_to_xml_batch.call_count == 2
+
+        # Unreadable mappings: build without the cache rather than key on nothing.
+        gen.xml_integration.recruiter_mapping_fingerprint.return_value = None
+        gen._build_clean_xml(jobs, {'1': 'REF-1'})
+        assert gen.xml_integration.map_bullhorn_jobs_to_xml_batch.call_count == 3
+
+    def test_recruiter_lookup_fallback_is_not_cached(self):
+        gen = self._gen()
+        integration = gen.xml_integration
+        mapped = integration.map_bullhorn_jobs_to_xml_batch.side_effect
+
+        def _failing_lookup(jobs_data, existing_references, **kw):
+            integration.recruiter_lookup_errors += 1
+            return mapped(jobs_data, existing_references, **kw)
+
+        integration.map_bullhorn_jobs_to_xml_batch.side_effect = _failing_lookup
+        jobs = [dict(j) for j in self._JOBS]
+        gen._build_clean_xml(jobs, {})
+        assert len(gen.fragment_cache) == 0
+
+        integration.map_bullhorn_jobs_to_xml_batch.side_effect = mapped
+        gen._build_clean_xml(jobs, {})
+        assert self._mapped_ids(gen) == [1, 2]
+        assert len(gen.fragment_cache) == 2
+
+    def test_mapping_fingerprint_tracks_recruiter_mappings(self, app):
+        from app import db
+        from models import RecruiterMapping
+        from xml_integration_service import XMLIntegrationService
+        service = XMLIntegrationService()
+        before = service.recruiter_mapping_fingerprint()
+
+        mapping = RecruiterMapping(recruiter_name='Fragment Cache Tester', linkedin_tag='#LI-FC1')
+        db.session.add(mapping)
+        db.session.commit()
+        try:
+            added = service.recruiter_mapping_fingerprint()
+            mapping.linkedin_tag = '#LI-FC2'
+            db.session.commit()
+            edited = service.recruiter_mapping_fingerprint()
+        finally:
+            db.session.delete(mapping)
+            db.session.commit()
+
+        assert len({before, added, edited}) == 3
+        assert service.recruiter_mapping_fingerprint() == before
+
+    def test_cache_is_lru_bounded(self):
+        from simplified_xml_generator import JobFragmentCache
+        cache = JobFragmentCache(max_bytes=12)
+        for i in range(3):
+            cache.put(('k', i), b'<job/>', (str(i), '', ''))
+        assert len(cache) == 2
+        assert cache.total_bytes == 12
+        assert cache.get(('k', 0)) is None
+        assert cache.get(('k', 2)) == (b'<job/>', ('2', '', ''))
+
+        cache.put(('k', 3), b'<job>' + b'x' * 20 + b'</job>', ('3', '', ''))
+        assert len(cache) == 2 and cache.total_bytes == 12
+
+    def test_cycle_drops_entries_it_did_not_use(self):
+        from simplified_xml_generator import JobFragmentCache
+        cache = JobFragmentCache(max_bytes=1024)
+        cache.put(('job', 1, 'v1'), b'<job/>', ('1', '', ''))
+        cache.put(('job', 2, 'v1'), b'<job/>', ('2', '', ''))
+
+        cache.begin_cycle()
+        cache.get(('job', 1, 'v1'))
+        cache.put(('job', 2, 'v2'), b'<job/>', ('2', '', ''))
+        assert cache.end_cycle() == 1
+
+        assert cache.get(('job', 2, 'v1')) is None
+        assert cache.get(('job', 1, 'v1')) is not None
+        assert cache.total_bytes == 12
+
+
+class TestReferenceDeltaPersistence:
+    _XML_JOBS = TestStreamingFeedWriter._XML_JOBS
+
+    def _generate(self, existing, output_path=None):
+        from simplified_xml_generator import SimplifiedXMLGenerator, JobFragmentCache
+        gen = SimplifiedXMLGenerator(db=MagicMock())
+        gen.fragment_cache = JobFragmentCache(max_bytes=0)
+        gen.xml_integration = MagicMock()
+        gen.xml_integration.map_bullhorn_jobs_to_xml_batch.return_value = [dict(j) for j in self._XML_JOBS]
+        mock_bh = MagicMock()
+        mock_bh.authenticate.return_value = True
+
+        with patch.object(gen, '_get_bullhorn_service', return_value=mock_bh), \
+             patch.object(gen, '_load_references_from_database', return_value=dict(existing)), \
+             patch.object(gen, '_get_jobs_from_tearsheets', return_value=[{'id': 1}, {'id': 2}]), \
+             patch.object(gen, '_save_reference_rows_to_database') as save_rows:
+            gen.generate_fresh_xml(source_channel=SOURCE_LINKEDIN, output_path=output_path)
+        return save_rows
+
+    @pytest.mark.parametrize('streaming', [False, True])
+    def test_only_changed_references_are_saved(self, tmp_path, streaming):
+        out = str(tmp_path / 'v2.xml') if streaming else None
+        save_rows = self._generate({'1': 'REF-1', '2': 'OLD-2'}, output_path=out)
+        save_rows.assert_called_once_with([('2', 'REF-2', 'Analyst (2)')])
+
+    def test_unchanged_feed_skips_database_write(self):
+        save_rows = self._generate({'1': 'REF-1', '2': 'REF-2'})
+        save_rows.assert_not_called()
+
+    def test_uncovered_feed_reuses_cycle_reference_map(self):
+        from simplified_xml_generator import TearsheetSnapshot
+        gen, mock_bh = TestCycleSnapshot()._gen({TEARSHEET_STSI_ZIPRECRUITER: []})
+        gen._snapshot = TearsheetSnapshot({}, {'5': 'REF-5'})
+        seen = []
+
+        def _fake_build(jobs, refs, **kwargs):
+            seen.append(dict(refs))
+            return '<source/>', dict(refs)
+
+        with patch.object(gen, '_get_bullhorn_service', return_value=mock_bh), \
+             patch.object(gen, '_load_references_from_database') as load_refs, \
+             patch.object(gen, '_build_clean_xml', side_effect=_fake_build):
+            gen.generate_fresh_xml(tearsheet_ids=[TEARSHEET_STSI_ZIPRECRUITER], allow_empty=True)
+
+        load_refs.assert_not_called()
+        assert seen == [{'5': 'REF-5'}]
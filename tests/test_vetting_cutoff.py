@@ -124,7 +124,10 @@ class TestVettingCutoffDateFilter:
                     'email': 'new@example.com',
                 }
             }
-            mock_bullhorn.session.get.return_value = mock_response
+            record = mock_response.json.return_value['data']
+            mock_bullhorn.get_entities.side_effect = (
+                lambda entity, ids, fields=None: {i: dict(record, id=i) for i in ids}
+            )
             mock_bullhorn_cls.return_value = mock_bullhorn
 
             service = CandidateVettingService(bullhorn_service=mock_bullhorn)
@@ -193,7 +196,10 @@ class TestVettingCutoffDateFilter:
                     'email': 'old@example.com',
                 }
             }
-            mock_bullhorn.session.get.return_value = mock_response
+            record = mock_response.json.return_value['data']
+            mock_bullhorn.get_entities.side_effect = (
+                lambda entity, ids, fields=None: {i: dict(record, id=i) for i in ids}
+            )
             mock_bullhorn_cls.return_value = mock_bullhorn
 
             service = CandidateVettingService(bullhorn_service=mock_bullhorn)
@@ -46,9 +46,9 @@ def get_bullhorn_service(environment=None):
         credentials = {}
         for key in ['bullhorn_client_id', 'bullhorn_client_secret', 'bullhorn_username', 'bullhorn_password']:
             try:
-                setting = GlobalSettings.query.filter_by(setting_key=key).first()
-                if setting and setting.setting_value:
-                    credentials[key] = setting.setting_value.strip()
+                value = GlobalSettings.settings.get_str(key)
+                if value:
+                    credentials[key] = value
             except Exception as e:
                 logger.error(f"Error loading credential {key}: {str(e)}")
 
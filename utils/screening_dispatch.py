@@ -35,6 +35,8 @@ Architectural notes
   job uses a fixed ID so duplicate clicks don't queue duplicate
   cycles — APScheduler raises `ConflictingIdError` on duplicate IDs
   and we treat that as "already queued" success.
+- Under the lease scheduler backend the advanced job must also be marked
+  due in its lease row, or the claim would see it as not due yet and skip.
 - The helper never raises. It returns a result dict so callers can
   flash an appropriate user message regardless of outcome.
 
@@ -70,6 +72,15 @@ PERIODIC_JOB_ID = 'candidate_vetting_cycle'
 ONE_SHOT_JOB_ID = 'candidate_vetting_cycle_oneshot'
 
 
+def _mark_due_safe(job_id: str) -> None:
+    try:
+        from scheduler_leases import lease_backend_enabled, mark_due
+        if lease_backend_enabled():
+            mark_due(job_id)
+    except Exception as exc:  # noqa: BLE001
+        logger.warning(f"enqueue_vetting_now: could not mark '{job_id}' due ({exc})")
+
+
 def enqueue_vetting_now(reason: str = 'manual') -> Dict[str, Any]:
     """Push a candidate-vetting cycle onto the background scheduler.
 
@@ -115,6 +126,7 @@ def enqueue_vetting_now(reason: str = 'manual') -> Dict[str, Any]:
                 PERIODIC_JOB_ID,
                 next_run_time=datetime.now(),
             )
+            _mark_due_safe(PERIODIC_JOB_ID)
             logger.info(
                 f"🚀 enqueue_vetting_now({reason}): advanced periodic job "
                 f"'{PERIODIC_JOB_ID}' to fire immediately."
@@ -136,8 +136,9 @@ def _ocr_raw_file_with_vision(file_content: bytes, filename: str) -> Optional[st
     """Send raw file bytes as an image to AI vision for OCR (last resort for unreadable docs)."""
     try:
         from openai import OpenAI
+        from services.openai_governor import shared_http_client
 
-        client = OpenAI(api_key=os.environ.get("OPENAI_API_KEY"))
+        client = OpenAI(api_key=os.environ.get("OPENAI_API_KEY"), http_client=shared_http_client())
         b64_content = base64.b64encode(file_content).decode("utf-8")
 
         ext = filename.lower().rsplit('.', 1)[-1] if '.' in filename else 'bin'
@@ -250,8 +251,9 @@ def _ocr_pdf_with_vision(file_content: bytes, max_pages: int = 5) -> Optional[st
     try:
         import fitz
         from openai import OpenAI
+        from services.openai_governor import shared_http_client
 
-        client = OpenAI(api_key=os.environ.get("OPENAI_API_KEY"))
+        client = OpenAI(api_key=os.environ.get("OPENAI_API_KEY"), http_client=shared_http_client())
         doc = fitz.open(stream=file_content, filetype="pdf")
         page_count = min(len(doc), max_pages)
 
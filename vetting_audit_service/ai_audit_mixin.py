@@ -117,13 +117,14 @@ IMPORTANT:
         # visibility and enables per-site MODEL_TIER_OVERRIDE_VETTING_AUDIT.
         import time as _time
         from openai import OpenAI
+        from services.openai_governor import shared_http_client
         from services.openai_helper import log_call, resolve_model
 
         _audit_model = resolve_model('vetting_audit', get_auditor_model())
         _t0 = _time.monotonic()
         _api_response = None
         try:
-            _client = OpenAI(api_key=self.openai_api_key, timeout=30.0)
+            _client = OpenAI(api_key=self.openai_api_key, timeout=30.0, http_client=shared_http_client())
             _api_response = _client.chat.completions.create(
                 model=_audit_model,
                 messages=[
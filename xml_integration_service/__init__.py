@@ -8,6 +8,7 @@ This is the modular successor to the former xml_integration_service.py monolith
   - MappingMixin       : Bullhorn job dict → XML field mapping + cleaners
   - ValidationMixin    : pre/post-write validation + change detection
   - FileOpsMixin       : safe write, backup rotation, sort, whitespace cleanup
+  - FeedIndexMixin     : cached parsed feed + bhatsid index, batched backups
   - JobsMixin          : add/remove/update single job, regenerate full feed
   - SyncMixin          : full feed sync + orphan detection/removal
 
@@ -22,6 +23,7 @@ from xml_integration_service._core import _XMLCore
 from xml_integration_service.mapping import MappingMixin
 from xml_integration_service.validation import ValidationMixin
 from xml_integration_service.file_ops import FileOpsMixin
+from xml_integration_service.feed_index import FeedIndexMixin
 from xml_integration_service.jobs import JobsMixin
 from xml_integration_service.sync import SyncMixin
 
@@ -32,6 +34,7 @@ class XMLIntegrationService(
     MappingMixin,
     ValidationMixin,
     FileOpsMixin,
+    FeedIndexMixin,
     _XMLCore,
 ):
     """Service for integrating Bullhorn job data with XML files.
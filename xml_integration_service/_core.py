@@ -89,3 +89,7 @@ class _XMLCore:
         self._recruiter_cache = {}
         # Thread lock for preventing concurrent XML modifications
         self._xml_lock = threading.Lock()
+        # Parsed feed trees + bhatsid index keyed by file path (see feed_index.py)
+        self._feed_cache = {}
+        # Files currently inside a feed_batch(), mapped to the batch backup path
+        self._feed_batches = {}
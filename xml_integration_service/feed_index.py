@@ -0,0 +1,151 @@
+"""FeedIndexMixin — parsed-feed cache and bhatsid index for XMLIntegrationService.
+
+The add/update/verify paths used to re-parse the whole feed and walk every
+``<job>`` to find one bhatsid, several times per job. The parsed tree is now
+kept per file together with a ``bhatsid -> <job>`` index and is invalidated
+when the file's (mtime, size, inode) signature changes underneath us, so
+lookups are a dict hit and a bulk sync parses the file roughly once.
+"""
+import os
+import re
+import shutil
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional, Set
+try:
+    from lxml import etree
+except ImportError:
+    from xml_safe_compat import safe_etree as etree
+
+_TITLE_ID_RE = re.compile(r'\(([^()]*)\)')
+
+
+def _clean_text(elem) -> str:
+    """Element text with any literal CDATA markers stripped."""
+    if elem is None or not elem.text:
+        return ''
+    text = str(elem.text).strip()
+    if '<![CDATA[' in text:
+        text = text.replace('<![CDATA[', '').replace(']]>', '').strip()
+    return text
+
+
+class _FeedSnapshot:
+    """Parsed tree plus lookup indexes for one feed file."""
+
+    __slots__ = ('tree', 'root', 'signature', 'by_bhatsid', 'title_ids')
+
+    def __init__(self, tree, signature):
+        self.tree = tree
+        self.root = tree.getroot()
+        self.signature = signature
+        self.reindex()
+
+    def reindex(self):
+        by_bhatsid: Dict[str, object] = {}
+        title_ids: Set[str] = set()
+        for job in self.root.iter('job'):
+            job_id = _clean_text(job.find('.//bhatsid'))
+            # First occurrence in document order wins, same as the old scans.
+            if job_id and job_id not in by_bhatsid:
+                by_bhatsid[job_id] = job
+            title = job.find('.//title')
+            if title is not None and title.text:
+                title_ids.update(m.strip() for m in _TITLE_ID_RE.findall(title.text))
+        self.by_bhatsid = by_bhatsid
+        self.title_ids = title_ids
+
+
+class FeedIndexMixin:
+    """Mixin providing the cached, indexed view of XML feed files."""
+
+    @staticmethod
+    def _feed_signature(xml_file_path: str):
+        st = os.stat(xml_file_path)
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    def _feed_snapshot(self, xml_file_path: str) -> _FeedSnapshot:
+        """Return the cached snapshot, re-parsing only if the file changed."""
+        key = os.path.abspath(xml_file_path)
+        signature = self._feed_signature(xml_file_path)
+        snapshot = self._feed_cache.get(key)
+        if snapshot is not None and snapshot.signature == signature:
+            return snapshot
+        with open(xml_file_path, 'rb') as f:
+            tree = etree.parse(f, self._parser)
+        snapshot = _FeedSnapshot(tree, signature)
+        self._feed_cache[key] = snapshot
+        return snapshot
+
+    def _invalidate_feed(self, xml_file_path: str):
+        self._feed_cache.pop(os.path.abspath(xml_file_path), None)
+
+    def _find_feed_job(self, xml_file_path: str, job_id) -> Optional[object]:
+        """Look up a <job> element by bhatsid without touching the disk."""
+        return self._feed_snapshot(xml_file_path).by_bhatsid.get(str(job_id))
+
+    def _commit_feed(self, xml_file_path: str, snapshot: _FeedSnapshot, pretty_print: bool = True) -> bool:
+        """Write a mutated snapshot back atomically and refresh its indexes.
+
+        On failure the cache entry is dropped so the next lookup re-reads
+        whatever is actually on disk.
+        """
+        tmp_path = f"{xml_file_path}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                snapshot.tree.write(f, encoding='utf-8', xml_declaration=True, pretty_print=pretty_print)
+            os.replace(tmp_path, xml_file_path)
+            snapshot.reindex()
+            snapshot.signature = self._feed_signature(xml_file_path)
+            self._feed_cache[os.path.abspath(xml_file_path)] = snapshot
+            return True
+        except Exception:
+            self._invalidate_feed(xml_file_path)
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    @staticmethod
+    def _existing_ai_fields(job_elem, fields=('jobfunction', 'jobindustries', 'senioritylevel')) -> Dict[str, str]:
+        ai_fields = {}
+        if job_elem is None:
+            return ai_fields
+        for ai_field in fields:
+            value = _clean_text(job_elem.find(f'.//{ai_field}'))
+            if value:
+                ai_fields[ai_field] = value
+        return ai_fields
+
+    def _in_feed_batch(self, xml_file_path: str) -> bool:
+        return os.path.abspath(xml_file_path) in self._feed_batches
+
+    @contextmanager
+    def feed_batch(self, xml_file_path: str):
+        """Group many add/update/remove calls under a single backup.
+
+        Inside the block the per-job backup copy and backup rotation are
+        skipped; the one backup taken here is restored if the block raises
+        and removed once it completes.
+        """
+        key = os.path.abspath(xml_file_path)
+        if key in self._feed_batches:
+            yield
+            return
+
+        self._cleanup_old_backups(xml_file_path, keep_count=2)
+        backup_path = f"{xml_file_path}.backup_update_{int(time.time())}"
+        shutil.copy2(xml_file_path, backup_path)
+        self._feed_batches[key] = backup_path
+        try:
+            yield
+        except Exception:
+            self.logger.error(f"Feed batch on {xml_file_path} failed - restoring {backup_path}")
+            shutil.copy2(backup_path, xml_file_path)
+            self._invalidate_feed(xml_file_path)
+            raise
+        finally:
+            self._feed_batches.pop(key, None)
+        try:
+            os.remove(backup_path)
+        except OSError:
+            pass
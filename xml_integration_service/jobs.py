@@ -18,6 +18,7 @@ from job_classification_service import JobClassificationService, InternalJobClas
 from xml_safeguards import XMLSafeguards
 from tearsheet_config import TearsheetConfig
 from utils.field_mappers import map_employment_type, map_remote_type
+from xml_integration_service.feed_index import _clean_text
 
 logger = logging.getLogger(__name__)
 
@@ -49,12 +50,17 @@ class JobsMixin:
         with self._xml_lock:
             self.logger.debug(f"Acquired XML lock for adding job {job_id}")
             
+            # Inside a feed_batch() the batch already holds one backup for the file
+            in_batch = self._in_feed_batch(xml_file_path)
+            backup_path = None
+            
             for attempt in range(max_retries):
                 try:
-                    # Clean up old backup files first, then create new backup
-                    self._cleanup_old_backups(xml_file_path, keep_count=2)
-                    backup_path = f"{xml_file_path}.backup_add_{job_id}"
-                    shutil.copy2(xml_file_path, backup_path)
+                    if not in_batch:
+                        # Clean up old backup files first, then create new backup
+                        self._cleanup_old_backups(xml_file_path, keep_count=2)
+                        backup_path = f"{xml_file_path}.backup_add_{job_id}"
+                        shutil.copy2(xml_file_path, backup_path)
                     
                     self.logger.info(f"Attempt {attempt + 1}/{max_retries}: Adding job {job_id} ({job_title}) to XML")
                     
@@ -69,31 +75,15 @@ class JobsMixin:
                     job_already_exists = False
                     
                     try:
-                        tree = etree.parse(xml_file_path, self._parser)
-                        root = tree.getroot()
-                        
-                        # Find existing job by bhatsid - check for CDATA format
-                        for job in root.xpath('.//job'):
-                            bhatsid_elem = job.find('.//bhatsid')
-                            if bhatsid_elem is not None and bhatsid_elem.text:
-                                # Extract ID from CDATA if present
-                                bhatsid_text = str(bhatsid_elem.text).strip()
-                                if 'CDATA' in bhatsid_text:
-                                    existing_bhatsid = bhatsid_text[9:-3].strip()  # Remove CDATA wrapper
-                                else:
-                                    existing_bhatsid = bhatsid_text.strip()
-                                
-                                if existing_bhatsid == job_id:
-                                    job_already_exists = True
-                                    ref_elem = job.find('.//referencenumber')
-                                    if ref_elem is not None and ref_elem.text:
-                                        found_in_xml_reference = ref_elem.text.strip()
-                                        if 'CDATA' in found_in_xml_reference:
-                                            found_in_xml_reference = found_in_xml_reference[9:-3].strip()
-                                        self.logger.info(f"Job {job_id} already exists in XML with reference {found_in_xml_reference}")
-                                    else:
-                                        self.logger.info(f"Job {job_id} already exists in XML")
-                                    break
+                        # Indexed lookup against the cached parse of the feed
+                        existing_job = self._find_feed_job(xml_file_path, job_id)
+                        if existing_job is not None:
+                            job_already_exists = True
+                            found_in_xml_reference = _clean_text(existing_job.find('.//referencenumber')) or None
+                            if found_in_xml_reference:
+                                self.logger.info(f"Job {job_id} already exists in XML with reference {found_in_xml_reference}")
+                            else:
+                                self.logger.info(f"Job {job_id} already exists in XML")
                     except Exception as e:
                         self.logger.debug(f"Could not check for existing job: {e}")
                     
@@ -101,7 +91,7 @@ class JobsMixin:
                     if job_already_exists:
                         self.logger.warning(f"⚠️ Job {job_id} already exists in {xml_file_path} - skipping to prevent duplicate")
                         # Clean up backup file
-                        if os.path.exists(backup_path):
+                        if backup_path and os.path.exists(backup_path):
                             os.remove(backup_path)
                         return True  # Return True as the job is already in the file
                     
@@ -136,34 +126,12 @@ class JobsMixin:
                     # Use passed existing_ai_fields parameter, or extract from XML if not provided
                     ai_fields_to_use = existing_ai_fields
                     if not ai_fields_to_use:
-                        ai_fields_to_use = {}
                         try:
-                            with open(xml_file_path, 'rb') as f:
-                                content = f.read().decode('utf-8')
-                            
-                            # Find existing job data to extract AI classification fields only if none were passed
-                            job_pattern = rf'<job>.*?<bhatsid>(?:<!\[CDATA\[)?{re.escape(str(job_id))}(?:\]\]>)?</bhatsid>.*?</job>'
-                            job_match = re.search(job_pattern, content, re.DOTALL)
-                            
-                            if job_match:
-                                job_content = job_match.group(0)
-                                
-                                # Extract existing AI classification fields
-                                jobfunction_match = re.search(r'<jobfunction>(?:<!\[CDATA\[)?(.*?)(?:\]\]>)?</jobfunction>', job_content)
-                                if jobfunction_match:
-                                    ai_fields_to_use['jobfunction'] = jobfunction_match.group(1).strip()
-                                
-                                jobindustries_match = re.search(r'<jobindustries>(?:<!\[CDATA\[)?(.*?)(?:\]\]>)?</jobindustries>', job_content)  
-                                if jobindustries_match:
-                                    ai_fields_to_use['jobindustries'] = jobindustries_match.group(1).strip()
-                                
-                                senioritylevel_match = re.search(r'<senioritylevel>(?:<!\[CDATA\[)?(.*?)(?:\]\]>)?</senioritylevel>', job_content)
-                                if senioritylevel_match:
-                                    ai_fields_to_use['senioritylevel'] = senioritylevel_match.group(1).strip()
-                                    
+                            ai_fields_to_use = self._existing_ai_fields(self._find_feed_job(xml_file_path, job_id))
+                            if ai_fields_to_use:
                                 self.logger.debug(f"Extracted existing AI fields for job {job_id}: {ai_fields_to_use}")
-                                
                         except Exception as e:
+                            ai_fields_to_use = {}
                             self.logger.debug(f"Could not extract existing AI fields for job {job_id}: {e}")
                     else:
                         self.logger.info(f"Using passed AI fields for job {job_id}: {ai_fields_to_use}")
@@ -177,11 +145,9 @@ class JobsMixin:
                             continue
                         return False
                     
-                    # Parse existing XML
-                    with open(xml_file_path, 'rb') as f:
-                        tree = etree.parse(f, self._parser)
-                    
-                    root = tree.getroot()
+                    # Mutate the cached tree; it is only written back once below
+                    snapshot = self._feed_snapshot(xml_file_path)
+                    root = snapshot.root
                     
                     # Find the publisherurl element
                     publisher_url = root.find('publisherurl')
@@ -219,20 +185,21 @@ class JobsMixin:
                     root.insert(publisher_url_index + 1, job_element)
                     
                     # Write updated XML back to file with proper formatting
-                    with open(xml_file_path, 'wb') as f:
-                        tree.write(f, encoding='utf-8', xml_declaration=True, pretty_print=True)
+                    self._commit_feed(xml_file_path, snapshot)
                     
-                    # Verify the job was actually added by checking the file
+                    # Verify the job was actually added (reads the refreshed index)
                     if self._verify_job_added_to_xml(xml_file_path, job_id, xml_job['title']):
                         self.logger.info(f"Successfully added and verified job {job_id} ({xml_job['title']}) to XML file")
                         # Clean up backup file on success
-                        if os.path.exists(backup_path):
+                        if backup_path and os.path.exists(backup_path):
                             os.remove(backup_path)
                         return True
                     else:
                         self.logger.error(f"Verification failed: Job {job_id} was not properly added to XML")
                         # Restore backup
-                        shutil.copy2(backup_path, xml_file_path)
+                        if backup_path:
+                            shutil.copy2(backup_path, xml_file_path)
+                        self._invalidate_feed(xml_file_path)
                         if attempt < max_retries - 1:
                             time.sleep(retry_delay)
                             continue
@@ -240,9 +207,10 @@ class JobsMixin:
                         
                 except Exception as e:
                     self.logger.error(f"Attempt {attempt + 1} failed adding job {job_id}: {str(e)}")
-                    # Restore backup on error
+                    # Restore backup on error; either way drop the possibly half-mutated cached tree
                     if backup_path and os.path.exists(backup_path):
                         shutil.copy2(backup_path, xml_file_path)
+                    self._invalidate_feed(xml_file_path)
                     
                     if attempt < max_retries - 1:
                         time.sleep(retry_delay)
@@ -264,11 +232,9 @@ class JobsMixin:
             bool: True if job was removed successfully, False otherwise
         """
         try:
-            # Parse existing XML
-            with open(xml_file_path, 'rb') as f:
-                tree = etree.parse(f, self._parser)
-            
-            root = tree.getroot()
+            # Work on the cached parse of the feed
+            snapshot = self._feed_snapshot(xml_file_path)
+            root = snapshot.root
             
             # Find job elements
             jobs = root.findall('job')
@@ -317,11 +283,12 @@ class JobsMixin:
                     publisher_url.tail = "\n  "
                 
                 # Write updated XML back to file
-                with open(xml_file_path, 'wb') as f:
-                    tree.write(f, encoding='utf-8', xml_declaration=True, pretty_print=True)
+                self._commit_feed(xml_file_path, snapshot)
                     
-                # Post-process to remove extra blank lines
+                # Post-process to remove extra blank lines (rewrites the file, so
+                # the cached tree no longer matches it byte-for-byte)
                 self._clean_extra_whitespace(xml_file_path)
+                self._invalidate_feed(xml_file_path)
                 return True
             else:
                 self.logger.warning(f"Job with ID {job_id} not found in XML")
@@ -329,53 +296,28 @@ class JobsMixin:
             
         except Exception as e:
             self.logger.error(f"Error removing job from XML: {str(e)}")
+            self._invalidate_feed(xml_file_path)
             return False
     def _update_fields_in_place(self, xml_file_path: str, job_id: str, bullhorn_job: Dict, existing_reference_number: Optional[str], existing_ai_fields: Optional[Dict], monitor_name: Optional[str]) -> bool:
         """
         Update job fields in-place without remove-and-add to preserve reference numbers
         """
         try:
-            # Parse the XML file
-            tree = etree.parse(xml_file_path, self._parser)
-            root = tree.getroot()
+            snapshot = self._feed_snapshot(xml_file_path)
             
             # Find the job to update
-            job_element = None
+            job_element = snapshot.by_bhatsid.get(str(job_id))
             actual_existing_reference = None
             actual_existing_ai_fields = {}
             
-            for job in root.xpath('.//job'):
-                bhatsid_elem = job.find('.//bhatsid')
-                if bhatsid_elem is not None and bhatsid_elem.text:
-                    bhatsid_text = bhatsid_elem.text.strip()
-                    if '<![CDATA[' in bhatsid_text:
-                        bhatsid_text = bhatsid_text.replace('<![CDATA[', '').replace(']]>', '').strip()
-                    
-                    if bhatsid_text == str(job_id):
-                        job_element = job
-                        
-                        # CRITICAL FIX: Extract the ACTUAL existing reference number from the current XML
-                        ref_elem = job.find('.//referencenumber')
-                        if ref_elem is not None and ref_elem.text:
-                            ref_text = ref_elem.text.strip()
-                            # Remove CDATA wrapper if present
-                            if '<![CDATA[' in ref_text:
-                                actual_existing_reference = ref_text.replace('<![CDATA[', '').replace(']]>', '').strip()
-                            else:
-                                actual_existing_reference = ref_text
-                            self.logger.info(f"✅ EXTRACTED existing reference from XML for job {job_id}: {actual_existing_reference}")
-                        
-                        # Also extract existing AI fields
-                        for ai_field in ['jobfunction', 'jobindustries', 'senioritylevel']:
-                            ai_elem = job.find(f'.//{ai_field}')
-                            if ai_elem is not None and ai_elem.text:
-                                ai_value = ai_elem.text.strip()
-                                if '<![CDATA[' in ai_value:
-                                    ai_value = ai_value.replace('<![CDATA[', '').replace(']]>', '').strip()
-                                if ai_value:
-                                    actual_existing_ai_fields[ai_field] = ai_value
-                        
-                        break
+            if job_element is not None:
+                # CRITICAL FIX: Extract the ACTUAL existing reference number from the current XML
+                actual_existing_reference = _clean_text(job_element.find('.//referencenumber')) or None
+                if actual_existing_reference:
+                    self.logger.info(f"✅ EXTRACTED existing reference from XML for job {job_id}: {actual_existing_reference}")
+                
+                # Also extract existing AI fields
+                actual_existing_ai_fields = self._existing_ai_fields(job_element)
             
             if job_element is None:
                 self.logger.error(f"Job {job_id} not found for in-place update")
@@ -443,12 +385,13 @@ class JobsMixin:
                             self.logger.debug(f"Title already correct for job {job_id}: '{current_value}'")
             
             # Save the updated XML
-            tree.write(xml_file_path, encoding='utf-8', xml_declaration=True)
+            self._commit_feed(xml_file_path, snapshot, pretty_print=False)
             self.logger.info(f"✅ IN-PLACE UPDATE completed for job {job_id} - {fields_updated} fields updated without reference number changes")
             return True
             
         except Exception as e:
             self.logger.error(f"Error during in-place update for job {job_id}: {str(e)}")
+            self._invalidate_feed(xml_file_path)
             return False
     def update_job_in_xml(self, xml_file_path: str, bullhorn_job: Dict, monitor_name: Optional[str] = None, existing_reference_number: Optional[str] = None, existing_ai_fields: Optional[Dict] = None) -> bool:
         """
@@ -489,19 +432,28 @@ class JobsMixin:
         
         self.logger.info(f"Update needed for job {job_id} - proceeding with XML update")
         
-        # Create backup of XML file before modification
+        # Create backup of XML file before modification - unless a feed_batch()
+        # already holds one for this file
         backup_path = f"{xml_file_path}.backup_update_{int(time.time())}"
+        in_batch = self._in_feed_batch(xml_file_path)
         max_retries = 3
         retry_delay = 1  # seconds
         
-        # Clean up old backup files to keep only the 2 most recent (reduced for optimization)
-        self._cleanup_old_backups(xml_file_path, keep_count=2)
+        def restore_backup():
+            if not in_batch:
+                shutil.copy2(backup_path, xml_file_path)
+            self._invalidate_feed(xml_file_path)
+        
+        if not in_batch:
+            # Clean up old backup files to keep only the 2 most recent (reduced for optimization)
+            self._cleanup_old_backups(xml_file_path, keep_count=2)
         
         for attempt in range(max_retries):
             try:
-                # Create backup
-                shutil.copy2(xml_file_path, backup_path)
-                self.logger.info(f"Created backup at {backup_path} for job {job_id} update (attempt {attempt + 1})")
+                if not in_batch:
+                    # Create backup
+                    shutil.copy2(xml_file_path, backup_path)
+                    self.logger.info(f"Created backup at {backup_path} for job {job_id} update (attempt {attempt + 1})")
                 
                 # Verify job exists in XML before update
                 job_exists_before = self._verify_job_exists_in_xml(xml_file_path, job_id)
@@ -511,39 +463,19 @@ class JobsMixin:
                 existing_reference_for_preservation = None
                 
                 try:
-                    tree = etree.parse(xml_file_path, self._parser)
-                    root = tree.getroot()
-                    
                     # Find existing job by bhatsid to preserve AI classifications and potentially reference
-                    for job in root.xpath('.//job'):
-                        bhatsid_elem = job.find('.//bhatsid')
-                        if bhatsid_elem is not None and bhatsid_elem.text:
-                            bhatsid_text = bhatsid_elem.text.strip()
-                            # Remove CDATA wrapper if present (CRITICAL FIX for duplicate bug)
-                            if '<![CDATA[' in bhatsid_text:
-                                bhatsid_text = bhatsid_text.replace('<![CDATA[', '').replace(']]>', '').strip()
-                            
-                            if bhatsid_text == str(job_id):
-                                # Get existing reference number BEFORE removal
-                                ref_elem = job.find('.//referencenumber')
-                                if ref_elem is not None and ref_elem.text:
-                                    existing_reference_for_preservation = ref_elem.text.strip()
-                                    if 'CDATA' in existing_reference_for_preservation:
-                                        existing_reference_for_preservation = existing_reference_for_preservation[9:-3].strip()
-                                    self.logger.info(f"Found existing reference for job {job_id}: {existing_reference_for_preservation}")
-                                
-                                # CRITICAL: Preserve existing AI classification values
-                                ai_fields = ['jobfunction', 'jobindustries', 'senoritylevel']
-                                for ai_field in ai_fields:
-                                    ai_elem = job.find(f'.//{ai_field}')
-                                    if ai_elem is not None and ai_elem.text:
-                                        # Extract text from CDATA if present
-                                        ai_value = ai_elem.text.strip()
-                                        if ai_value:
-                                            existing_ai_classifications[ai_field] = ai_value
-                                            self.logger.info(f"Preserving existing {ai_field}: {ai_value}")
-                                
-                                break
+                    existing_job = self._find_feed_job(xml_file_path, job_id)
+                    if existing_job is not None:
+                        # Get existing reference number BEFORE removal
+                        existing_reference_for_preservation = _clean_text(existing_job.find('.//referencenumber')) or None
+                        if existing_reference_for_preservation:
+                            self.logger.info(f"Found existing reference for job {job_id}: {existing_reference_for_preservation}")
+                        
+                        # CRITICAL: Preserve existing AI classification values
+                        existing_ai_classifications = self._existing_ai_fields(
+                            existing_job, fields=('jobfunction', 'jobindustries', 'senoritylevel'))
+                        for ai_field, ai_value in existing_ai_classifications.items():
+                            self.logger.info(f"Preserving existing {ai_field}: {ai_value}")
                             
                 except Exception as e:
                     self.logger.warning(f"Could not get existing data: {e}")
@@ -560,7 +492,7 @@ class JobsMixin:
                     self.logger.warning(f"Failed in-place field update for job {job_id} on attempt {attempt + 1}")
                     if attempt < max_retries - 1:
                         # Restore backup and retry
-                        shutil.copy2(backup_path, xml_file_path)
+                        restore_backup()
                         time.sleep(retry_delay)
                         continue
                     else:
@@ -597,19 +529,19 @@ class JobsMixin:
                 
                 if not xml_job:
                     self.logger.error(f"Failed to map job {job_id} to XML format")
-                    shutil.copy2(backup_path, xml_file_path)
+                    restore_backup()
                     return False
                 
                 # Parse XML and add the job manually to ensure reference preservation
                 try:
-                    tree = etree.parse(xml_file_path, self._parser)
-                    root = tree.getroot()
+                    snapshot = self._feed_snapshot(xml_file_path)
+                    root = snapshot.root
                     
                     # Find the publisherurl element
                     publisher_url = root.find('publisherurl')
                     if publisher_url is None:
                         self.logger.error("No publisherurl element found in XML")
-                        shutil.copy2(backup_path, xml_file_path)
+                        restore_backup()
                         return False
                     
                     # Create new job element with proper formatting
@@ -637,8 +569,7 @@ class JobsMixin:
                     root.insert(publisher_url_index + 1, job_element)
                     
                     # Write updated XML back to file with proper formatting
-                    with open(xml_file_path, 'wb') as f:
-                        tree.write(f, encoding='utf-8', xml_declaration=True, pretty_print=True)
+                    self._commit_feed(xml_file_path, snapshot)
                     
                     self.logger.info(f"Successfully updated job {xml_job['title']} with NEW reference number {xml_job.get('referencenumber', 'unknown')} in XML file {xml_file_path}")
                     addition_success = True
@@ -650,13 +581,13 @@ class JobsMixin:
                 if not addition_success:
                     if attempt < max_retries - 1:
                         # Restore backup and retry
-                        shutil.copy2(backup_path, xml_file_path)
+                        restore_backup()
                         time.sleep(retry_delay)
                         continue
                     else:
                         self.logger.error(f"Failed to add updated job {job_id} after {max_retries} attempts")
                         # Restore backup on final failure
-                        shutil.copy2(backup_path, xml_file_path)
+                        restore_backup()
                         return False
                 
                 # Step 3: Verify the update was successful
@@ -665,19 +596,19 @@ class JobsMixin:
                     self.logger.error(f"Job {job_id} update verification failed on attempt {attempt + 1}")
                     if attempt < max_retries - 1:
                         # Restore backup and retry
-                        shutil.copy2(backup_path, xml_file_path)
+                        restore_backup()
                         time.sleep(retry_delay)
                         continue
                     else:
                         self.logger.error(f"Job {job_id} update verification failed after {max_retries} attempts")
                         # Restore backup on final failure
-                        shutil.copy2(backup_path, xml_file_path)
+                        restore_backup()
                         return False
                 
                 # Success - cleanup backup
                 try:
-                    import os
-                    os.remove(backup_path)
+                    if not in_batch:
+                        os.remove(backup_path)
                     self.logger.info(f"Successfully updated job {job_id} ({job_title}) in XML file")
                 except Exception:
                     pass  # Backup cleanup failure is not critical
@@ -689,7 +620,7 @@ class JobsMixin:
                 if attempt < max_retries - 1:
                     # Restore backup and retry
                     try:
-                        shutil.copy2(backup_path, xml_file_path)
+                        restore_backup()
                         time.sleep(retry_delay)
                         continue
                     except Exception:
@@ -697,7 +628,7 @@ class JobsMixin:
                 else:
                     # Final attempt failed - restore backup
                     try:
-                        shutil.copy2(backup_path, xml_file_path)
+                        restore_backup()
                         self.logger.error(f"Restored backup after failed update for job {job_id}")
                     except Exception:
                         pass
@@ -799,24 +730,10 @@ class JobsMixin:
             
             # Job exists - perform comprehensive field comparison
             try:
-                # Parse XML to get current job data
-                tree = etree.parse(xml_file_path, self._parser)
-                root = tree.getroot()
-                
-                # Find the job in XML
-                current_xml_job = None
-                for job in root.findall('.//job'):
-                    bhatsid_elem = job.find('.//bhatsid')
-                    if bhatsid_elem is not None and bhatsid_elem.text:
-                        bhatsid_text = str(bhatsid_elem.text).strip()
-                        if 'CDATA' in bhatsid_text:
-                            bhatsid_text = bhatsid_text[9:-3].strip()
-                        
-                        if bhatsid_text == job_id:
-                            current_xml_job = job
-                            break
+                # Find the job in XML via the bhatsid index
+                current_xml_job = self._find_feed_job(xml_file_path, job_id)
                 
-                if not current_xml_job:
+                if current_xml_job is None:
                     self.logger.warning(f"Job {job_id} not found during comprehensive sync")
                     return False
                 
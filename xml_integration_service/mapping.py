@@ -1,5 +1,6 @@
 """MappingMixin — XMLIntegrationService methods for this domain."""
 import os
+import hashlib
 import logging
 import re
 import shutil
@@ -21,10 +22,18 @@ from utils.field_mappers import map_employment_type, map_remote_type
 
 logger = logging.getLogger(__name__)
 
+# Bump whenever map_bullhorn_job_to_xml (or anything it calls) changes its
+# output, so cached <job> fragments built by the old mapping are discarded.
+MAPPING_VERSION = 1
+
 
 class MappingMixin:
     """Mixin providing mapping-related XMLIntegrationService methods."""
 
+    # Incremented whenever a recruiter tag lookup falls back to the raw name
+    # because the database could not be read.
+    recruiter_lookup_errors = 0
+
     def map_bullhorn_jobs_to_xml_batch(self, jobs_data: List[Dict], existing_references: Dict = None, enable_ai_classification: bool = False, monitor_names: Dict = None, feed_name: str = None, source_channel: str = 'LinkedIn') -> List[Dict]:
         """
         Map multiple Bullhorn jobs to XML format with fast keyword-based classification
@@ -494,8 +503,33 @@ class MappingMixin:
                 
         except Exception as e:
             self.logger.warning(f"Error querying recruiter mapping database: {str(e)}")
+            self.recruiter_lookup_errors += 1
             # Fallback to just returning the name if database query fails
             return recruiter_name
+
+    def recruiter_mapping_fingerprint(self) -> Optional[str]:
+        """
+        Digest of every RecruiterMapping row, or None if the table can't be read.
+
+        Part of the job fragment cache key, so editing a mapping invalidates
+        cached <job> fragments that carry a recruiter tag.
+        """
+        try:
+            from app import RecruiterMapping, app
+
+            with app.app_context():
+                rows = RecruiterMapping.query.with_entities(
+                    RecruiterMapping.recruiter_name, RecruiterMapping.linkedin_tag
+                ).order_by(RecruiterMapping.recruiter_name).all()
+        except Exception as e:
+            self.logger.warning(f"Error reading recruiter mappings for fragment cache: {str(e)}")
+            return None
+
+        digest = hashlib.sha1()
+        for name, tag in rows:
+            digest.update(f"{name}\x1f{tag}\x1e".encode('utf-8'))
+        return digest.hexdigest()
+
     def _clean_description(self, description: str) -> str:
         """Clean and format job description for XML with proper HTML formatting"""
         if not description:
@@ -150,40 +150,43 @@ class SyncMixin:
             updated_count = 0
             errors = []
             
-            # Add new jobs
-            for job in current_jobs:
-                job_id = str(job.get('id', ''))
-                if job_id in added_job_ids:
-                    if self.add_job_to_xml(xml_file_path, job):
-                        added_count += 1
+            # One backup and (roughly) one parse for the whole sync; the per-job
+            # add/update/remove calls below share the cached, indexed tree.
+            previous_by_id = {str(job.get('id', '')): job for job in previous_jobs}
+            with self.feed_batch(xml_file_path):
+                # Add new jobs
+                for job in current_jobs:
+                    job_id = str(job.get('id', ''))
+                    if job_id in added_job_ids:
+                        if self.add_job_to_xml(xml_file_path, job):
+                            added_count += 1
+                        else:
+                            errors.append(f"Failed to add job {job_id}")
+            
+                # Remove deleted jobs
+                for job_id in removed_job_ids:
+                    if self.remove_job_from_xml(xml_file_path, job_id):
+                        removed_count += 1
                     else:
-                        errors.append(f"Failed to add job {job_id}")
-            
-            # Remove deleted jobs
-            for job_id in removed_job_ids:
-                if self.remove_job_from_xml(xml_file_path, job_id):
-                    removed_count += 1
-                else:
-                    errors.append(f"Failed to remove job {job_id}")
-            
-            # Check for modified jobs (same ID but different content)
-            for current_job in current_jobs:
-                current_id = str(current_job.get('id', ''))
-                if current_id not in added_job_ids:  # Skip newly added jobs
-                    # Find matching previous job
-                    previous_job = next((job for job in previous_jobs 
-                                       if str(job.get('id', '')) == current_id), None)
+                        errors.append(f"Failed to remove job {job_id}")
+            
+                # Check for modified jobs (same ID but different content)
+                for current_job in current_jobs:
+                    current_id = str(current_job.get('id', ''))
+                    if current_id not in added_job_ids:  # Skip newly added jobs
+                        # Find matching previous job
+                        previous_job = previous_by_id.get(current_id)
                     
-                    if previous_job:
-                        # Comprehensive field comparison - check ALL relevant fields
-                        changed_fields = self._compare_job_fields(current_job, previous_job)
+                        if previous_job:
+                            # Comprehensive field comparison - check ALL relevant fields
+                            changed_fields = self._compare_job_fields(current_job, previous_job)
                         
-                        if changed_fields:
-                            self.logger.info(f"Job {current_id} has changed fields: {', '.join(changed_fields)}")
-                            if self.update_job_in_xml(xml_file_path, current_job):
-                                updated_count += 1
-                            else:
-                                errors.append(f"Failed to update job {current_id}")
+                            if changed_fields:
+                                self.logger.info(f"Job {current_id} has changed fields: {', '.join(changed_fields)}")
+                                if self.update_job_in_xml(xml_file_path, current_job):
+                                    updated_count += 1
+                                else:
+                                    errors.append(f"Failed to update job {current_id}")
             
             self.logger.info(f"XML sync completed: {added_count} added, {removed_count} removed, {updated_count} updated")
             
@@ -42,23 +42,13 @@ class ValidationMixin:
     def _verify_job_added_to_xml(self, xml_file_path: str, job_id: str, expected_title: str) -> bool:
         """Verify that a job was actually added to the XML file"""
         try:
-            with open(xml_file_path, 'rb') as f:
-                tree = etree.parse(f, self._parser)
+            snapshot = self._feed_snapshot(xml_file_path)
+            root = snapshot.root
             
-            root = tree.getroot()
-            
-            # Look for job by bhatsid (most reliable) - handle CDATA properly
-            for job in root.xpath('.//job'):
-                bhatsid_elem = job.find('.//bhatsid')
-                if bhatsid_elem is not None and bhatsid_elem.text:
-                    bhatsid_text = bhatsid_elem.text.strip()
-                    # Remove CDATA wrapper if present
-                    if '<![CDATA[' in bhatsid_text:
-                        bhatsid_text = bhatsid_text.replace('<![CDATA[', '').replace(']]>', '').strip()
-                    
-                    if bhatsid_text == str(job_id):
-                        self.logger.debug(f"Verified job {job_id} exists in XML by bhatsid")
-                        return True
+            # Look for job by bhatsid (most reliable) - indexed, no re-parse
+            if str(job_id) in snapshot.by_bhatsid:
+                self.logger.debug(f"Verified job {job_id} exists in XML by bhatsid")
+                return True
             
             # Alternative verification - look for job ID in title
             for job in root.xpath('.//job'):
@@ -91,19 +81,8 @@ class ValidationMixin:
             bool: True if job exists, False otherwise
         """
         try:
-            with open(xml_file_path, 'rb') as f:
-                tree = etree.parse(f, self._parser)
-            
-            root = tree.getroot()
-            jobs = root.findall('job')
-            
-            for job in jobs:
-                title_element = job.find('title')
-                if title_element is not None and title_element.text:
-                    if f"({job_id})" in title_element.text:
-                        return True
-            
-            return False
+            # "(job_id)" appears in a title iff job_id is one of its parenthesised tokens
+            return str(job_id) in self._feed_snapshot(xml_file_path).title_ids
             
         except Exception as e:
             self.logger.error(f"Error verifying job existence in XML: {str(e)}")
@@ -121,10 +100,7 @@ class ValidationMixin:
             bool: True if job exists with correct title, False otherwise
         """
         try:
-            with open(xml_file_path, 'rb') as f:
-                tree = etree.parse(f, self._parser)
-            
-            root = tree.getroot()
+            root = self._feed_snapshot(xml_file_path).root
             jobs = root.findall('job')
             
             for job in jobs:
@@ -165,74 +141,67 @@ class ValidationMixin:
             job_id = str(bullhorn_job.get('id', ''))
             field_changes = {}
             
-            # Parse existing XML
-            with open(xml_file_path, 'rb') as f:
-                tree = etree.parse(f, self._parser)
-            
-            root = tree.getroot()
-            
-            # Find the job by bhatsid
-            for job in root.xpath('.//job'):
-                bhatsid_elem = job.find('.//bhatsid')
-                if bhatsid_elem is not None and bhatsid_elem.text and bhatsid_elem.text.strip() == job_id:
-                    # Extract current XML job data for comparison (including AI classification fields)
-                    xml_data = {}
-                    for field in ['title', 'city', 'state', 'country', 'jobtype', 'remotetype', 'assignedrecruiter', 'description', 'jobfunction', 'jobindustries', 'senoritylevel']:
-                        elem = job.find(field)
-                        if elem is not None and elem.text:
-                            xml_data[field] = elem.text.strip()
-                        else:
-                            xml_data[field] = ''
-                    
-                    # Map Bullhorn data to XML format for comparison (skip AI classification for performance)
-                    bullhorn_xml_data = self.map_bullhorn_job_to_xml(bullhorn_job, skip_ai_classification=True)
-                    if not bullhorn_xml_data:
-                        self.logger.warning(f"Could not map Bullhorn job {job_id} for comparison")
-                        return True, {}  # Assume update needed if we can't compare
-                    
-                    # COMPREHENSIVE FIELD COMPARISON - Check ALL fields from Bullhorn
-                    # This ensures complete accuracy and catches all changes
-                    comparison_fields = [
-                        'title', 'city', 'state', 'country', 'jobtype', 
-                        'remotetype', 'assignedrecruiter', 'description',
-                        'jobfunction', 'jobindustries', 'senoritylevel',
-                        'company', 'date', 'url', 'apply_email'
-                    ]
-                    changes_detected = False
-                    
-                    # Field display names for user-friendly notifications
-                    field_display_names = {
-                        'title': 'Job Title',
-                        'city': 'City',
-                        'state': 'State/Province',
-                        'country': 'Country',
-                        'jobtype': 'Employment Type',
-                        'remotetype': 'Remote Type',
-                        'assignedrecruiter': 'Assigned Recruiter',
-                        'description': 'Job Description',
-                        'jobfunction': 'Job Function',
-                        'jobindustries': 'Job Industry',
-                        'senoritylevel': 'Seniority Level'
-                    }
-                    
-                    for field in comparison_fields:
-                        xml_value = xml_data.get(field, '').strip()
-                        bullhorn_value = str(bullhorn_xml_data.get(field, '')).strip()
-                        
-                        if xml_value != bullhorn_value:
-                            field_changes[field] = {
-                                'display_name': field_display_names.get(field, field),
-                                'old_value': xml_value or '(empty)',
-                                'new_value': bullhorn_value or '(empty)'
-                            }
-                            changes_detected = True
-                            self.logger.info(f"Job {job_id} field '{field}' changed: '{xml_value}' → '{bullhorn_value}'")
-                    
-                    if not changes_detected:
-                        self.logger.debug(f"Job {job_id} - no critical business changes detected (AI classification variations ignored)")
+            # Find the job by bhatsid (cached parse + index)
+            job = self._find_feed_job(xml_file_path, job_id)
+            if job is not None:
+                # Extract current XML job data for comparison (including AI classification fields)
+                xml_data = {}
+                for field in ['title', 'city', 'state', 'country', 'jobtype', 'remotetype', 'assignedrecruiter', 'description', 'jobfunction', 'jobindustries', 'senoritylevel']:
+                    elem = job.find(field)
+                    if elem is not None and elem.text:
+                        xml_data[field] = elem.text.strip()
+                    else:
+                        xml_data[field] = ''
+                
+                # Map Bullhorn data to XML format for comparison (skip AI classification for performance)
+                bullhorn_xml_data = self.map_bullhorn_job_to_xml(bullhorn_job, skip_ai_classification=True)
+                if not bullhorn_xml_data:
+                    self.logger.warning(f"Could not map Bullhorn job {job_id} for comparison")
+                    return True, {}  # Assume update needed if we can't compare
+                
+                # COMPREHENSIVE FIELD COMPARISON - Check ALL fields from Bullhorn
+                # This ensures complete accuracy and catches all changes
+                comparison_fields = [
+                    'title', 'city', 'state', 'country', 'jobtype', 
+                    'remotetype', 'assignedrecruiter', 'description',
+                    'jobfunction', 'jobindustries', 'senoritylevel',
+                    'company', 'date', 'url', 'apply_email'
+                ]
+                changes_detected = False
+                
+                # Field display names for user-friendly notifications
+                field_display_names = {
+                    'title': 'Job Title',
+                    'city': 'City',
+                    'state': 'State/Province',
+                    'country': 'Country',
+                    'jobtype': 'Employment Type',
+                    'remotetype': 'Remote Type',
+                    'assignedrecruiter': 'Assigned Recruiter',
+                    'description': 'Job Description',
+                    'jobfunction': 'Job Function',
+                    'jobindustries': 'Job Industry',
+                    'senoritylevel': 'Seniority Level'
+                }
+                
+                for field in comparison_fields:
+                    xml_value = xml_data.get(field, '').strip()
+                    bullhorn_value = str(bullhorn_xml_data.get(field, '')).strip()
                     
-                    return changes_detected, field_changes
-            
+                    if xml_value != bullhorn_value:
+                        field_changes[field] = {
+                            'display_name': field_display_names.get(field, field),
+                            'old_value': xml_value or '(empty)',
+                            'new_value': bullhorn_value or '(empty)'
+                        }
+                        changes_detected = True
+                        self.logger.info(f"Job {job_id} field '{field}' changed: '{xml_value}' → '{bullhorn_value}'")
+                
+                if not changes_detected:
+                    self.logger.debug(f"Job {job_id} - no critical business changes detected (AI classification variations ignored)")
+                
+                return changes_detected, field_changes
+        
             # Job not found in XML - this shouldn't happen in update context
             self.logger.warning(f"Job {job_id} not found in XML for update comparison")
             return True, {}  # Assume update needed